@@ -5,11 +5,13 @@ Bills API - Manage household bills
 from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel
 from typing import Optional, List
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
 from database import get_db
 from models import Bill
+from money import MoneyStr, format_money
 
 router = APIRouter(prefix="/bills", tags=["bills"])
 
@@ -17,7 +19,7 @@ router = APIRouter(prefix="/bills", tags=["bills"])
 class CreateBillRequest(BaseModel):
     """Request to create a new bill"""
     name: str
-    amount: str
+    amount: MoneyStr
     due_date: datetime
     category: Optional[str] = None
     payee: Optional[str] = None
@@ -30,7 +32,7 @@ class CreateBillRequest(BaseModel):
 class UpdateBillRequest(BaseModel):
     """Request to update a bill"""
     name: Optional[str] = None
-    amount: Optional[str] = None
+    amount: Optional[MoneyStr] = None
     due_date: Optional[datetime] = None
     paid: Optional[str] = None  # yes, no, partial
     category: Optional[str] = None
@@ -50,6 +52,7 @@ class BillResponse(BaseModel):
     paid_at: Optional[datetime]
     name: str
     amount: str
+    amount_cents: Optional[int] = None
     due_date: datetime
     paid: str
     category: Optional[str]
@@ -233,14 +236,15 @@ async def get_upcoming_summary(
     """Get summary of upcoming bills"""
     now = datetime.utcnow()
     future_date = now + timedelta(days=days)
-    
-    upcoming_bills = db.query(Bill).filter(
+    upcoming = (
         Bill.due_date >= now,
         Bill.due_date <= future_date,
         Bill.paid == "no"
-    ).order_by(Bill.due_date.asc()).all()
+    )
+    
+    upcoming_bills = db.query(Bill).filter(*upcoming).order_by(Bill.due_date.asc()).all()
     
-    total_amount = sum(float(bill.amount.replace("$", "").replace(",", "")) for bill in upcoming_bills if bill.amount)
+    total_cents = db.query(func.coalesce(func.sum(Bill.amount_cents), 0)).filter(*upcoming).scalar()
     overdue_bills = db.query(Bill).filter(
         Bill.due_date < now,
         Bill.paid == "no"
@@ -248,7 +252,7 @@ async def get_upcoming_summary(
     
     return {
         "upcoming_count": len(upcoming_bills),
-        "total_amount": f"${total_amount:.2f}",
+        "total_amount": format_money(total_cents),
         "overdue_count": overdue_bills,
         "bills": [BillResponse.from_orm(bill).dict() for bill in upcoming_bills]
     }
@@ -6,11 +6,13 @@ Phase 3 — CONTROL_OTTO_PHASE3.md
 from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel
 from typing import Optional, List
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
 from database import get_db
 from models import Income
+from money import MoneyStr, format_money
 
 router = APIRouter(prefix="/income", tags=["income"])
 
@@ -18,7 +20,7 @@ router = APIRouter(prefix="/income", tags=["income"])
 class CreateIncomeRequest(BaseModel):
     """Request to create a new income entry"""
     source: str
-    amount: str
+    amount: MoneyStr
     received_date: datetime
     category: Optional[str] = None
     notes: Optional[str] = None
@@ -29,7 +31,7 @@ class CreateIncomeRequest(BaseModel):
 class UpdateIncomeRequest(BaseModel):
     """Request to update an income entry"""
     source: Optional[str] = None
-    amount: Optional[str] = None
+    amount: Optional[MoneyStr] = None
     received_date: Optional[datetime] = None
     category: Optional[str] = None
     notes: Optional[str] = None
@@ -45,6 +47,7 @@ class IncomeResponse(BaseModel):
     updated_at: datetime
     source: str
     amount: str
+    amount_cents: Optional[int] = None
     received_date: datetime
     category: Optional[str]
     notes: Optional[str]
@@ -188,7 +191,7 @@ async def get_income_by_period(
     year: Optional[int] = Query(None, description="Year (defaults to current year)"),
     db: Session = Depends(get_db)
 ):
-    """Get income summary by period"""
+    """Get income summary by period (one GROUP BY query)"""
     now = datetime.utcnow()
     if not year:
         year = now.year
@@ -214,26 +217,23 @@ async def get_income_by_period(
     else:
         raise HTTPException(status_code=400, detail="Invalid period. Use: monthly, quarterly, yearly")
     
-    income_list = db.query(Income).filter(
+    category = func.coalesce(func.nullif(Income.category, ""), "uncategorized").label("category")
+    rows = db.query(
+        category,
+        func.count(Income.id),
+        func.coalesce(func.sum(Income.amount_cents), 0)
+    ).filter(
         Income.received_date >= start_date,
         Income.received_date < end_date
-    ).all()
-    
-    total_amount = sum(float(inc.amount.replace("$", "").replace(",", "")) for inc in income_list if inc.amount)
-    
-    by_category = {}
-    for inc in income_list:
-        cat = inc.category or "uncategorized"
-        amount = float(inc.amount.replace("$", "").replace(",", "")) if inc.amount else 0
-        by_category[cat] = by_category.get(cat, 0) + amount
+    ).group_by(category).all()
     
     return {
         "period": period,
         "year": year,
         "start_date": start_date.isoformat(),
         "end_date": end_date.isoformat(),
-        "total_amount": f"${total_amount:.2f}",
-        "count": len(income_list),
-        "by_category": {k: f"${v:.2f}" for k, v in by_category.items()}
+        "total_amount": format_money(sum(cents for _, _, cents in rows)),
+        "count": sum(count for _, count, _ in rows),
+        "by_category": {cat: format_money(cents) for cat, _, cents in rows}
     }
 
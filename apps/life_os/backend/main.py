@@ -19,6 +19,9 @@ from categories import router as categories_router
 from otto_memory import router as otto_memory_router
 from activity_reporting import router as activity_reporting_router
 from database import init_db
+from memory_index import init_memory_index
+from money import init_money_columns
+from otto.task_queue import init_task_queue
 
 app = FastAPI(
     title="Life OS API",
@@ -37,6 +40,9 @@ app.add_middleware(
 
 # Initialize database
 init_db()
+init_memory_index()  # FTS5 + tag index for OttoMemory search (memory_index.py)
+init_money_columns()  # amount_cents + summary indexes on databases that predate them (money.py)
+init_task_queue()  # Queue columns/indexes on databases that predate them (otto/task_queue.py)
 
 # Include routers
 app.include_router(otto_router.router)
@@ -0,0 +1,226 @@
+"""
+OttoMemory search index
+
+Keeps two derived structures next to the otto_memory table:
+- otto_memory_fts: SQLite FTS5 index over memory content (rowid = memory id)
+- otto_memory_tags: one indexed row per tag (models.OttoMemoryTag)
+
+Every code path that creates, edits or deletes a memory calls
+index_memory() / unindex_memory() in the same transaction. For databases
+created before the index existed, run:
+
+    python -m memory_index rebuild
+"""
+
+import logging
+import re
+import sys
+from typing import Iterable, List, Optional
+
+from sqlalchemy import Float, Integer, select, text
+from sqlalchemy.orm import Query, Session
+
+from models import OttoMemory, OttoMemoryTag
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "otto_memory_fts"
+
+# Engines (by URL) where the FTS5 table is known to exist
+_fts_ready = set()
+
+
+def _has_fts(db: Session) -> bool:
+    """True if the FTS5 table exists (checked once per database)"""
+    bind = db.get_bind()
+    key = str(bind.url)
+    if key in _fts_ready:
+        return True
+    if bind.dialect.name != "sqlite":
+        return False
+    exists = db.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE}
+    ).first()
+    if exists:
+        _fts_ready.add(key)
+    return bool(exists)
+
+
+def create_fts_table(db: Session) -> bool:
+    """
+    Create the FTS5 table if it doesn't exist.
+    
+    Returns False if this SQLite build has no FTS5 (search then falls back to LIKE).
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        return False
+    try:
+        db.execute(text(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+            "USING fts5(content, tokenize = 'porter unicode61')"
+        ))
+        db.commit()
+    except Exception:
+        db.rollback()
+        return False
+    return _has_fts(db)
+
+
+def _normalize_tags(tags: Optional[Iterable]) -> List[str]:
+    if not tags:
+        return []
+    if isinstance(tags, str):
+        tags = [tags]
+    return list(dict.fromkeys(str(tag) for tag in tags if tag is not None))
+
+
+def _insert_index_rows(db: Session, rows: List[tuple]):
+    """Insert (memory_id, content, tags) rows into the tag table and FTS index"""
+    tag_rows = [
+        {"memory_id": memory_id, "tag": tag}
+        for memory_id, _, tags in rows
+        for tag in _normalize_tags(tags)
+    ]
+    if tag_rows:
+        db.execute(OttoMemoryTag.__table__.insert(), tag_rows)
+    if rows and _has_fts(db):
+        db.execute(
+            text(f"INSERT INTO {FTS_TABLE} (rowid, content) VALUES (:id, :content)"),
+            [{"id": memory_id, "content": content or ""} for memory_id, content, _ in rows]
+        )
+
+
+def index_memory(db: Session, memory: OttoMemory):
+    """
+    (Re)index one memory's content and tags. Call after changing them,
+    before commit; flushes so a new memory has its id.
+    """
+    if memory.id is None:
+        db.flush()
+    unindex_memory(db, memory.id)
+    _insert_index_rows(db, [(memory.id, memory.content, memory.tags)])
+
+
+def unindex_memory(db: Session, memory_id: int):
+    """Remove a memory from the index (call alongside db.delete)"""
+    db.query(OttoMemoryTag).filter(OttoMemoryTag.memory_id == memory_id).delete(synchronize_session=False)
+    if _has_fts(db):
+        db.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), {"id": memory_id})
+
+
+def filter_by_tag(query: Query, tag: str) -> Query:
+    """Restrict an OttoMemory query to memories carrying a tag (uses the tag index)"""
+    return query.filter(
+        OttoMemory.id.in_(select(OttoMemoryTag.memory_id).where(OttoMemoryTag.tag == tag))
+    )
+
+
+def _match_expression(q: str) -> Optional[str]:
+    """
+    FTS5 MATCH expression for free text: every word must match, as a
+    prefix, so "vend tks" finds "Vendor TKS ...". Quoting each word keeps
+    user input from being parsed as FTS syntax.
+    """
+    words = re.findall(r"\w+", q, flags=re.UNICODE)
+    if not words:
+        return None
+    return " AND ".join(f'"{word}"*' for word in words)
+
+
+def search_query(db: Session, query: Query, q: str) -> Query:
+    """
+    Apply a text search to an OttoMemory query, ranked by relevance
+    (FTS5 bm25) when the index is available, else a substring match.
+    """
+    expression = _match_expression(q)
+    if expression is None or not _has_fts(db):
+        return query.filter(OttoMemory.content.contains(q)).order_by(OttoMemory.created_at.desc())
+    
+    matches = text(
+        f"SELECT rowid AS memory_id, bm25({FTS_TABLE}) AS rank FROM {FTS_TABLE} "
+        f"WHERE {FTS_TABLE} MATCH :expression"
+    ).bindparams(expression=expression).columns(memory_id=Integer, rank=Float).subquery()
+    # bm25 is lower-is-better; break ties by recency
+    return query.join(matches, matches.c.memory_id == OttoMemory.id).order_by(
+        matches.c.rank, OttoMemory.created_at.desc()
+    )
+
+
+def index_is_current(db: Session) -> bool:
+    """Cheap check that every memory is indexed (row counts match)"""
+    memories = db.query(OttoMemory).count()
+    if _has_fts(db):
+        indexed = db.execute(text(f"SELECT count(*) FROM {FTS_TABLE}")).scalar()
+        if indexed != memories:
+            return False
+    tagged = db.execute(text(
+        "SELECT count(*) FROM otto_memory WHERE tags IS NOT NULL AND json_array_length(tags) > 0"
+    )).scalar()
+    return tagged == db.query(OttoMemoryTag.memory_id).distinct().count()
+
+
+def rebuild_memory_index(db: Session) -> dict:
+    """Rebuild the tag table and FTS index from otto_memory"""
+    create_fts_table(db)
+    db.query(OttoMemoryTag).delete(synchronize_session=False)
+    if _has_fts(db):
+        db.execute(text(f"DELETE FROM {FTS_TABLE}"))
+    
+    rows = db.query(OttoMemory.id, OttoMemory.content, OttoMemory.tags).all()
+    _insert_index_rows(db, [tuple(row) for row in rows])
+    db.commit()
+    
+    return {
+        "memories": len(rows),
+        "tags": db.query(OttoMemoryTag).count(),
+        "fts": _has_fts(db)
+    }
+
+
+def ensure_memory_index(db: Session) -> Optional[dict]:
+    """Create the index on startup and backfill it if it's behind"""
+    create_fts_table(db)
+    if not index_is_current(db):
+        return rebuild_memory_index(db)
+    return None
+
+
+def init_memory_index():
+    """Startup hook: ensure_memory_index() with its own session"""
+    from database import SessionLocal
+    
+    db = SessionLocal()
+    try:
+        stats = ensure_memory_index(db)
+        if stats:
+            logger.info(f"Rebuilt OttoMemory search index: {stats['memories']} memories, {stats['tags']} tags")
+    finally:
+        db.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: python -m memory_index rebuild"""
+    import argparse
+    from database import SessionLocal, init_db
+    
+    parser = argparse.ArgumentParser(description="Manage the OttoMemory search index")
+    parser.add_argument("command", choices=["rebuild", "check"])
+    args = parser.parse_args(argv)
+    
+    init_db()
+    db = SessionLocal()
+    try:
+        if args.command == "rebuild":
+            stats = rebuild_memory_index(db)
+            print(f"Indexed {stats['memories']} memories ({stats['tags']} tags, FTS5: {'yes' if stats['fts'] else 'unavailable'})")
+            return 0
+        current = index_is_current(db)
+        print("Index is current" if current else "Index is out of date - run: python -m memory_index rebuild")
+        return 0 if current else 1
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Add OttoMemory search index
+
+Revision ID: 003_add_memory_search_index
+Revises: 002_add_activity_reports
+Create Date: 2025-01-XX
+
+Adds otto_memory_tags (normalized, indexed tags) and the otto_memory_fts
+FTS5 table, and backfills both from otto_memory. See memory_index.py;
+`python -m memory_index rebuild` does the same backfill on demand.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003_add_memory_search_index'
+down_revision: Union[str, None] = '002_add_activity_reports'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create otto_memory_tags and otto_memory_fts, then backfill"""
+    op.create_table(
+        'otto_memory_tags',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('memory_id', sa.Integer(), sa.ForeignKey('otto_memory.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('tag', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_otto_memory_tags_memory_id', 'otto_memory_tags', ['memory_id'])
+    op.create_index('ix_otto_memory_tags_tag_memory', 'otto_memory_tags', ['tag', 'memory_id'])
+    
+    # Backfill tags from the JSON column
+    op.execute(
+        "INSERT INTO otto_memory_tags (memory_id, tag) "
+        "SELECT DISTINCT otto_memory.id, tags.value FROM otto_memory, json_each(otto_memory.tags) AS tags "
+        "WHERE otto_memory.tags IS NOT NULL AND json_type(otto_memory.tags) = 'array' AND tags.value IS NOT NULL"
+    )
+    
+    # FTS5 index over content (SQLite only)
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS otto_memory_fts "
+            "USING fts5(content, tokenize = 'porter unicode61')"
+        )
+        op.execute("INSERT INTO otto_memory_fts (rowid, content) SELECT id, content FROM otto_memory")
+
+
+def downgrade() -> None:
+    """Drop the OttoMemory search index"""
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("DROP TABLE IF EXISTS otto_memory_fts")
+    op.drop_index('ix_otto_memory_tags_tag_memory', table_name='otto_memory_tags')
+    op.drop_index('ix_otto_memory_tags_memory_id', table_name='otto_memory_tags')
+    op.drop_table('otto_memory_tags')
@@ -0,0 +1,46 @@
+"""Add Otto task queue columns
+
+Revision ID: 004_add_task_queue
+Revises: 003_add_memory_search_index
+Create Date: 2025-01-XX
+
+Adds priority and lease columns to otto_tasks and lease columns to
+otto_events, plus the indexes the workers' claim queries use. See
+otto/task_queue.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004_add_task_queue'
+down_revision: Union[str, None] = '003_add_memory_search_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add queue columns and claim indexes"""
+    op.add_column('otto_tasks', sa.Column('priority', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('otto_tasks', sa.Column('locked_by', sa.String(), nullable=True))
+    op.add_column('otto_tasks', sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+    op.create_index('ix_otto_tasks_queue', 'otto_tasks', ['status', sa.text('priority DESC'), 'next_run_at'])
+    
+    op.add_column('otto_events', sa.Column('locked_by', sa.String(), nullable=True))
+    op.add_column('otto_events', sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+    op.create_index('ix_otto_events_queue', 'otto_events', ['status', 'id'])
+
+
+def downgrade() -> None:
+    """Drop queue columns and indexes"""
+    op.drop_index('ix_otto_events_queue', table_name='otto_events')
+    with op.batch_alter_table('otto_events') as batch_op:
+        batch_op.drop_column('lease_expires_at')
+        batch_op.drop_column('locked_by')
+    
+    op.drop_index('ix_otto_tasks_queue', table_name='otto_tasks')
+    with op.batch_alter_table('otto_tasks') as batch_op:
+        batch_op.drop_column('lease_expires_at')
+        batch_op.drop_column('locked_by')
+        batch_op.drop_column('priority')
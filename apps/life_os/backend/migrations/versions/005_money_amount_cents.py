@@ -0,0 +1,43 @@
+"""Store money amounts as integer cents
+
+Revision ID: 005_money_amount_cents
+Revises: 004_add_task_queue
+Create Date: 2025-01-XX
+
+Adds amount_cents to bills, income and transactions, backfills it by
+parsing the existing amount strings, and adds the date/category indexes
+the summary endpoints group by. See money.py.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from money import MONEY_INDEXES, MONEY_TABLES, _backfill
+
+# revision identifiers, used by Alembic.
+revision: str = '005_money_amount_cents'
+down_revision: Union[str, None] = '004_add_task_queue'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add amount_cents, backfill it, and index the summary columns"""
+    for table in MONEY_TABLES:
+        op.add_column(table, sa.Column('amount_cents', sa.BigInteger(), nullable=True))
+        # Amounts that don't parse stay NULL and are left out of totals (logged)
+        _backfill(op.get_bind(), table)
+    
+    for name, (table, columns) in MONEY_INDEXES.items():
+        op.create_index(name, table, [column.strip() for column in columns.split(",")])
+
+
+def downgrade() -> None:
+    """Drop amount_cents and the summary indexes"""
+    for name, (table, _) in MONEY_INDEXES.items():
+        op.drop_index(name, table_name=table)
+    
+    for table in MONEY_TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('amount_cents')
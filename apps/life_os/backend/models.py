@@ -2,10 +2,11 @@
 Life OS data models
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey, Boolean, Date, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, BigInteger, String, Text, DateTime, JSON, ForeignKey, Boolean, Date, Float, Index
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from database import Base
+from money import parse_money
 
 
 class Household(Base):
@@ -101,6 +102,16 @@ class OttoTask(Base):
     max_retries = Column(Integer, nullable=False, default=3)
     next_retry_at = Column(DateTime, nullable=True)
     requires_approval = Column(String, nullable=True)  # approval_id if pending approval
+    
+    # Queue fields (otto/task_queue.py)
+    priority = Column(Integer, nullable=False, default=0, server_default="0")  # Higher runs first
+    locked_by = Column(String, nullable=True)  # Worker holding the lease
+    lease_expires_at = Column(DateTime, nullable=True)  # Lease is up for grabs after this
+    
+    __table_args__ = (
+        # Serves the worker's claim query: ready statuses, by priority, then schedule
+        Index("ix_otto_tasks_queue", "status", priority.desc(), "next_run_at"),
+    )
 
 
 class LifeOSTask(Base):
@@ -137,7 +148,8 @@ class Bill(Base):
     household_id = Column(Integer, ForeignKey("households.id"), nullable=False)
     
     name = Column(String, nullable=False)  # e.g., "Electric Bill", "Internet"
-    amount = Column(String, nullable=False)  # Store as string to handle currency formatting
+    amount = Column(String, nullable=False)  # As entered, for display (e.g. "$120.00")
+    amount_cents = Column(BigInteger, nullable=True)  # Same amount in cents, for totals (money.py)
     due_date = Column(DateTime, nullable=False)
     paid = Column(String, nullable=False, default="no")  # yes, no, partial
     
@@ -150,6 +162,15 @@ class Bill(Base):
     is_recurring = Column(String, nullable=False, default="no")  # yes, no
     recurrence_frequency = Column(String, nullable=True)  # monthly, quarterly, yearly
     next_due_date = Column(DateTime, nullable=True)  # For recurring bills
+    
+    __table_args__ = (
+        Index("ix_bills_paid_due_date", "paid", "due_date"),
+    )
+    
+    @validates("amount")
+    def _set_amount_cents(self, key, value):
+        self.amount_cents = parse_money(value)
+        return value
 
 
 class CalendarEvent(Base):
@@ -199,7 +220,8 @@ class Income(Base):
     user_id = Column(Integer, ForeignKey("user_profiles.id"), nullable=True)  # Who received the income
     
     source = Column(String, nullable=False)  # e.g., "Salary", "Freelance", "Investment"
-    amount = Column(String, nullable=False)  # Store as string to handle currency formatting
+    amount = Column(String, nullable=False)  # As entered, for display (e.g. "$2,500.00")
+    amount_cents = Column(BigInteger, nullable=True)  # Same amount in cents, for totals (money.py)
     received_date = Column(DateTime, nullable=False)
     category = Column(String, nullable=True)  # For tax purposes: "wages", "self_employment", "investment", etc.
     notes = Column(Text, nullable=True)
@@ -208,6 +230,16 @@ class Income(Base):
     is_recurring = Column(String, nullable=False, default="no")  # yes, no
     recurrence_frequency = Column(String, nullable=True)  # monthly, quarterly, yearly
     next_expected_date = Column(DateTime, nullable=True)  # For recurring income
+    
+    __table_args__ = (
+        Index("ix_income_received_date", "received_date"),
+        Index("ix_income_category_received_date", "category", "received_date"),
+    )
+    
+    @validates("amount")
+    def _set_amount_cents(self, key, value):
+        self.amount_cents = parse_money(value)
+        return value
 
 
 class Category(Base):
@@ -252,7 +284,8 @@ class Transaction(Base):
     user_id = Column(Integer, ForeignKey("user_profiles.id"), nullable=True)  # Who made the transaction
     
     date = Column(DateTime, nullable=False)
-    amount = Column(String, nullable=False)  # Store as string, negative for expenses, positive for income
+    amount = Column(String, nullable=False)  # As entered, negative for expenses, positive for income
+    amount_cents = Column(BigInteger, nullable=True)  # Same amount in cents, for totals (money.py)
     vendor = Column(String, nullable=True)  # Vendor/merchant name
     description = Column(Text, nullable=True)
     
@@ -268,6 +301,16 @@ class Transaction(Base):
     # Additional metadata
     notes = Column(Text, nullable=True)
     tags = Column(JSON, nullable=True)  # Array of tags for filtering
+    
+    __table_args__ = (
+        Index("ix_transactions_date", "date"),
+        Index("ix_transactions_tax_category_date", "tax_category", "date"),
+    )
+    
+    @validates("amount")
+    def _set_amount_cents(self, key, value):
+        self.amount_cents = parse_money(value)
+        return value
 
 
 class OttoEvent(Base):
@@ -286,6 +329,14 @@ class OttoEvent(Base):
     
     status = Column(String, nullable=False, default="pending")  # pending, processing, done, error
     error = Column(Text, nullable=True)
+    
+    # Queue fields (otto/task_queue.py)
+    locked_by = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        Index("ix_otto_events_queue", "status", "id"),
+    )
 
 
 class OttoMemory(Base):
@@ -320,6 +371,23 @@ class OttoMemory(Base):
     stale_reason = Column(Text, nullable=True)
 
 
+class OttoMemoryTag(Base):
+    """
+    Normalized, indexed copy of OttoMemory.tags (one row per tag)
+    
+    Kept in sync by memory_index.index_memory(); lets tag filters use an
+    index instead of scanning the JSON column of every memory.
+    """
+    __tablename__ = "otto_memory_tags"
+    __table_args__ = (
+        Index("ix_otto_memory_tags_tag_memory", "tag", "memory_id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    memory_id = Column(Integer, ForeignKey("otto_memory.id", ondelete="CASCADE"), nullable=False, index=True)
+    tag = Column(String, nullable=False)
+
+
 class OttoMemoryHistory(Base):
     """
     Model for OttoMemory version history
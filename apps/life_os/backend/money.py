@@ -0,0 +1,128 @@
+"""
+Money amounts for the Life OS finance tables
+
+Bills, income and transactions keep `amount` exactly as entered (e.g.
+"$1,234.56") for display, plus the same value as integer cents in
+`amount_cents`. The models fill amount_cents whenever amount is set,
+and summaries add up amount_cents in SQL instead of re-parsing strings.
+
+For databases created before amount_cents existed, the app adds and
+backfills the column at startup (migration 005 does the same).
+"""
+
+import logging
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Annotated, Any, Optional
+
+from pydantic import AfterValidator
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Tables with an amount / amount_cents pair, and the indexes their summaries use
+MONEY_TABLES = ("bills", "income", "transactions")
+MONEY_INDEXES = {
+    "ix_bills_paid_due_date": ("bills", "paid, due_date"),
+    "ix_income_received_date": ("income", "received_date"),
+    "ix_income_category_received_date": ("income", "category, received_date"),
+    "ix_transactions_date": ("transactions", "date"),
+    "ix_transactions_tax_category_date": ("transactions", "tax_category, date"),
+}
+
+BACKFILL_BATCH = 1000
+
+
+def parse_money(value: Any) -> int:
+    """
+    Amount -> integer cents: "$1,234.56" -> 123456, "-12" / "(12.00)" -> -1200.
+    
+    Raises ValueError if the value isn't an amount.
+    """
+    if value is None or isinstance(value, bool):
+        raise ValueError(f"Invalid amount: {value!r}")
+    if isinstance(value, int):
+        return value * 100
+    
+    text_value = str(value).strip()
+    negative = text_value.startswith("(") and text_value.endswith(")")
+    if negative:
+        text_value = text_value[1:-1]
+    text_value = text_value.replace("$", "").replace(",", "").replace(" ", "")
+    try:
+        amount = Decimal(text_value)
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {value!r}")
+    if not amount.is_finite():
+        raise ValueError(f"Invalid amount: {value!r}")
+    
+    cents = int((amount * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP))
+    return -cents if negative else cents
+
+
+def format_money(cents: Optional[int]) -> str:
+    """Integer cents -> "$1234.56" (the format the summary endpoints return)"""
+    return f"${Decimal(cents or 0).scaleb(-2):.2f}"
+
+
+def _check_money(value: str) -> str:
+    parse_money(value)
+    return value
+
+
+# Request field type: a string that must parse as an amount (422 otherwise)
+MoneyStr = Annotated[str, AfterValidator(_check_money)]
+
+
+def _backfill(connection, table: str) -> int:
+    """Fill amount_cents for rows that don't have it yet; returns rows still unparseable"""
+    unparseable = 0
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            text(f"SELECT id, amount FROM {table} WHERE amount_cents IS NULL AND id > :last_id ORDER BY id LIMIT :limit"),
+            {"last_id": last_id, "limit": BACKFILL_BATCH}
+        ).fetchall()
+        if not rows:
+            return unparseable
+        updates = []
+        for row_id, amount in rows:
+            try:
+                updates.append({"id": row_id, "cents": parse_money(amount)})
+            except ValueError:
+                unparseable += 1
+                logger.warning(f"{table} #{row_id}: amount {amount!r} is not a number; left out of totals")
+        if updates:
+            connection.execute(text(f"UPDATE {table} SET amount_cents = :cents WHERE id = :id"), updates)
+        last_id = rows[-1][0]
+
+
+def ensure_money_columns(engine: Engine):
+    """
+    Add and backfill amount_cents, and create the summary indexes, on
+    SQLite databases that predate them. create_all() never alters
+    existing tables; with Alembic, migration 005_money_amount_cents
+    does the same.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.begin() as connection:
+        tables = set(inspect(connection).get_table_names())
+        for table in MONEY_TABLES:
+            if table not in tables:
+                continue
+            columns = {column["name"] for column in inspect(connection).get_columns(table)}
+            if "amount_cents" not in columns:
+                connection.execute(text(f"ALTER TABLE {table} ADD COLUMN amount_cents BIGINT"))
+                logger.info(f"Added {table}.amount_cents")
+            _backfill(connection, table)
+        for name, (table, columns) in MONEY_INDEXES.items():
+            if table in tables:
+                connection.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+
+
+def init_money_columns():
+    """Startup hook: ensure_money_columns() on the app database"""
+    from database import engine
+    
+    ensure_money_columns(engine)
@@ -1313,6 +1313,7 @@ def _handle_memory_create(db: Session, payload: Dict[str, Any], context: Dict[st
     try:
         from models import OttoMemory
         from otto.context import get_default_context
+        from memory_index import index_memory
         
         category = payload.get("category")
         content = payload.get("content")
@@ -1341,6 +1342,7 @@ def _handle_memory_create(db: Session, payload: Dict[str, Any], context: Dict[st
         )
         
         db.add(new_memory)
+        index_memory(db, new_memory)
         db.commit()
         db.refresh(new_memory)
         
@@ -1379,6 +1381,7 @@ def _handle_memory_update(db: Session, payload: Dict[str, Any], context: Dict[st
     try:
         from models import OttoMemory, OttoMemoryHistory
         from otto.context import get_default_context
+        from memory_index import index_memory
         
         memory_id = payload.get("id")
         if not memory_id:
@@ -1439,6 +1442,9 @@ def _handle_memory_update(db: Session, payload: Dict[str, Any], context: Dict[st
         memory.version += 1
         memory.updated_at = datetime.utcnow()
         
+        if payload.get("content") is not None or payload.get("tags") is not None:
+            index_memory(db, memory)
+        
         db.commit()
         db.refresh(memory)
         
@@ -1725,6 +1731,7 @@ def _handle_memory_delete(db: Session, payload: Dict[str, Any], context: Dict[st
     try:
         from models import OttoMemory, OttoMemoryHistory
         from otto.context import get_default_context
+        from memory_index import unindex_memory
         
         memory_id = payload.get("id")
         if not memory_id:
@@ -1763,6 +1770,7 @@ def _handle_memory_delete(db: Session, payload: Dict[str, Any], context: Dict[st
         )
         db.add(history_entry)
         
+        unindex_memory(db, memory.id)
         db.delete(memory)
         db.commit()
         
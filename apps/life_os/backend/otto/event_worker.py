@@ -3,45 +3,58 @@ Otto Event Worker - Processes pending events
 Phase 2.5 — CONTROL_OTTO_PHASE2_5_FOUNDATIONS.md
 """
 
-import time
+import os
+from typing import Optional
 from sqlalchemy.orm import Session
-from datetime import datetime
 
-from models import OttoEvent
 from otto.events import process_event
-from database import SessionLocal
+from otto.task_queue import (
+    claim_next_event, release_event, recover_expired_leases,
+    get_queue_signal, make_worker_id, init_task_queue, start_queue_watcher
+)
+from database import SessionLocal, engine
 
 
-def run_event_worker(interval_seconds: int = 5, max_iterations: Optional[int] = None):
+# Longest an idle worker sleeps without a wake-up (backstop for missed notifications)
+EVENT_WORKER_INTERVAL = int(os.getenv("OTTO_EVENT_WORKER_INTERVAL", "30"))  # seconds
+
+
+def run_event_worker(interval_seconds: int = EVENT_WORKER_INTERVAL, max_iterations: Optional[int] = None):
     """
     Run the event worker loop.
     
-    Fetches pending events and processes them.
+    Claims pending events one at a time (safe to run several workers)
+    and processes them. When there are none it sleeps until emit_event()
+    commits a new one.
     
     Args:
-        interval_seconds: Seconds to wait between checks
+        interval_seconds: Longest to wait for a wake-up before checking again
         max_iterations: Maximum iterations (None = run forever)
     """
+    worker_id = make_worker_id("events")
+    signal = get_queue_signal()
+    start_queue_watcher(engine)
     iteration = 0
     
     while max_iterations is None or iteration < max_iterations:
+        # Read before looking for work so a notify during the claim isn't missed
+        seen = signal.generation
+        event = None
         db: Session = SessionLocal()
         try:
-            # Fetch pending events
-            pending_events = db.query(OttoEvent).filter(
-                OttoEvent.status == "pending"
-            ).limit(10).all()
-            
-            for event in pending_events:
+            event = claim_next_event(db, worker_id)
+            if event is None:
+                # Idle: re-queue events whose worker died mid-run
+                recover_expired_leases(db)
+            else:
+                event_id = event.id
                 try:
                     process_event(db, event)
                 except Exception as e:
-                    print(f"Error processing event {event.id}: {e}")
+                    print(f"Error processing event {event_id}: {e}")
                     # Event status already set to "error" in process_event
-                    db.rollback()
-                    continue
-            
-            db.commit()
+                finally:
+                    release_event(db, event_id, worker_id)
         
         except Exception as e:
             print(f"Error in event worker: {e}")
@@ -50,12 +63,9 @@ def run_event_worker(interval_seconds: int = 5, max_iterations: Optional[int] =
         finally:
             db.close()
         
-        if pending_events:
-            # If we processed events, check again immediately
-            time.sleep(1)
-        else:
-            # No events, wait longer
-            time.sleep(interval_seconds)
+        if event is None:
+            # No events, wait for the next one
+            signal.wait(seen, interval_seconds)
         
         iteration += 1
 
@@ -63,5 +73,5 @@ def run_event_worker(interval_seconds: int = 5, max_iterations: Optional[int] =
 if __name__ == "__main__":
     # Run worker
     print("Starting Otto Event Worker...")
+    init_task_queue()
     run_event_worker()
-
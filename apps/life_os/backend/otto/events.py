@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 
 from models import OttoEvent
+from otto.task_queue import notify_queue
 
 
 def emit_event(
@@ -31,6 +32,8 @@ def emit_event(
     
     Returns:
         Created OttoEvent
+    
+    Event workers are woken as soon as the caller commits.
     """
     event = OttoEvent(
         household_id=household_id,
@@ -43,6 +46,7 @@ def emit_event(
     
     db.add(event)
     db.flush()  # Don't commit here - let caller commit
+    notify_queue(db)
     
     return event
 
@@ -0,0 +1,423 @@
+"""
+Otto Task Queue - claim-with-lease over OttoTask / OttoEvent
+
+Workers used to poll on a fixed interval. This module lets them block
+until there is work instead:
+
+- Wake-ups: any commit that inserts or re-queues an OttoTask / OttoEvent
+  (emit_event, process_event, the tasks API, ...) notifies the queue
+  signal after it commits. Other processes sharing the SQLite file are
+  woken by a watcher on `PRAGMA data_version`, which only reads the
+  database header, never the tables.
+- Claims: a worker takes a row by setting locked_by / lease_expires_at
+  with a conditional UPDATE that only succeeds while the lease is free,
+  so any number of workers (threads or processes) can share the tables.
+- Leases: a worker renews its task leases while they run (renew_lease);
+  a worker that dies leaves its lease to expire, and
+  recover_expired_leases() puts the row back in the queue.
+- Ordering: priority (highest first), then next_run_at, served by
+  ix_otto_tasks_queue.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import event, inspect, or_, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from models import OttoEvent, OttoTask
+
+logger = logging.getLogger(__name__)
+
+# Seconds a claimed row stays locked unless renewed (OTTO_QUEUE_LEASE_SECONDS); the worker
+# renews task leases while they run, so this only bounds how long a dead worker's rows stay locked
+LEASE_SECONDS = int(os.getenv("OTTO_QUEUE_LEASE_SECONDS", "300"))
+# Seconds between cross-process change checks (OTTO_QUEUE_WATCH_INTERVAL)
+WATCH_INTERVAL = float(os.getenv("OTTO_QUEUE_WATCH_INTERVAL", "0.25"))
+
+TASK_READY_STATUSES = ("pending", "approved")
+EVENT_READY_STATUS = "pending"
+
+# Candidate rows fetched per claim attempt
+CLAIM_BATCH = 20
+
+_NOTIFY_KEY = "otto_queue_notify"
+
+
+class QueueSignal:
+    """
+    Wake-up signal for idle workers.
+    
+    Read `generation` before looking for work and pass it to wait(); a
+    notify() that lands in between makes wait() return immediately, so
+    no wake-up is lost.
+    """
+    
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._generation = 0
+        self._listeners = set()
+    
+    @property
+    def generation(self) -> int:
+        with self._condition:
+            return self._generation
+    
+    def notify(self):
+        with self._condition:
+            self._generation += 1
+            self._condition.notify_all()
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener()
+    
+    def wait(self, seen: int, timeout: Optional[float] = None) -> bool:
+        """Block until notified after `seen` (or timeout); True if notified"""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._generation != seen, timeout)
+    
+    async def wait_async(self, seen: int, timeout: Optional[float] = None) -> bool:
+        """wait() for asyncio code, without tying up a thread"""
+        loop = asyncio.get_running_loop()
+        woken = asyncio.Event()
+        
+        def listener():
+            loop.call_soon_threadsafe(woken.set)
+        
+        with self._condition:
+            if self._generation != seen:
+                return True
+            self._listeners.add(listener)
+        try:
+            await asyncio.wait_for(woken.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._condition:
+                self._listeners.discard(listener)
+
+
+_signal = QueueSignal()
+
+
+def get_queue_signal() -> QueueSignal:
+    """The process-wide queue signal"""
+    return _signal
+
+
+def notify_queue(db: Optional[Session] = None):
+    """
+    Wake idle workers. With a session, the wake-up is deferred until it
+    commits (a worker can't see uncommitted rows anyway).
+    """
+    if db is None:
+        _signal.notify()
+    else:
+        db.info[_NOTIFY_KEY] = True
+
+
+def _is_ready(obj) -> bool:
+    if isinstance(obj, OttoTask):
+        return obj.status in TASK_READY_STATUSES
+    if isinstance(obj, OttoEvent):
+        return obj.status == EVENT_READY_STATUS
+    return False
+
+
+@event.listens_for(Session, "after_flush")
+def _note_queue_writes(session: Session, flush_context):
+    # new/dirty still hold the flushed objects at this point
+    if any(_is_ready(obj) for obj in session.new) or any(_is_ready(obj) for obj in session.dirty):
+        session.info[_NOTIFY_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_after_commit(session: Session):
+    if session.info.pop(_NOTIFY_KEY, False):
+        _signal.notify()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_notify(session: Session):
+    session.info.pop(_NOTIFY_KEY, None)
+
+
+class DataVersionWatcher:
+    """
+    Notifies the queue signal when another connection commits to the
+    SQLite file (e.g. the API server inserting an event the worker
+    process should pick up). SQLite has no LISTEN/NOTIFY;
+    `PRAGMA data_version` is the cheap substitute.
+    """
+    
+    def __init__(self, database_path: str, interval: float = WATCH_INTERVAL):
+        self.database_path = database_path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="otto-queue-watcher", daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        self._stop.set()
+    
+    def _run(self):
+        connection = sqlite3.connect(self.database_path, check_same_thread=False)
+        try:
+            last = None
+            while not self._stop.is_set():
+                try:
+                    version = connection.execute("PRAGMA data_version").fetchone()[0]
+                except sqlite3.Error as e:
+                    logger.warning(f"Queue watcher could not read data_version: {e}")
+                    version = last
+                if last is not None and version != last:
+                    _signal.notify()
+                last = version
+                self._stop.wait(self.interval)
+        finally:
+            connection.close()
+
+
+_watcher: Optional[DataVersionWatcher] = None
+_watcher_lock = threading.Lock()
+
+
+def start_queue_watcher(engine: Engine) -> bool:
+    """Start the cross-process watcher (SQLite file databases only)"""
+    global _watcher
+    if engine.dialect.name != "sqlite" or not engine.url.database or engine.url.database == ":memory:":
+        return False
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = DataVersionWatcher(engine.url.database)
+            _watcher.start()
+    return True
+
+
+def stop_queue_watcher():
+    global _watcher
+    with _watcher_lock:
+        if _watcher is not None:
+            _watcher.stop()
+            _watcher = None
+
+
+def make_worker_id(prefix: str = "worker") -> str:
+    """Unique lease owner name, e.g. "worker-myhost-1234-3f2a9c" """
+    return f"{prefix}-{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+def _lease_free(model, now: datetime):
+    return or_(model.lease_expires_at.is_(None), model.lease_expires_at < now)
+
+
+def _try_lease(db: Session, model, row_id: int, worker_id: str, now: datetime, lease_seconds: int, ready) -> bool:
+    """Compare-and-set the lease on one row; True if this worker got it"""
+    claimed = db.query(model).filter(
+        model.id == row_id,
+        ready,
+        _lease_free(model, now)
+    ).update(
+        {model.locked_by: worker_id, model.lease_expires_at: now + timedelta(seconds=lease_seconds)},
+        synchronize_session=False
+    )
+    db.commit()
+    return claimed == 1
+
+
+def claim_next_task(
+    db: Session,
+    worker_id: str,
+    lease_seconds: int = LEASE_SECONDS,
+    accept: Optional[Callable[[OttoTask], bool]] = None
+) -> Optional[OttoTask]:
+    """
+    Lease the next ready OttoTask (highest priority, then earliest
+    next_run_at) to worker_id. Tasks rejected by `accept` are skipped
+    but stay in the queue. Returns None if nothing is ready.
+    """
+    offset = 0
+    while True:
+        now = datetime.utcnow()
+        ready = OttoTask.status.in_(TASK_READY_STATUSES)
+        candidates = db.query(OttoTask).filter(
+            ready,
+            or_(OttoTask.next_run_at.is_(None), OttoTask.next_run_at <= now),
+            OttoTask.retries < OttoTask.max_retries,
+            _lease_free(OttoTask, now)
+        ).order_by(
+            OttoTask.priority.desc(), OttoTask.next_run_at, OttoTask.id
+        ).offset(offset).limit(CLAIM_BATCH).all()
+        
+        candidate_ids = [task.id for task in candidates if accept is None or accept(task)]
+        db.rollback()  # End the read before writing
+        
+        for task_id in candidate_ids:
+            if _try_lease(db, OttoTask, task_id, worker_id, now, lease_seconds, ready):
+                return db.get(OttoTask, task_id)
+        
+        if len(candidates) < CLAIM_BATCH:
+            return None
+        # Rejected tasks stay in the queue (skip past them); ones taken by other workers drop out
+        offset += len(candidates) - len(candidate_ids)
+
+
+def claim_next_event(db: Session, worker_id: str, lease_seconds: int = LEASE_SECONDS) -> Optional[OttoEvent]:
+    """Lease the oldest pending OttoEvent to worker_id; None if there is none"""
+    while True:
+        now = datetime.utcnow()
+        ready = OttoEvent.status == EVENT_READY_STATUS
+        candidate_ids = [row.id for row in db.query(OttoEvent.id).filter(
+            ready,
+            _lease_free(OttoEvent, now)
+        ).order_by(OttoEvent.id).limit(CLAIM_BATCH).all()]
+        db.rollback()
+        
+        if not candidate_ids:
+            return None
+        for event_id in candidate_ids:
+            if _try_lease(db, OttoEvent, event_id, worker_id, now, lease_seconds, ready):
+                return db.get(OttoEvent, event_id)
+
+
+def _release(db: Session, model, row_id: int, worker_id: str):
+    db.rollback()  # Drop anything the handler left half-done
+    db.query(model).filter(model.id == row_id, model.locked_by == worker_id).update(
+        {model.locked_by: None, model.lease_expires_at: None},
+        synchronize_session=False
+    )
+    db.commit()
+
+
+def release_task(db: Session, task_id: int, worker_id: str):
+    """Give up the lease on a task (no-op if it was lost to another worker)"""
+    _release(db, OttoTask, task_id, worker_id)
+
+
+def release_event(db: Session, event_id: int, worker_id: str):
+    """Give up the lease on an event"""
+    _release(db, OttoEvent, event_id, worker_id)
+
+
+def renew_lease(db: Session, model, row_id: int, worker_id: str, lease_seconds: int = LEASE_SECONDS) -> bool:
+    """Extend a lease for long-running work; False if the lease was lost"""
+    renewed = db.query(model).filter(model.id == row_id, model.locked_by == worker_id).update(
+        {model.lease_expires_at: datetime.utcnow() + timedelta(seconds=lease_seconds)},
+        synchronize_session=False
+    )
+    db.commit()
+    return renewed == 1
+
+
+def recover_expired_leases(db: Session) -> int:
+    """
+    Re-queue rows whose worker died mid-run.
+    
+    A task stuck in "running" counts as a failed attempt (it may have
+    partly run), so it goes back to "pending" with retries + 1 and
+    passes the approval check again. Events go back to "pending".
+    Returns the number of rows recovered.
+    """
+    now = datetime.utcnow()
+    expired = OttoTask.lease_expires_at < now
+    blocked = db.query(OttoTask).filter(
+        OttoTask.status == "running", expired, OttoTask.retries + 1 >= OttoTask.max_retries
+    ).update({
+        OttoTask.status: "blocked",
+        OttoTask.retries: OttoTask.retries + 1,
+        OttoTask.last_error: "Worker lease expired (max retries exceeded)",
+        OttoTask.locked_by: None,
+        OttoTask.lease_expires_at: None
+    }, synchronize_session=False)
+    tasks = db.query(OttoTask).filter(OttoTask.status == "running", expired).update({
+        OttoTask.status: "pending",
+        OttoTask.retries: OttoTask.retries + 1,
+        OttoTask.last_error: "Worker lease expired before the task finished",
+        OttoTask.locked_by: None,
+        OttoTask.lease_expires_at: None
+    }, synchronize_session=False)
+    events = db.query(OttoEvent).filter(
+        OttoEvent.status == "processing", OttoEvent.lease_expires_at < now
+    ).update({
+        OttoEvent.status: EVENT_READY_STATUS,
+        OttoEvent.locked_by: None,
+        OttoEvent.lease_expires_at: None
+    }, synchronize_session=False)
+    if tasks or events:
+        notify_queue(db)
+    db.commit()
+    
+    recovered = blocked + tasks + events
+    if recovered:
+        logger.warning(f"Recovered {recovered} row(s) from expired worker leases")
+    return recovered
+
+
+def seconds_until_next_task(db: Session, default: float) -> float:
+    """Seconds until the earliest scheduled task comes due (capped at default)"""
+    now = datetime.utcnow()
+    next_run_at = db.query(OttoTask.next_run_at).filter(
+        OttoTask.status.in_(TASK_READY_STATUSES),
+        OttoTask.next_run_at > now
+    ).order_by(OttoTask.next_run_at).limit(1).scalar()
+    db.rollback()
+    if next_run_at is None:
+        return default
+    return max(0.0, min(default, (next_run_at - now).total_seconds()))
+
+
+def _missing_columns(connection, table: str, wanted: Iterable[str]) -> list:
+    existing = {column["name"] for column in inspect(connection).get_columns(table)}
+    return [name for name in wanted if name not in existing]
+
+
+def ensure_queue_schema(engine: Engine):
+    """
+    Add the queue columns and indexes to databases created before they
+    existed. create_all() makes new tables but never alters old ones;
+    with Alembic, migration 004_add_task_queue does the same.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    added = {
+        "otto_tasks": {
+            "priority": "INTEGER NOT NULL DEFAULT 0",
+            "locked_by": "VARCHAR",
+            "lease_expires_at": "DATETIME"
+        },
+        "otto_events": {
+            "locked_by": "VARCHAR",
+            "lease_expires_at": "DATETIME"
+        }
+    }
+    with engine.begin() as connection:
+        for table, columns in added.items():
+            for name in _missing_columns(connection, table, columns):
+                connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {columns[name]}"))
+                logger.info(f"Added {table}.{name} for the Otto task queue")
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_otto_tasks_queue ON otto_tasks (status, priority DESC, next_run_at)"
+        ))
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_otto_events_queue ON otto_events (status, id)"
+        ))
+
+
+def init_task_queue():
+    """Startup hook: ensure_queue_schema() on the app database"""
+    from database import engine
+    
+    ensure_queue_schema(engine)
@@ -8,9 +8,11 @@ from sqlalchemy.orm import Session
 from typing import List, Optional, Dict
 from pydantic import BaseModel
 from datetime import datetime
+from collections import Counter
 
 from database import get_db
 from models import OttoMemory, OttoMemoryHistory, OttoMemoryLink
+from memory_index import index_memory, unindex_memory, filter_by_tag, search_query
 from otto.context import get_default_context
 
 router = APIRouter(prefix="/otto/memory", tags=["otto_memory"])
@@ -56,6 +58,7 @@ class MemoryResponse(BaseModel):
 
 class MemoryUseRequest(BaseModel):
     id: Optional[int] = None
+    ids: Optional[List[int]] = None  # Bulk mark; an id listed twice counts twice
     category: Optional[str] = None
     tags: Optional[List[str]] = None
 
@@ -83,6 +86,7 @@ def create_memory(
     )
     
     db.add(new_memory)
+    index_memory(db, new_memory)
     db.commit()
     db.refresh(new_memory)
     
@@ -111,9 +115,9 @@ def list_memories(
     
     if tags:
         tag_list = [t.strip() for t in tags.split(",")]
-        # Filter by tags (tags is JSON array)
+        # Filter by tags (via the otto_memory_tags index)
         for tag in tag_list:
-            query = query.filter(OttoMemory.tags.contains([tag]))
+            query = filter_by_tag(query, tag)
     
     if source:
         query = query.filter(OttoMemory.source == source)
@@ -137,9 +141,10 @@ def search_memories(
     db: Session = Depends(get_db)
 ):
     """
-    Search memories with simple SQL-based text search.
+    Search memories by text, most relevant first.
     
-    Phase 4 — Simple search, no embeddings/vector search.
+    Phase 4 — No embeddings/vector search. Uses the SQLite FTS5 index
+    (memory_index.py): every word in q must match, as a prefix.
     """
     otto_context = get_default_context(db)
     
@@ -147,15 +152,11 @@ def search_memories(
         OttoMemory.household_id == otto_context.household_id
     )
     
-    # Text search on content
-    if q:
-        query = query.filter(OttoMemory.content.contains(q))
-    
     if category:
         query = query.filter(OttoMemory.category == category)
     
     if tag:
-        query = query.filter(OttoMemory.tags.contains([tag]))
+        query = filter_by_tag(query, tag)
     
     if source:
         query = query.filter(OttoMemory.source == source)
@@ -163,10 +164,44 @@ def search_memories(
     if is_stale is not None:
         query = query.filter(OttoMemory.is_stale == is_stale)
     
-    memories = query.order_by(OttoMemory.created_at.desc()).offset(offset).limit(limit).all()
+    # Text search on content (ranked); newest first without a query
+    if q:
+        query = search_query(db, query, q)
+    else:
+        query = query.order_by(OttoMemory.created_at.desc())
+    
+    memories = query.offset(offset).limit(limit).all()
     return memories
 
 
+@router.get("/batch", response_model=List[MemoryResponse])
+def get_memories_batch(
+    ids: str = Query(..., description="Comma-separated memory IDs"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get several memories in one request.
+    
+    Returns the memories that exist, in the order requested (missing IDs are skipped).
+    """
+    otto_context = get_default_context(db)
+    
+    try:
+        id_list = [int(i) for i in ids.split(",") if i.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma-separated integers")
+    if len(id_list) > 100:
+        raise HTTPException(status_code=400, detail="At most 100 ids per request")
+    
+    memories = db.query(OttoMemory).filter(
+        OttoMemory.id.in_(id_list),
+        OttoMemory.household_id == otto_context.household_id
+    ).all()
+    by_id = {memory.id: memory for memory in memories}
+    
+    return [by_id[memory_id] for memory_id in dict.fromkeys(id_list) if memory_id in by_id]
+
+
 @router.get("/{memory_id}", response_model=MemoryResponse)
 def get_memory(
     memory_id: int,
@@ -243,6 +278,9 @@ def update_memory(
     memory.version += 1
     memory.updated_at = datetime.utcnow()
     
+    if updates.content is not None or updates.tags is not None:
+        index_memory(db, memory)
+    
     db.commit()
     db.refresh(memory)
     
@@ -261,6 +299,7 @@ def mark_memory_used(
     - Increments usage_count
     - Sets last_used_at to now
     - Updates all matching entries if query-based
+    - With ids, marks each listed memory (once per occurrence) in one request
     
     Safety: Tier 1 (read-only operation, just tracking)
     """
@@ -270,13 +309,26 @@ def mark_memory_used(
         OttoMemory.household_id == otto_context.household_id
     )
     
+    if request.ids:
+        counts = Counter(request.ids)
+        memories = query.filter(OttoMemory.id.in_(list(counts))).all()
+        
+        now = datetime.utcnow()
+        for memory in memories:
+            memory.usage_count += counts[memory.id]
+            memory.last_used_at = now
+        
+        db.commit()
+        
+        return memories
+    
     if request.id:
         query = query.filter(OttoMemory.id == request.id)
     if request.category:
         query = query.filter(OttoMemory.category == request.category)
     if request.tags:
         for tag in request.tags:
-            query = query.filter(OttoMemory.tags.contains([tag]))
+            query = filter_by_tag(query, tag)
     
     memories = query.all()
     
@@ -325,6 +377,7 @@ def delete_memory(
     )
     db.add(history_entry)
     
+    unindex_memory(db, memory.id)
     db.delete(memory)
     db.commit()
     
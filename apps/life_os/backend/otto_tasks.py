@@ -20,6 +20,7 @@ class CreateTaskRequest(BaseModel):
     description: str
     payload: Optional[Dict[str, Any]] = None
     next_run_at: Optional[datetime] = None  # For scheduled tasks
+    priority: int = 0  # Higher runs first
 
 
 class TaskResponse(BaseModel):
@@ -34,6 +35,7 @@ class TaskResponse(BaseModel):
     next_run_at: Optional[datetime] = None
     last_run_at: Optional[datetime] = None
     last_error: Optional[str] = None
+    priority: int = 0
 
     class Config:
         from_attributes = True
@@ -52,7 +54,8 @@ async def create_task(request: CreateTaskRequest, db: Session = Depends(get_db))
         type=request.type,
         description=request.description,
         payload=request.payload,
-        next_run_at=request.next_run_at
+        next_run_at=request.next_run_at,
+        priority=request.priority
     )
     db.add(task)
     db.commit()
@@ -0,0 +1,204 @@
+"""
+The Otto task queue against a temporary SQLite database: claims, leases,
+recovery, ordering and the idle-worker signal.
+"""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from models import OttoEvent, OttoTask
+from otto import task_queue
+from otto.task_queue import (
+    QueueSignal,
+    claim_next_event,
+    claim_next_task,
+    recover_expired_leases,
+    release_task,
+    renew_lease,
+)
+
+
+@pytest.fixture
+def make_session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'queue.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    sessions = []
+    
+    def make():
+        session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        sessions.append(session)
+        return session
+    
+    yield make
+    for session in sessions:
+        session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def db(make_session):
+    return make_session()
+
+
+def _add_task(db, description, **fields):
+    task = OttoTask(household_id=1, type="test.noop", description=description, **fields)
+    db.add(task)
+    db.commit()
+    return task.id
+
+
+def _claim_all(db, worker_id, **kwargs):
+    claimed = []
+    while (task := claim_next_task(db, worker_id, **kwargs)) is not None:
+        claimed.append(task.description)
+    return claimed
+
+
+def test_priority_then_run_time_then_id(db):
+    now = datetime.utcnow()
+    _add_task(db, "low", priority=0)
+    _add_task(db, "high-later", priority=5, next_run_at=now - timedelta(minutes=1))
+    _add_task(db, "high-earlier", priority=5, next_run_at=now - timedelta(minutes=5))
+    _add_task(db, "approved", status="approved")
+    _add_task(db, "future", priority=9, next_run_at=now + timedelta(hours=1))
+    _add_task(db, "out-of-retries", priority=9, retries=3, max_retries=3)
+    _add_task(db, "done", priority=9, status="success")
+    
+    # Same priority and no run time: "low" and "approved" go by id
+    assert _claim_all(db, "w1") == ["high-earlier", "high-later", "low", "approved"]
+    
+    task = db.query(OttoTask).filter_by(description="low").one()
+    assert task.locked_by == "w1" and task.lease_expires_at > datetime.utcnow()
+
+def test_two_workers_never_claim_the_same_task(make_session):
+    first, second = make_session(), make_session()
+    for n in range(3):
+        _add_task(first, f"task-{n}")
+    
+    # The first worker leases task-0 after the second has read it as a candidate
+    raced = []
+    
+    def accept(task):
+        if not raced:
+            raced.append(claim_next_task(first, "w1").description)
+        return True
+    
+    assert claim_next_task(second, "w2", accept=accept).description == "task-1"
+    assert raced == ["task-0"]
+    assert _claim_all(first, "w1") == ["task-2"]
+    assert claim_next_task(second, "w2") is None
+
+def test_concurrent_claims_hand_out_each_task_once(make_session):
+    setup = make_session()
+    for n in range(30):
+        _add_task(setup, f"task-{n}")
+    
+    claimed = {}
+    
+    def work(worker_id):
+        claimed[worker_id] = _claim_all(make_session(), worker_id)
+    
+    threads = [threading.Thread(target=work, args=(f"w{n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    descriptions = [description for worker in claimed.values() for description in worker]
+    assert sorted(descriptions) == sorted(f"task-{n}" for n in range(30))
+
+def test_rejected_tasks_are_skipped_across_batches(db, monkeypatch):
+    monkeypatch.setattr(task_queue, "CLAIM_BATCH", 2)
+    for n in range(5):
+        _add_task(db, f"task-{n}")
+    
+    # Only the last task is acceptable: the claim pages past four rejected ones
+    task = claim_next_task(db, "w1", accept=lambda t: t.description == "task-4")
+    assert task.description == "task-4"
+    
+    # Leased tasks drop out of the query, so the offset only counts rejected ones
+    assert claim_next_task(db, "w2").description == "task-0"
+    task = claim_next_task(db, "w3", accept=lambda t: t.description != "task-1")
+    assert task.description == "task-2"
+    
+    assert claim_next_task(db, "w4", accept=lambda t: False) is None
+    assert db.query(OttoTask).filter(OttoTask.locked_by.is_(None)).count() == 2
+
+def test_expired_lease_can_be_claimed_again(db):
+    task_id = _add_task(db, "task")
+    assert claim_next_task(db, "w1", lease_seconds=-1).id == task_id
+    assert claim_next_task(db, "w2").locked_by == "w2"
+    
+    # The original owner has lost it: renewing and releasing do nothing
+    assert not renew_lease(db, OttoTask, task_id, "w1")
+    release_task(db, task_id, "w1")
+    assert db.get(OttoTask, task_id).locked_by == "w2"
+
+def test_renew_lease_extends_only_the_owners_lease(db):
+    task_id = _add_task(db, "task")
+    claim_next_task(db, "w1", lease_seconds=1)
+    expires = db.get(OttoTask, task_id).lease_expires_at
+    
+    assert renew_lease(db, OttoTask, task_id, "w1", lease_seconds=600)
+    db.expire_all()
+    assert db.get(OttoTask, task_id).lease_expires_at > expires + timedelta(seconds=500)
+    assert not renew_lease(db, OttoTask, task_id, "w2")
+    
+    release_task(db, task_id, "w1")
+    db.expire_all()
+    task = db.get(OttoTask, task_id)
+    assert task.locked_by is None and task.lease_expires_at is None
+    assert claim_next_task(db, "w2").id == task_id
+
+def test_recover_expired_leases(db):
+    past = datetime.utcnow() - timedelta(seconds=5)
+    future = datetime.utcnow() + timedelta(minutes=5)
+    dead = _add_task(db, "dead", status="running", locked_by="w1", lease_expires_at=past)
+    last_try = _add_task(db, "last-try", status="running", locked_by="w1", lease_expires_at=past, retries=2)
+    alive = _add_task(db, "alive", status="running", locked_by="w2", lease_expires_at=future)
+    event = OttoEvent(
+        household_id=1, type="bill.created", source_model="Bill", source_id=1,
+        status="processing", locked_by="w1", lease_expires_at=past
+    )
+    db.add(event)
+    db.commit()
+    
+    signal = task_queue.get_queue_signal()
+    seen = signal.generation
+    assert recover_expired_leases(db) == 3
+    assert signal.generation != seen
+    
+    db.expire_all()
+    task = db.get(OttoTask, dead)
+    assert (task.status, task.retries, task.locked_by, task.lease_expires_at) == ("pending", 1, None, None)
+    assert task.last_error == "Worker lease expired before the task finished"
+    task = db.get(OttoTask, last_try)
+    assert (task.status, task.retries, task.locked_by) == ("blocked", 3, None)
+    task = db.get(OttoTask, alive)
+    assert (task.status, task.locked_by) == ("running", "w2")
+    
+    assert claim_next_task(db, "w3").id == dead
+    assert claim_next_event(db, "w3").id == event.id
+    assert recover_expired_leases(db) == 0
+
+def test_wait_async_wakes_on_notify_from_another_thread():
+    signal = QueueSignal()
+    
+    async def scenario():
+        seen = signal.generation
+        assert not await signal.wait_async(seen, timeout=0.05)
+        
+        threading.Timer(0.05, signal.notify).start()
+        assert await asyncio.wait_for(signal.wait_async(seen, timeout=5), 2)
+        
+        # A notify between reading the generation and waiting is not lost
+        assert await signal.wait_async(seen, timeout=0)
+    
+    asyncio.run(scenario())
+    assert signal._listeners == set()
@@ -6,11 +6,13 @@ Phase 3 — CONTROL_OTTO_PHASE3.md
 from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel
 from typing import Optional, List
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
 from database import get_db
 from models import Transaction
+from money import MoneyStr, format_money
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
@@ -18,7 +20,7 @@ router = APIRouter(prefix="/transactions", tags=["transactions"])
 class CreateTransactionRequest(BaseModel):
     """Request to create a new transaction"""
     date: datetime
-    amount: str
+    amount: MoneyStr
     vendor: Optional[str] = None
     description: Optional[str] = None
     tax_category: Optional[str] = None
@@ -31,7 +33,7 @@ class CreateTransactionRequest(BaseModel):
 class UpdateTransactionRequest(BaseModel):
     """Request to update a transaction"""
     date: Optional[datetime] = None
-    amount: Optional[str] = None
+    amount: Optional[MoneyStr] = None
     vendor: Optional[str] = None
     description: Optional[str] = None
     tax_category: Optional[str] = None
@@ -46,6 +48,7 @@ class TransactionResponse(BaseModel):
     updated_at: datetime
     date: datetime
     amount: str
+    amount_cents: Optional[int] = None
     vendor: Optional[str]
     description: Optional[str]
     tax_category: Optional[str]
@@ -177,32 +180,23 @@ async def get_summary_by_category(
     end_date: Optional[datetime] = Query(None, description="Filter until this date"),
     db: Session = Depends(get_db)
 ):
-    """Get transaction summary by tax category"""
-    query = db.query(Transaction)
+    """Get transaction summary by tax category (one GROUP BY query)"""
+    category = func.coalesce(func.nullif(Transaction.tax_category, ""), "uncategorized").label("category")
+    query = db.query(
+        category,
+        func.count(Transaction.id),
+        func.coalesce(func.sum(Transaction.amount_cents), 0)
+    )
     
     if start_date:
         query = query.filter(Transaction.date >= start_date)
     if end_date:
         query = query.filter(Transaction.date <= end_date)
     
-    transactions = query.all()
-    
-    by_category = {}
-    total = 0
-    
-    for txn in transactions:
-        cat = txn.tax_category or "uncategorized"
-        amount_str = txn.amount or "0"
-        try:
-            amount = float(amount_str.replace("$", "").replace(",", ""))
-            total += amount
-            by_category[cat] = by_category.get(cat, 0) + amount
-        except:
-            pass
+    rows = query.group_by(category).all()
     
     return {
-        "total": f"${total:.2f}",
-        "count": len(transactions),
-        "by_category": {k: f"${v:.2f}" for k, v in by_category.items()}
+        "total": format_money(sum(cents for _, _, cents in rows)),
+        "count": sum(count for _, count, _ in rows),
+        "by_category": {cat: format_money(cents) for cat, _, cents in rows}
     }
-
@@ -7,16 +7,19 @@ import os
 import httpx
 import json
 import logging
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 
 logger = logging.getLogger(__name__)
 
-from database import SessionLocal, init_db
+from database import SessionLocal, engine, init_db
 from models import OttoTask, OttoRun
 from otto.actions import execute_actions
+from otto.task_queue import (
+    claim_next_task, release_task, renew_lease, recover_expired_leases, seconds_until_next_task,
+    get_queue_signal, LEASE_SECONDS, make_worker_id, init_task_queue, start_queue_watcher, stop_queue_watcher
+)
 from otto.safety import (
     get_task_tier, requires_approval, is_test_artifact,
     MAX_ACTIONS_PER_RUN, OTTO_ENABLED
@@ -27,50 +30,64 @@ from otto.safety import (
 OTTO_API_URL = os.getenv("OTTO_API_URL", "http://localhost:8001")
 
 # Worker configuration
+# Workers are woken when tasks are committed; this only bounds how long an idle worker sleeps
 POLL_INTERVAL = int(os.getenv("OTTO_WORKER_POLL_INTERVAL", "30"))  # seconds
+WORKER_CONCURRENCY = int(os.getenv("OTTO_WORKER_CONCURRENCY", "8"))  # Otto calls in flight at once
+OTTO_REQUEST_TIMEOUT = float(os.getenv("OTTO_WORKER_REQUEST_TIMEOUT", "60"))  # seconds per Otto call
+LEASE_RENEW_INTERVAL = max(1.0, LEASE_SECONDS / 3)  # seconds between lease renewals on a running task
 
 
-async def call_otto_for_task(task: OttoTask) -> dict:
+async def call_otto_for_task(task: OttoTask, client: Optional[httpx.AsyncClient] = None) -> dict:
     """
     Call Otto API with a structured task payload.
     
-    This function is separate so it can be reused and tested independently.
+    The worker passes its long-lived client; without one, a client is
+    opened for this call only. This function is separate so it can be
+    reused and tested independently.
     """
+    if client is None:
+        async with httpx.AsyncClient(timeout=OTTO_REQUEST_TIMEOUT) as client:
+            return await call_otto_for_task(task, client)
+    
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            # Use /task endpoint for structured tasks
-            response = await client.post(
-                f"{OTTO_API_URL}/task",
-                json={
-                    "type": task.type,
-                    "payload": task.payload or {},
-                    "source": "life_os_worker",
-                    "task_id": task.id,
-                    "description": task.description
-                }
-            )
-            response.raise_for_status()
-            return response.json()
+        # Use /task endpoint for structured tasks
+        response = await client.post(
+            f"{OTTO_API_URL}/task",
+            json={
+                "type": task.type,
+                "payload": task.payload or {},
+                "source": "life_os_worker",
+                "task_id": task.id,
+                "description": task.description
+            }
+        )
+        response.raise_for_status()
+        return response.json()
     except httpx.RequestError as e:
         raise Exception(f"Could not connect to Otto API: {str(e)}")
     except httpx.HTTPStatusError as e:
         raise Exception(f"Otto API error: {e.response.status_code} - {e.response.text}")
 
 
-def process_task(db: Session, task: OttoTask) -> None:
+def _in_session(fn: Callable, *args, **kwargs):
+    """Call fn(db, *args, **kwargs) with a session of its own (for asyncio.to_thread)"""
+    db = SessionLocal()
+    try:
+        return fn(db, *args, **kwargs)
+    finally:
+        db.close()
+
+
+def _begin_task(db: Session, task_id: int) -> Optional[Tuple[OttoTask, int]]:
     """
-    Process a single OttoTask:
-    1. Check safety tier and approval requirements
-    2. Lock it (set status to "running")
-    3. Create OttoRun record
-    4. Call Otto API
-    5. Execute returned actions (with rate limiting)
-    6. Update task and run records
+    Check safety tier, approval and retry limit, then mark the task
+    "running" and create its OttoRun in one transaction.
+    
+    Returns the (detached) task and run id, or None if it must not run.
     """
-    # Check kill switch
-    if not OTTO_ENABLED:
-        logger.warning("Otto is disabled via OTTO_ENABLED=false")
-        return
+    task = db.get(OttoTask, task_id)
+    if task is None:
+        return None
     
     # Check if task requires approval
     if requires_approval(task.type) and task.status != "approved":
@@ -78,7 +95,7 @@ def process_task(db: Session, task: OttoTask) -> None:
         task.last_error = f"Task type '{task.type}' requires approval (Tier {get_task_tier(task.type).value})"
         db.commit()
         logger.info(f"Task #{task.id} requires approval - set to pending_approval")
-        return
+        return None
     
     # Check retry limit
     if task.retries >= task.max_retries:
@@ -86,17 +103,14 @@ def process_task(db: Session, task: OttoTask) -> None:
         task.last_error = f"Max retries ({task.max_retries}) exceeded"
         db.commit()
         logger.warning(f"Task #{task.id} blocked - max retries exceeded")
-        return
+        return None
     
-    # Lock the task by setting status to "running" and committing
     task.status = "running"
     task.last_run_at = datetime.utcnow()
-    db.commit()
-    db.refresh(task)
-    
-    # Create OttoRun record
     run = OttoRun(
-        status="pending",
+        household_id=task.household_id,
+        user_id=task.user_id,
+        status="running",
         source="worker",
         input_text=f"Task #{task.id}: {task.description}",
         input_payload={
@@ -107,19 +121,25 @@ def process_task(db: Session, task: OttoTask) -> None:
     )
     db.add(run)
     db.commit()
-    db.refresh(run)
+    
+    run_id = run.id
+    db.refresh(task)
+    db.expunge(task)  # Read-only copy for the Otto call
+    return task, run_id
+
+
+def _finish_task(db: Session, task_id: int, run_id: int, otto_response: Optional[dict], error: Optional[str]) -> None:
+    """
+    Execute the returned actions (with rate limiting) and record the
+    outcome on the task and run in one transaction. `error` is set when
+    the Otto call itself failed.
+    """
+    task = db.get(OttoTask, task_id)
+    run = db.get(OttoRun, run_id)
     
     try:
-        # Update run status to running
-        run.status = "running"
-        db.commit()
-        
-        # Call Otto API (using asyncio.run since we're in a sync context)
-        try:
-            otto_response = asyncio.run(call_otto_for_task(task))
-        except Exception as e:
-            # If async call fails, wrap it
-            raise Exception(f"Error calling Otto: {str(e)}")
+        if error is not None:
+            raise Exception(error)
         
         # Extract response - support both old format (actions in result) and new format (actions at top level)
         message = otto_response.get("message", "")
@@ -190,9 +210,10 @@ def process_task(db: Session, task: OttoTask) -> None:
             task.last_error = None
         
         db.commit()
-        
+    
     except Exception as e:
-        # Mark both task and run as error
+        # Drop any half-written result, then mark both task and run as error
+        db.rollback()
         error_msg = str(e)
         run.status = "error"
         run.logs = json.dumps({"error": error_msg}, indent=2)
@@ -211,7 +232,6 @@ def process_task(db: Session, task: OttoTask) -> None:
             else:
                 delay_minutes = 15
             
-            from datetime import timedelta
             task.next_run_at = datetime.utcnow() + timedelta(minutes=delay_minutes)
             task.status = "pending"  # Will retry later
             logger.info(f"Task #{task.id} will retry in {delay_minutes} minutes (attempt {task.retries}/{task.max_retries})")
@@ -222,69 +242,195 @@ def process_task(db: Session, task: OttoTask) -> None:
         db.commit()
 
 
-def find_ready_tasks(db: Session) -> list:
+async def process_task(task_id: int, client: httpx.AsyncClient) -> None:
     """
-    Find tasks that are ready to run:
-    - status = "pending" or "approved"
-    - next_run_at is None or <= now
-    - retries < max_retries (if failed before)
-    - Not a test artifact (unless in dev mode)
+    Process a single OttoTask:
+    1. Check safety tier and approval requirements
+    2. Lock it (status "running") and create its OttoRun - one transaction
+    3. Call Otto API over the worker's shared client
+    4. Execute returned actions (with rate limiting)
+    5. Update task and run records - one transaction
+    
+    Database steps run in a thread with their own session, so the event
+    loop keeps other tasks' Otto calls moving meanwhile.
     """
-    import os
-    otto_mode = os.getenv("OTTO_MODE", "dev").lower()
+    # Check kill switch
+    if not OTTO_ENABLED:
+        logger.warning("Otto is disabled via OTTO_ENABLED=false")
+        return
     
-    now = datetime.utcnow()
-    query = db.query(OttoTask).filter(
-        and_(
-            OttoTask.status.in_(["pending", "approved"]),
-            (OttoTask.next_run_at.is_(None)) | (OttoTask.next_run_at <= now),
-            OttoTask.retries < OttoTask.max_retries
-        )
-    )
+    started = await asyncio.to_thread(_in_session, _begin_task, task_id)
+    if started is None:
+        return
+    task, run_id = started
     
-    # In production mode, exclude test artifacts
-    if otto_mode == "prod":
-        # Filter out test tasks by checking description
-        tasks = query.all()
-        return [
-            t for t in tasks
-            if not is_test_artifact(t.description, t.payload)
-        ]
+    try:
+        otto_response, error = await call_otto_for_task(task, client), None
+    except Exception as e:
+        otto_response, error = None, f"Error calling Otto: {str(e)}"
     
-    return query.all()
+    await asyncio.to_thread(_in_session, _finish_task, task_id, run_id, otto_response, error)
+
+
+def _accepts_task(task: OttoTask) -> bool:
+    """In production mode, leave test artifacts in the queue untouched"""
+    if os.getenv("OTTO_MODE", "dev").lower() == "prod":
+        return not is_test_artifact(task.description, task.payload)
+    return True
+
 
+def _claim(db: Session, worker_id: str, accept: Callable[[OttoTask], bool]) -> Optional[int]:
+    task = claim_next_task(db, worker_id, accept=accept)
+    return task.id if task is not None else None
 
-def run_worker_cycle(db: Session) -> int:
+
+def _mark_error(db: Session, task_id: int, error: str) -> None:
+    task = db.get(OttoTask, task_id)
+    if task is not None:
+        task.status = "error"
+        task.last_error = error
+        db.commit()
+
+
+class OttoWorker:
     """
-    Run one cycle of the worker:
-    1. Find ready tasks
-    2. Process each one
+    Async worker core.
     
-    Returns number of tasks processed.
+    Claims tasks from the queue (otto/task_queue.py) and runs up to
+    `concurrency` of them at once, all over one long-lived AsyncClient,
+    so throughput follows what the Otto API can take rather than one
+    request at a time.
     """
-    ready_tasks = find_ready_tasks(db)
     
-    for task in ready_tasks:
+    def __init__(self, concurrency: Optional[int] = None, worker_id: Optional[str] = None):
+        self.concurrency = concurrency or WORKER_CONCURRENCY
+        self.worker_id = worker_id or make_worker_id()
+        self.processed = 0
+    
+    def _make_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=OTTO_REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        )
+    
+    async def _keep_lease(self, task_id: int) -> None:
+        """Renew a running task's lease so it is not re-queued while the Otto call is in flight"""
+        while True:
+            await asyncio.sleep(LEASE_RENEW_INTERVAL)
+            try:
+                renewed = await asyncio.to_thread(_in_session, renew_lease, OttoTask, task_id, self.worker_id)
+            except Exception as e:
+                print(f"Error renewing lease on task #{task_id}: {str(e)}")
+                continue
+            if not renewed:
+                logger.warning(f"Task #{task_id} lost its lease while running")
+                return
+    
+    async def _run_task(self, task_id: int, client: httpx.AsyncClient, slots: asyncio.Semaphore) -> None:
         try:
-            process_task(db, task)
-        except Exception as e:
-            # Log error but continue with other tasks
-            print(f"Error processing task #{task.id}: {str(e)}")
-            # Mark task as error
-            task.status = "error"
-            task.last_error = str(e)
-            db.commit()
+            lease = asyncio.create_task(self._keep_lease(task_id))
+            try:
+                await process_task(task_id, client)
+            except asyncio.CancelledError:
+                # Shutting down mid-task: keep the lease so it expires and the task is re-queued
+                raise
+            except Exception as e:
+                # Log error and mark task as error
+                print(f"Error processing task #{task_id}: {str(e)}")
+                await asyncio.to_thread(_in_session, _mark_error, task_id, str(e))
+            finally:
+                lease.cancel()
+            await asyncio.to_thread(_in_session, release_task, task_id, self.worker_id)
+            self.processed += 1
+            print(f"[{datetime.now().isoformat()}] Processed task #{task_id}")
+        finally:
+            slots.release()
+    
+    async def _recover_leases(self) -> None:
+        """Periodically re-queue tasks whose worker died mid-run"""
+        while True:
+            try:
+                await asyncio.to_thread(_in_session, recover_expired_leases)
+            except Exception as e:
+                print(f"Error recovering task leases: {str(e)}")
+            await asyncio.sleep(POLL_INTERVAL)
     
-    return len(ready_tasks)
+    async def run(self, drain: bool = False) -> int:
+        """
+        Claim and run tasks until cancelled, sleeping while the queue is
+        empty. With drain=True, return once no ready tasks are left
+        (each task runs at most once). Returns the number processed.
+        """
+        signal = get_queue_signal()
+        slots = asyncio.Semaphore(self.concurrency)
+        in_flight = set()
+        claimed = set()
+        
+        if drain:
+            accept = lambda task: task.id not in claimed and _accepts_task(task)
+            housekeeping = None
+        else:
+            accept = _accepts_task
+            housekeeping = asyncio.create_task(self._recover_leases())
+        
+        try:
+            async with self._make_client() as client:
+                while True:
+                    await slots.acquire()
+                    # Read before looking for work so a notify during the claim isn't missed
+                    seen = signal.generation
+                    task_id = await asyncio.to_thread(_in_session, _claim, self.worker_id, accept)
+                    
+                    if task_id is not None:
+                        claimed.add(task_id)
+                        running = asyncio.create_task(self._run_task(task_id, client, slots))
+                        in_flight.add(running)
+                        running.add_done_callback(in_flight.discard)
+                        continue
+                    
+                    slots.release()
+                    if drain:
+                        if not in_flight:
+                            break
+                        # Finished tasks may have queued follow-ups
+                        await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                        continue
+                    
+                    wait = await asyncio.to_thread(_in_session, seconds_until_next_task, POLL_INTERVAL)
+                    await signal.wait_async(seen, wait)
+                
+                if in_flight:
+                    await asyncio.gather(*in_flight)
+        finally:
+            if housekeeping is not None:
+                housekeeping.cancel()
+        
+        return self.processed
+
+
+def run_worker_cycle(concurrency: Optional[int] = None) -> int:
+    """
+    Run one cycle of the worker: process ready tasks (concurrently)
+    until none are left.
+    
+    Returns number of tasks processed.
+    """
+    return asyncio.run(OttoWorker(concurrency, make_worker_id("cycle")).run(drain=True))
 
 
-def run_worker_forever():
+def run_worker_forever(concurrency: Optional[int] = None):
     """
-    Main worker loop - runs forever, polling for tasks.
+    Main worker loop - runs the async worker until Ctrl+C.
+    
+    Tasks are picked up as soon as they are committed (see
+    otto/task_queue.py) instead of on a polling interval.
     """
+    worker = OttoWorker(concurrency)
+    
     print("Starting Otto Worker...")
     print(f"Otto API URL: {OTTO_API_URL}")
-    print(f"Poll interval: {POLL_INTERVAL} seconds")
+    print(f"Concurrent tasks: {worker.concurrency}")
+    print(f"Idle wake-up interval: {POLL_INTERVAL} seconds")
     print(f"Otto Enabled: {OTTO_ENABLED}")
     print(f"Max actions per run: {MAX_ACTIONS_PER_RUN}")
     print("Press Ctrl+C to stop")
@@ -298,37 +444,17 @@ def run_worker_forever():
     
     # Initialize database
     init_db()
+    init_task_queue()
+    start_queue_watcher(engine)
     
-    while True:
-        # Re-check kill switch each cycle
-        if not OTTO_ENABLED:
-            print("Otto disabled - pausing worker")
-            import time
-            time.sleep(POLL_INTERVAL)
-            continue
-        try:
-            db = SessionLocal()
-            try:
-                processed = run_worker_cycle(db)
-                if processed > 0:
-                    print(f"[{datetime.now().isoformat()}] Processed {processed} task(s)")
-            finally:
-                db.close()
-            
-            # Sleep before next cycle
-            import time
-            time.sleep(POLL_INTERVAL)
-            
-        except KeyboardInterrupt:
-            print("\nStopping worker...")
-            break
-        except Exception as e:
-            print(f"Error in worker cycle: {str(e)}")
-            # Continue running even if there's an error
-            import time
-            time.sleep(POLL_INTERVAL)
+    try:
+        asyncio.run(worker.run())
+    except KeyboardInterrupt:
+        # Tasks cut off mid-run keep their lease and are re-queued once it expires
+        print("\nStopping worker...")
+    finally:
+        stop_queue_watcher()
 
 
 if __name__ == "__main__":
     run_worker_forever()
-
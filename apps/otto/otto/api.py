@@ -2,20 +2,23 @@
 Otto API Server - HTTP interface for receiving prompts from anywhere
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
 import uuid
 import os
+import json
 from datetime import datetime
 
 from .config import load_config
 from .core.models import Task, TaskStatus, TaskResult
 from .core.skill_base import SkillContext
-from .core.runner import run_tasks
+from .core.executor import SkillExecutor
+from .core.http_client import close_http_clients
 from .core.logging_utils import get_logger
-from .skills import get_all_skills
+from .skills import get_skill_registry
 
 logger = get_logger(__name__)
 
@@ -38,18 +41,37 @@ app.add_middleware(
 _config = None
 _context = None
 _skills = None
+_executor = None
 
 
 def get_context():
-    """Get or create Otto context"""
+    """Get or create Otto context and the skill registry"""
     global _config, _context, _skills
     if _config is None:
         _config = load_config()
         _context = SkillContext(config=_config, logger=logger)
-        _skills = get_all_skills()
+        _skills = get_skill_registry()
     return _context, _skills
 
 
+def get_executor() -> SkillExecutor:
+    """Get or create the executor that runs skills off the event loop"""
+    global _executor
+    if _executor is None:
+        _executor = SkillExecutor()
+    return _executor
+
+
+@app.on_event("shutdown")
+def shutdown_executor():
+    """Stop skill worker threads and close pooled HTTP connections"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
+    close_http_clients()
+
+
 class PromptRequest(BaseModel):
     """Request model for sending a prompt"""
     prompt: str
@@ -134,16 +156,11 @@ async def submit_prompt(request: PromptRequest):
     # In Phase 2, this will use LLM to route to appropriate skills
     
     # Check if any skill can handle it
-    handler = None
-    for skill in skills:
-        if skill.can_handle(task):
-            handler = skill
-            break
+    handler = skills.resolve(task)
     
     if handler:
-        # Execute with the skill
-        results = run_tasks([task], skills, context)
-        result = results[0]
+        # Execute with the skill (in the worker pool, so other requests keep flowing)
+        result = await get_executor().run(handler, task, context)
         
         return PromptResponse(
             task_id=task_id,
@@ -185,8 +202,15 @@ async def submit_task(request: TaskRequest):
     )
     
     # Execute the task
-    results = run_tasks([task], skills, context)
-    result = results[0]
+    handler = skills.resolve(task)
+    if handler is None:
+        result = TaskResult(
+            task_id=task_id,
+            success=False,
+            message=f"No skill found to handle task type: {task.type}"
+        )
+    else:
+        result = await get_executor().run(handler, task, context)
     
     # Extract actions from result.data if present
     actions = None
@@ -211,6 +235,97 @@ async def submit_task(request: TaskRequest):
     )
 
 
+@app.post("/tasks", status_code=202)
+async def start_task(request: TaskRequest):
+    """
+    Start a structured task in the background.
+    
+    Returns immediately; poll /tasks/{task_id} or stream /tasks/{task_id}/events.
+    """
+    context, skills = get_context()
+    
+    task = Task(
+        id=str(uuid.uuid4()),
+        type=request.type,
+        payload=request.payload,
+        source=request.source,
+        status=TaskStatus.PENDING
+    )
+    
+    handler = skills.resolve(task)
+    if handler is None:
+        raise HTTPException(status_code=404, detail=f"No skill found to handle task type: {task.type}")
+    
+    record = get_executor().submit(handler, task, context)
+    return _accepted(record)
+
+
+def _accepted(record):
+    """202 body for a background task"""
+    return {
+        "task_id": record.task.id,
+        "status": record.task.status.value,
+        "skill": record.skill_name,
+        "links": {
+            "self": f"/tasks/{record.task.id}",
+            "events": f"/tasks/{record.task.id}/events"
+        }
+    }
+
+
+@app.get("/tasks")
+async def list_background_tasks(limit: int = 50):
+    """Recent background tasks, newest first"""
+    return {"tasks": [record.to_dict() for record in get_executor().list(limit)]}
+
+
+@app.get("/tasks/{task_id}")
+async def get_background_task(task_id: str, events: bool = False):
+    """Status (and result, once finished) of a background task"""
+    record = get_executor().get(task_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
+    return record.to_dict(include_events=events)
+
+
+@app.get("/tasks/{task_id}/events")
+async def stream_task_events(
+    task_id: str,
+    request: Request,
+    since: int = 0,
+    last_event_id: Optional[str] = Header(None)
+):
+    """
+    Server-Sent Events stream of a background task's progress.
+    
+    Ends after the "finished" event. Reconnecting clients resume from
+    the Last-Event-ID header (or ?since=N).
+    """
+    executor = get_executor()
+    record = executor.get(task_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
+    
+    if last_event_id is not None and last_event_id.isdigit():
+        since = int(last_event_id) + 1
+    
+    async def event_stream():
+        async for event in executor.stream_events(record, since=since):
+            if await request.is_disconnected():
+                break
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            data = {"task_id": task_id, "time": event["time"], **event["data"]}
+            yield f"id: {event['id']}\nevent: {event['event']}\ndata: {json.dumps(data, default=str)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @app.get("/skills")
 async def list_skills():
     """List all available Otto skills"""
@@ -220,19 +335,33 @@ async def list_skills():
         "skills": [
             {
                 "name": skill.name,
-                "description": getattr(skill, "description", "No description available")
+                "description": getattr(skill, "description", "No description available"),
+                "task_types": sorted(getattr(skill, "task_types", ()))
             }
             for skill in skills
         ]
     }
 
 
+@app.get("/skills/metrics")
+async def skill_dispatch_metrics():
+    """Skill dispatch counts and lookup latency"""
+    context, skills = get_context()
+    
+    return {
+        "skills": len(skills),
+        "routes": len(skills.routes()),
+        "dispatch": skills.metrics.snapshot()
+    }
+
+
 class MonitorRepairRequest(BaseModel):
     """Request model for monitor/repair/redeploy"""
     mode: str = "pr"  # "pr" or "main"
     targets: Dict[str, Any]
     maxIterations: int = 5
     dryRun: bool = False  # If true, show proposed changes without committing
+    background: bool = False  # If true, return 202 right away and track via /tasks/{task_id}
 
 
 @app.post("/skills/monitor_repair_redeploy")
@@ -255,17 +384,17 @@ async def monitor_repair_redeploy(request: MonitorRepairRequest):
     )
     
     # Find the skill
-    skill = None
-    for s in skills:
-        if hasattr(s, "can_handle") and s.can_handle(task):
-            skill = s
-            break
+    skill = skills.resolve(task)
     
     if not skill:
         raise HTTPException(status_code=404, detail="Monitor repair skill not found")
     
+    if request.background:
+        record = get_executor().submit(skill, task, context)
+        return JSONResponse(status_code=202, content=_accepted(record))
+    
     # Execute
-    result = skill.run(task, context)
+    result = await get_executor().run(skill, task, context)
     
     return {
         "task_id": task_id,
@@ -280,14 +409,12 @@ class DeployMonitorRequest(BaseModel):
     mode: str = "pr"
     maxIterations: int = 5
     dryRun: bool = False
+    background: bool = False
 
-
-@app.post("/actions/fix_and_monitor")
-async def fix_and_monitor(request: DeployMonitorRequest):
-    """Fix Render runtime if needed, then run monitor loop until both Render and Vercel pass"""
-    from ..providers.render_client import RenderClient
+def _fix_render_runtime(dry_run: bool) -> Dict[str, Any]:
+    """Switch the Otto Render service to docker/apps/otto if it isn't already"""
+    from .providers.render_client import RenderClient
     
-    # Step 1: Proactively fix Render runtime if needed
     render_fix_result = {"fixed": False, "message": "No fix needed"}
     
     render_api_key = os.getenv("RENDER_API_KEY")
@@ -310,7 +437,7 @@ async def fix_and_monitor(request: DeployMonitorRequest):
                 if current_root_dir != "apps/otto":
                     needs_fix = True
                 
-                if needs_fix and not request.dryRun:
+                if needs_fix and not dry_run:
                     logger.info(f"Fixing Render service {render_service_id}: runtime={current_runtime}->docker, rootDir={current_root_dir}->apps/otto")
                     result = render_client.update_service_runtime(render_service_id, "docker", "apps/otto")
                     
@@ -331,7 +458,7 @@ async def fix_and_monitor(request: DeployMonitorRequest):
                             "message": f"Failed to fix Render service: {result.get('error')}",
                             "error": result.get("error")
                         }
-                elif needs_fix and request.dryRun:
+                elif needs_fix and dry_run:
                     render_fix_result = {
                         "fixed": False,
                         "message": f"Would fix Render service {render_service_id}: runtime={current_runtime}->docker, rootDir={current_root_dir}->apps/otto",
@@ -341,6 +468,15 @@ async def fix_and_monitor(request: DeployMonitorRequest):
             logger.warning(f"Could not check/fix Render service: {e}")
             render_fix_result = {"fixed": False, "message": f"Error checking Render: {str(e)}"}
     
+    return render_fix_result
+
+
+@app.post("/actions/fix_and_monitor")
+async def fix_and_monitor(request: DeployMonitorRequest):
+    """Fix Render runtime if needed, then run monitor loop until both Render and Vercel pass"""
+    # Step 1: Proactively fix Render runtime if needed (blocking HTTP calls, so off the event loop)
+    render_fix_result = await get_executor().run_blocking(_fix_render_runtime, request.dryRun)
+    
     # Step 2: Run monitor loop
     # Default targets - read from environment variables
     default_targets = {}
@@ -383,7 +519,8 @@ async def fix_and_monitor(request: DeployMonitorRequest):
         mode=request.mode,
         targets=default_targets,
         maxIterations=request.maxIterations,
-        dryRun=request.dryRun
+        dryRun=request.dryRun,
+        background=request.background
     )
     
     return await monitor_repair_redeploy(monitor_request)
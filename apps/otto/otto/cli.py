@@ -15,7 +15,7 @@ from .core.skill_base import SkillContext
 from .core.runner import run_tasks
 from .core.health import run_skill_health_checks
 from .core.logging_utils import get_logger
-from .skills import get_all_skills
+from .skills import get_skill_registry
 
 logger = get_logger(__name__)
 
@@ -48,7 +48,7 @@ def main():
     # Load config
     config = load_config()
     context = SkillContext(config=config, logger=logger)
-    skills = get_all_skills()
+    skills = get_skill_registry()
     
     if args.command == "run-sample":
         # Create a sample task
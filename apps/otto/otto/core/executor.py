@@ -0,0 +1,218 @@
+"""
+Execution layer for Otto - runs skills without blocking the event loop
+
+Sync skills run in a bounded thread pool; skills whose `run` is an
+`async def` are awaited directly. Background tasks are tracked in memory
+so clients can poll them or stream their progress events.
+"""
+
+import asyncio
+import inspect
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from .models import Task, TaskResult, TaskStatus
+from .runner import execute_task
+from .skill_base import Skill, SkillContext
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Threads available to sync skills (OTTO_SKILL_WORKERS)
+DEFAULT_MAX_WORKERS = 8
+# Finished background tasks kept for polling before the oldest are dropped
+DEFAULT_RETENTION = 500
+
+
+def is_async_skill(skill: Skill) -> bool:
+    """True if the skill implements `async def run`"""
+    return inspect.iscoroutinefunction(getattr(skill, "run", None))
+
+
+@dataclass
+class TaskRecord:
+    """A background task and its progress events"""
+    task: Task
+    skill_name: str
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[TaskResult] = None
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    # (loop, asyncio.Event) pairs woken when an event is added
+    waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = field(default_factory=list, repr=False)
+    
+    @property
+    def done(self) -> bool:
+        return self.task.status in (TaskStatus.SUCCESS, TaskStatus.FAILED)
+    
+    def to_dict(self, include_events: bool = False) -> Dict[str, Any]:
+        """JSON-friendly view for the API"""
+        data = {
+            "task_id": self.task.id,
+            "type": self.task.type,
+            "source": self.task.source,
+            "skill": self.skill_name,
+            "status": self.task.status.value,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "event_count": len(self.events),
+            "result": asdict(self.result) if self.result else None,
+        }
+        if include_events:
+            data["events"] = list(self.events)
+        return data
+
+
+class SkillExecutor:
+    """
+    Runs skills off the event loop and tracks background tasks.
+    
+    Use `await run(...)` to execute a task inside a request without
+    blocking other requests, or `submit(...)` to start it in the
+    background and follow it through `get` / `stream_events`.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, retention: int = DEFAULT_RETENTION):
+        if max_workers is None:
+            max_workers = int(os.getenv("OTTO_SKILL_WORKERS", str(DEFAULT_MAX_WORKERS)))
+        self.max_workers = max_workers
+        self.retention = retention
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="otto-skill")
+        self._records: "OrderedDict[str, TaskRecord]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._background: set = set()  # Keeps running asyncio tasks referenced
+    
+    async def run(self, handler: Skill, task: Task, context: SkillContext) -> TaskResult:
+        """Execute a task without blocking the event loop"""
+        if is_async_skill(handler):
+            try:
+                return await handler.run(task, context)
+            except Exception as e:
+                return TaskResult(
+                    task_id=task.id,
+                    success=False,
+                    message=f"Error executing task: {str(e)}"
+                )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, execute_task, handler, task, context)
+    
+    async def run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run any blocking helper in the skill thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, func, *args)
+    
+    def submit(self, handler: Skill, task: Task, context: SkillContext) -> TaskRecord:
+        """
+        Start a task in the background (must be called from the event loop).
+        
+        Returns:
+            The TaskRecord to poll; its id is task.id
+        """
+        record = TaskRecord(task=task, skill_name=handler.name)
+        with self._lock:
+            self._records[task.id] = record
+            self._prune()
+        self._add_event(record, "queued", {"type": task.type, "skill": handler.name})
+        
+        background = asyncio.get_running_loop().create_task(self._run_tracked(record, handler, context))
+        self._background.add(background)
+        background.add_done_callback(self._background.discard)
+        return record
+    
+    async def _run_tracked(self, record: TaskRecord, handler: Skill, context: SkillContext):
+        task = record.task
+        task.status = TaskStatus.RUNNING
+        record.started_at = time.time()
+        self._add_event(record, "started", {})
+        
+        # Skills report progress through context.progress (see skill_base.report_progress)
+        tracked_context = replace(
+            context,
+            progress=lambda message, data=None: self._add_event(record, "progress", {"message": message, **(data or {})})
+        )
+        try:
+            result = await self.run(handler, task, tracked_context)
+        except Exception as e:  # run() already converts skill errors; this is a safety net
+            logger.error(f"Background task {task.id} crashed: {e}")
+            result = TaskResult(task_id=task.id, success=False, message=f"Error executing task: {str(e)}")
+        
+        record.result = result
+        record.finished_at = time.time()
+        task.status = TaskStatus.SUCCESS if result.success else TaskStatus.FAILED
+        self._add_event(record, "finished", {"status": task.status.value, "message": result.message})
+    
+    def _add_event(self, record: TaskRecord, kind: str, data: Dict[str, Any]):
+        """Append an event and wake streaming clients (safe from any thread)"""
+        with self._lock:
+            record.events.append({"id": len(record.events), "event": kind, "time": time.time(), "data": data})
+            waiters, record.waiters = record.waiters, []
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # Client's loop already closed
+    
+    def _prune(self):
+        """Drop the oldest finished records beyond the retention limit (lock held)"""
+        excess = len(self._records) - self.retention
+        if excess <= 0:
+            return
+        for task_id in [tid for tid, rec in self._records.items() if rec.done][:excess]:
+            del self._records[task_id]
+    
+    def get(self, task_id: str) -> Optional[TaskRecord]:
+        """Look up a background task"""
+        with self._lock:
+            return self._records.get(task_id)
+    
+    def list(self, limit: int = 50) -> List[TaskRecord]:
+        """Most recent background tasks, newest first"""
+        with self._lock:
+            records = list(self._records.values())
+        return records[::-1][:limit]
+    
+    async def stream_events(
+        self,
+        record: TaskRecord,
+        since: int = 0,
+        keepalive: float = 15.0
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield a task's events from index `since` until it finishes.
+        
+        Yields None after `keepalive` seconds without events so callers
+        can send a heartbeat.
+        """
+        loop = asyncio.get_running_loop()
+        index = since
+        while True:
+            wakeup = asyncio.Event()
+            with self._lock:
+                new_events = record.events[index:]
+                finished = record.done
+                if not new_events and not finished:
+                    record.waiters.append((loop, wakeup))
+            
+            for event in new_events:
+                yield event
+            index += len(new_events)
+            
+            if finished:
+                # "finished" is always the last event; anything before it was just yielded
+                return
+            if not new_events:
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+    
+    def shutdown(self, wait: bool = False):
+        """Stop the thread pool"""
+        self._pool.shutdown(wait=wait)
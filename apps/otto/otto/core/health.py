@@ -2,7 +2,8 @@
 Health check runner for Otto skills
 """
 
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
 from dataclasses import dataclass
 from .skill_base import Skill, SkillHealthIssue, SkillContext
 
@@ -21,17 +22,34 @@ class HealthReport:
         return sum(len(issues) for issues in self.issues.values())
 
 
+def _safe_self_test(skill: Skill, context: SkillContext) -> List[SkillHealthIssue]:
+    """Run one skill's self_test, reporting a crash as an issue"""
+    try:
+        return skill.self_test(context)
+    except Exception as e:
+        return [SkillHealthIssue(code="self_test_error", message=f"self_test raised: {str(e)}")]
+
+
 def run_skill_health_checks(
     skills: List[Skill],
-    context: SkillContext
+    context: SkillContext,
+    max_workers: Optional[int] = None
 ) -> HealthReport:
     """
     Run health checks on all skills and return a report.
+    
+    Checks run concurrently (most of them are network probes), so the
+    sweep takes about as long as the slowest skill.
     """
+    skills = list(skills)
     issues: Dict[str, List[SkillHealthIssue]] = {}
+    if not skills:
+        return HealthReport(issues=issues)
+    
+    with ThreadPoolExecutor(max_workers=max_workers or len(skills), thread_name_prefix="otto-health") as pool:
+        all_issues = list(pool.map(lambda skill: _safe_self_test(skill, context), skills))
     
-    for skill in skills:
-        skill_issues = skill.self_test(context)
+    for skill, skill_issues in zip(skills, all_issues):
         if skill_issues:
             issues[skill.name] = skill_issues
     
@@ -0,0 +1,277 @@
+"""
+Shared HTTP clients for Otto skills
+
+Skills used to open a new httpx.Client per call, paying a TCP (and TLS)
+handshake on every round trip to Life OS. This module keeps one
+keep-alive, connection-pooled client per process (plus one async client
+per event loop), a short-TTL cache for read-mostly lookups, and a
+batcher that folds "mark memory used" calls into one bulk request.
+"""
+
+import asyncio
+import atexit
+import importlib.util
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TIMEOUT = 10.0
+# Connection pool size (OTTO_HTTP_MAX_CONNECTIONS)
+DEFAULT_MAX_CONNECTIONS = 20
+# Seconds a cached read stays fresh (OTTO_HTTP_CACHE_TTL, 0 disables)
+DEFAULT_CACHE_TTL = 30.0
+# Seconds between bulk "memory used" flushes
+USAGE_FLUSH_INTERVAL = 1.0
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2]) and an https URL
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_lock = threading.Lock()
+_client: Optional[httpx.Client] = None
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _limits() -> httpx.Limits:
+    max_connections = int(os.getenv("OTTO_HTTP_MAX_CONNECTIONS", str(DEFAULT_MAX_CONNECTIONS)))
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=30.0
+    )
+
+
+def get_http_client() -> httpx.Client:
+    """The process-wide pooled sync client (thread-safe)"""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = httpx.Client(timeout=DEFAULT_TIMEOUT, limits=_limits(), http2=HTTP2_AVAILABLE)
+    return _client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """The pooled async client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, limits=_limits(), http2=HTTP2_AVAILABLE)
+            _async_clients[loop] = client
+    return client
+
+
+class _SharedClientView:
+    """
+    The shared client with a per-call default timeout.
+    
+    Exposes the request methods skills use; closing it is a no-op so the
+    pool survives the `with` block.
+    """
+    
+    def __init__(self, client: httpx.Client, timeout: Optional[float]):
+        self._client = client
+        self._timeout = timeout
+    
+    def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        if self._timeout is not None:
+            kwargs.setdefault("timeout", self._timeout)
+        response = self._client.request(method, url, **kwargs)
+        if method != "GET" and response.status_code < 400 and not _is_usage_mark(url):
+            # A write may change anything we cached from the same resource
+            _read_cache.invalidate(_resource_prefix(url))
+        return response
+    
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+    
+    def post(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+    
+    def put(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("PUT", url, **kwargs)
+    
+    def patch(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("PATCH", url, **kwargs)
+    
+    def delete(self, url: str, **kwargs) -> httpx.Response:
+        return self.request("DELETE", url, **kwargs)
+    
+    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None, ttl: Optional[float] = None) -> Any:
+        """
+        GET and decode JSON, served from the read cache when fresh.
+        
+        Returns None for non-200 responses (which are not cached).
+        """
+        return cached_get_json(url, params=params, ttl=ttl, timeout=self._timeout)
+
+
+@contextmanager
+def shared_client(timeout: Optional[float] = DEFAULT_TIMEOUT) -> Iterator[_SharedClientView]:
+    """
+    Drop-in for `with httpx.Client(timeout=...) as client:` that reuses
+    the pooled connection instead of opening a new one.
+    """
+    yield _SharedClientView(get_http_client(), timeout)
+
+
+def _is_usage_mark(url: str) -> bool:
+    """POST .../use only bumps usage counters; cached lookups stay valid"""
+    return httpx.URL(url).path.rstrip("/").endswith("/use")
+
+
+def _resource_prefix(url: str) -> str:
+    """Collection URL a write touches, e.g. .../otto/memory/12 -> .../otto/memory"""
+    path = httpx.URL(url).copy_with(query=None, fragment=None)
+    parts = str(path).rstrip("/").split("/")
+    while parts and (parts[-1].isdigit() or parts[-1] in ("use", "batch")):
+        parts.pop()
+    return "/".join(parts)
+
+
+class ReadCache:
+    """Small thread-safe TTL cache for GET responses, keyed by URL + params"""
+    
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, Tuple], Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]]) -> Tuple[str, Tuple]:
+        return url, tuple(sorted((k, str(v)) for k, v in (params or {}).items()))
+    
+    def get(self, key: Tuple[str, Tuple]) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+    
+    def put(self, key: Tuple[str, Tuple], value: Any, ttl: float):
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # Drop expired entries, then the oldest if still full
+                now = time.monotonic()
+                for k in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+                    del self._entries[k]
+                if len(self._entries) >= self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + ttl, value)
+    
+    def invalidate(self, url_prefix: str = ""):
+        """Drop cached reads whose URL starts with url_prefix (all by default)"""
+        with self._lock:
+            for k in [k for k in self._entries if k[0].startswith(url_prefix)]:
+                del self._entries[k]
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+_read_cache = ReadCache()
+
+
+def get_read_cache() -> ReadCache:
+    """The shared read cache (for invalidation and stats)"""
+    return _read_cache
+
+
+def cached_get_json(
+    url: str,
+    params: Optional[Dict[str, Any]] = None,
+    ttl: Optional[float] = None,
+    timeout: Optional[float] = DEFAULT_TIMEOUT
+) -> Any:
+    """GET JSON through the shared client and read cache; None if not 200"""
+    if ttl is None:
+        ttl = float(os.getenv("OTTO_HTTP_CACHE_TTL", str(DEFAULT_CACHE_TTL)))
+    key = ReadCache.key(url, params)
+    if ttl > 0:
+        found, value = _read_cache.get(key)
+        if found:
+            return value
+    
+    response = get_http_client().get(url, params=params, timeout=timeout)
+    if response.status_code != 200:
+        return None
+    value = response.json()
+    if ttl > 0:
+        _read_cache.put(key, value, ttl)
+    return value
+
+
+class MemoryUsageBatcher:
+    """
+    Collects "memory used" marks and sends them as one
+    POST /otto/memory/use {"ids": [...]} per base URL and interval.
+    
+    Usage tracking is bookkeeping, so it shouldn't add a round trip to
+    the lookup that triggered it.
+    """
+    
+    def __init__(self, interval: float = USAGE_FLUSH_INTERVAL):
+        self.interval = interval
+        self._pending: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+    
+    def mark(self, life_os_api_url: str, memory_id: Optional[int]):
+        """Queue a usage mark for one memory"""
+        if memory_id is None:
+            return
+        with self._lock:
+            self._pending.setdefault(life_os_api_url, []).append(memory_id)
+            if self._timer is None:
+                self._timer = threading.Timer(self.interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def flush(self):
+        """Send all queued marks now"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._timer = None
+        for base_url, ids in pending.items():
+            try:
+                get_http_client().post(f"{base_url}/otto/memory/use", json={"ids": ids}, timeout=5.0)
+            except Exception as e:
+                logger.warning(f"Could not record memory usage for {len(ids)} memories: {e}")
+
+
+_usage_batcher = MemoryUsageBatcher()
+# The flush timer is a daemon thread; don't drop marks queued just before exit
+atexit.register(_usage_batcher.flush)
+
+
+def mark_memory_used(life_os_api_url: str, memory_id: Optional[int]):
+    """Record that a memory was used (sent in the background, batched)"""
+    _usage_batcher.mark(life_os_api_url, memory_id)
+
+
+def close_http_clients():
+    """Flush pending usage marks and close the shared sync client"""
+    global _client
+    _usage_batcher.flush()
+    with _lock:
+        client, _client = _client, None
+        # Async clients belong to their loops; they close when those loops go away
+        _async_clients.clear()
+    if client is not None:
+        client.close()
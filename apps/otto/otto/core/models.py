@@ -3,7 +3,7 @@ Core data models for Otto
 """
 
 from typing import Any, Dict, Optional, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -22,6 +22,8 @@ class Task:
     payload: Dict[str, Any]
     source: str = "cli"  # e.g., "cli", "doc", "life_os"
     status: TaskStatus = TaskStatus.PENDING
+    depends_on: List[str] = field(default_factory=list)  # Task ids that must succeed first (run_tasks)
+    timeout: Optional[float] = None  # Seconds before run_tasks gives up on this task
 
 
 @dataclass
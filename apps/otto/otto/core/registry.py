@@ -0,0 +1,149 @@
+"""
+Skill registry for Otto - maps task types to skills once, dispatches in O(1)
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Any
+
+from .models import Task
+from .skill_base import Skill
+from .logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+WILDCARD = "*"
+
+
+class DispatchMetrics:
+    """Thread-safe counters and latency totals for skill lookups"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def reset(self):
+        """Clear all counters"""
+        with self._lock:
+            self.lookups = 0
+            self.routes: Dict[str, int] = {"exact": 0, "wildcard": 0, "fallback": 0, "miss": 0}
+            self.by_type: Dict[str, int] = {}
+            self.total_ns = 0
+            self.max_ns = 0
+    
+    def record(self, task_type: str, route: str, elapsed_ns: int):
+        """Record one lookup"""
+        with self._lock:
+            self.lookups += 1
+            self.routes[route] += 1
+            # Unmatched types share one bucket so arbitrary input can't grow this
+            key = task_type if route != "miss" else "<unmatched>"
+            self.by_type[key] = self.by_type.get(key, 0) + 1
+            self.total_ns += elapsed_ns
+            if elapsed_ns > self.max_ns:
+                self.max_ns = elapsed_ns
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Current metrics as a plain dict"""
+        with self._lock:
+            return {
+                "lookups": self.lookups,
+                "routes": dict(self.routes),
+                "by_type": dict(self.by_type),
+                "avg_latency_us": (self.total_ns / self.lookups / 1000) if self.lookups else 0.0,
+                "max_latency_us": self.max_ns / 1000,
+                "total_latency_ms": self.total_ns / 1_000_000,
+            }
+
+
+class SkillRegistry:
+    """
+    Index of skills by the task types they declare.
+    
+    Skills list their types in a `task_types` attribute. Entries ending in
+    ".*" (e.g. "memory.*") match any type under that prefix, and "*"
+    matches everything. Lookup order:
+    
+    1. Exact type (dict lookup)
+    2. Longest matching wildcard prefix (one dict lookup per dot in the type)
+    3. Skills without `task_types`, via `can_handle`, in registration order
+    
+    When two skills declare the same type, the first registered wins, as
+    with the old first-match scan over get_all_skills().
+    """
+    
+    def __init__(self, skills: Iterable[Skill]):
+        self.skills: List[Skill] = list(skills)
+        self.metrics = DispatchMetrics()
+        self._exact: Dict[str, Skill] = {}
+        self._prefixes: Dict[str, Skill] = {}  # "memory." for "memory.*", "" for "*"
+        self._fallback: List[Skill] = []
+        
+        for skill in self.skills:
+            task_types = getattr(skill, "task_types", None)
+            if task_types is None:
+                self._fallback.append(skill)
+                continue
+            for task_type in task_types:
+                if task_type == WILDCARD or task_type.endswith("." + WILDCARD):
+                    table, key = self._prefixes, task_type[:-1]
+                else:
+                    table, key = self._exact, task_type
+                if key in table:
+                    logger.warning(
+                        f"Task type '{task_type}' declared by both {table[key].name} and {skill.name}; "
+                        f"using {table[key].name}"
+                    )
+                    continue
+                table[key] = skill
+    
+    def __iter__(self) -> Iterator[Skill]:
+        return iter(self.skills)
+    
+    def __len__(self) -> int:
+        return len(self.skills)
+    
+    def _lookup(self, task: Task):
+        """Find (skill, route) for a task"""
+        task_type = task.type
+        skill = self._exact.get(task_type)
+        if skill is not None:
+            return skill, "exact"
+        
+        if self._prefixes:
+            end = len(task_type)
+            while True:
+                end = task_type.rfind(".", 0, end)
+                if end < 0:
+                    break
+                skill = self._prefixes.get(task_type[:end + 1])
+                if skill is not None:
+                    return skill, "wildcard"
+            skill = self._prefixes.get("")
+            if skill is not None:
+                return skill, "wildcard"
+        
+        for skill in self._fallback:
+            if skill.can_handle(task):
+                return skill, "fallback"
+        return None, "miss"
+    
+    def resolve(self, task: Task) -> Optional[Skill]:
+        """Return the skill that handles a task, or None"""
+        start = time.perf_counter_ns()
+        skill, route = self._lookup(task)
+        self.metrics.record(task.type, route, time.perf_counter_ns() - start)
+        return skill
+    
+    def get(self, name: str) -> Optional[Skill]:
+        """Find a skill by name"""
+        for skill in self.skills:
+            if skill.name == name:
+                return skill
+        return None
+    
+    def routes(self) -> Dict[str, str]:
+        """Declared task type (or wildcard) -> skill name"""
+        routes = {task_type: skill.name for task_type, skill in self._exact.items()}
+        routes.update({prefix + WILDCARD: skill.name for prefix, skill in self._prefixes.items()})
+        return routes
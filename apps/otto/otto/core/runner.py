@@ -2,50 +2,203 @@
 Task runner for Otto
 """
 
-from typing import List
+import asyncio
+import inspect
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Union
 from .models import Task, TaskResult
+from .registry import SkillRegistry
 from .skill_base import Skill, SkillContext
 
+# Worker threads for run_tasks (OTTO_RUNNER_WORKERS)
+DEFAULT_MAX_WORKERS = 8
+# How often the scheduler checks the cancel event, and whether queued tasks
+# with a timeout have started, while tasks are running
+_POLL_SECONDS = 0.1
+
+
+def execute_task(handler: Skill, task: Task, context: SkillContext) -> TaskResult:
+    """
+    Run a task with an already-resolved skill.
+    
+    Exceptions from the skill are turned into a failed TaskResult.
+    Async skills are driven to completion on a fresh event loop, so call
+    this from a worker thread (or SkillExecutor.run) inside the API.
+    """
+    try:
+        result = handler.run(task, context)
+        if inspect.iscoroutine(result):
+            result = asyncio.run(result)
+        return result
+    except Exception as e:
+        return TaskResult(
+            task_id=task.id,
+            success=False,
+            message=f"Error executing task: {str(e)}"
+        )
+
+
+def _failed(task: Task, message: str) -> TaskResult:
+    return TaskResult(task_id=task.id, success=False, message=message)
+
 
 def run_tasks(
     tasks: List[Task],
-    skills: List[Skill],
-    context: SkillContext
+    skills: Union[SkillRegistry, Sequence[Skill]],
+    context: SkillContext,
+    max_workers: Optional[int] = None,
+    skill_limits: Optional[Mapping[str, int]] = None,
+    cancel: Optional[threading.Event] = None
 ) -> List[TaskResult]:
     """
     Run a list of tasks using available skills.
     
-    For each task, finds the first skill that can handle it,
-    then executes the task.
+    For each task, looks up the skill registered for its type,
+    then executes the task. Pass a SkillRegistry built once at startup;
+    a plain list of skills is indexed on every call.
+    
+    Independent tasks run concurrently in a thread pool, so a sweep of
+    status checks takes as long as the slowest one. Results come back in
+    the same order as `tasks`.
+    
+    - task.depends_on: ids of tasks in this batch that must succeed first;
+      if one fails, the dependent task fails without running
+    - task.timeout: seconds the task may run, counted from when a worker
+      thread starts it (time queued behind other tasks does not count); on
+      expiry it is reported as failed
+    - skill_limits: max concurrent tasks per skill name, overriding the
+      skill's `max_concurrency` attribute (unlimited when neither is set)
+    - cancel: when set, tasks not yet finished are reported as cancelled
+    
+    A timed-out skill's thread is abandoned, not killed, and keeps its
+    skill_limits slot until it returns. Later tasks for that skill wait for
+    the slot, so a thread that never returns holds them, and this call,
+    indefinitely: task.timeout bounds each task, not the call. To bound the
+    whole call, set `cancel` from a timer (e.g. threading.Timer).
     """
-    results: List[TaskResult] = []
-    
-    for task in tasks:
-        # Find a skill that can handle this task
-        handler: Skill | None = None
-        for skill in skills:
-            if skill.can_handle(task):
-                handler = skill
-                break
-        
+    registry = skills if isinstance(skills, SkillRegistry) else SkillRegistry(skills)
+    results: List[Optional[TaskResult]] = [None] * len(tasks)
+    
+    # Find a skill that can handle each task
+    handlers: List[Optional[Skill]] = []
+    for i, task in enumerate(tasks):
+        handler = registry.resolve(task)
         if handler is None:
-            results.append(TaskResult(
-                task_id=task.id,
-                success=False,
-                message=f"No skill found to handle task type: {task.type}"
-            ))
+            results[i] = _failed(task, f"No skill found to handle task type: {task.type}")
+        handlers.append(handler)
+    
+    # Nothing to schedule around: keep the plain inline path
+    if len(tasks) == 1 and handlers[0] is not None and not tasks[0].timeout and not tasks[0].depends_on:
+        results[0] = execute_task(handlers[0], tasks[0], context)
+        return results
+    
+    index_by_id: Dict[str, int] = {task.id: i for i, task in enumerate(tasks)}
+    waiting_on: Dict[int, Set[int]] = {}
+    for i, task in enumerate(tasks):
+        if results[i] is not None:
             continue
-        
-        # Execute the task
-        try:
-            result = handler.run(task, context)
-            results.append(result)
-        except Exception as e:
-            results.append(TaskResult(
-                task_id=task.id,
-                success=False,
-                message=f"Error executing task: {str(e)}"
-            ))
+        missing = [dep for dep in task.depends_on if dep not in index_by_id]
+        if missing:
+            results[i] = _failed(task, f"Unknown dependency: {', '.join(missing)}")
+        else:
+            waiting_on[i] = {index_by_id[dep] for dep in task.depends_on}
+    
+    limits: Dict[str, int] = {}
+    for handler in handlers:
+        if handler is not None:
+            limit = (skill_limits or {}).get(handler.name, getattr(handler, "max_concurrency", None))
+            if limit:
+                limits[handler.name] = limit
+    in_flight: Dict[str, int] = {}
+    
+    if max_workers is None:
+        max_workers = int(os.getenv("OTTO_RUNNER_WORKERS", str(DEFAULT_MAX_WORKERS)))
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks) or 1)), thread_name_prefix="otto-run")
+    running: Dict[Future, int] = {}
+    # Timed-out tasks whose threads are still going
+    abandoned: Dict[Future, int] = {}
+    # When each task began running, set from its worker thread
+    started: Dict[int, float] = {}
+    
+    def start(i: int) -> TaskResult:
+        started[i] = time.monotonic()
+        return execute_task(handlers[i], tasks[i], context)
+    
+    def release(i: int):
+        in_flight[handlers[i].name] -= 1
+    
+    try:
+        while True:
+            if cancel is not None and cancel.is_set():
+                for future, i in running.items():
+                    future.cancel()
+                    results[i] = _failed(tasks[i], "Cancelled")
+                running.clear()
+                for i in waiting_on:
+                    if results[i] is None:
+                        results[i] = _failed(tasks[i], "Cancelled")
+                break
+            
+            # Settle tasks whose dependencies are done, start the ready ones
+            # (repeat so a skipped task can skip its dependents in the same pass)
+            settled = True
+            while settled:
+                settled = False
+                for i in list(waiting_on):
+                    deps = waiting_on[i]
+                    failed_deps = [tasks[d].id for d in deps if results[d] is not None and not results[d].success]
+                    if failed_deps:
+                        results[i] = _failed(tasks[i], f"Skipped: dependency failed: {', '.join(failed_deps)}")
+                        del waiting_on[i]
+                        settled = True
+                        continue
+                    if any(results[d] is None for d in deps):
+                        continue
+                    name = handlers[i].name
+                    if name in limits and in_flight.get(name, 0) >= limits[name]:
+                        continue
+                    in_flight[name] = in_flight.get(name, 0) + 1
+                    del waiting_on[i]
+                    running[pool.submit(start, i)] = i
+            
+            if not running:
+                # Ready tasks held back only by a slot an abandoned thread still has
+                held = bool(abandoned) and any(all(results[d] is not None for d in deps) for deps in waiting_on.values())
+                if not held:
+                    # Anything still waiting depends on itself through a cycle
+                    for i in waiting_on:
+                        results[i] = _failed(tasks[i], "Dependency cycle")
+                    break
+            
+            wait_for = None
+            timed = [i for i in running.values() if tasks[i].timeout]
+            running_deadlines = [started[i] + tasks[i].timeout for i in timed if i in started]
+            if running_deadlines:
+                wait_for = max(0.0, min(running_deadlines) - time.monotonic())
+            if cancel is not None or len(running_deadlines) < len(timed):
+                wait_for = _POLL_SECONDS if wait_for is None else min(wait_for, _POLL_SECONDS)
+            done, _ = wait(list(running) + list(abandoned), timeout=wait_for, return_when=FIRST_COMPLETED)
+            
+            # Free skill slots only once the thread has actually returned
+            for future in done:
+                if future in abandoned:
+                    release(abandoned.pop(future))
+                    continue
+                i = running.pop(future)
+                release(i)
+                results[i] = future.result()
+            
+            now = time.monotonic()
+            for future, i in list(running.items()):
+                if tasks[i].timeout and i in started and now >= started[i] + tasks[i].timeout:
+                    del running[future]
+                    abandoned[future] = i
+                    results[i] = _failed(tasks[i], f"Timed out after {tasks[i].timeout:g}s")
+    finally:
+        # Don't block on abandoned (timed out / cancelled) tasks
+        pool.shutdown(wait=False, cancel_futures=True)
     
     return results
-
@@ -2,7 +2,7 @@
 Base classes and interfaces for Otto skills
 """
 
-from typing import Protocol, List, Optional, Any
+from typing import Protocol, List, Optional, Any, AbstractSet, Callable
 from dataclasses import dataclass
 from .models import Task, TaskResult
 
@@ -20,19 +20,30 @@ class SkillContext:
     """Context passed to skills when executing"""
     config: Any  # AppConfig
     logger: Any  # logging.Logger (will be added later)
+    # Set by SkillExecutor for background tasks; called as progress(message, data)
+    progress: Optional[Callable[[str, Optional[dict]], None]] = None
+
+
+def report_progress(context: SkillContext, message: str, **data: Any):
+    """Report progress from a long-running skill (no-op outside background tasks)"""
+    if context.progress is not None:
+        context.progress(message, data or None)
 
 
 class Skill(Protocol):
     """Protocol that all Otto skills must implement"""
     
     name: str
+    # Task types this skill handles, e.g. {"memory.recall"} or {"memory.*"};
+    # used by SkillRegistry for O(1) dispatch (skills without it fall back to can_handle)
+    task_types: AbstractSet[str]
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the given task"""
         ...
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
-        """Execute the task"""
+        """Execute the task (may be `async def`; SkillExecutor awaits it on the event loop)"""
         ...
     
     def self_test(self, context: SkillContext) -> List[SkillHealthIssue]:
@@ -23,6 +23,9 @@ from .deployment_automation import DeploymentAutomationSkill
 from .launcher_diagnostic import LauncherDiagnosticSkill
 from .activity_reporting import ActivityReportingSkill
 from .monitor_repair_redeploy import MonitorRepairRedeploySkill
+from ..core.registry import SkillRegistry
+
+_registry = None
 
 def get_all_skills():
     """Get all available Otto skills"""
@@ -50,3 +53,10 @@ def get_all_skills():
         MonitorRepairRedeploySkill(),
     ]
 
+
+def get_skill_registry() -> SkillRegistry:
+    """Get the shared task type -> skill registry (built on first use)"""
+    global _registry
+    if _registry is None:
+        _registry = SkillRegistry(get_all_skills())
+    return _registry
@@ -5,11 +5,11 @@ Generates activity reports for specified time periods and automatic daily report
 
 from typing import List, Dict, Any, Optional
 import os
-import httpx
 from datetime import datetime, timedelta, date
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client
 from ..core.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -20,6 +20,13 @@ class ActivityReportingSkill:
     
     name = "activity_reporting"
     description = "Tracks and reports on all OTTO activity and changes within specified time periods"
+    task_types = frozenset({
+        "activity.report",
+        "activity.daily_report",
+        "activity.compare_periods",
+        "activity.list_reports",
+        "activity.get_report",
+    })
     
     def __init__(self):
         # Life OS backend API URL
@@ -27,13 +34,7 @@ class ActivityReportingSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in [
-            "activity.report",
-            "activity.daily_report",
-            "activity.compare_periods",
-            "activity.list_reports",
-            "activity.get_report",
-        ]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the activity reporting operation"""
@@ -79,7 +80,7 @@ class ActivityReportingSkill:
             )
         
         try:
-            with httpx.Client(timeout=30.0) as client:
+            with shared_client(timeout=30.0) as client:
                 params = {
                     "start": start_time,
                     "end": end_time,
@@ -127,7 +128,7 @@ class ActivityReportingSkill:
         compare_previous = payload.get("compare_previous", True)
         
         try:
-            with httpx.Client(timeout=30.0) as client:
+            with shared_client(timeout=30.0) as client:
                 params = {}
                 if target_date:
                     params["target_date"] = target_date
@@ -183,7 +184,7 @@ class ActivityReportingSkill:
             )
         
         try:
-            with httpx.Client(timeout=30.0) as client:
+            with shared_client(timeout=30.0) as client:
                 params = {
                     "report1_id": report1_id,
                     "report2_id": report2_id
@@ -220,7 +221,7 @@ class ActivityReportingSkill:
         limit = payload.get("limit", 30)
         
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 params = {"limit": limit}
                 if report_type:
                     params["report_type"] = report_type
@@ -263,7 +264,7 @@ class ActivityReportingSkill:
             )
         
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(f"{self.life_os_api_url}/otto/activity/reports/{report_id}")
                 
                 if response.status_code == 200:
@@ -299,7 +300,7 @@ class ActivityReportingSkill:
         issues = []
         
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.life_os_api_url}/health")
                 if response.status_code != 200:
                     issues.append(SkillHealthIssue(
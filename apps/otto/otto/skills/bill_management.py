@@ -9,11 +9,11 @@ Implements:
 
 from typing import List, Dict, Any, Optional
 import os
-import httpx
 from datetime import datetime, timedelta
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client
 from ..core.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +24,16 @@ class BillManagementSkill:
     
     name = "bill_management"
     description = "Manages bills: create, update, mark paid, list, find upcoming/overdue, summarize"
+    task_types = frozenset({
+        "bills.create_bill",
+        "bills.list_bills",
+        "bills.update_bill",
+        "bills.mark_paid",
+        "bills.find_upcoming",
+        "bills.find_overdue",
+        "bills.summarize_bills",
+        "bills.get_bill",
+    })
     
     def __init__(self):
         # Life OS backend API URL
@@ -31,16 +41,7 @@ class BillManagementSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in [
-            "bills.create_bill",
-            "bills.list_bills",
-            "bills.update_bill",
-            "bills.mark_paid",
-            "bills.find_upcoming",
-            "bills.find_overdue",
-            "bills.summarize_bills",
-            "bills.get_bill",
-        ]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the bill management operation"""
@@ -122,7 +123,7 @@ class BillManagementSkill:
                 params["overdue"] = True
             params["limit"] = payload.get("limit", 50)
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/bills",
                     params=params
@@ -233,7 +234,7 @@ class BillManagementSkill:
                 "limit": 100
             }
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/bills",
                     params=params
@@ -285,7 +286,7 @@ class BillManagementSkill:
                 "limit": 100
             }
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/bills",
                     params=params
@@ -322,7 +323,7 @@ class BillManagementSkill:
         
         # Use the summary endpoint
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/bills/upcoming/summary",
                     params={"days": days}
@@ -368,7 +369,7 @@ class BillManagementSkill:
         
         # Fetch bill from API
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/bills/{bill_id}"
                 )
@@ -407,7 +408,7 @@ class BillManagementSkill:
         
         # Check if Life OS API is reachable
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.life_os_api_url}/health")
                 if response.status_code != 200:
                     issues.append(SkillHealthIssue(
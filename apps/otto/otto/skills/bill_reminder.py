@@ -4,11 +4,11 @@ BillReminderSkill - Monitors bills and creates reminders
 
 from typing import List, Dict, Any
 import os
-import httpx
 from datetime import datetime, timedelta
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client
 from ..core.logging_utils import get_logger
 from .memory_helpers import get_reminder_pattern
 
@@ -20,6 +20,13 @@ class BillReminderSkill:
     
     name = "bill_reminder"
     description = "Monitors household bills and creates reminder tasks for upcoming or overdue bills"
+    task_types = frozenset({
+        "bill_reminder",
+        "check_bills",
+        "create_bill_reminders",
+        "scan_bills",
+        "upcoming_bills",
+    })
     
     def __init__(self):
         # Life OS backend API URL
@@ -27,13 +34,7 @@ class BillReminderSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in [
-            "bill_reminder",
-            "check_bills",
-            "create_bill_reminders",
-            "scan_bills",
-            "upcoming_bills"
-        ]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the bill reminder check"""
@@ -167,7 +168,7 @@ class BillReminderSkill:
     def _fetch_bills(self) -> List[Dict[str, Any]]:
         """Fetch bills from Life OS API"""
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 # Get upcoming bills (next 30 days) and overdue bills
                 response = client.get(
                     f"{self.life_os_api_url}/bills",
@@ -265,7 +266,7 @@ class BillReminderSkill:
         
         # Check if Life OS API is reachable
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.life_os_api_url}/health")
                 if response.status_code != 200:
                     issues.append(SkillHealthIssue(
@@ -10,11 +10,11 @@ Implements:
 
 from typing import List, Dict, Any, Optional
 import os
-import httpx
 from datetime import datetime, timedelta
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client
 from ..core.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -25,6 +25,16 @@ class CalendarSkill:
     
     name = "calendar"
     description = "Manages calendar events: create, update, list, find upcoming, detect conflicts"
+    task_types = frozenset({
+        "calendar.create_event",
+        "calendar.list_events",
+        "calendar.update_event",
+        "calendar.delete_event",
+        "calendar.find_upcoming",
+        "calendar.find_conflicts",
+        "calendar.create_reminder",
+        "calendar.get_event",
+    })
     
     def __init__(self):
         # Life OS backend API URL
@@ -32,16 +42,7 @@ class CalendarSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in [
-            "calendar.create_event",
-            "calendar.list_events",
-            "calendar.update_event",
-            "calendar.delete_event",
-            "calendar.find_upcoming",
-            "calendar.find_conflicts",
-            "calendar.create_reminder",
-            "calendar.get_event",
-        ]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the calendar operation"""
@@ -124,7 +125,7 @@ class CalendarSkill:
                 params["status"] = payload.get("status")
             params["limit"] = payload.get("limit", 50)
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/calendar",
                     params=params
@@ -207,7 +208,7 @@ class CalendarSkill:
         
         # Delete via API (Tier 2 - affects scheduling)
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.delete(
                     f"{self.life_os_api_url}/calendar/{event_id}"
                 )
@@ -245,7 +246,7 @@ class CalendarSkill:
         
         # Use the upcoming endpoint
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/calendar/upcoming",
                     params={"days": days}
@@ -309,7 +310,7 @@ class CalendarSkill:
                 "limit": 100
             }
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/calendar",
                     params=params
@@ -400,7 +401,7 @@ class CalendarSkill:
         
         # Fetch event from API
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/calendar/{event_id}"
                 )
@@ -439,7 +440,7 @@ class CalendarSkill:
         
         # Check if Life OS API is reachable
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.life_os_api_url}/health")
                 if response.status_code != 200:
                     issues.append(SkillHealthIssue(
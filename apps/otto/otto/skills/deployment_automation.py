@@ -39,6 +39,15 @@ class DeploymentAutomationSkill:
     
     name = "deployment_automation"
     description = "Automates deployment: push commits, monitor builds, auto-fix errors until live site matches code"
+    task_types = frozenset({
+        "deployment.deploy_and_fix",
+        "deployment.sync_to_live",
+        "deployment.push_and_monitor",
+        "deployment.auto_deploy",
+        "catered_by_me.deploy",
+        "corporate_crashout.deploy",
+        "achillies.deploy",
+    })
     
     def __init__(self):
         """Initialize the skill with infrastructure clients"""
@@ -89,15 +98,7 @@ class DeploymentAutomationSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in [
-            "deployment.deploy_and_fix",
-            "deployment.sync_to_live",
-            "deployment.push_and_monitor",
-            "deployment.auto_deploy",
-            "catered_by_me.deploy",
-            "corporate_crashout.deploy",
-            "achillies.deploy",
-        ]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the deployment automation workflow"""
@@ -23,6 +23,16 @@ class DeploymentStatusSkill:
     
     name = "deployment_status"
     description = "Checks deployment status across Vercel, Render, Stripe, Cloudflare, and GitHub"
+    task_types = frozenset({
+        "deployment.check_status",
+        "deployment.check_vercel",
+        "deployment.check_render",
+        "deployment.check_stripe",
+        "deployment.check_cloudflare",
+        "deployment.check_all",
+        "infra.check_deployments",
+        "check_deployment_status",
+    })
     
     def __init__(self):
         """Initialize the skill with infrastructure clients"""
@@ -98,16 +108,7 @@ class DeploymentStatusSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in [
-            "deployment.check_status",
-            "deployment.check_vercel",
-            "deployment.check_render",
-            "deployment.check_stripe",
-            "deployment.check_cloudflare",
-            "deployment.check_all",
-            "infra.check_deployments",
-            "check_deployment_status",
-        ]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the deployment status check"""
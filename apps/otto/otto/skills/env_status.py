@@ -5,11 +5,11 @@ EnvStatusSkill - Diagnoses environment and dependency status
 from typing import List, Dict, Any
 import os
 import subprocess
-import httpx
 from pathlib import Path
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client
 from ..core.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -20,6 +20,12 @@ class EnvStatusSkill:
     
     name = "env_status"
     description = "Diagnoses environment setup, dependencies, and service health"
+    task_types = frozenset({
+        "env_status",
+        "otto_doctor",
+        "check_dependencies",
+        "diagnose_env",
+    })
     
     def __init__(self):
         # Life OS backend API URL
@@ -29,7 +35,7 @@ class EnvStatusSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in ["env_status", "otto_doctor", "check_dependencies", "diagnose_env"]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the environment status check"""
@@ -166,7 +172,7 @@ class EnvStatusSkill:
     def _check_otto_api(self) -> Dict[str, Any]:
         """Check if Otto API is running"""
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.otto_api_url}/health")
                 if response.status_code == 200:
                     return {"ok": True, "url": self.otto_api_url}
@@ -178,7 +184,7 @@ class EnvStatusSkill:
     def _check_life_os_backend(self) -> Dict[str, Any]:
         """Check if Life OS Backend is running"""
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.life_os_api_url}/health")
                 if response.status_code == 200:
                     return {"ok": True, "url": self.life_os_api_url}
@@ -190,7 +196,7 @@ class EnvStatusSkill:
     def _check_life_os_frontend(self) -> Dict[str, Any]:
         """Check if Life OS Frontend is running"""
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get("http://localhost:3000")
                 if response.status_code == 200:
                     return {"ok": True, "url": "http://localhost:3000"}
@@ -9,11 +9,11 @@ Implements:
 
 from typing import List, Dict, Any, Optional
 import os
-import httpx
 from datetime import datetime, timedelta
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client
 from ..core.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +24,14 @@ class IncomeTrackingSkill:
     
     name = "income_tracking"
     description = "Tracks income sources: create, update, list, summarize by period"
+    task_types = frozenset({
+        "income.create_income",
+        "income.list_income",
+        "income.update_income",
+        "income.summarize_income",
+        "income.by_period",
+        "income.get_income",
+    })
     
     def __init__(self):
         # Life OS backend API URL
@@ -31,14 +39,7 @@ class IncomeTrackingSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in [
-            "income.create_income",
-            "income.list_income",
-            "income.update_income",
-            "income.summarize_income",
-            "income.by_period",
-            "income.get_income",
-        ]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the income tracking operation"""
@@ -114,7 +115,7 @@ class IncomeTrackingSkill:
                 params["end_date"] = payload.get("end_date")
             params["limit"] = payload.get("limit", 50)
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/income",
                     params=params
@@ -176,7 +177,7 @@ class IncomeTrackingSkill:
             if payload.get("recurrence_frequency") is not None:
                 update_data["recurrence_frequency"] = payload.get("recurrence_frequency")
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.patch(
                     f"{self.life_os_api_url}/income/{income_id}",
                     json=update_data
@@ -222,7 +223,7 @@ class IncomeTrackingSkill:
             if end_date:
                 params["end_date"] = end_date
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/income",
                     params=params
@@ -291,7 +292,7 @@ class IncomeTrackingSkill:
             if year:
                 params["year"] = year
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/income/summary/by_period",
                     params=params
@@ -335,7 +336,7 @@ class IncomeTrackingSkill:
         
         # Fetch income from API
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/income/{income_id}"
                 )
@@ -374,7 +375,7 @@ class IncomeTrackingSkill:
         
         # Check if Life OS API is reachable
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.life_os_api_url}/health")
                 if response.status_code != 200:
                     issues.append(SkillHealthIssue(
@@ -21,10 +21,16 @@ class LauncherDiagnosticSkill:
     
     name = "launcher_diagnostic"
     description = "Diagnose and fix launcher dependency and configuration issues"
+    task_types = frozenset({
+        "launcher_diagnostic",
+        "fix_launcher",
+        "diagnose_launcher",
+        "test_launcher",
+    })
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in ["launcher_diagnostic", "fix_launcher", "diagnose_launcher", "test_launcher"]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute launcher diagnostic"""
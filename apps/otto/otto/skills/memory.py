@@ -5,11 +5,11 @@ Phase 3 Extension — CONTROL_OTTO_LONG_TERM_MEMORY.md
 
 from typing import List, Dict, Any, Optional
 import os
-import httpx
 from datetime import datetime
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client, mark_memory_used
 from ..core.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -20,6 +20,15 @@ class OttoMemorySkill:
     
     name = "memory"
     description = "Manages Otto's structured long-term memory (preferences, rules, facts, workflow cues)"
+    task_types = frozenset({
+        "memory.remember",
+        "memory.recall",
+        "memory.lookup",
+        "memory.search",
+        "memory.update",
+        "memory.propose",
+        "memory.delete",
+    })
     
     def __init__(self):
         # Life OS backend API URL
@@ -27,15 +36,7 @@ class OttoMemorySkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in [
-            "memory.remember",
-            "memory.recall",
-            "memory.lookup",
-            "memory.search",
-            "memory.update",
-            "memory.propose",
-            "memory.delete"
-        ]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the memory operation"""
@@ -116,10 +117,13 @@ class OttoMemorySkill:
         )
     
     def _handle_recall(self, task: Task, context: SkillContext) -> TaskResult:
-        """Handle memory.recall - Retrieve specific memory by ID"""
+        """Handle memory.recall - Retrieve specific memory by ID (or several with 'ids')"""
         payload = task.payload or {}
         memory_id = payload.get("id")
         
+        if payload.get("ids"):
+            return self._recall_many(task, payload["ids"])
+        
         if not memory_id:
             return TaskResult(
                 task_id=task.id,
@@ -128,17 +132,14 @@ class OttoMemorySkill:
             )
         
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(f"{self.life_os_api_url}/otto/memory/{memory_id}")
                 
                 if response.status_code == 200:
                     memory = response.json()
                     
-                    # Mark as used
-                    client.post(
-                        f"{self.life_os_api_url}/otto/memory/use",
-                        json={"id": memory_id}
-                    )
+                    # Mark as used (batched, sent in the background)
+                    mark_memory_used(self.life_os_api_url, memory.get("id"))
                     
                     return TaskResult(
                         task_id=task.id,
@@ -168,6 +169,50 @@ class OttoMemorySkill:
                 message=f"Error recalling memory: {str(e)}"
             )
     
+    def _recall_many(self, task: Task, memory_ids: List[int]) -> TaskResult:
+        """memory.recall with 'ids' - fetch several memories in one request"""
+        try:
+            with shared_client(timeout=10.0) as client:
+                response = client.get(
+                    f"{self.life_os_api_url}/otto/memory/batch",
+                    params={"ids": ",".join(str(i) for i in memory_ids)}
+                )
+                
+                if response.status_code != 200:
+                    return TaskResult(
+                        task_id=task.id,
+                        success=False,
+                        message=f"Error recalling memories: {response.status_code}"
+                    )
+                memories = response.json()
+            
+            for memory in memories:
+                mark_memory_used(self.life_os_api_url, memory.get("id"))
+            
+            found_ids = [m.get("id") for m in memories]
+            missing = [i for i in memory_ids if i not in found_ids]
+            return TaskResult(
+                task_id=task.id,
+                success=bool(memories),
+                message=f"Recalled {len(memories)} of {len(memory_ids)} memory(ies)",
+                data={"memories": memories, "count": len(memories), "missing_ids": missing},
+                reasoning={
+                    "steps": [{
+                        "id": "step1",
+                        "type": "recall",
+                        "summary": f"Retrieved memory IDs {found_ids}",
+                        "evidence": [{"kind": "memory", "id": i} for i in found_ids]
+                    }]
+                },
+                evidence={"memory_ids": found_ids}
+            )
+        except Exception as e:
+            return TaskResult(
+                task_id=task.id,
+                success=False,
+                message=f"Error recalling memories: {str(e)}"
+            )
+    
     def _handle_search(self, task: Task, context: SkillContext) -> TaskResult:
         """Handle memory.search - Search memories with filters"""
         payload = task.payload or {}
@@ -180,7 +225,7 @@ class OttoMemorySkill:
         limit = payload.get("limit", 50)
         
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 params = {"limit": limit}
                 if q:
                     params["q"] = q
@@ -239,7 +284,7 @@ class OttoMemorySkill:
         limit = payload.get("limit", 50)
         
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 params = {"limit": limit}
                 if category:
                     params["category"] = category
@@ -248,14 +293,13 @@ class OttoMemorySkill:
                 if source:
                     params["source"] = source
                 
-                response = client.get(
+                # Lookups are read-mostly preferences/hints, served from the short-TTL cache
+                memories = client.get_json(
                     f"{self.life_os_api_url}/otto/memory",
                     params=params
                 )
                 
-                if response.status_code == 200:
-                    memories = response.json()
-                    
+                if memories is not None:
                     # Mark all as used
                     if memories:
                         use_request = {}
@@ -289,7 +333,7 @@ class OttoMemorySkill:
                     return TaskResult(
                         task_id=task.id,
                         success=False,
-                        message=f"Error querying memories: {response.status_code}"
+                        message="Error querying memories"
                     )
         except Exception as e:
             return TaskResult(
@@ -439,7 +483,7 @@ class OttoMemorySkill:
         # Check if Life OS API is reachable
         try:
             life_os_url = os.getenv("LIFE_OS_API_URL", "http://localhost:8000")
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{life_os_url}/health")
                 if response.status_code != 200:
                     issues.append(SkillHealthIssue(
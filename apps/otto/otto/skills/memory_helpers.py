@@ -6,14 +6,18 @@ Provides helper functions for skills to:
 - Lookup reminder patterns from memory
 - Lookup vendor hints for tax categorization
 - Track memory usage
+
+Lookups go through the shared pooled client and its short-TTL read cache,
+and usage marks are batched in the background (see otto.core.http_client).
 """
 
 from typing import List, Dict, Any, Optional, Tuple
 import os
-import httpx
 import re
 from datetime import datetime
 
+from ..core.http_client import cached_get_json, mark_memory_used
+
 logger = None  # Will be set by importing skill
 
 
@@ -34,61 +38,50 @@ def get_reminder_pattern(life_os_api_url: str) -> Tuple[List[int], Optional[int]
     default_pattern = [7, 1, 0]  # Fallback
     
     try:
-        with httpx.Client(timeout=5.0) as client:
-            # Phase 4: Lookup memory, prefer non-stale
-            # First try non-stale
-            response = client.get(
+        # Phase 4: Lookup memory, prefer non-stale
+        # First try non-stale
+        memories = cached_get_json(
+            f"{life_os_api_url}/otto/memory",
+            params={
+                "category": "preference",
+                "tags": "reminder_pattern",
+                "is_stale": False,
+                "limit": 1
+            },
+            timeout=5.0
+        ) or []
+        
+        # If no non-stale found, try any (including stale)
+        if not memories:
+            memories = cached_get_json(
                 f"{life_os_api_url}/otto/memory",
                 params={
                     "category": "preference",
                     "tags": "reminder_pattern",
-                    "is_stale": False,
                     "limit": 1
-                }
-            )
-            
-            memories = []
-            if response.status_code == 200:
-                memories = response.json()
-            
-            # If no non-stale found, try any (including stale)
-            if not memories:
-                response = client.get(
-                    f"{life_os_api_url}/otto/memory",
-                    params={
-                        "category": "preference",
-                        "tags": "reminder_pattern",
-                        "limit": 1
-                    }
-                )
-                if response.status_code == 200:
-                    memories = response.json()
+                },
+                timeout=5.0
+            ) or []
+        
+        if memories:
+            memory = memories[0]
+            is_stale = memory.get("is_stale", False)
+            content = memory.get("content", "")
             
-            if memories:
-                memory = memories[0]
-                is_stale = memory.get("is_stale", False)
-                content = memory.get("content", "")
+            # Parse pattern from content
+            days = _parse_reminder_pattern(content)
+            if days:
+                # Mark as used (batched, sent in the background)
+                mark_memory_used(life_os_api_url, memory.get("id"))
                 
-                # Parse pattern from content
-                days = _parse_reminder_pattern(content)
-                if days:
-                    # Mark as used
-                    try:
-                        client.post(
-                            f"{life_os_api_url}/otto/memory/use",
-                            json={"id": memory.get("id")}
-                        )
-                    except:
-                        pass
-                    
-                    # Phase 4: Warn if using stale memory
-                    if is_stale and logger:
-                        logger.warning(f"Using stale reminder pattern memory (ID: {memory.get('id')})")
-                    
-                    return days, memory.get("id"), memory
-            
-            # Not found, return default
-            return default_pattern, None, None
+                # Phase 4: Warn if using stale memory
+                if is_stale and logger:
+                    logger.warning(f"Using stale reminder pattern memory (ID: {memory.get('id')})")
+                
+                return days, memory.get("id"), memory
+        
+        # Not found, return default
+        return default_pattern, None, None
     except Exception as e:
         if logger:
             logger.warning(f"Error looking up reminder pattern: {str(e)}")
@@ -144,61 +137,50 @@ def get_vendor_hint(life_os_api_url: str, vendor_name: str) -> Tuple[Optional[st
     try:
         normalized_vendor = vendor_name.upper().strip()
         
-        with httpx.Client(timeout=5.0) as client:
-            # Phase 4: First try non-stale memories
-            response = client.get(
+        # Phase 4: First try non-stale memories
+        memories = cached_get_json(
+            f"{life_os_api_url}/otto/memory",
+            params={
+                "category": "tax_hint",
+                "tags": f"vendor:{normalized_vendor}",
+                "is_stale": False,
+                "limit": 10
+            },
+            timeout=5.0
+        ) or []
+        
+        # If no non-stale found, try any (including stale)
+        if not memories:
+            memories = cached_get_json(
                 f"{life_os_api_url}/otto/memory",
                 params={
                     "category": "tax_hint",
                     "tags": f"vendor:{normalized_vendor}",
-                    "is_stale": False,
                     "limit": 10
-                }
-            )
-            
-            memories = []
-            if response.status_code == 200:
-                memories = response.json()
-            
-            # If no non-stale found, try any (including stale)
-            if not memories:
-                response = client.get(
-                    f"{life_os_api_url}/otto/memory",
-                    params={
-                        "category": "tax_hint",
-                        "tags": f"vendor:{normalized_vendor}",
-                        "limit": 10
-                    }
-                )
-                if response.status_code == 200:
-                    memories = response.json()
+                },
+                timeout=5.0
+            ) or []
+        
+        # Find exact match
+        for memory in memories:
+            tags = memory.get("tags") or []
+            is_stale = memory.get("is_stale", False)
             
-            # Find exact match
-            for memory in memories:
-                tags = memory.get("tags", [])
-                is_stale = memory.get("is_stale", False)
+            if any(f"vendor:{normalized_vendor}" in str(tag).upper() for tag in tags):
+                content = memory.get("content", "")
+                category_code = _parse_category_code_from_hint(content)
                 
-                if any(f"vendor:{normalized_vendor}" in str(tag).upper() for tag in tags):
-                    content = memory.get("content", "")
-                    category_code = _parse_category_code_from_hint(content)
+                if category_code:
+                    # Mark as used (batched, sent in the background)
+                    mark_memory_used(life_os_api_url, memory.get("id"))
                     
-                    if category_code:
-                        # Mark as used
-                        try:
-                            client.post(
-                                f"{life_os_api_url}/otto/memory/use",
-                                json={"id": memory.get("id")}
-                            )
-                        except:
-                            pass
-                        
-                        # Phase 4: Warn if using stale memory
-                        if is_stale and logger:
-                            logger.warning(f"Using stale vendor hint memory (ID: {memory.get('id')}) for vendor {vendor_name}")
-                        
-                        return category_code, memory.get("id"), memory
-            
-            return None, None, None
+                    # Phase 4: Warn if using stale memory
+                    if is_stale and logger:
+                        logger.warning(f"Using stale vendor hint memory (ID: {memory.get('id')}) for vendor {vendor_name}")
+                    
+                    return category_code, memory.get("id"), memory
+        
+        return None, None, None
     except Exception as e:
         if logger:
             logger.warning(f"Error looking up vendor hint: {str(e)}")
@@ -12,7 +12,7 @@ from typing import Any, Dict, List, Optional
 from pathlib import Path
 
 from ..core.models import Task, TaskResult
-from ..core.skill_base import SkillContext
+from ..core.skill_base import SkillContext, report_progress
 from ..core.logging_utils import get_logger
 from ..providers.vercel_client import VercelClient
 from ..providers.render_client import RenderClient
@@ -28,6 +28,7 @@ class MonitorRepairRedeploySkill:
     
     name = "monitor_repair_redeploy"
     description = "Monitors Vercel and Render deployments, detects failures, applies minimal fixes, commits, and redeploys"
+    task_types = frozenset({"monitor_repair_redeploy"})
     
     def __init__(self):
         """Initialize the skill with provider clients"""
@@ -58,7 +59,7 @@ class MonitorRepairRedeploySkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type == "monitor_repair_redeploy"
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Run the monitor/repair/redeploy loop"""
@@ -78,6 +79,7 @@ class MonitorRepairRedeploySkill:
             while iteration < max_iterations:
                 iteration += 1
                 logger.info(f"Monitor/repair iteration {iteration}/{max_iterations}")
+                report_progress(context, "iteration", iteration=iteration, max_iterations=max_iterations)
                 
                 # Check Vercel status
                 vercel_status = None
@@ -135,6 +137,11 @@ class MonitorRepairRedeploySkill:
                             "target": failing_target[0],
                             "files_changed": fix_result.get("files_changed", [])
                         })
+                        report_progress(
+                            context, "fix_applied",
+                            target=failing_target[0],
+                            files_changed=fix_result.get("files_changed", [])
+                        )
                         
                         # Wait for redeploy
                         logger.info("Waiting for redeploy to trigger...")
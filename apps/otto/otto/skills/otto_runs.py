@@ -8,6 +8,7 @@ import os
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client
 from ..core.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -18,6 +19,12 @@ class OttoRunsSkill:
     
     name = "otto_runs"
     description = "Query and view Otto run history from the Life OS backend"
+    task_types = frozenset({
+        "otto_runs",
+        "list_otto_runs",
+        "get_otto_run",
+        "otto_history",
+    })
     
     def __init__(self):
         # Life OS backend API URL - use env var or default
@@ -26,7 +33,7 @@ class OttoRunsSkill:
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
         # Handle tasks related to Otto runs
-        return task.type in ["otto_runs", "list_otto_runs", "get_otto_run", "otto_history"]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the Otto runs query task"""
@@ -69,7 +76,7 @@ class OttoRunsSkill:
             
             # For now, we'll use sync httpx since Otto's runner might be sync
             # In the future, this could be made async
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/otto/runs",
                     params={"limit": limit}
@@ -136,7 +143,7 @@ class OttoRunsSkill:
     def _get_run_details(self, run_id: int, task_id: str) -> TaskResult:
         """Get details of a specific Otto run"""
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/otto/runs/{run_id}"
                 )
@@ -212,7 +219,7 @@ class OttoRunsSkill:
         
         # Check if Life OS API is reachable
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.life_os_api_url}/health")
                 if response.status_code != 200:
                     issues.append(SkillHealthIssue(
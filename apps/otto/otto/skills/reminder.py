@@ -10,11 +10,11 @@ Implements:
 
 from typing import List, Dict, Any, Optional
 import os
-import httpx
 from datetime import datetime, timedelta
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client
 from ..core.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -25,6 +25,11 @@ class ReminderSkill:
     
     name = "reminder"
     description = "Sends reminders for tasks, bills, and events"
+    task_types = frozenset({
+        "reminder.create_reminder",
+        "reminder.send_reminders",
+        "reminder.list_upcoming_reminders",
+    })
     
     def __init__(self):
         # Life OS backend API URL
@@ -32,11 +37,7 @@ class ReminderSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in [
-            "reminder.create_reminder",
-            "reminder.send_reminders",
-            "reminder.list_upcoming_reminders",
-        ]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the reminder operation"""
@@ -81,7 +82,7 @@ class ReminderSkill:
         if reminder_type == "task":
             # Get task and create reminder
             try:
-                with httpx.Client(timeout=10.0) as client:
+                with shared_client(timeout=10.0) as client:
                     task_response = client.get(f"{self.life_os_api_url}/life_os/tasks/{item_id}")
                     
                     if task_response.status_code == 200:
@@ -152,7 +153,7 @@ class ReminderSkill:
         elif reminder_type == "event":
             # Get event and create reminder
             try:
-                with httpx.Client(timeout=10.0) as client:
+                with shared_client(timeout=10.0) as client:
                     event_response = client.get(f"{self.life_os_api_url}/calendar/{item_id}")
                     
                     if event_response.status_code == 200:
@@ -220,7 +221,7 @@ class ReminderSkill:
             reminder_window = now + timedelta(minutes=minutes_ahead)
             
             # Check tasks due soon
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 tasks_response = client.get(
                     f"{self.life_os_api_url}/life_os/tasks",
                     params={"limit": 100}
@@ -349,7 +350,7 @@ class ReminderSkill:
             
             upcoming_reminders = []
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 # Get tasks
                 tasks_response = client.get(
                     f"{self.life_os_api_url}/life_os/tasks",
@@ -447,7 +448,7 @@ class ReminderSkill:
         
         # Check if Life OS API is reachable
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.life_os_api_url}/health")
                 if response.status_code != 200:
                     issues.append(SkillHealthIssue(
@@ -18,10 +18,11 @@ class RepoAuditSkill:
     """Skill that audits the Otto repository"""
     
     name = "repo_audit"
+    task_types = frozenset({"repo_audit"})
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type == "repo_audit"
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the repo audit task"""
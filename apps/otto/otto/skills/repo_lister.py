@@ -18,10 +18,11 @@ class RepoListerSkill:
     """Skill that lists repository structure"""
     
     name = "repo_lister"
+    task_types = frozenset({"repo_list"})
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type == "repo_list"
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the repo listing task"""
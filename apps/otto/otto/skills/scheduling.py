@@ -11,11 +11,11 @@ Implements:
 
 from typing import List, Dict, Any, Optional
 import os
-import httpx
 from datetime import datetime, timedelta
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client
 from ..core.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -26,6 +26,13 @@ class SchedulingSkill:
     
     name = "scheduling"
     description = "Schedules recurring tasks, bill reminders, and events"
+    task_types = frozenset({
+        "schedule.create_recurring_task",
+        "schedule.create_recurring_bill_reminder",
+        "schedule.create_recurring_event",
+        "schedule.list_recurring_items",
+        "schedule.update_recurring_item",
+    })
     
     def __init__(self):
         # Life OS backend API URL
@@ -35,13 +42,7 @@ class SchedulingSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in [
-            "schedule.create_recurring_task",
-            "schedule.create_recurring_bill_reminder",
-            "schedule.create_recurring_event",
-            "schedule.list_recurring_items",
-            "schedule.update_recurring_item",
-        ]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the scheduling operation"""
@@ -126,7 +127,7 @@ class SchedulingSkill:
         
         # Get bill to determine frequency
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 bill_response = client.get(f"{self.life_os_api_url}/bills/{bill_id}")
                 
                 if bill_response.status_code != 200:
@@ -214,7 +215,7 @@ class SchedulingSkill:
             recurring_items = []
             
             # Get recurring tasks (OttoTasks with next_run_at)
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 # Get recurring OttoTasks
                 otto_tasks_response = client.get(
                     f"{self.life_os_api_url}/otto/tasks",
@@ -301,7 +302,7 @@ class SchedulingSkill:
         if item_type == "task":
             # Update OttoTask
             try:
-                with httpx.Client(timeout=10.0) as client:
+                with shared_client(timeout=10.0) as client:
                     update_data = {}
                     if payload.get("next_run_at"):
                         update_data["next_run_at"] = payload.get("next_run_at")
@@ -324,7 +325,7 @@ class SchedulingSkill:
         elif item_type == "bill":
             # Update bill recurrence
             try:
-                with httpx.Client(timeout=10.0) as client:
+                with shared_client(timeout=10.0) as client:
                     update_data = {}
                     if payload.get("recurrence_frequency"):
                         update_data["recurrence_frequency"] = payload.get("recurrence_frequency")
@@ -357,7 +358,7 @@ class SchedulingSkill:
         elif item_type == "event":
             # Update event recurrence
             try:
-                with httpx.Client(timeout=10.0) as client:
+                with shared_client(timeout=10.0) as client:
                     update_data = {}
                     if payload.get("recurrence_frequency"):
                         update_data["recurrence_frequency"] = payload.get("recurrence_frequency")
@@ -414,7 +415,7 @@ class SchedulingSkill:
         
         # Check if Life OS API is reachable
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.life_os_api_url}/health")
                 if response.status_code != 200:
                     issues.append(SkillHealthIssue(
@@ -18,6 +18,12 @@ class SelfTestSkill:
     
     name = "self_test"
     description = "Test Otto's worker, actions, and API endpoints"
+    task_types = frozenset({
+        "self_test",
+        "test_otto",
+        "test_worker",
+        "test_phase2",
+    })
     
     def __init__(self):
         self.life_os_api_url = os.getenv("LIFE_OS_API_URL", "http://localhost:8000")
@@ -25,7 +31,7 @@ class SelfTestSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in ["self_test", "test_otto", "test_worker", "test_phase2"]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute self-test"""
@@ -9,6 +9,7 @@ from typing import List, Dict, Any
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client
 from ..core.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -19,10 +20,16 @@ class SymbiozSkill:
     
     name = "symbioz"
     description = "Launch and manage Symbioz game server and UI"
+    task_types = frozenset({
+        "symbioz",
+        "launch_symbioz",
+        "start_symbioz",
+        "symbioz_game",
+    })
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in ["symbioz", "launch_symbioz", "start_symbioz", "symbioz_game"]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute Symbioz task"""
@@ -100,14 +107,12 @@ class SymbiozSkill:
     
     def _check_status(self, context: SkillContext) -> TaskResult:
         """Check if Symbioz services are running"""
-        import httpx
-        
         results = {}
         all_ok = True
         
         # Check API server
         try:
-            with httpx.Client(timeout=2.0) as client:
+            with shared_client(timeout=2.0) as client:
                 response = client.get("http://localhost:8002/")
                 results["api_server"] = {
                     "ok": response.status_code == 200,
@@ -125,7 +130,7 @@ class SymbiozSkill:
         
         # Check web UI (harder to check, just try to connect)
         try:
-            with httpx.Client(timeout=2.0) as client:
+            with shared_client(timeout=2.0) as client:
                 response = client.get("http://localhost:3001/")
                 results["web_ui"] = {
                     "ok": response.status_code == 200,
@@ -9,11 +9,11 @@ Implements:
 
 from typing import List, Dict, Any, Optional
 import os
-import httpx
 from datetime import datetime, timedelta
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client
 from ..core.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +24,17 @@ class TaskManagementSkill:
     
     name = "task_management"
     description = "Manages Life OS tasks: create, update, list, filter, and summarize tasks"
+    task_types = frozenset({
+        "life_os.create_task",
+        "life_os.list_tasks",
+        "life_os.update_task",
+        "life_os.delete_task",
+        "life_os.summarize_tasks",
+        "life_os.find_overdue",
+        "life_os.find_by_category",
+        "life_os.find_by_assignee",
+        "life_os.get_task",
+    })
     
     def __init__(self):
         # Life OS backend API URL
@@ -31,17 +42,7 @@ class TaskManagementSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in [
-            "life_os.create_task",
-            "life_os.list_tasks",
-            "life_os.update_task",
-            "life_os.delete_task",
-            "life_os.summarize_tasks",
-            "life_os.find_overdue",
-            "life_os.find_by_category",
-            "life_os.find_by_assignee",
-            "life_os.get_task",
-        ]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the task management operation"""
@@ -120,7 +121,7 @@ class TaskManagementSkill:
                 params["category"] = payload.get("category")
             params["limit"] = payload.get("limit", 50)
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/life_os/tasks",
                     params=params
@@ -201,7 +202,7 @@ class TaskManagementSkill:
         
         # Delete via API
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.delete(
                     f"{self.life_os_api_url}/life_os/tasks/{task_id}"
                 )
@@ -239,7 +240,7 @@ class TaskManagementSkill:
         # Fetch all tasks
         try:
             params = {"limit": 500}  # Get more for summary
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/life_os/tasks",
                     params=params
@@ -330,7 +331,7 @@ class TaskManagementSkill:
         # Fetch all tasks and filter
         try:
             params = {"limit": 500}
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/life_os/tasks",
                     params=params
@@ -430,7 +431,7 @@ class TaskManagementSkill:
         
         # Fetch task from API
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/life_os/tasks/{task_id}"
                 )
@@ -469,7 +470,7 @@ class TaskManagementSkill:
         
         # Check if Life OS API is reachable
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.life_os_api_url}/health")
                 if response.status_code != 200:
                     issues.append(SkillHealthIssue(
@@ -11,11 +11,11 @@ Implements:
 
 from typing import List, Dict, Any, Optional
 import os
-import httpx
 from datetime import datetime
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client
 from ..core.logging_utils import get_logger
 from .memory_helpers import get_vendor_hint
 
@@ -27,6 +27,14 @@ class TaxBrainSkill:
     
     name = "tax_brain"
     description = "Integrates with Tax Brain: categorize transactions, generate reports, find deductions"
+    task_types = frozenset({
+        "tax.categorize_transaction",
+        "tax.generate_report",
+        "tax.find_deductions",
+        "tax.summarize_by_category",
+        "tax.update_category",
+        "tax.get_categories",
+    })
     
     def __init__(self):
         # Life OS backend API URL
@@ -34,14 +42,7 @@ class TaxBrainSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in [
-            "tax.categorize_transaction",
-            "tax.generate_report",
-            "tax.find_deductions",
-            "tax.summarize_by_category",
-            "tax.update_category",
-            "tax.get_categories",
-        ]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the tax brain operation"""
@@ -97,7 +98,7 @@ class TaxBrainSkill:
         
         # First get the transaction
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 # Get transaction
                 txn_response = client.get(
                     f"{self.life_os_api_url}/transactions/{transaction_id}"
@@ -343,7 +344,7 @@ class TaxBrainSkill:
         
         # Generate year summary
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/tax/summary/{year}",
                     params={"user_id": context.config.get("user_id", 1) if hasattr(context, "config") else 1}
@@ -383,7 +384,7 @@ class TaxBrainSkill:
         
         # Get transactions for the year and filter for deductions
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 # Get transactions
                 start_date = f"{year}-01-01"
                 end_date = f"{year + 1}-01-01"
@@ -457,7 +458,7 @@ class TaxBrainSkill:
         
         # Use transaction summary by category
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 start_date = f"{year}-01-01"
                 end_date = f"{year + 1}-01-01"
                 
@@ -508,7 +509,7 @@ class TaxBrainSkill:
         
         # Update transaction via API
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.patch(
                     f"{self.life_os_api_url}/transactions/{transaction_id}",
                     json={"tax_category": tax_category}
@@ -544,7 +545,7 @@ class TaxBrainSkill:
         """Handle getting tax categories"""
         # Get categories from Tax Brain
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/tax/categories",
                     params={"user_id": context.config.get("user_id", 1) if hasattr(context, "config") else 1}
@@ -580,7 +581,7 @@ class TaxBrainSkill:
         
         # Check if Life OS API is reachable
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.life_os_api_url}/health")
                 if response.status_code != 200:
                     issues.append(SkillHealthIssue(
@@ -597,7 +598,7 @@ class TaxBrainSkill:
         
         # Check if Tax Brain API is reachable
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.life_os_api_url}/tax/categories", params={"user_id": 1})
                 # 200 or 404 is OK (404 means no categories yet)
                 if response.status_code not in [200, 404]:
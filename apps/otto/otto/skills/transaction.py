@@ -10,11 +10,11 @@ Implements:
 
 from typing import List, Dict, Any, Optional
 import os
-import httpx
 from datetime import datetime, timedelta
 
 from ..core.models import Task, TaskResult, TaskStatus
 from ..core.skill_base import Skill, SkillHealthIssue, SkillContext
+from ..core.http_client import shared_client
 from ..core.logging_utils import get_logger
 
 logger = get_logger(__name__)
@@ -25,6 +25,14 @@ class TransactionSkill:
     
     name = "transaction"
     description = "Tracks transactions: create, update, categorize, list, summarize by category"
+    task_types = frozenset({
+        "transactions.create_transaction",
+        "transactions.list_transactions",
+        "transactions.update_transaction",
+        "transactions.categorize_transaction",
+        "transactions.summarize_by_category",
+        "transactions.get_transaction",
+    })
     
     def __init__(self):
         # Life OS backend API URL
@@ -32,14 +40,7 @@ class TransactionSkill:
     
     def can_handle(self, task: Task) -> bool:
         """Check if this skill can handle the task"""
-        return task.type in [
-            "transactions.create_transaction",
-            "transactions.list_transactions",
-            "transactions.update_transaction",
-            "transactions.categorize_transaction",
-            "transactions.summarize_by_category",
-            "transactions.get_transaction",
-        ]
+        return task.type in self.task_types
     
     def run(self, task: Task, context: SkillContext) -> TaskResult:
         """Execute the transaction operation"""
@@ -119,7 +120,7 @@ class TransactionSkill:
                 params["source"] = payload.get("source")
             params["limit"] = payload.get("limit", 50)
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/transactions",
                     params=params
@@ -181,7 +182,7 @@ class TransactionSkill:
             if payload.get("tags") is not None:
                 update_data["tags"] = payload.get("tags")
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.patch(
                     f"{self.life_os_api_url}/transactions/{transaction_id}",
                     json=update_data
@@ -253,7 +254,7 @@ class TransactionSkill:
             if end_date:
                 params["end_date"] = end_date
             
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/transactions/summary/by_category",
                     params=params
@@ -297,7 +298,7 @@ class TransactionSkill:
         
         # Fetch transaction from API
         try:
-            with httpx.Client(timeout=10.0) as client:
+            with shared_client(timeout=10.0) as client:
                 response = client.get(
                     f"{self.life_os_api_url}/transactions/{transaction_id}"
                 )
@@ -336,7 +337,7 @@ class TransactionSkill:
         
         # Check if Life OS API is reachable
         try:
-            with httpx.Client(timeout=5.0) as client:
+            with shared_client(timeout=5.0) as client:
                 response = client.get(f"{self.life_os_api_url}/health")
                 if response.status_code != 200:
                     issues.append(SkillHealthIssue(
@@ -0,0 +1,167 @@
+"""
+run_tasks scheduling: dependencies, cycles, skill limits, timeouts and
+cancellation, using fake skills.
+"""
+
+import threading
+import time
+
+import pytest
+
+from otto.core.models import Task, TaskResult
+from otto.core.runner import run_tasks
+from otto.core.skill_base import SkillContext
+
+
+class FakeSkill:
+    """
+    Handles one task type. A task sleeps for payload["sleep"] seconds, or
+    blocks until `gate` is set when payload["block"] is true, and fails
+    when payload["fail"] is true.
+    """
+    
+    def __init__(self, name="fake", max_concurrency=None):
+        self.name = name
+        self.task_types = {name}
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+        self.gate = threading.Event()
+        self.started = []
+        self.peak = 0
+        self._running = 0
+        self._lock = threading.Lock()
+    
+    def can_handle(self, task):
+        return task.type == self.name
+    
+    def run(self, task, context):
+        with self._lock:
+            self.started.append(task.id)
+            self._running += 1
+            self.peak = max(self.peak, self._running)
+        try:
+            if task.payload.get("block"):
+                self.gate.wait(5)
+            time.sleep(task.payload.get("sleep", 0))
+        finally:
+            with self._lock:
+                self._running -= 1
+        return TaskResult(task_id=task.id, success=not task.payload.get("fail"), message="done")
+
+
+@pytest.fixture
+def context():
+    return SkillContext(config=None, logger=None)
+
+
+@pytest.fixture
+def skill():
+    fake = FakeSkill()
+    yield fake
+    fake.gate.set()  # let abandoned threads finish
+
+
+def _task(task_id, skill_name="fake", **payload):
+    depends_on = payload.pop("depends_on", [])
+    timeout = payload.pop("timeout", None)
+    return Task(id=task_id, type=skill_name, payload=payload, depends_on=depends_on, timeout=timeout)
+
+
+def _messages(results):
+    return [result.message for result in results]
+
+
+def test_independent_tasks_run_concurrently_in_order(skill, context):
+    tasks = [_task(str(n), sleep=0.2) for n in range(4)]
+    start = time.monotonic()
+    results = run_tasks(tasks, [skill], context, max_workers=4)
+    
+    assert time.monotonic() - start < 0.6
+    assert [result.task_id for result in results] == ["0", "1", "2", "3"]
+    assert all(result.success for result in results)
+
+def test_unknown_task_type_fails(skill, context):
+    results = run_tasks([_task("a"), _task("b", skill_name="other")], [skill], context)
+    assert results[0].success
+    assert results[1].message == "No skill found to handle task type: other"
+
+def test_dependencies_run_first_and_failures_skip_dependents(skill, context):
+    tasks = [
+        _task("c", depends_on=["b"]),
+        _task("b", depends_on=["a"]),
+        _task("a", sleep=0.05),
+        _task("x", fail=True),
+        _task("y", depends_on=["x"]),
+        _task("z", depends_on=["y"]),
+        _task("u", depends_on=["missing"]),
+    ]
+    results = run_tasks(tasks, [skill], context)
+    
+    assert skill.started.index("a") < skill.started.index("b") < skill.started.index("c")
+    assert [result.success for result in results[:3]] == [True, True, True]
+    assert results[4].message == "Skipped: dependency failed: x"
+    assert results[5].message == "Skipped: dependency failed: y"
+    assert results[6].message == "Unknown dependency: missing"
+    assert "y" not in skill.started and "z" not in skill.started
+
+def test_dependency_cycle_is_reported(skill, context):
+    tasks = [_task("a", depends_on=["b"]), _task("b", depends_on=["a"]), _task("c")]
+    results = run_tasks(tasks, [skill], context)
+    assert _messages(results) == ["Dependency cycle", "Dependency cycle", "done"]
+
+def test_skill_limits_cap_concurrency(context):
+    limited = FakeSkill("limited", max_concurrency=2)
+    results = run_tasks([_task(str(n), "limited", sleep=0.05) for n in range(6)], [limited], context, max_workers=6)
+    assert all(result.success for result in results)
+    assert limited.peak == 2
+    
+    override = FakeSkill("override", max_concurrency=2)
+    tasks = [_task(str(n), "override", sleep=0.05) for n in range(4)]
+    run_tasks(tasks, [override], context, max_workers=4, skill_limits={"override": 1})
+    assert override.peak == 1
+
+def test_timeout_counts_from_start_not_queue(skill, context):
+    # One worker thread: the timed task waits behind a slower one but still runs
+    tasks = [_task("slow", sleep=0.3), _task("timed", sleep=0.05, timeout=0.2)]
+    results = run_tasks(tasks, [skill], context, max_workers=1)
+    assert _messages(results) == ["done", "done"]
+
+def test_timed_out_task_keeps_its_slot_until_the_thread_returns(context):
+    limited = FakeSkill("limited", max_concurrency=1)
+    tasks = [_task("a", "limited", sleep=0.4, timeout=0.1), _task("b", "limited")]
+    start = time.monotonic()
+    results = run_tasks(tasks, [limited], context, max_workers=2)
+    
+    assert _messages(results) == ["Timed out after 0.1s", "done"]
+    assert limited.peak == 1
+    assert time.monotonic() - start >= 0.4
+
+def test_cancel_reports_unfinished_tasks(skill, context):
+    cancel = threading.Event()
+    tasks = [_task("a"), _task("b", block=True), _task("c", depends_on=["b"])]
+    threading.Timer(0.1, cancel.set).start()
+    results = run_tasks(tasks, [skill], context, cancel=cancel)
+    assert _messages(results) == ["done", "Cancelled", "Cancelled"]
+
+def test_cancel_bounds_a_call_held_by_an_abandoned_thread(context):
+    limited = FakeSkill("limited", max_concurrency=1)
+    cancel = threading.Event()
+    tasks = [_task("hung", "limited", block=True, timeout=0.05), _task("next", "limited")]
+    threading.Timer(0.2, cancel.set).start()
+    try:
+        start = time.monotonic()
+        results = run_tasks(tasks, [limited], context, cancel=cancel)
+    finally:
+        limited.gate.set()
+    
+    assert time.monotonic() - start < 1.0
+    assert _messages(results) == ["Timed out after 0.05s", "Cancelled"]
+    assert limited.started == ["hung"]
+
+def test_async_skills_are_awaited(context):
+    class AsyncSkill(FakeSkill):
+        async def run(self, task, context):
+            return TaskResult(task_id=task.id, success=True, message="async")
+    
+    results = run_tasks([_task("a", "async"), _task("b", "async")], [AsyncSkill("async")], context)
+    assert _messages(results) == ["async", "async"]
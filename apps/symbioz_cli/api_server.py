@@ -6,7 +6,6 @@ from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uuid
-import json
 import os
 
 # Add current directory to path for imports
@@ -14,11 +13,18 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, current_dir)
 
 from main import Game
+from catalog import get_catalog
+from session_store import LRUCache, create_session_store
 from models.character import Character
 from models.enemy import Enemy
+from systems import replay
+from systems.replay import CombatLog
 
 app = FastAPI(title="Symbioz Game API", version="1.0.0")
 
+# Load the shared game catalog once at startup; every session reuses it
+get_catalog()
+
 # CORS configuration - read from environment or use defaults for local dev
 def get_allowed_origins():
     """Get allowed origins from environment or use localhost defaults."""
@@ -45,46 +51,80 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Game sessions (in-memory with file persistence)
-game_sessions: Dict[str, Game] = {}
+# Game sessions: live Game objects in a bounded LRU, save data in the session store
+# (backend chosen by SYMBIOZ_SESSION_BACKEND, see session_store.create_session_store).
+# Every save gets a new revision; with a shared backend, a worker whose live
+# copy is older than the store's reloads it, so workers serve the same sessions.
 SAVE_DIR = os.path.join(os.path.dirname(__file__), "saves")
-os.makedirs(SAVE_DIR, exist_ok=True)
+session_store = create_session_store(SAVE_DIR)
+MAX_LIVE_SESSIONS = int(os.getenv("SYMBIOZ_MAX_LIVE_SESSIONS", "1000"))
+LIVE_SESSION_TTL = float(os.getenv("SYMBIOZ_LIVE_SESSION_TTL", "3600"))
+
+# Only a shared store can hold a newer copy (memory and file are single-process)
+CHECK_STORE_REVISION = session_store.shared
+
+
+def _is_current(game: Game, revision: Optional[str]) -> bool:
+    """True unless the store holds a save of the session newer than the live copy."""
+    return revision is None or revision == getattr(game, "session_revision", None)
+
+
+def _save_live_session(session_id: str, game: Game):
+    """Persist a live session before it leaves memory (unless another worker saved it since)."""
+    if CHECK_STORE_REVISION and not _is_current(game, session_store.get_revision(session_id)):
+        return
+    save_game_session(session_id, game)
+
+
+game_sessions = LRUCache(
+    max_size=MAX_LIVE_SESSIONS,
+    ttl_seconds=LIVE_SESSION_TTL,
+    on_evict=_save_live_session,
+)
 
 
 def save_game_session(session_id: str, game: Game):
-    """Save game session to file."""
+    """Save game session to the session store."""
+    game.session_revision = uuid.uuid4().hex
     if not game.player:
+        # Record the empty session so other workers can find it
+        session_store.put(session_id, {"session_id": session_id, "character": None, "revision": game.session_revision})
         return
     
     save_data = {
         "session_id": session_id,
+        "revision": game.session_revision,
         "character": character_to_dict(game.player),
         "has_active_mission": hasattr(game, "current_mission"),
-        "mission_id": game.current_mission.get("id") if hasattr(game, "current_mission") else None
+        "mission_id": game.current_mission.get("id") if hasattr(game, "current_mission") else None,
+        "rng": {"seed": game.rng.seed, "counter": game.rng.counter, "skill_counter": game.skill_rng.counter}
     }
     
-    save_path = os.path.join(SAVE_DIR, f"{session_id}.json")
-    with open(save_path, 'w') as f:
-        json.dump(save_data, f, indent=2)
+    # Active combat is saved as its starting point + event log, and replayed on load
+    if getattr(game, "combat_start", None) and getattr(game, "current_enemies", None):
+        save_data["combat"] = {**game.combat_start, "log": game.combat_system.log.to_base64()}
+    
+    session_store.put(session_id, save_data)
 
 
-def load_game_session(session_id: str) -> Optional[Game]:
-    """Load game session from file."""
-    save_path = os.path.join(SAVE_DIR, f"{session_id}.json")
-    if not os.path.exists(save_path):
+def load_game_session(session_id: str, save_data: Optional[Dict[str, Any]] = None) -> Optional[Game]:
+    """Load game session from the session store (or from save data already read from it)."""
+    if save_data is None:
+        save_data = session_store.get(session_id)
+    if save_data is None:
         return None
     
     try:
-        with open(save_path, 'r') as f:
-            save_data = json.load(f)
-        
         game = Game()
+        game.session_revision = save_data.get("revision")
         
         # Recreate character
         char_data = save_data["character"]
+        if char_data is None:
+            return game
         # Find race and class by name
-        race = next((r for r in game.races if r.name == char_data["race"]), None)
-        clazz = next((c for c in game.classes if c.name == char_data["class"]), None)
+        race = game.catalog.get_race(char_data["race"])
+        clazz = game.catalog.get_class(char_data["class"])
         
         if not race or not clazz:
             return None
@@ -98,9 +138,31 @@ def load_game_session(session_id: str) -> Optional[Game]:
         
         # Restore equipment
         if char_data["weapon"]:
-            game.player.weapon = next((w for w in game.weapons if w.name == char_data["weapon"]), None)
+            game.player.weapon = game.catalog.get_weapon(char_data["weapon"])
         if char_data["armor"]:
-            game.player.armor = next((a for a in game.armor_list if a.name == char_data["armor"]), None)
+            game.player.armor = game.catalog.get_armor(char_data["armor"])
+        
+        if save_data.get("combat"):
+            try:
+                replay_combat(session_id, game, save_data["combat"])
+            except Exception as e:
+                # Keep the character as saved and drop the unfinished fight
+                print(f"Error replaying combat: {e}")
+                clear_combat(game)
+                game.player.hp = char_data["hp"]
+                game.player.inventory = char_data["inventory"]
+                game.player.status_effects = char_data["status_effects"]
+        elif save_data.get("has_active_mission") and save_data.get("mission_id") is not None:
+            # Skill mission in progress
+            mission = game.catalog.get_mission(save_data["mission_id"])
+            if mission is not None:
+                game.current_mission = mission
+        
+        # Dice streams continue where the session left off
+        rng_state = save_data.get("rng")
+        if rng_state:
+            game.rng.set_state({"seed": rng_state["seed"], "counter": rng_state["counter"]})
+            game.skill_rng.set_state({"seed": rng_state["seed"], "stream": 1, "counter": rng_state["skill_counter"]})
         
         return game
     except Exception as e:
@@ -108,6 +170,58 @@ def load_game_session(session_id: str) -> Optional[Game]:
         return None
 
 
+def replay_combat(session_id: str, game: Game, combat: Dict[str, Any]):
+    """
+    Rebuild an in-progress combat from its saved starting point.
+    
+    Restores the player and dice stream as they were when the mission
+    started, then re-runs every recorded player command. The regenerated
+    event log must match the saved one byte for byte.
+    """
+    mission = game.catalog.get_mission(combat["mission_id"])
+    if mission is None:
+        raise ValueError(f"Unknown mission in saved combat: {combat['mission_id']}")
+    
+    recorded = CombatLog.from_base64(combat["log"])
+    game.player.hp = combat["player"]["hp"]
+    game.player.status_effects = list(combat["player"]["status_effects"])
+    game.player.inventory = list(combat["player"]["inventory"])
+    game.rng.set_state(combat["rng"])
+    
+    start_combat(game, mission)
+    for command in recorded.commands():
+        try:
+            run_combat_action(session_id, game, CombatAction(**command), autosave=False)
+        except HTTPException:
+            pass  # Rejected requests are replayed as rejected
+    
+    if game.combat_system.log.to_bytes() != recorded.to_bytes():
+        raise ValueError("Saved combat log does not replay (game data changed?)")
+
+
+def get_game(session_id: str) -> Optional[Game]:
+    """
+    Get a live session, loading it from the session store if needed.
+    
+    With a shared store, the live copy is replaced when another worker
+    has saved the session since this worker last saved or loaded it
+    (checked by revision alone, so the save data is only read on a reload).
+    """
+    game = game_sessions.get(session_id)
+    if game is not None and (
+        not CHECK_STORE_REVISION or _is_current(game, session_store.get_revision(session_id))
+    ):
+        return game
+    
+    save_data = session_store.get(session_id)
+    if save_data is None:
+        return game
+    game = load_game_session(session_id, save_data)
+    if game is not None:
+        game_sessions[session_id] = game
+    return game
+
+
 # Pydantic models for API
 class CharacterCreate(BaseModel):
     name: str
@@ -126,6 +240,14 @@ class StartMissionRequest(BaseModel):
     mission_id: int
 
 
+@app.on_event("shutdown")
+def shutdown_session_store():
+    """Save live sessions and flush buffered writes."""
+    for session_id, game in game_sessions.items():
+        _save_live_session(session_id, game)
+    session_store.close()
+
+
 @app.get("/")
 def root():
     """Health check."""
@@ -149,6 +271,7 @@ def create_session():
         game = Game()
     
     game_sessions[session_id] = game
+    save_game_session(session_id, game)
     return {"session_id": session_id}
 
 
@@ -158,16 +281,12 @@ def load_session(session_id: Optional[str] = Query(None)):
     if not session_id:
         raise HTTPException(status_code=400, detail="session_id required")
     
-    if session_id not in game_sessions:
-        game = load_game_session(session_id)
-        if game:
-            game_sessions[session_id] = game
-            return {"status": "loaded", "session_id": session_id, "has_character": game.player is not None}
-        else:
-            raise HTTPException(status_code=404, detail="Session not found")
-    else:
-        game = game_sessions[session_id]
-        return {"status": "active", "session_id": session_id, "has_character": game.player is not None}
+    live_game = game_sessions.get(session_id)
+    game = get_game(session_id)
+    if game is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    status = "active" if game is live_game else "loaded"
+    return {"status": status, "session_id": session_id, "has_character": game.player is not None}
 
 
 @app.post("/api/session/save")
@@ -176,10 +295,9 @@ def save_session(session_id: Optional[str] = Query(None)):
     if not session_id:
         raise HTTPException(status_code=400, detail="session_id required")
     
-    if session_id not in game_sessions:
+    game = get_game(session_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
     save_game_session(session_id, game)
     return {"status": "saved", "session_id": session_id}
 
@@ -192,10 +310,10 @@ def create_character(character: CharacterCreate, session_id: Optional[str] = Que
         session_id = str(uuid.uuid4())
         game = Game()
         game_sessions[session_id] = game
-    elif session_id not in game_sessions:
-        raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
+    else:
+        game = get_game(session_id)
+        if game is None:
+            raise HTTPException(status_code=404, detail="Session not found")
     
     # Get race and class
     if character.race_id < 1 or character.race_id > len(game.races):
@@ -211,9 +329,9 @@ def create_character(character: CharacterCreate, session_id: Optional[str] = Que
     
     # Give starting equipment
     if selected_class.name in ["Vanguard"]:
-        game.player.weapon = next(w for w in game.weapons if w.name == "Basic Sword")
+        game.player.weapon = game.catalog.weapons_by_name["Basic Sword"]
     else:
-        game.player.weapon = next(w for w in game.weapons if w.name == "Basic Pistol")
+        game.player.weapon = game.catalog.weapons_by_name["Basic Pistol"]
     game.player.armor = game.starting_armor
     
     # Auto-save after character creation
@@ -225,10 +343,9 @@ def create_character(character: CharacterCreate, session_id: Optional[str] = Que
 @app.get("/api/character")
 def get_character(session_id: str):
     """Get current character state."""
-    if session_id not in game_sessions:
+    game = get_game(session_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
     if not game.player:
         raise HTTPException(status_code=404, detail="Character not created")
     
@@ -238,10 +355,9 @@ def get_character(session_id: str):
 @app.get("/api/missions")
 def get_missions(session_id: str):
     """Get available missions."""
-    if session_id not in game_sessions:
+    game = get_game(session_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
     missions = []
     for i, mission in enumerate(game.missions):
         missions.append({
@@ -257,10 +373,9 @@ def get_missions(session_id: str):
 @app.get("/api/races")
 def get_races(session_id: str):
     """Get available races."""
-    if session_id not in game_sessions:
+    game = get_game(session_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
     races = []
     for i, race in enumerate(game.races):
         races.append({
@@ -274,10 +389,9 @@ def get_races(session_id: str):
 @app.get("/api/classes")
 def get_classes(session_id: str):
     """Get available classes."""
-    if session_id not in game_sessions:
+    game = get_game(session_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
     classes = []
     for i, clazz in enumerate(game.classes):
         classes.append({
@@ -292,10 +406,9 @@ def get_classes(session_id: str):
 @app.post("/api/mission/start")
 def start_mission(session_id: str, request: StartMissionRequest):
     """Start a mission and initialize combat if needed."""
-    if session_id not in game_sessions:
+    game = get_game(session_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
     if not game.player:
         raise HTTPException(status_code=404, detail="Character not created")
     
@@ -306,33 +419,9 @@ def start_mission(session_id: str, request: StartMissionRequest):
     
     # Initialize combat if combat mission
     if mission["type"] == "combat":
-        # Create enemies
-        enemies = []
-        for enemy_data in mission["enemies"]:
-            weapon = None
-            armor = None
-            if enemy_data.get("weapon"):
-                weapon = next((w for w in game.weapons if w.name == enemy_data["weapon"]), None)
-            if enemy_data.get("armor"):
-                armor = next((a for a in game.armor_list if a.name == enemy_data["armor"]), None)
-            
-            enemy = Enemy(
-                name=enemy_data["name"],
-                level=enemy_data["level"],
-                attributes=enemy_data["attributes"],
-                max_hp=enemy_data["max_hp"],
-                weapon=weapon,
-                armor=armor
-            )
-            enemies.append(enemy)
-        
-        # Start combat
-        turn_order = game.combat_system.start_combat(game.player, enemies)
-        
-        # Store combat state
-        game.current_mission = mission
-        game.current_enemies = enemies
-        game.combat_round = 1
+        turn_order = start_combat(game, mission)
+        enemies = game.current_enemies
+        save_game_session(session_id, game)
         
         return {
             "status": "combat_started",
@@ -347,6 +436,7 @@ def start_mission(session_id: str, request: StartMissionRequest):
     else:
         # Skill mission - store mission state and return data
         game.current_mission = mission
+        save_game_session(session_id, game)
         return {
             "status": "mission_started",
             "mission": mission,
@@ -357,29 +447,50 @@ def start_mission(session_id: str, request: StartMissionRequest):
 @app.get("/api/combat/state")
 def get_combat_state_endpoint(session_id: str):
     """Get current combat state."""
-    if session_id not in game_sessions:
+    game = get_game(session_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
     if not hasattr(game, "current_enemies") or not game.current_enemies:
         raise HTTPException(status_code=404, detail="No active combat")
     
     return get_combat_state(game)
 
 
+@app.get("/api/combat/log")
+def get_combat_log(session_id: str, decode: bool = False):
+    """Get the current combat's starting point and binary event log (base64)."""
+    game = get_game(session_id)
+    if game is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    if not getattr(game, "current_enemies", None) or not getattr(game, "combat_start", None):
+        raise HTTPException(status_code=404, detail="No active combat")
+    
+    combat_log = game.combat_system.log
+    response = {**game.combat_start, "event_count": len(combat_log), "log": combat_log.to_base64()}
+    if decode:
+        response["events"] = [replay.describe_event(event) for event in combat_log.events()]
+    return response
+
+
 @app.post("/api/combat/action")
 def combat_action(session_id: str, action: CombatAction):
     """Execute a combat action."""
-    if session_id not in game_sessions:
+    game = get_game(session_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
     if not game.player:
         raise HTTPException(status_code=404, detail="Character not created")
     
     if not hasattr(game, "current_enemies") or not game.current_enemies:
         raise HTTPException(status_code=404, detail="No active combat")
     
+    return run_combat_action(session_id, game, action)
+
+
+def run_combat_action(session_id: str, game: Game, action: CombatAction, autosave: bool = True) -> Dict[str, Any]:
+    """Run one player combat action plus the enemy turns around it."""
+    # Record the request first so the fight can be replayed from the log
+    game.combat_system.log.record_command(action.action_type, action.target_id, action.ability_name, action.item_name)
     combat_log = []
     
     # Check if it's player's turn
@@ -458,13 +569,13 @@ def combat_action(session_id: str, action: CombatAction):
         
         # Use item (Honey)
         if "Honey" in action.item_name:
-            import random
             con_mod = game.player.get_attribute_modifier("CON")
-            heal_amount = random.randint(1, 6) + con_mod
+            heal_amount = game.rng.randint(1, 6) + con_mod
             heal_amount = max(3, heal_amount)
             old_hp = game.player.hp
             game.player.heal(heal_amount)
             actual_heal = game.player.hp - old_hp
+            game.combat_system.log.record(0, replay.ITEM, value=actual_heal)
             
             # Remove honey from inventory
             honey_items = [item for item in game.player.inventory if "Honey" in str(item)]
@@ -512,6 +623,10 @@ def combat_action(session_id: str, action: CombatAction):
     if is_over:
         return handle_combat_end(session_id, game, combat_log, result)
     
+    # Saves are small (seed + log), so keep other workers current after every action
+    if autosave:
+        save_game_session(session_id, game)
+    
     # Return updated state
     return {
         "status": "action_complete",
@@ -523,10 +638,9 @@ def combat_action(session_id: str, action: CombatAction):
 @app.get("/api/hub/vendor")
 def get_vendor_items(session_id: str):
     """Get vendor items."""
-    if session_id not in game_sessions:
+    game = get_game(session_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
     if not game.player:
         raise HTTPException(status_code=404, detail="Character not created")
     
@@ -543,10 +657,9 @@ def get_vendor_items(session_id: str):
 @app.post("/api/hub/vendor/purchase")
 def purchase_item(session_id: str, item_id: int):
     """Purchase an item from vendor."""
-    if session_id not in game_sessions:
+    game = get_game(session_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
     if not game.player:
         raise HTTPException(status_code=404, detail="Character not created")
     
@@ -568,11 +681,11 @@ def purchase_item(session_id: str, item_id: int):
     game.player.credits -= item["price"]
     
     if item["type"] == "weapon":
-        weapon = next((w for w in game.weapons if w.name == item["weapon_name"]), None)
+        weapon = game.catalog.get_weapon(item["weapon_name"])
         if weapon:
             game.player.weapon = weapon
     elif item["type"] == "armor":
-        armor = next((a for a in game.armor_list if a.name == item["armor_name"]), None)
+        armor = game.catalog.get_armor(item["armor_name"])
         if not armor:
             from models.armor import Armor
             armor = Armor(
@@ -594,10 +707,9 @@ def purchase_item(session_id: str, item_id: int):
 @app.post("/api/hub/rest")
 def rest(session_id: str):
     """Rest and recover HP."""
-    if session_id not in game_sessions:
+    game = get_game(session_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
     if not game.player:
         raise HTTPException(status_code=404, detail="Character not created")
     
@@ -613,10 +725,9 @@ def rest(session_id: str):
 @app.post("/api/skill/check")
 def skill_check(session_id: str, skill_check_data: dict):
     """Execute a skill check."""
-    if session_id not in game_sessions:
+    game = get_game(session_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
     if not game.player:
         raise HTTPException(status_code=404, detail="Character not created")
     
@@ -631,6 +742,9 @@ def skill_check(session_id: str, skill_check_data: dict):
     
     passed, total = game.skill_system.roll_check(game.player, attribute, dc)
     
+    # Save the advanced dice stream so the next roll is the same on any worker
+    save_game_session(session_id, game)
+    
     return {
         "passed": passed,
         "total": total,
@@ -643,10 +757,9 @@ def skill_check(session_id: str, skill_check_data: dict):
 @app.post("/api/skill/complete")
 def complete_skill_mission(session_id: str, success: bool):
     """Complete a skill mission and award rewards."""
-    if session_id not in game_sessions:
+    game = get_game(session_id)
+    if game is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    game = game_sessions[session_id]
     if not game.player:
         raise HTTPException(status_code=404, detail="Character not created")
     
@@ -700,6 +813,56 @@ def complete_skill_mission(session_id: str, success: bool):
 
 
 # Helper functions
+def start_combat(game: Game, mission: Dict[str, Any]) -> List[Character]:
+    """Create a mission's enemies, roll initiative and store the combat state."""
+    # Starting point for replaying this combat from its event log
+    game.combat_start = {
+        "mission_id": mission["id"],
+        "rng": game.rng.get_state(),
+        "player": {
+            "hp": game.player.hp,
+            "status_effects": list(game.player.status_effects),
+            "inventory": list(game.player.inventory)
+        }
+    }
+    
+    # Create enemies
+    enemies = []
+    for enemy_data in mission["enemies"]:
+        weapon = None
+        armor = None
+        if enemy_data.get("weapon"):
+            weapon = game.catalog.get_weapon(enemy_data["weapon"])
+        if enemy_data.get("armor"):
+            armor = game.catalog.get_armor(enemy_data["armor"])
+        
+        enemy = Enemy(
+            name=enemy_data["name"],
+            level=enemy_data["level"],
+            attributes=enemy_data["attributes"],
+            max_hp=enemy_data["max_hp"],
+            weapon=weapon,
+            armor=armor
+        )
+        enemies.append(enemy)
+    
+    # Start combat
+    turn_order = game.combat_system.start_combat(game.player, enemies)
+    
+    # Store combat state
+    game.current_mission = mission
+    game.current_enemies = enemies
+    game.combat_round = 1
+    return turn_order
+
+
+def clear_combat(game: Game):
+    """Drop mission and combat state after a fight ends."""
+    for attr in ("current_mission", "current_enemies", "combat_round", "combat_start"):
+        if hasattr(game, attr):
+            delattr(game, attr)
+
+
 def character_to_dict(char: Character) -> Dict[str, Any]:
     """Convert Character to dict."""
     return {
@@ -761,9 +924,7 @@ def handle_combat_end(session_id: str, game: Game, combat_log: List[str], result
                 game.player.inventory.append(item)
         
         # Clear combat state
-        delattr(game, "current_mission")
-        delattr(game, "current_enemies")
-        delattr(game, "combat_round")
+        clear_combat(game)
         
         # Auto-save after victory
         save_game_session(session_id, game)
@@ -781,12 +942,7 @@ def handle_combat_end(session_id: str, game: Game, combat_log: List[str], result
     else:
         # Defeat
         game.player.hp = 1
-        if hasattr(game, "current_mission"):
-            delattr(game, "current_mission")
-        if hasattr(game, "current_enemies"):
-            delattr(game, "current_enemies")
-        if hasattr(game, "combat_round"):
-            delattr(game, "combat_round")
+        clear_combat(game)
         
         # Auto-save after defeat
         save_game_session(session_id, game)
@@ -0,0 +1,177 @@
+"""Shared, read-only game catalog loaded once per process."""
+import os
+import sys
+import threading
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+# Add current directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import data_loader
+from models.race import Race
+from models.clazz import Class
+from models.weapon import Weapon
+from models.armor import Armor
+
+
+# Set to "1" to reload the catalog when a data/*.json file changes
+HOT_RELOAD_ENV = "SYMBIOZ_CATALOG_HOT_RELOAD"
+
+CATALOG_FILES = (
+    "races.json",
+    "classes.json",
+    "weapons.json",
+    "armor.json",
+    "missions.json",
+    "honey.json",
+)
+
+
+class GameCatalog:
+    """
+    Immutable, name-indexed game data shared by every Game session.
+    
+    Lists are tuples and indexes are read-only mappings. The model objects
+    and mission/honey dicts are shared between sessions and must not be
+    mutated (characters copy what they change, e.g. base attributes).
+    """
+    
+    __slots__ = (
+        "races",
+        "classes",
+        "weapons",
+        "armor",
+        "missions",
+        "honey",
+        "races_by_name",
+        "classes_by_name",
+        "weapons_by_name",
+        "armor_by_name",
+        "missions_by_id",
+        "honey_by_name",
+        "signature",
+    )
+    
+    def __init__(
+        self,
+        races: Tuple[Race, ...],
+        classes: Tuple[Class, ...],
+        weapons: Tuple[Weapon, ...],
+        armor: Tuple[Armor, ...],
+        missions: Tuple[Dict, ...],
+        honey: Tuple[Dict, ...],
+        signature: Optional[Tuple] = None
+    ):
+        values = {
+            "races": tuple(races),
+            "classes": tuple(classes),
+            "weapons": tuple(weapons),
+            "armor": tuple(armor),
+            "missions": tuple(missions),
+            "honey": tuple(honey),
+            "signature": signature,
+        }
+        # First entry wins on duplicate names, matching next(...) lookups
+        values["races_by_name"] = _index(values["races"], lambda r: r.name)
+        values["classes_by_name"] = _index(values["classes"], lambda c: c.name)
+        values["weapons_by_name"] = _index(values["weapons"], lambda w: w.name)
+        values["armor_by_name"] = _index(values["armor"], lambda a: a.name)
+        values["missions_by_id"] = _index(values["missions"], lambda m: m.get("id"))
+        values["honey_by_name"] = _index(values["honey"], lambda h: h.get("name"))
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("GameCatalog is read-only")
+    
+    def get_race(self, name: str) -> Optional[Race]:
+        """Look up a race by name."""
+        return self.races_by_name.get(name)
+    
+    def get_class(self, name: str) -> Optional[Class]:
+        """Look up a class by name."""
+        return self.classes_by_name.get(name)
+    
+    def get_weapon(self, name: str) -> Optional[Weapon]:
+        """Look up a weapon by name."""
+        return self.weapons_by_name.get(name)
+    
+    def get_armor(self, name: str) -> Optional[Armor]:
+        """Look up armor by name."""
+        return self.armor_by_name.get(name)
+    
+    def get_mission(self, mission_id: str) -> Optional[Dict]:
+        """Look up a mission by its id."""
+        return self.missions_by_id.get(mission_id)
+
+
+def _index(items, key) -> Mapping:
+    """Read-only name -> item mapping (first item wins)."""
+    index = {}
+    for item in items:
+        index.setdefault(key(item), item)
+    return MappingProxyType(index)
+
+
+def _data_signature() -> Tuple:
+    """mtime/size of every catalog data file, for change detection."""
+    signature = []
+    for filename in CATALOG_FILES:
+        path = os.path.join(data_loader.DATA_DIR, filename)
+        try:
+            stat = os.stat(path)
+            signature.append((filename, stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((filename, None, None))
+    return tuple(signature)
+
+
+def load_catalog() -> GameCatalog:
+    """Read all data files and build a new catalog."""
+    signature = _data_signature()
+    return GameCatalog(
+        races=data_loader.load_races(),
+        classes=data_loader.load_classes(),
+        weapons=data_loader.load_weapons(),
+        armor=data_loader.load_armor(),
+        missions=data_loader.load_missions(),
+        honey=data_loader.load_honey(),
+        signature=signature
+    )
+
+
+_catalog: Optional[GameCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog(check_for_updates: Optional[bool] = None) -> GameCatalog:
+    """
+    Return the process-wide catalog, loading it on first use.
+    
+    Args:
+        check_for_updates: Reload if any data file changed since the catalog
+            was loaded. Defaults to the SYMBIOZ_CATALOG_HOT_RELOAD env var.
+    
+    Returns:
+        Shared GameCatalog. Sessions holding an older catalog keep it.
+    """
+    global _catalog
+    if check_for_updates is None:
+        check_for_updates = os.getenv(HOT_RELOAD_ENV, "") == "1"
+    
+    catalog = _catalog
+    if catalog is not None and not (check_for_updates and catalog.signature != _data_signature()):
+        return catalog
+    
+    with _catalog_lock:
+        if _catalog is None or (check_for_updates and _catalog.signature != _data_signature()):
+            _catalog = load_catalog()
+        return _catalog
+
+
+def reset_catalog() -> None:
+    """Drop the shared catalog so the next get_catalog() reloads it."""
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
@@ -13,10 +13,12 @@ from models.weapon import Weapon
 from models.armor import Armor
 
 
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
 def load_json(filepath: str) -> List[Dict]:
     """Load JSON file and return list/dict."""
-    data_dir = os.path.join(os.path.dirname(__file__), "data")
-    full_path = os.path.join(data_dir, filepath)
+    full_path = os.path.join(DATA_DIR, filepath)
     with open(full_path, 'r') as f:
         return json.load(f)
 
@@ -88,3 +90,8 @@ def load_missions() -> List[Dict]:
     """Load all missions from data/missions.json."""
     return load_json("missions.json")
 
+
+def load_honey() -> List[Dict]:
+    """Load all honey items from data/honey.json."""
+    return load_json("honey.json")
+
@@ -14,25 +14,33 @@ from systems.combat import CombatSystem
 from systems.skill_checks import SkillCheckSystem
 from systems.progression import ProgressionSystem
 from systems.hub import Hub
-import data_loader
+from systems.rng import GameRNG
+from systems import replay
+import catalog as game_catalog
 
 
 class Game:
     """Main game controller."""
     
-    def __init__(self):
+    def __init__(self, catalog: game_catalog.GameCatalog = None, seed: int = None):
         self.player: Character = None
         self.hub = Hub()
-        self.combat_system = CombatSystem()
-        self.skill_system = SkillCheckSystem()
+        
+        # Per-game dice: combat/items on one stream, skill checks on another,
+        # so checks never shift a combat replay (seed=None picks a random seed)
+        self.rng = GameRNG(seed)
+        self.skill_rng = self.rng.fork(1)
+        self.combat_system = CombatSystem(self.rng)
+        self.skill_system = SkillCheckSystem(self.skill_rng)
         self.progression = ProgressionSystem()
         
-        # Load game data
-        self.races = data_loader.load_races()
-        self.classes = data_loader.load_classes()
-        self.weapons = data_loader.load_weapons()
-        self.armor_list = data_loader.load_armor()
-        self.missions = data_loader.load_missions()
+        # Game data comes from the shared catalog (loaded once per process)
+        self.catalog = catalog or game_catalog.get_catalog()
+        self.races = self.catalog.races
+        self.classes = self.catalog.classes
+        self.weapons = self.catalog.weapons
+        self.armor_list = self.catalog.armor
+        self.missions = self.catalog.missions
         
         # Give player starting equipment
         self.starting_weapon = self.weapons[0]  # Basic Pistol or Basic Sword
@@ -100,10 +108,10 @@ class Game:
         # Give starting equipment based on class
         if selected_class.name in ["Vanguard"]:
             # Melee class gets sword
-            self.player.weapon = next(w for w in self.weapons if w.name == "Basic Sword")
+            self.player.weapon = self.catalog.weapons_by_name["Basic Sword"]
         else:
             # Others get pistol
-            self.player.weapon = next(w for w in self.weapons if w.name == "Basic Pistol")
+            self.player.weapon = self.catalog.weapons_by_name["Basic Pistol"]
         
         self.player.armor = self.starting_armor
         
@@ -135,9 +143,9 @@ class Game:
             weapon = None
             armor = None
             if enemy_data.get('weapon'):
-                weapon = next((w for w in self.weapons if w.name == enemy_data['weapon']), None)
+                weapon = self.catalog.get_weapon(enemy_data['weapon'])
             if enemy_data.get('armor'):
-                armor = next((a for a in self.armor_list if a.name == enemy_data['armor']), None)
+                armor = self.catalog.get_armor(enemy_data['armor'])
             
             enemy = Enemy(
                 name=enemy_data['name'],
@@ -279,13 +287,13 @@ class Game:
                             # For MVP, just use Vital Honey if available
                             has_honey = any("Honey" in str(item) for item in self.player.inventory)
                             if has_honey:
-                                import random
                                 con_mod = self.player.get_attribute_modifier("CON")
-                                heal_amount = random.randint(1, 6) + con_mod
+                                heal_amount = self.rng.randint(1, 6) + con_mod
                                 heal_amount = max(3, heal_amount)  # Minimum 3 HP
                                 old_hp = self.player.hp
                                 self.player.heal(heal_amount)
                                 actual_heal = self.player.hp - old_hp
+                                self.combat_system.log.record(0, replay.ITEM, value=actual_heal)
                                 # Remove one honey from inventory (simplified)
                                 honey_items = [item for item in self.player.inventory if "Honey" in str(item)]
                                 if honey_items:
@@ -517,7 +525,7 @@ class Game:
                         
                         if item['type'] == "weapon":
                             # Find and equip weapon
-                            weapon = next((w for w in self.weapons if w.name == item['weapon_name']), None)
+                            weapon = self.catalog.get_weapon(item['weapon_name'])
                             if weapon:
                                 old_weapon = self.player.weapon.name if self.player.weapon else "None"
                                 self.player.weapon = weapon
@@ -529,7 +537,7 @@ class Game:
                         
                         elif item['type'] == "armor":
                             # Find and equip armor
-                            armor = next((a for a in self.armor_list if a.name == item['armor_name']), None)
+                            armor = self.catalog.get_armor(item['armor_name'])
                             if armor:
                                 old_armor = self.player.armor.name if self.player.armor else "None"
                                 self.player.armor = armor
@@ -4,6 +4,8 @@
 class Armor:
     """Represents armor."""
     
+    __slots__ = ("name", "armor_type", "defense_bonus", "damage_reduction")
+    
     def __init__(
         self,
         name: str,
@@ -5,6 +5,8 @@ from typing import Dict, List
 class Class:
     """Represents a character class."""
     
+    __slots__ = ("name", "description", "base_hp", "hp_per_level", "attribute_bonuses", "abilities")
+    
     def __init__(
         self,
         name: str,
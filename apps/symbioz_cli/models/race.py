@@ -5,6 +5,8 @@ from typing import Dict
 class Race:
     """Represents a playable race."""
     
+    __slots__ = ("name", "description", "base_attributes", "racial_traits")
+    
     def __init__(
         self,
         name: str,
@@ -5,6 +5,8 @@ from typing import Dict, Optional
 class Weapon:
     """Represents a weapon."""
     
+    __slots__ = ("name", "weapon_type", "base_damage", "attack_bonus", "upgrades")
+    
     def __init__(
         self,
         name: str,
@@ -19,8 +21,8 @@ class Weapon:
         self.attack_bonus = attack_bonus
         self.upgrades = upgrades or {}  # Slot upgrades
     
-    def roll_damage(self) -> int:
-        """Roll damage dice (simple parser for MVP)."""
+    def roll_damage(self, rng=None) -> int:
+        """Roll damage dice (simple parser for MVP); rng defaults to the random module."""
         # Parse "1d6" or "1d8" format
         parts = self.base_damage.split("d")
         if len(parts) != 2:
@@ -28,10 +30,11 @@ class Weapon:
         num_dice = int(parts[0])
         die_size = int(parts[1])
         
-        import random
+        if rng is None:
+            import random as rng
         total = 0
         for _ in range(num_dice):
-            total += random.randint(1, die_size)
+            total += rng.randint(1, die_size)
         
         # Add upgrade bonuses
         damage_bonus = self.upgrades.get("damage_bonus", 0)
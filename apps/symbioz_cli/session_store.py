@@ -0,0 +1,476 @@
+"""Session storage backends for the Symbioz API server.
+
+Stores hold the JSON-serializable save data for a session (see
+api_server.save_game_session). Backends:
+
+- MemorySessionStore: in-process LRU with max size and TTL
+- FileSessionStore: one JSON file per session (original behaviour)
+- SQLiteSessionStore: single SQLite database in WAL mode, safe to share
+  between uvicorn workers on one host
+- RedisSessionStore: any client with Redis get/set/delete (redis-py, or
+  FakeRedis for local runs), shared between hosts
+
+WriteBehindSessionStore wraps any backend so puts are buffered and flushed
+in batches from a background thread instead of on the request path.
+Shared backends (sqlite, redis) also answer get_revision() without
+loading the save data, so workers can cheaply check for newer saves.
+create_session_store() builds the configured store from environment vars.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+class SessionStore:
+    """Interface for session save-data storage."""
+    
+    # True when other processes can write the same sessions (see get_revision)
+    shared = False
+    
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Return save data for a session, or None if unknown/expired."""
+        raise NotImplementedError
+    
+    def get_revision(self, session_id: str) -> Optional[str]:
+        """Return the "revision" of a session's save data without loading it all."""
+        data = self.get(session_id)
+        return data.get("revision") if data is not None else None
+    
+    def put(self, session_id: str, data: Dict[str, Any]):
+        """Store save data for a session (replaces any previous data)."""
+        raise NotImplementedError
+    
+    def put_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Store several sessions at once (backends may batch this)."""
+        for session_id, data in items:
+            self.put(session_id, data)
+    
+    def delete(self, session_id: str):
+        """Remove a session."""
+        raise NotImplementedError
+    
+    def flush(self):
+        """Persist any buffered writes."""
+    
+    def close(self):
+        """Flush and release resources."""
+        self.flush()
+
+
+class LRUCache:
+    """Thread-safe LRU mapping with optional TTL and eviction callback."""
+    
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: Optional[float] = None,
+        on_evict: Optional[Callable[[str, Any], None]] = None
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.on_evict = on_evict
+        self._items: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value for key (refreshing its TTL), or None."""
+        evicted = []
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._items[key]
+                evicted.append((key, value))
+                value = None
+            else:
+                self._items[key] = (time.monotonic(), value)
+                self._items.move_to_end(key)
+        self._notify(evicted)
+        return value
+    
+    def set(self, key: str, value: Any):
+        """Store a value, evicting expired and least recently used entries."""
+        evicted = []
+        with self._lock:
+            self._items[key] = (time.monotonic(), value)
+            self._items.move_to_end(key)
+            evicted.extend(self._expire_locked())
+            while len(self._items) > self.max_size:
+                evicted.append(self._pop_oldest_locked())
+        self._notify(evicted)
+    
+    def pop(self, key: str) -> Optional[Any]:
+        """Remove and return a value (no eviction callback)."""
+        with self._lock:
+            entry = self._items.pop(key, None)
+        return entry[1] if entry else None
+    
+    def items(self):
+        """Snapshot of (key, value) pairs, oldest first."""
+        with self._lock:
+            return [(key, value) for key, (_, value) in self._items.items()]
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+    
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def __setitem__(self, key: str, value: Any):
+        self.set(key, value)
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def _expire_locked(self):
+        if self.ttl_seconds is None:
+            return []
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = []
+        # Entries are kept in access order, so expired ones are at the front
+        while self._items:
+            key, (stored_at, value) = next(iter(self._items.items()))
+            if stored_at > cutoff:
+                break
+            del self._items[key]
+            expired.append((key, value))
+        return expired
+    
+    def _pop_oldest_locked(self):
+        key, (_, value) = self._items.popitem(last=False)
+        return key, value
+    
+    def _notify(self, evicted):
+        if self.on_evict:
+            for key, value in evicted:
+                self.on_evict(key, value)
+
+
+class MemorySessionStore(SessionStore):
+    """In-process store: LRU with a max size and idle TTL."""
+    
+    def __init__(self, max_size: int = 10000, ttl_seconds: Optional[float] = 24 * 3600):
+        self._cache = LRUCache(max_size=max_size, ttl_seconds=ttl_seconds)
+    
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        data = self._cache.get(session_id)
+        return json.loads(data) if data is not None else None
+    
+    def put(self, session_id: str, data: Dict[str, Any]):
+        # Stored serialized so callers can't mutate stored state
+        self._cache.set(session_id, json.dumps(data))
+    
+    def delete(self, session_id: str):
+        self._cache.pop(session_id)
+
+
+class FileSessionStore(SessionStore):
+    """One JSON file per session in a directory."""
+    
+    def __init__(self, save_dir: str):
+        self.save_dir = save_dir
+        os.makedirs(save_dir, exist_ok=True)
+    
+    def _path(self, session_id: str) -> str:
+        return os.path.join(self.save_dir, f"{os.path.basename(session_id)}.json")
+    
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(session_id), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def put(self, session_id: str, data: Dict[str, Any]):
+        path = self._path(session_id)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    
+    def delete(self, session_id: str):
+        try:
+            os.remove(self._path(session_id))
+        except FileNotFoundError:
+            pass
+
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite-backed store in WAL mode (shared by workers on one host)."""
+    
+    shared = True
+    
+    def __init__(self, path: str, ttl_seconds: Optional[float] = None):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "session_id TEXT PRIMARY KEY, data TEXT NOT NULL, updated_at REAL NOT NULL, revision TEXT)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(sessions)")}
+        if "revision" not in columns:
+            self._conn.execute("ALTER TABLE sessions ADD COLUMN revision TEXT")
+        self._conn.commit()
+    
+    def _select(self, session_id: str, column: str):
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {column}, updated_at FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        if self.ttl_seconds is not None and time.time() - row[1] > self.ttl_seconds:
+            self.delete(session_id)
+            return None
+        return row[0]
+    
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        data = self._select(session_id, "data")
+        return json.loads(data) if data is not None else None
+    
+    def get_revision(self, session_id: str) -> Optional[str]:
+        return self._select(session_id, "revision")
+    
+    def put(self, session_id: str, data: Dict[str, Any]):
+        self.put_many([(session_id, data)])
+    
+    def put_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]):
+        now = time.time()
+        rows = [(session_id, json.dumps(data), now, data.get("revision")) for session_id, data in items]
+        if not rows:
+            return
+        with self._lock:
+            # One transaction per batch
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO sessions (session_id, data, updated_at, revision) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(session_id) DO UPDATE SET data = excluded.data, "
+                    "updated_at = excluded.updated_at, revision = excluded.revision",
+                    rows,
+                )
+    
+    def delete(self, session_id: str):
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Store for any Redis-compatible client (get/set/delete, optional pipeline).
+    
+    Each session's revision is also kept under its own "<key>:revision"
+    key, so it can be checked without fetching the save data.
+    """
+    
+    shared = True
+    
+    def __init__(self, client: Any, prefix: str = "symbioz:session:", ttl_seconds: Optional[int] = 24 * 3600):
+        self.client = client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+    
+    def _key(self, session_id: str) -> str:
+        return f"{self.prefix}{session_id}"
+    
+    def _get_text(self, key: str) -> Optional[str]:
+        raw = self.client.get(key)
+        if isinstance(raw, bytes):
+            raw = raw.decode("utf-8")
+        return raw
+    
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        raw = self._get_text(self._key(session_id))
+        return json.loads(raw) if raw is not None else None
+    
+    def get_revision(self, session_id: str) -> Optional[str]:
+        return self._get_text(f"{self._key(session_id)}:revision")
+    
+    def put(self, session_id: str, data: Dict[str, Any]):
+        self.put_many([(session_id, data)])
+    
+    def put_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]):
+        # Pipeline batches the round trips when the client supports it
+        pipe = self.client.pipeline() if hasattr(self.client, "pipeline") else self.client
+        for session_id, data in items:
+            key = self._key(session_id)
+            pipe.set(key, json.dumps(data), ex=self.ttl_seconds)
+            if data.get("revision") is not None:
+                pipe.set(f"{key}:revision", data["revision"], ex=self.ttl_seconds)
+            else:
+                pipe.delete(f"{key}:revision")
+        if pipe is not self.client:
+            pipe.execute()
+    
+    def delete(self, session_id: str):
+        key = self._key(session_id)
+        self.client.delete(key, f"{key}:revision")
+
+
+class FakeRedis:
+    """Minimal in-process stand-in for a Redis client (get/set with ex/delete)."""
+    
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._data[key]
+                return None
+            return value
+    
+    def set(self, key: str, value: Any, ex: Optional[int] = None) -> bool:
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ex if ex else None)
+        return True
+    
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+
+class WriteBehindSessionStore(SessionStore):
+    """
+    Buffer puts and flush them to a backend in batches.
+    
+    Repeated saves of one session between flushes collapse into a single
+    write. Reads see buffered data immediately.
+    """
+    
+    def __init__(self, backend: SessionStore, flush_interval: float = 0.5, max_pending: int = 500):
+        self.backend = backend
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="session-write-behind", daemon=True)
+        self._thread.start()
+    
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            data = self._pending.get(session_id)
+        if data is not None:
+            return data
+        return self.backend.get(session_id)
+    
+    def get_revision(self, session_id: str) -> Optional[str]:
+        with self._lock:
+            data = self._pending.get(session_id)
+        if data is not None:
+            return data.get("revision")
+        return self.backend.get_revision(session_id)
+    
+    @property
+    def shared(self) -> bool:
+        return self.backend.shared
+    
+    def put(self, session_id: str, data: Dict[str, Any]):
+        with self._lock:
+            self._pending[session_id] = data
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self._wakeup.set()
+    
+    def delete(self, session_id: str):
+        # Wait out an in-flight flush, which may be writing this session back
+        with self._flush_lock:
+            with self._lock:
+                self._pending.pop(session_id, None)
+            self.backend.delete(session_id)
+    
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return
+            try:
+                self.backend.put_many(batch.items())
+            except Exception as e:
+                # Keep unsaved data (newer puts win) and retry on the next flush
+                with self._lock:
+                    for session_id, data in batch.items():
+                        self._pending.setdefault(session_id, data)
+                print(f"Error flushing sessions: {e}")
+    
+    def close(self):
+        self._stopped.set()
+        self._wakeup.set()
+        self._thread.join(timeout=5.0)
+        self.flush()
+        self.backend.close()
+    
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+def create_session_store(default_save_dir: str) -> SessionStore:
+    """
+    Build the session store configured by environment variables.
+    
+    SYMBIOZ_SESSION_BACKEND: "file" (default), "sqlite", "redis", "fakeredis" or "memory"
+    SYMBIOZ_SESSION_DB: SQLite path (default <save dir>/sessions.db)
+    REDIS_URL: Redis connection URL (requires the redis package)
+    SYMBIOZ_SESSION_TTL: Session TTL in seconds for memory/sqlite/redis
+    SYMBIOZ_SESSION_WRITE_BEHIND: "0" to write synchronously (default "1")
+    """
+    backend_name = os.getenv("SYMBIOZ_SESSION_BACKEND", "file").lower()
+    ttl = os.getenv("SYMBIOZ_SESSION_TTL")
+    ttl_seconds = int(ttl) if ttl else None
+    
+    if backend_name == "file":
+        backend = FileSessionStore(default_save_dir)
+    elif backend_name == "sqlite":
+        os.makedirs(default_save_dir, exist_ok=True)
+        db_path = os.getenv("SYMBIOZ_SESSION_DB", os.path.join(default_save_dir, "sessions.db"))
+        backend = SQLiteSessionStore(db_path, ttl_seconds=ttl_seconds)
+    elif backend_name in ("redis", "fakeredis"):
+        if backend_name == "fakeredis":
+            client = FakeRedis()
+        else:
+            try:
+                import redis
+            except ImportError:
+                raise ImportError("SYMBIOZ_SESSION_BACKEND=redis requires the 'redis' package")
+            client = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"))
+        backend = RedisSessionStore(client, ttl_seconds=ttl_seconds if ttl else 24 * 3600)
+    elif backend_name == "memory":
+        backend = MemorySessionStore(ttl_seconds=ttl_seconds if ttl else 24 * 3600)
+    else:
+        raise ValueError(f"Unknown SYMBIOZ_SESSION_BACKEND: {backend_name}")
+    
+    # Memory writes are already cheap; everything else is written behind
+    if backend_name != "memory" and os.getenv("SYMBIOZ_SESSION_WRITE_BEHIND", "1") != "0":
+        return WriteBehindSessionStore(backend)
+    return backend
@@ -9,24 +9,41 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.character import Character
 from models.enemy import Enemy
+from systems import replay
+from systems.replay import CombatLog
 
 
 class CombatSystem:
     """Handles turn-based combat."""
     
-    def __init__(self):
+    def __init__(self, rng=None):
+        # Dice source: a per-game GameRNG, or the global random module
+        self.rng = rng or random
         self.turn_order: List[Character] = []
         self.current_turn = 0
+        # Player first, then enemies; indexes used in the combat log
+        self.combatants: List[Character] = []
+        self.log = CombatLog()
+    
+    def _index(self, character: Character) -> int:
+        """Combat log index of a combatant."""
+        for index, combatant in enumerate(self.combatants):
+            if combatant is character:
+                return index
+        return replay.NO_TARGET
     
     def roll_initiative(self, character: Character) -> int:
         """Roll initiative: d20 + DEX mod."""
         dex_mod = character.get_attribute_modifier("DEX")
-        roll = random.randint(1, 20)
+        roll = self.rng.randint(1, 20)
+        self.log.record(self._index(character), replay.INITIATIVE, roll=roll, value=roll + dex_mod)
         return roll + dex_mod
     
     def start_combat(self, player: Character, enemies: List[Enemy]) -> List[Character]:
         """Initialize combat and determine turn order."""
         all_combatants = [player] + enemies
+        self.combatants = all_combatants
+        self.log = CombatLog()
         
         # Roll initiative for all
         initiatives = []
@@ -54,7 +71,7 @@ class CombatSystem:
         Perform an attack roll and return (hit, damage, message).
         Returns "hit", "graze", or "miss".
         """
-        attack_roll = random.randint(1, 20)
+        attack_roll = self.rng.randint(1, 20)
         attack_bonus = attacker.get_attack_bonus()
         total_attack = attack_roll + attack_bonus
         
@@ -83,7 +100,7 @@ class CombatSystem:
         result_type = "miss"
         
         if hit or attack_roll == 20:  # Critical hit on natural 20
-            damage = attacker.weapon.roll_damage() if attacker.weapon else 1
+            damage = attacker.weapon.roll_damage(self.rng) if attacker.weapon else 1
             attr_mod = attacker.get_attribute_modifier("STR" if attacker.weapon and attacker.weapon.weapon_type == "melee" else "DEX")
             damage += attr_mod
             
@@ -105,17 +122,21 @@ class CombatSystem:
             
             actual_damage = target.take_damage(damage)
             result_type = "hit"
+            action = replay.ATTACK_CRIT if attack_roll == 20 else replay.ATTACK_HIT
+            self.log.record(self._index(attacker), action, self._index(target), attack_roll, actual_damage)
             return True, actual_damage, result_type
         
         elif is_graze:
             # Graze: half damage, no status effects, no ability bonuses
-            damage = attacker.weapon.roll_damage() if attacker.weapon else 1
+            damage = attacker.weapon.roll_damage(self.rng) if attacker.weapon else 1
             attr_mod = attacker.get_attribute_modifier("STR" if attacker.weapon and attacker.weapon.weapon_type == "melee" else "DEX")
             damage = (damage + attr_mod + 1) // 2  # Half damage, rounded up
             actual_damage = target.take_damage(damage)
             result_type = "graze"
+            self.log.record(self._index(attacker), replay.ATTACK_GRAZE, self._index(target), attack_roll, actual_damage)
             return True, actual_damage, result_type
         
+        self.log.record(self._index(attacker), replay.ATTACK_MISS, self._index(target), attack_roll)
         return False, 0, result_type
     
     def use_ability(self, character: Character, ability_name: str, target: Character = None) -> str:
@@ -123,81 +144,91 @@ class CombatSystem:
         if ability_name not in character.clazz.abilities:
             return f"{character.name} doesn't have that ability."
         
+        message, roll, value = self._resolve_ability(character, ability_name, target)
+        if ability_name in replay.ABILITY_CODES:
+            action = replay.ABILITY + replay.ABILITY_CODES[ability_name]
+            target_index = self._index(target) if target is not None else replay.NO_TARGET
+            self.log.record(self._index(character), action, target_index, roll, value)
+        return message
+    
+    def _resolve_ability(self, character: Character, ability_name: str, target: Character = None) -> Tuple[str, int, int]:
+        """Apply an ability and return (message, check roll, damage/heal)."""
         # Enhanced ability implementations for Round 2
         if ability_name == "Power Strike":
             # Power Strike: +2 to hit and +2 damage on next attack
             character.add_status_effect("Power Strike Active", duration=1)
-            return f"{character.name} uses Power Strike! Next attack gains +2 to hit and +2 damage."
+            return f"{character.name} uses Power Strike! Next attack gains +2 to hit and +2 damage.", 0, 0
         
         elif ability_name == "Brace":
             # Brace: +4 Defense for 1 turn
             character.add_status_effect("Guarded", duration=1)
             # Store the defense bonus in a way we can check
-            return f"{character.name} braces for impact! Defense increased by 4 this turn."
+            return f"{character.name} braces for impact! Defense increased by 4 this turn.", 0, 0
         
         elif ability_name == "Sneak Attack":
             # Sneak Attack: +3 damage if enemy hasn't acted
             character.add_status_effect("Sneak Attack Ready", duration=1)
-            return f"{character.name} uses Sneak Attack! Next attack deals +3 damage if enemy hasn't acted."
+            return f"{character.name} uses Sneak Attack! Next attack deals +3 damage if enemy hasn't acted.", 0, 0
         
         elif ability_name == "Dodge":
             # Dodge: +4 Defense for 1 turn
             character.add_status_effect("Guarded", duration=1)
-            return f"{character.name} dodges! Defense increased by 4 this turn."
+            return f"{character.name} dodges! Defense increased by 4 this turn.", 0, 0
         
         elif ability_name == "Hack":
             # Disable enemy for 1 turn (INT check)
             if not target:
-                return f"{character.name} needs a target to hack!"
+                return f"{character.name} needs a target to hack!", 0, 0
             int_mod = character.get_attribute_modifier("INT")
-            roll = random.randint(1, 20) + int_mod
+            roll = self.rng.randint(1, 20) + int_mod
             if roll >= target.get_defense():
                 target.add_status_effect("Stunned", duration=1)
-                return f"{character.name} hacks {target.name}! {target.name} is stunned for 1 turn."
-            return f"{character.name}'s hack failed! (Roll: {roll} vs Defense: {target.get_defense()})"
+                return f"{character.name} hacks {target.name}! {target.name} is stunned for 1 turn.", roll, 0
+            return f"{character.name}'s hack failed! (Roll: {roll} vs Defense: {target.get_defense()})", roll, 0
         
         elif ability_name == "Repair":
             # Repair: MVP - self-only, no enemy targeting
             int_mod = character.get_attribute_modifier("INT")
-            heal_amount = random.randint(1, 4) + int_mod
+            heal_amount = self.rng.randint(1, 4) + int_mod
             heal_amount = max(1, heal_amount)  # Minimum 1 HP
             character.heal(heal_amount)
-            return f"{character.name} reroutes power and stabilizes systems, restoring {heal_amount} HP."
+            return f"{character.name} reroutes power and stabilizes systems, restoring {heal_amount} HP.", 0, heal_amount
         
         elif ability_name == "Overload Systems":
             # Overload Systems: Tech Specialist offensive ability
             if not target:
-                return f"{character.name} needs a target to overload systems!"
+                return f"{character.name} needs a target to overload systems!", 0, 0
             int_mod = character.get_attribute_modifier("INT")
-            roll = random.randint(1, 20) + int_mod + 2  # +2 ability bonus
+            roll = self.rng.randint(1, 20) + int_mod + 2  # +2 ability bonus
             defense = target.get_defense()
             
             if roll >= defense:
                 # Hit: deal energy damage and apply debuff
-                damage = random.randint(1, 6) + int_mod
+                damage = self.rng.randint(1, 6) + int_mod
                 actual_damage = target.take_damage(damage)
                 target.add_status_effect("Systems Disrupted", duration=2)
-                return f"{character.name} overloads enemy systems! The overload hits {target.name} for {actual_damage} energy damage and disrupts their defenses! (-2 Defense for 2 turns)"
+                return f"{character.name} overloads enemy systems! The overload hits {target.name} for {actual_damage} energy damage and disrupts their defenses! (-2 Defense for 2 turns)", roll, actual_damage
             else:
-                return f"{character.name}'s overload fizzles against {target.name}'s shielding. (Roll: {roll} vs Defense: {defense})"
+                return f"{character.name}'s overload fizzles against {target.name}'s shielding. (Roll: {roll} vs Defense: {defense})", roll, 0
         
         elif ability_name == "First Aid":
             # First Aid: MVP - self-only, no target prompt
-            heal_amount = random.randint(2, 8) + 2
+            heal_amount = self.rng.randint(2, 8) + 2
             character.heal(heal_amount)
-            return f"{character.name} applies first aid! You restore {heal_amount} HP."
+            return f"{character.name} applies first aid! You restore {heal_amount} HP.", 0, heal_amount
         
         elif ability_name == "Survival Instinct":
             # Survival Instinct: +2 Attack, +1 to skill checks, lasts 3 turns
             character.add_status_effect("Focused", duration=3)
-            return f"{character.name} taps into survival instinct! +2 Attack and +1 to skill checks for 3 turns."
+            return f"{character.name} taps into survival instinct! +2 Attack and +1 to skill checks for 3 turns.", 0, 0
         
-        return f"{character.name} uses {ability_name}!"
+        return f"{character.name} uses {ability_name}!", 0, 0
     
     def apply_status_effects(self, character: Character):
         """Apply status effect damage/effects at start of turn."""
         if character.has_status_effect("Bleeding"):
             damage = character.take_damage(1)
+            self.log.record(self._index(character), replay.BLEED, value=damage)
             return f"{character.name} takes 1 bleeding damage! ({character.hp}/{character.max_hp} HP)"
         return None
     
@@ -0,0 +1,165 @@
+"""Compact binary combat event log."""
+import base64
+import struct
+from typing import Dict, Iterator, NamedTuple, Optional
+
+
+# One event: actor, action, target, roll, value (6 bytes, little-endian)
+EVENT_FORMAT = struct.Struct("<BBBbh")
+
+# Combatant index for "no combatant"; 0 is the player, 1.. are enemies
+NO_TARGET = 255
+
+# Event actions. roll is the d20 (or ability check total), value the damage/heal/total.
+INITIATIVE = 1  # roll = d20, value = initiative total
+ATTACK_MISS = 2  # roll = d20
+ATTACK_HIT = 3  # roll = d20, value = damage dealt
+ATTACK_GRAZE = 4  # roll = d20, value = damage dealt
+ATTACK_CRIT = 5  # roll = 20, value = damage dealt
+BLEED = 6  # value = damage dealt
+ITEM = 7  # value = HP restored
+COMMAND = 8  # Player request, see CombatLog.record_command
+ABILITY = 16  # ABILITY + ABILITY_CODES[name]; roll = check total, value = damage/heal
+
+ACTION_NAMES = {
+    INITIATIVE: "initiative",
+    ATTACK_MISS: "miss",
+    ATTACK_HIT: "hit",
+    ATTACK_GRAZE: "graze",
+    ATTACK_CRIT: "crit",
+    BLEED: "bleed",
+    ITEM: "item",
+    COMMAND: "command",
+}
+
+# Ability name <-> code; 0 = none, UNKNOWN_CODE = a name not in the table
+ABILITY_NAMES = (
+    None,
+    "Power Strike",
+    "Brace",
+    "Sneak Attack",
+    "Dodge",
+    "Hack",
+    "Repair",
+    "Overload Systems",
+    "First Aid",
+    "Survival Instinct",
+)
+ABILITY_CODES = {name: code for code, name in enumerate(ABILITY_NAMES) if name}
+UNKNOWN_CODE = 255
+
+# /api/combat/action action_type <-> code (stored in the roll field of COMMAND)
+COMMAND_TYPES = ("attack", "ability", "item", "defend")
+_UNKNOWN_COMMAND = -1
+# Target id stored in the value field of COMMAND when none was given
+_NO_TARGET_ID = -32768
+
+
+class CombatEvent(NamedTuple):
+    actor: int
+    action: int
+    target: int
+    roll: int
+    value: int
+
+
+def _clamp16(value: int) -> int:
+    return max(-32768, min(32767, int(value)))
+
+
+def _clamp8(value: int) -> int:
+    return max(-128, min(127, int(value)))
+
+
+class CombatLog:
+    """
+    Append-only combat record, 6 bytes per event.
+
+    Together with the RNG state at combat start, the COMMAND events are
+    enough to replay a fight exactly; the other events let a replay be
+    checked and audited.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes = b""):
+        self.data = bytearray(data)
+
+    def record(self, actor: int, action: int, target: int = NO_TARGET, roll: int = 0, value: int = 0):
+        """Append one event."""
+        self.data += EVENT_FORMAT.pack(actor, action, target, _clamp8(roll), _clamp16(value))
+
+    def record_command(
+        self,
+        action_type: str,
+        target_id: Optional[int] = None,
+        ability_name: Optional[str] = None,
+        item_name: Optional[str] = None
+    ):
+        """Append a player request (see decode_command)."""
+        code = COMMAND_TYPES.index(action_type) if action_type in COMMAND_TYPES else _UNKNOWN_COMMAND
+        if action_type == "item":
+            # Any "...Honey" item behaves the same; anything else is rejected
+            detail = 0 if not item_name else (1 if "Honey" in item_name else UNKNOWN_CODE)
+        else:
+            detail = 0 if not ability_name else ABILITY_CODES.get(ability_name, UNKNOWN_CODE)
+        target = _NO_TARGET_ID if target_id is None else max(_NO_TARGET_ID + 1, _clamp16(target_id))
+        self.record(0, COMMAND, detail, code, target)
+
+    def events(self) -> Iterator[CombatEvent]:
+        """Decode all events."""
+        for fields in EVENT_FORMAT.iter_unpack(bytes(self.data)):
+            yield CombatEvent(*fields)
+
+    def commands(self) -> Iterator[Dict]:
+        """Decoded player requests, in order."""
+        for event in self.events():
+            if event.action == COMMAND:
+                yield decode_command(event)
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.data)
+
+    def to_base64(self) -> str:
+        return base64.b64encode(self.data).decode("ascii")
+
+    @classmethod
+    def from_base64(cls, text: str) -> "CombatLog":
+        return cls(base64.b64decode(text))
+
+    def __len__(self) -> int:
+        return len(self.data) // EVENT_FORMAT.size
+
+
+def decode_command(event: CombatEvent) -> Dict:
+    """CombatAction fields for a COMMAND event."""
+    action_type = COMMAND_TYPES[event.roll] if 0 <= event.roll < len(COMMAND_TYPES) else "unknown"
+    command = {
+        "action_type": action_type,
+        "target_id": None if event.value == _NO_TARGET_ID else event.value,
+        "ability_name": None,
+        "item_name": None,
+    }
+    if action_type == "item":
+        command["item_name"] = {0: None, 1: "Honey"}.get(event.target, "unknown")
+    elif event.target:
+        command["ability_name"] = (
+            ABILITY_NAMES[event.target] if event.target < len(ABILITY_NAMES) else "unknown"
+        )
+    return command
+
+
+def describe_event(event: CombatEvent) -> Dict:
+    """Readable form of an event (for audit endpoints)."""
+    described = {"actor": event.actor, "action": ACTION_NAMES.get(event.action, str(event.action))}
+    if event.action == COMMAND:
+        described.update(decode_command(event))
+        return described
+    if ABILITY < event.action < ABILITY + len(ABILITY_NAMES):
+        described["action"] = "ability"
+        described["ability"] = ABILITY_NAMES[event.action - ABILITY]
+    if event.target != NO_TARGET:
+        described["target"] = event.target
+    described["roll"] = event.roll
+    described["value"] = event.value
+    return described
@@ -0,0 +1,62 @@
+"""Seedable, counter-based dice streams for reproducible games."""
+import secrets
+from typing import Dict, Optional
+
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+def _mix64(z: int) -> int:
+    """SplitMix64 finalizer."""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+class GameRNG:
+    """
+    Deterministic random stream owned by one game session.
+
+    Draw n is a pure function of (seed, stream, n), so the whole state is
+    three integers: saving and restoring a stream never needs the full
+    generator state. Supports the randint() subset of the random module
+    used by the game systems.
+    """
+
+    __slots__ = ("seed", "stream", "counter", "_key")
+
+    def __init__(self, seed: Optional[int] = None, stream: int = 0, counter: int = 0):
+        self.seed = secrets.randbits(63) if seed is None else int(seed)
+        self.stream = stream
+        self.counter = counter
+        self._key = _mix64((self.seed ^ _mix64(stream * _GOLDEN_GAMMA)) & _MASK64)
+
+    def _next(self) -> int:
+        """Next raw 64-bit value."""
+        value = _mix64((self._key + (self.counter + 1) * _GOLDEN_GAMMA) & _MASK64)
+        self.counter += 1
+        return value
+
+    def randint(self, a: int, b: int) -> int:
+        """Random integer in [a, b], like random.randint (modulo bias < 2^-58 for dice)."""
+        if b < a:
+            raise ValueError(f"empty range for randint({a}, {b})")
+        return a + self._next() % (b - a + 1)
+
+    def fork(self, stream: int) -> "GameRNG":
+        """Independent stream from the same seed (e.g. skill checks vs combat)."""
+        return GameRNG(self.seed, stream)
+
+    def get_state(self) -> Dict[str, int]:
+        """Serializable state."""
+        return {"seed": self.seed, "stream": self.stream, "counter": self.counter}
+
+    def set_state(self, state: Dict[str, int]):
+        """Restore a state from get_state()."""
+        self.__init__(state["seed"], state.get("stream", 0), state.get("counter", 0))
+
+    @classmethod
+    def from_state(cls, state: Dict[str, int]) -> "GameRNG":
+        """Create a stream from get_state() output."""
+        return cls(state["seed"], state.get("stream", 0), state.get("counter", 0))
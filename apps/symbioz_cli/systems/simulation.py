@@ -0,0 +1,533 @@
+"""Headless Monte Carlo balance simulator for combat missions.
+
+Runs many seeded fights at once with NumPy: every combatant is a column in
+(fights x combatants) hp/flag arrays and every dice roll for a turn step is
+drawn as one batch. The rules mirror CombatSystem.attack/use_ability/
+apply_status_effects; a fight ends as soon as the player or every enemy is
+down.
+
+Requires numpy (not needed to play the game or run the API).
+
+Usage (from apps/symbioz_cli/):
+    python -m systems.simulation --mission raider_ambush --class Vanguard --fights 1000000
+    python -m systems.simulation --level 2 --policy tactical --workers 8 --json balance.json
+"""
+import argparse
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.character import Character
+from models.enemy import Enemy
+import catalog as game_catalog
+
+
+# Status effect bits in the per-combatant flag array
+BLEEDING = np.uint8(1)
+GUARDED = np.uint8(2)
+DISRUPTED = np.uint8(4)
+FOCUSED = np.uint8(8)
+POWER_STRIKE = np.uint8(16)
+SNEAK_READY = np.uint8(32)
+STUNNED = np.uint8(64)
+
+# Player decision policies
+POLICY_ATTACK = "attack"  # Always attack the first living enemy
+POLICY_TACTICAL = "tactical"  # Lasting buffs first, heal below half HP, overload, else attack
+POLICIES = (POLICY_ATTACK, POLICY_TACTICAL)
+
+# Abilities whose status effect lasts the whole fight (durations are not tracked)
+LASTING_BUFFS = {"Brace": GUARDED, "Dodge": GUARDED, "Survival Instinct": FOCUSED}
+HEAL_ABILITIES = ("Repair", "First Aid")
+
+DEFAULT_MAX_ROUNDS = 50
+DEFAULT_BATCH_SIZE = 100_000
+
+# Player action codes
+_ATTACK = 0
+_BUFF = 1
+_HEAL = 2
+_OVERLOAD = 3
+
+
+@dataclass(frozen=True)
+class Matchup:
+    """One mission/build combination to simulate."""
+
+    mission_id: str
+    race: str
+    class_name: str
+    weapon: str
+    armor: str
+    level: int = 1
+    policy: str = POLICY_ATTACK
+
+
+@dataclass
+class SimulationResult:
+    """Aggregated outcome of many simulated fights for one matchup."""
+
+    matchup: Matchup
+    fights: int
+    victories: int
+    defeats: int
+    timeouts: int  # Fights still going after max_rounds
+    rounds_hist: List[int] = field(default_factory=list)  # rounds_hist[r] = fights that lasted r rounds
+    hp_loss_hist: List[int] = field(default_factory=list)  # hp_loss_hist[h] = victories costing h HP
+
+    @property
+    def win_rate(self) -> float:
+        return self.victories / self.fights if self.fights else 0.0
+
+    @property
+    def mean_rounds(self) -> float:
+        return _hist_mean(self.rounds_hist)
+
+    @property
+    def mean_hp_loss(self) -> float:
+        """Average HP lost in victories."""
+        return _hist_mean(self.hp_loss_hist)
+
+    def rounds_percentile(self, q: float) -> int:
+        return _hist_percentile(self.rounds_hist, q)
+
+    def hp_loss_percentile(self, q: float) -> int:
+        return _hist_percentile(self.hp_loss_hist, q)
+
+    def to_dict(self) -> Dict:
+        """JSON-friendly summary including the raw histograms."""
+        return {
+            **asdict(self.matchup),
+            "fights": self.fights,
+            "victories": self.victories,
+            "defeats": self.defeats,
+            "timeouts": self.timeouts,
+            "win_rate": self.win_rate,
+            "mean_rounds": self.mean_rounds,
+            "p90_rounds": self.rounds_percentile(0.9),
+            "mean_hp_loss": self.mean_hp_loss,
+            "p50_hp_loss": self.hp_loss_percentile(0.5),
+            "p90_hp_loss": self.hp_loss_percentile(0.9),
+            "rounds_hist": list(self.rounds_hist),
+            "hp_loss_hist": list(self.hp_loss_hist),
+        }
+
+
+def _hist_mean(hist: Sequence[int]) -> float:
+    total = sum(hist)
+    if not total:
+        return 0.0
+    return sum(value * count for value, count in enumerate(hist)) / total
+
+
+def _hist_percentile(hist: Sequence[int], q: float) -> int:
+    total = sum(hist)
+    if not total:
+        return 0
+    cumulative = np.cumsum(hist)
+    return int(np.searchsorted(cumulative, q * total))
+
+
+class CombatantTable:
+    """
+    Static combat stats for one fight layout, one array entry per combatant.
+
+    Index 0 is the player, 1.. are the mission's enemies in mission order.
+    """
+
+    def __init__(self, combatants: Sequence[Character]):
+        weapons = [c.weapon for c in combatants]
+        self.size = len(combatants)
+        self.max_hp = np.array([c.max_hp for c in combatants], dtype=np.int32)
+        self.attack_bonus = np.array([c.get_attack_bonus() for c in combatants], dtype=np.int32)
+        self.defense = np.array([c.get_defense() for c in combatants], dtype=np.int32)
+        self.damage_reduction = np.array([c.get_damage_reduction() for c in combatants], dtype=np.int32)
+        self.initiative_mod = np.array([c.get_attribute_modifier("DEX") for c in combatants], dtype=np.int32)
+        self.int_mod = np.array([c.get_attribute_modifier("INT") for c in combatants], dtype=np.int32)
+        self.damage_mod = np.array([
+            c.get_attribute_modifier("STR" if w and w.weapon_type == "melee" else "DEX")
+            for c, w in zip(combatants, weapons)
+        ], dtype=np.int32)
+
+        # Weapon dice; no weapon (or unparsable dice) is a flat 1 like Weapon.roll_damage
+        dice = [_parse_dice(w) for w in weapons]
+        self.dice_count = np.array([d[0] for d in dice], dtype=np.int32)
+        self.die_size = np.array([max(d[1], 1) for d in dice], dtype=np.int32)
+        self.damage_bonus = np.array([d[2] for d in dice], dtype=np.int32)
+        self.max_dice = int(self.dice_count.max()) if self.size else 0
+
+
+def _parse_dice(weapon) -> Tuple[int, int, int]:
+    """(dice count, die size, flat bonus) for a weapon."""
+    if weapon is None:
+        return 0, 1, 1
+    parts = weapon.base_damage.split("d")
+    if len(parts) != 2:
+        return 0, 1, 1
+    return int(parts[0]), int(parts[1]), weapon.upgrades.get("damage_bonus", 0)
+
+
+def build_player(catalog, race: str, class_name: str, weapon: str, armor: str, level: int = 1) -> Character:
+    """Create an equipped player, levelled up the same way the game does."""
+    race_obj = catalog.get_race(race)
+    class_obj = catalog.get_class(class_name)
+    if race_obj is None or class_obj is None:
+        raise ValueError(f"Unknown race/class: {race}/{class_name}")
+    player = Character("Simulated", race_obj, class_obj)
+    for _ in range(level - 1):
+        player.level_up()
+    player.weapon = catalog.get_weapon(weapon)
+    player.armor = catalog.get_armor(armor)
+    return player
+
+
+def build_enemies(catalog, mission: Dict) -> List[Enemy]:
+    """Create the enemies of a combat mission."""
+    enemies = []
+    for enemy_data in mission.get("enemies", []):
+        enemies.append(Enemy(
+            name=enemy_data["name"],
+            level=enemy_data["level"],
+            attributes=enemy_data["attributes"],
+            max_hp=enemy_data["max_hp"],
+            weapon=catalog.get_weapon(enemy_data["weapon"]) if enemy_data.get("weapon") else None,
+            armor=catalog.get_armor(enemy_data["armor"]) if enemy_data.get("armor") else None
+        ))
+    return enemies
+
+
+class BatchSimulator:
+    """Runs a batch of independent fights for one matchup in lockstep."""
+
+    def __init__(self, table: CombatantTable, abilities: Sequence[str], policy: str = POLICY_ATTACK,
+                 max_rounds: int = DEFAULT_MAX_ROUNDS):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy: {policy} (expected one of {POLICIES})")
+        self.table = table
+        self.policy = policy
+        self.max_rounds = max_rounds
+        self.buff = next((a for a in abilities if a in LASTING_BUFFS), None)
+        self.heal = next((a for a in abilities if a in HEAL_ABILITIES), None)
+        self.overload = "Overload Systems" in abilities
+
+    def run(self, n_fights: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """
+        Simulate n_fights fights.
+
+        Returns:
+            Dict with "outcome" (1 victory, 2 defeat, 0 timeout), "rounds"
+            and "player_hp" arrays, one entry per fight.
+        """
+        table = self.table
+        n = n_fights
+        self.hp = np.tile(table.max_hp, (n, 1))
+        self.flags = np.zeros((n, table.size), dtype=np.uint8)
+        self.rng = rng
+        outcome = np.zeros(n, dtype=np.int8)
+        rounds = np.zeros(n, dtype=np.int32)
+
+        initiative = rng.integers(1, 21, size=(n, table.size)) + table.initiative_mod
+        # Highest first; ties keep list order like CombatSystem.start_combat
+        order = np.argsort(-initiative, axis=1, kind="stable")
+
+        for round_num in range(1, self.max_rounds + 1):
+            ongoing = np.flatnonzero(outcome == 0)
+            if not len(ongoing):
+                break
+            rounds[ongoing] = round_num
+
+            # Bleeding: 1 damage (take_damage minimum) at the start of each round
+            bleeding = ((self.flags[ongoing] & BLEEDING) != 0) & (self.hp[ongoing] > 0)
+            self.hp[ongoing] -= bleeding.astype(np.int32)
+            self._update_outcome(outcome, ongoing)
+
+            for position in range(table.size):
+                fights = np.flatnonzero(outcome == 0)
+                actors = order[fights, position]
+                alive = self.hp[fights, actors] > 0
+                fights, actors = fights[alive], actors[alive]
+                if not len(fights):
+                    break
+
+                enemy_turn = actors != 0
+                if enemy_turn.any():
+                    # Enemy AI always attacks the player
+                    self._attack(fights[enemy_turn], actors[enemy_turn], np.zeros(int(enemy_turn.sum()), dtype=np.intp))
+                player_fights = fights[~enemy_turn]
+                if len(player_fights):
+                    self._player_turn(player_fights)
+                self._update_outcome(outcome, fights)
+
+        return {"outcome": outcome, "rounds": rounds, "player_hp": self.hp[:, 0].copy()}
+
+    def _update_outcome(self, outcome: np.ndarray, fights: np.ndarray):
+        hp = self.hp[fights]
+        defeat = hp[:, 0] <= 0
+        victory = ~defeat & ~(hp[:, 1:] > 0).any(axis=1)
+        outcome[fights[defeat]] = 2
+        outcome[fights[victory]] = 1
+
+    def _roll_damage(self, attackers: np.ndarray) -> np.ndarray:
+        """Weapon damage (dice + upgrade bonus) for each attacker."""
+        table = self.table
+        damage = table.damage_bonus[attackers].copy()
+        if table.max_dice:
+            rolls = self.rng.integers(1, table.die_size[attackers][:, None] + 1, size=(len(attackers), table.max_dice))
+            used = np.arange(table.max_dice) < table.dice_count[attackers][:, None]
+            damage += (rolls * used).sum(axis=1)
+        return damage
+
+    def _take_damage(self, fights: np.ndarray, targets: np.ndarray, damage: np.ndarray) -> np.ndarray:
+        actual = np.maximum(1, damage - self.table.damage_reduction[targets])
+        self.hp[fights, targets] = np.maximum(0, self.hp[fights, targets] - actual)
+        return actual
+
+    def _attack(self, fights: np.ndarray, attackers: np.ndarray, targets: np.ndarray):
+        """Vectorized CombatSystem.attack."""
+        table = self.table
+        roll = self.rng.integers(1, 21, size=len(fights))
+        attacker_flags = self.flags[fights, attackers]
+        target_flags = self.flags[fights, targets]
+        power_strike = (attacker_flags & POWER_STRIKE) != 0
+
+        total = (roll + table.attack_bonus[attackers]
+                 + 2 * ((attacker_flags & FOCUSED) != 0) + 2 * power_strike)
+        defense = (table.defense[targets]
+                   + 4 * ((target_flags & GUARDED) != 0) - 2 * ((target_flags & DISRUPTED) != 0))
+        crit = roll == 20
+        hit = (total >= defense) | crit
+        graze = ~hit & (total >= defense - 3)
+
+        base = self._roll_damage(attackers) + table.damage_mod[attackers]
+        sneak = (attacker_flags & SNEAK_READY) != 0
+        damage = base + 2 * power_strike + 3 * sneak
+        damage = np.where(crit, damage * 2, damage)
+        damage = np.where(hit, damage, (base + 1) // 2)
+
+        landed = hit | graze
+        self._take_damage(fights[landed], targets[landed], damage[landed])
+
+        # Power Strike / Sneak Attack are spent on a hit; crits cause bleeding
+        self.flags[fights[hit], attackers[hit]] &= ~(POWER_STRIKE | SNEAK_READY)
+        self.flags[fights[crit], targets[crit]] |= BLEEDING
+
+    def _player_turn(self, fights: np.ndarray):
+        hp = self.hp[fights]
+        # First living enemy, like target_id 0 in the API
+        targets = 1 + np.argmax(hp[:, 1:] > 0, axis=1)
+        action = np.full(len(fights), _ATTACK, dtype=np.int8)
+
+        if self.policy == POLICY_TACTICAL:
+            if self.overload:
+                disrupted = (self.flags[fights, targets] & DISRUPTED) != 0
+                action[~disrupted] = _OVERLOAD
+            if self.heal:
+                action[hp[:, 0] * 2 < self.table.max_hp[0]] = _HEAL
+            if self.buff:
+                action[(self.flags[fights, 0] & LASTING_BUFFS[self.buff]) == 0] = _BUFF
+
+        for code, handler in ((_ATTACK, self._player_attack), (_BUFF, self._use_buff),
+                              (_HEAL, self._use_heal), (_OVERLOAD, self._use_overload)):
+            mask = action == code
+            if mask.any():
+                handler(fights[mask], targets[mask])
+
+    def _player_attack(self, fights: np.ndarray, targets: np.ndarray):
+        self._attack(fights, np.zeros(len(fights), dtype=np.intp), targets)
+
+    def _use_buff(self, fights: np.ndarray, targets: np.ndarray):
+        self.flags[fights, 0] |= LASTING_BUFFS[self.buff]
+
+    def _use_heal(self, fights: np.ndarray, targets: np.ndarray):
+        if self.heal == "Repair":
+            amount = np.maximum(1, self.rng.integers(1, 5, size=len(fights)) + self.table.int_mod[0])
+        else:  # First Aid
+            amount = self.rng.integers(2, 9, size=len(fights)) + 2
+        self.hp[fights, 0] = np.minimum(self.table.max_hp[0], self.hp[fights, 0] + amount)
+
+    def _use_overload(self, fights: np.ndarray, targets: np.ndarray):
+        # use_ability checks the target's base defense (no status modifiers)
+        int_mod = self.table.int_mod[0]
+        roll = self.rng.integers(1, 21, size=len(fights)) + int_mod + 2
+        success = roll >= self.table.defense[targets]
+        fights, targets = fights[success], targets[success]
+        damage = self.rng.integers(1, 7, size=len(fights)) + int_mod
+        self._take_damage(fights, targets, damage)
+        self.flags[fights, targets] |= DISRUPTED
+
+
+def _build_simulator(matchup: Matchup, max_rounds: int) -> BatchSimulator:
+    catalog = game_catalog.get_catalog()
+    mission = catalog.get_mission(matchup.mission_id)
+    if mission is None or mission.get("type") != "combat":
+        raise ValueError(f"Not a combat mission: {matchup.mission_id}")
+    player = build_player(catalog, matchup.race, matchup.class_name, matchup.weapon, matchup.armor, matchup.level)
+    table = CombatantTable([player] + build_enemies(catalog, mission))
+    return BatchSimulator(table, player.clazz.abilities, matchup.policy, max_rounds)
+
+
+def _run_batch(matchup: Matchup, n_fights: int, seed: np.random.SeedSequence, max_rounds: int) -> SimulationResult:
+    """Simulate one batch and reduce it to counts and histograms (worker entry point)."""
+    simulator = _build_simulator(matchup, max_rounds)
+    raw = simulator.run(n_fights, np.random.default_rng(seed))
+    outcome = raw["outcome"]
+    victories = outcome == 1
+    hp_loss = simulator.table.max_hp[0] - raw["player_hp"][victories]
+    return SimulationResult(
+        matchup=matchup,
+        fights=n_fights,
+        victories=int(victories.sum()),
+        defeats=int((outcome == 2).sum()),
+        timeouts=int((outcome == 0).sum()),
+        rounds_hist=np.bincount(raw["rounds"], minlength=max_rounds + 1).tolist(),
+        hp_loss_hist=np.bincount(hp_loss, minlength=int(simulator.table.max_hp[0]) + 1).tolist()
+    )
+
+
+def _merge(results: Iterable[SimulationResult]) -> SimulationResult:
+    results = list(results)
+    merged = SimulationResult(matchup=results[0].matchup, fights=0, victories=0, defeats=0, timeouts=0)
+    rounds = np.zeros(0, dtype=np.int64)
+    hp_loss = np.zeros(0, dtype=np.int64)
+    for result in results:
+        merged.fights += result.fights
+        merged.victories += result.victories
+        merged.defeats += result.defeats
+        merged.timeouts += result.timeouts
+        rounds = _add_hist(rounds, result.rounds_hist)
+        hp_loss = _add_hist(hp_loss, result.hp_loss_hist)
+    merged.rounds_hist = rounds.tolist()
+    merged.hp_loss_hist = hp_loss.tolist()
+    return merged
+
+
+def _add_hist(total: np.ndarray, hist: Sequence[int]) -> np.ndarray:
+    if len(hist) > len(total):
+        total = np.pad(total, (0, len(hist) - len(total)))
+    total[:len(hist)] += np.asarray(hist, dtype=np.int64)
+    return total
+
+
+def run_simulations(
+    matchups: Sequence[Matchup],
+    fights: int = 10_000,
+    seed: int = 0,
+    workers: int = 1,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_rounds: int = DEFAULT_MAX_ROUNDS
+) -> List[SimulationResult]:
+    """
+    Simulate fights for every matchup, optionally across worker processes.
+
+    Each matchup's fights are split into batches with their own child seed,
+    so results depend only on seed/fights/batch_size, not on workers.
+
+    Args:
+        matchups: Combinations to simulate
+        fights: Fights per matchup
+        seed: Root seed
+        workers: Worker processes (1 runs in-process)
+        batch_size: Fights simulated together in one set of arrays
+        max_rounds: Rounds before a fight counts as a timeout
+
+    Returns:
+        One SimulationResult per matchup, in input order
+    """
+    root = np.random.SeedSequence(seed)
+    jobs = []
+    for index, (matchup, matchup_seed) in enumerate(zip(matchups, root.spawn(len(matchups)))):
+        sizes = [batch_size] * (fights // batch_size)
+        if fights % batch_size:
+            sizes.append(fights % batch_size)
+        for size, batch_seed in zip(sizes, matchup_seed.spawn(len(sizes))):
+            jobs.append((index, matchup, size, batch_seed))
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_run_batch, m, size, s, max_rounds) for _, m, size, s in jobs]
+            batches = [future.result() for future in futures]
+    else:
+        batches = [_run_batch(m, size, s, max_rounds) for _, m, size, s in jobs]
+
+    grouped: Dict[int, List[SimulationResult]] = {}
+    for (index, _, _, _), batch in zip(jobs, batches):
+        grouped.setdefault(index, []).append(batch)
+    return [_merge(grouped[index]) for index in range(len(matchups))]
+
+
+def simulate_matchup(matchup: Matchup, fights: int = 10_000, seed: int = 0, workers: int = 1,
+                     max_rounds: int = DEFAULT_MAX_ROUNDS) -> SimulationResult:
+    """Simulate a single matchup (see run_simulations)."""
+    return run_simulations([matchup], fights, seed, workers, max_rounds=max_rounds)[0]
+
+
+def build_matchups(
+    catalog,
+    missions: Optional[Sequence[str]] = None,
+    races: Optional[Sequence[str]] = None,
+    classes: Optional[Sequence[str]] = None,
+    weapons: Optional[Sequence[str]] = None,
+    armors: Optional[Sequence[str]] = None,
+    levels: Sequence[int] = (1,),
+    policy: str = POLICY_ATTACK
+) -> List[Matchup]:
+    """Every combination of the given names (None = everything in the catalog)."""
+    missions = missions or [m["id"] for m in catalog.missions if m.get("type") == "combat"]
+    races = races or [r.name for r in catalog.races]
+    classes = classes or [c.name for c in catalog.classes]
+    weapons = weapons or [w.name for w in catalog.weapons]
+    armors = armors or [a.name for a in catalog.armor]
+    return [
+        Matchup(mission, race, clazz, weapon, armor, level, policy)
+        for mission, race, clazz, weapon, armor, level
+        in itertools.product(missions, races, classes, weapons, armors, levels)
+    ]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Monte Carlo combat balance simulator")
+    parser.add_argument("--mission", action="append", help="Mission id (repeatable; default: all combat missions)")
+    parser.add_argument("--race", action="append", help="Race (repeatable; default: all)")
+    parser.add_argument("--class", dest="classes", action="append", help="Class (repeatable; default: all)")
+    parser.add_argument("--weapon", action="append", help="Weapon (repeatable; default: all)")
+    parser.add_argument("--armor", action="append", help="Armor (repeatable; default: all)")
+    parser.add_argument("--level", type=int, action="append", help="Player level (repeatable; default: 1)")
+    parser.add_argument("--policy", choices=POLICIES, default=POLICY_ATTACK)
+    parser.add_argument("--fights", type=int, default=10_000, help="Fights per combination")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--max-rounds", type=int, default=DEFAULT_MAX_ROUNDS)
+    parser.add_argument("--json", dest="json_path", help="Write full results (with histograms) to this file")
+    args = parser.parse_args(argv)
+
+    catalog = game_catalog.get_catalog()
+    matchups = build_matchups(catalog, args.mission, args.race, args.classes, args.weapon, args.armor,
+                              args.level or [1], args.policy)
+    results = run_simulations(matchups, args.fights, args.seed, args.workers, args.batch_size, args.max_rounds)
+
+    print(f"{'Mission':<18} {'Race':<10} {'Class':<16} {'Weapon':<16} {'Armor':<13} {'Lvl':>3} "
+          f"{'Win%':>6} {'Rounds':>6} {'P90':>4} {'HP lost':>7} {'P90':>4}")
+    for result in results:
+        m = result.matchup
+        print(f"{m.mission_id:<18} {m.race:<10} {m.class_name:<16} {m.weapon:<16} {m.armor:<13} {m.level:>3} "
+              f"{result.win_rate * 100:>6.1f} {result.mean_rounds:>6.2f} {result.rounds_percentile(0.9):>4} "
+              f"{result.mean_hp_loss:>7.2f} {result.hp_loss_percentile(0.9):>4}")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump([result.to_dict() for result in results], f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
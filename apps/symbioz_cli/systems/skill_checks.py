@@ -13,6 +13,10 @@ from models.character import Character
 class SkillCheckSystem:
     """Handles skill/attribute checks."""
     
+    def __init__(self, rng=None):
+        # Dice source: a per-game GameRNG, or the global random module
+        self.rng = rng or random
+    
     def roll_check(
         self,
         character: Character,
@@ -24,7 +28,7 @@ class SkillCheckSystem:
         Returns (success, roll_total).
         """
         attr_mod = character.get_attribute_modifier(attribute)
-        roll = random.randint(1, 20)
+        roll = self.rng.randint(1, 20)
         total = roll + attr_mod
         
         # Apply status effects
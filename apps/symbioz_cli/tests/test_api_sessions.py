@@ -0,0 +1,72 @@
+"""
+Live session lookup in the API server: when the session store is read.
+"""
+
+import api_server
+from session_store import FileSessionStore, LRUCache, SQLiteSessionStore
+
+
+class CountingStore:
+    """Wraps a session store and counts full reads and revision reads."""
+    
+    def __init__(self, backend):
+        self.backend = backend
+        self.shared = backend.shared
+        self.gets = 0
+        self.revision_gets = 0
+    
+    def get(self, session_id):
+        self.gets += 1
+        return self.backend.get(session_id)
+    
+    def get_revision(self, session_id):
+        self.revision_gets += 1
+        return self.backend.get_revision(session_id)
+    
+    def put(self, session_id, data):
+        self.backend.put(session_id, data)
+    
+    def close(self):
+        self.backend.close()
+
+
+def _use_store(monkeypatch, backend):
+    store = CountingStore(backend)
+    monkeypatch.setattr(api_server, "session_store", store)
+    monkeypatch.setattr(api_server, "CHECK_STORE_REVISION", store.shared)
+    monkeypatch.setattr(api_server, "game_sessions", LRUCache(on_evict=api_server._save_live_session))
+    return store
+
+
+def test_file_store_serves_live_sessions_from_memory(tmp_path, monkeypatch):
+    store = _use_store(monkeypatch, FileSessionStore(str(tmp_path)))
+    session_id = api_server.create_session()["session_id"]
+    game = api_server.game_sessions.get(session_id)
+    store.gets = 0
+    
+    for _ in range(3):
+        assert api_server.get_game(session_id) is game
+    assert store.gets == 0
+    assert store.revision_gets == 0
+
+def test_shared_store_checks_revision_only(tmp_path, monkeypatch):
+    store = _use_store(monkeypatch, SQLiteSessionStore(str(tmp_path / "sessions.db")))
+    session_id = api_server.create_session()["session_id"]
+    game = api_server.game_sessions.get(session_id)
+    store.gets = 0
+    
+    assert api_server.get_game(session_id) is game
+    assert store.gets == 0
+    assert store.revision_gets == 1
+    
+    # Another worker saves the session: this worker reloads it
+    store.backend.put(session_id, {"session_id": session_id, "character": None, "revision": "other"})
+    reloaded = api_server.get_game(session_id)
+    assert reloaded is not game
+    assert reloaded.session_revision == "other"
+    assert store.gets == 1
+    
+    # A stale live copy is not written over the newer save when evicted
+    api_server._save_live_session(session_id, game)
+    assert store.backend.get_revision(session_id) == "other"
+    store.close()
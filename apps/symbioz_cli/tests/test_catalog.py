@@ -0,0 +1,73 @@
+"""
+The shared game catalog: hot reload from edited data files and read-only
+indexes.
+"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+import catalog as game_catalog
+import data_loader
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    data_dir = tmp_path / "data"
+    shutil.copytree(data_loader.DATA_DIR, data_dir)
+    monkeypatch.setattr(data_loader, "DATA_DIR", str(data_dir))
+    game_catalog.reset_catalog()
+    yield data_dir
+    game_catalog.reset_catalog()
+
+
+def _add_weapon(data_dir, name):
+    path = data_dir / "weapons.json"
+    weapons = json.loads(path.read_text())
+    weapons.append({"name": name, "weapon_type": "melee", "base_damage": "2d6", "attack_bonus": 1, "upgrades": {}})
+    path.write_text(json.dumps(weapons))
+    # Coarse filesystem clocks can leave mtime unchanged; the size changes anyway
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_edited_data_file_swaps_the_catalog(data_dir, monkeypatch):
+    monkeypatch.delenv(game_catalog.HOT_RELOAD_ENV, raising=False)
+    original = game_catalog.get_catalog()
+    assert game_catalog.get_catalog(check_for_updates=True) is original
+    
+    _add_weapon(data_dir, "Stinger Lance")
+    # Without hot reload the loaded catalog stays in use
+    assert game_catalog.get_catalog() is original
+    
+    reloaded = game_catalog.get_catalog(check_for_updates=True)
+    assert reloaded is not original
+    assert reloaded.get_weapon("Stinger Lance").base_damage == "2d6"
+    assert game_catalog.get_catalog() is reloaded
+    # Sessions holding the old catalog keep an unchanged copy
+    assert original.get_weapon("Stinger Lance") is None
+    assert len(reloaded.weapons) == len(original.weapons) + 1
+    
+    # The env var turns hot reload on by default
+    _add_weapon(data_dir, "Drone Needle")
+    monkeypatch.setenv(game_catalog.HOT_RELOAD_ENV, "1")
+    assert game_catalog.get_catalog().get_weapon("Drone Needle") is not None
+
+def test_shared_indexes_reject_mutation(data_dir):
+    catalog = game_catalog.get_catalog()
+    sword = catalog.get_weapon("Basic Sword")
+    assert sword is not None
+    
+    with pytest.raises(TypeError):
+        catalog.weapons_by_name["Basic Sword"] = None
+    with pytest.raises(TypeError):
+        del catalog.races_by_name[catalog.races[0].name]
+    with pytest.raises(TypeError):
+        catalog.missions_by_id[-1] = {}
+    with pytest.raises(AttributeError):
+        catalog.weapons.append(sword)
+    with pytest.raises(AttributeError):
+        catalog.weapons_by_name = {}
+    assert catalog.get_weapon("Basic Sword") is sword
@@ -0,0 +1,172 @@
+"""
+Deterministic dice, the binary combat log, and replaying a saved combat.
+"""
+
+import pytest
+from fastapi import HTTPException
+
+import api_server
+from api_server import CharacterCreate, CombatAction, StartMissionRequest
+from session_store import LRUCache, MemorySessionStore
+from systems import replay
+from systems.replay import CombatLog
+from systems.rng import GameRNG
+
+
+# Seed for the replayed fight: long enough that it is still going after ACTIONS
+SEED = 0
+
+# Player requests, including ones the API rejects (which are still logged)
+ACTIONS = [
+    CombatAction(action_type="attack", target_id=99),
+    CombatAction(action_type="item", item_name="Stim"),
+    CombatAction(action_type="ability"),
+    CombatAction(action_type="ability", ability_name="Hack", target_id=7),
+    CombatAction(action_type="item", item_name="Vital Honey"),
+    CombatAction(action_type="defend"),
+    CombatAction(action_type="ability", ability_name="Hack", target_id=0),
+    CombatAction(action_type="teleport"),
+    CombatAction(action_type="attack", target_id=0),
+]
+
+
+def test_rng_draws_depend_only_on_seed_stream_and_counter():
+    rng = GameRNG(1234)
+    rolls = [rng.randint(1, 20) for _ in range(50)]
+    assert GameRNG(1234).randint(1, 20) == rolls[0]
+    assert [roll for roll in rolls if not 1 <= roll <= 20] == []
+    
+    again = GameRNG(1234)
+    assert [again.randint(1, 20) for _ in range(50)] == rolls
+    
+    # Resuming from a saved state continues the same sequence
+    resumed = GameRNG(0)
+    resumed.set_state({"seed": 1234, "counter": 20})
+    assert [resumed.randint(1, 20) for _ in range(30)] == rolls[20:]
+    assert GameRNG.from_state(rng.get_state()).randint(1, 20) == rng.randint(1, 20)
+    
+    with pytest.raises(ValueError):
+        rng.randint(2, 1)
+
+def test_rng_streams_are_independent():
+    rng = GameRNG(99)
+    skill = rng.fork(1)
+    assert skill.get_state() == {"seed": 99, "stream": 1, "counter": 0}
+    
+    combat_rolls = [rng.randint(1, 1000) for _ in range(20)]
+    skill_rolls = [skill.randint(1, 1000) for _ in range(20)]
+    assert combat_rolls != skill_rolls
+    # Drawing from one stream does not move the other
+    assert GameRNG(99, stream=1).randint(1, 1000) == skill_rolls[0]
+    assert rng.counter == 20 and skill.counter == 20
+
+def test_combat_log_round_trip():
+    log = CombatLog()
+    log.record(0, replay.INITIATIVE, roll=17, value=19)
+    log.record(1, replay.ATTACK_HIT, 0, roll=15, value=40000)
+    log.record_command("attack", target_id=2)
+    log.record_command("ability", ability_name="Hack", target_id=0)
+    log.record_command("ability", ability_name="Fireball")
+    log.record_command("item", item_name="Vital Honey")
+    log.record_command("item", item_name="Stim")
+    log.record_command("defend")
+    log.record_command("teleport", target_id=-5)
+    
+    restored = CombatLog.from_base64(log.to_base64())
+    assert restored.to_bytes() == log.to_bytes()
+    assert len(restored) == 9
+    assert len(log.to_bytes()) == 9 * replay.EVENT_FORMAT.size
+    
+    events = list(restored.events())
+    assert events[0] == (0, replay.INITIATIVE, replay.NO_TARGET, 17, 19)
+    assert events[1].value == 32767  # clamped to 16 bits
+    
+    assert list(restored.commands()) == [
+        {"action_type": "attack", "target_id": 2, "ability_name": None, "item_name": None},
+        {"action_type": "ability", "target_id": 0, "ability_name": "Hack", "item_name": None},
+        {"action_type": "ability", "target_id": None, "ability_name": "unknown", "item_name": None},
+        {"action_type": "item", "target_id": None, "ability_name": None, "item_name": "Honey"},
+        {"action_type": "item", "target_id": None, "ability_name": None, "item_name": "unknown"},
+        {"action_type": "defend", "target_id": None, "ability_name": None, "item_name": None},
+        {"action_type": "unknown", "target_id": -5, "ability_name": None, "item_name": None},
+    ]
+
+def test_replayed_commands_log_the_same_bytes():
+    # Re-recording decoded commands reproduces them exactly ("Vital Honey" -> "Honey")
+    log = CombatLog()
+    for action in ACTIONS:
+        log.record_command(action.action_type, action.target_id, action.ability_name, action.item_name)
+    
+    again = CombatLog()
+    for command in log.commands():
+        again.record_command(**command)
+    assert again.to_bytes() == log.to_bytes()
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = MemorySessionStore()
+    monkeypatch.setattr(api_server, "session_store", store)
+    monkeypatch.setattr(api_server, "CHECK_STORE_REVISION", False)
+    monkeypatch.setattr(api_server, "game_sessions", LRUCache(on_evict=api_server._save_live_session))
+    return store
+
+
+def _start_fight(seed):
+    session_id = api_server.create_session()["session_id"]
+    api_server.create_character(CharacterCreate(name="Ada", race_id=1, class_id=3), session_id)
+    game = api_server.get_game(session_id)
+    game.player.inventory.append("Vital Honey")
+    game.rng.set_state({"seed": seed})
+    api_server.start_mission(session_id, StartMissionRequest(mission_id=0))
+    return session_id, game
+
+
+def _act(session_id, game, action):
+    try:
+        return api_server.run_combat_action(session_id, game, action)["status"]
+    except HTTPException as e:
+        return e.status_code
+
+
+def _snapshot(game):
+    return {
+        "log": game.combat_system.log.to_bytes(),
+        "player": (game.player.hp, list(game.player.inventory), list(game.player.status_effects)),
+        "enemies": [(enemy.hp, list(enemy.status_effects)) for enemy in game.current_enemies],
+        "rng": game.rng.get_state(),
+    }
+
+
+def test_saved_combat_replays_exactly(store):
+    session_id, game = _start_fight(SEED)
+    statuses = [_act(session_id, game, action) for action in ACTIONS]
+    assert 400 in statuses and "action_complete" in statuses
+    assert game.current_enemies, "fight ended early; pick another SEED"
+    assert "Vital Honey" not in game.player.inventory
+    
+    api_server.save_game_session(session_id, game)
+    loaded = api_server.load_game_session(session_id)
+    assert getattr(loaded, "combat_start", None) is not None, "replay failed and dropped the fight"
+    assert _snapshot(loaded) == _snapshot(game)
+    
+    # Both copies keep rolling the same dice from here on
+    follow_up = CombatAction(action_type="attack", target_id=0)
+    assert _act(session_id, loaded, follow_up) == _act(session_id, game, follow_up)
+    assert _snapshot(loaded) == _snapshot(game)
+
+def test_tampered_log_drops_the_fight(store):
+    session_id, game = _start_fight(SEED)
+    for action in ACTIONS[:5]:
+        _act(session_id, game, action)
+    api_server.save_game_session(session_id, game)
+    
+    save_data = store.get(session_id)
+    log = CombatLog.from_base64(save_data["combat"]["log"])
+    log.record(1, replay.ATTACK_HIT, 0, roll=20, value=99)
+    save_data["combat"]["log"] = log.to_base64()
+    
+    loaded = api_server.load_game_session(session_id, save_data)
+    assert loaded is not None
+    assert getattr(loaded, "current_enemies", None) is None
+    assert loaded.player.hp == save_data["character"]["hp"]
@@ -0,0 +1,222 @@
+"""
+Session store backends and the write-behind wrapper.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+import session_store
+from session_store import (
+    FakeRedis,
+    MemorySessionStore,
+    RedisSessionStore,
+    SQLiteSessionStore,
+    WriteBehindSessionStore,
+)
+
+
+class FakeClock:
+    """Stands in for the time module inside session_store."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self):
+        return self.now
+    
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(session_store, "time", fake)
+    return fake
+
+
+def test_memory_store_evicts_least_recently_used():
+    store = MemorySessionStore(max_size=2, ttl_seconds=None)
+    store.put("a", {"n": 1})
+    store.put("b", {"n": 2})
+    assert store.get("a") == {"n": 1}  # "b" is now the oldest
+    store.put("c", {"n": 3})
+    
+    assert store.get("b") is None
+    assert store.get("a") == {"n": 1}
+    assert store.get("c") == {"n": 3}
+
+def test_memory_store_expires_idle_sessions(clock):
+    store = MemorySessionStore(max_size=10, ttl_seconds=60)
+    store.put("a", {"n": 1})
+    store.put("b", {"n": 2})
+    
+    clock.now += 45
+    assert store.get("a") == {"n": 1}  # reading refreshes the TTL
+    clock.now += 30
+    assert store.get("b") is None
+    assert store.get("a") == {"n": 1}
+
+def test_memory_store_returns_copies():
+    store = MemorySessionStore()
+    data = {"inventory": ["Vital Honey"]}
+    store.put("a", data)
+    data["inventory"].append("Stim")
+    store.get("a")["inventory"].append("Stim")
+    assert store.get("a") == {"inventory": ["Vital Honey"]}
+
+def test_sqlite_store_put_many_and_delete(tmp_path):
+    store = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+    store.put_many([("a", {"n": 1}), ("b", {"n": 2}), ("a", {"n": 3})])
+    assert store.get("a") == {"n": 3}
+    assert store.get("b") == {"n": 2}
+    
+    store.delete("a")
+    assert store.get("a") is None
+    assert store.get("b") == {"n": 2}
+    store.close()
+    
+    # Data is on disk, not just in the connection
+    reopened = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+    assert reopened.get("b") == {"n": 2}
+    reopened.close()
+
+def test_sqlite_store_expires_sessions(tmp_path, clock):
+    store = SQLiteSessionStore(str(tmp_path / "sessions.db"), ttl_seconds=60)
+    store.put("a", {"n": 1})
+    clock.now += 61
+    assert store.get("a") is None
+    store.close()
+
+def test_redis_store_against_fake_redis(clock):
+    client = FakeRedis()
+    store = RedisSessionStore(client, prefix="test:", ttl_seconds=60)
+    store.put("a", {"n": 1})
+    store.put_many([("b", {"n": 2}), ("c", {"n": 3})])
+    
+    assert client.get("test:a") == b'{"n": 1}'
+    assert store.get("b") == {"n": 2}
+    store.delete("b")
+    assert store.get("b") is None
+    
+    clock.now += 60
+    assert store.get("a") is None
+    assert store.get("c") is None
+
+def test_write_behind_reads_its_own_writes():
+    backend = MemorySessionStore()
+    store = WriteBehindSessionStore(backend, flush_interval=60)
+    store.put("a", {"n": 1})
+    store.put("a", {"n": 2})
+    
+    assert store.get("a") == {"n": 2}
+    assert backend.get("a") is None
+    store.flush()
+    assert backend.get("a") == {"n": 2}
+    store.close()
+
+def test_write_behind_delete_drops_pending_put():
+    backend = MemorySessionStore()
+    backend.put("a", {"n": 1})
+    store = WriteBehindSessionStore(backend, flush_interval=60)
+    store.put("a", {"n": 2})
+    store.delete("a")
+    
+    assert store.get("a") is None
+    store.flush()
+    assert backend.get("a") is None
+    store.close()
+
+def test_write_behind_flushes_on_close():
+    backend = MemorySessionStore()
+    store = WriteBehindSessionStore(backend, flush_interval=60)
+    store.put("a", {"n": 1})
+    store.close()
+    assert backend.get("a") == {"n": 1}
+
+def test_write_behind_delete_waits_for_in_flight_flush():
+    class SlowBackend(MemorySessionStore):
+        def __init__(self):
+            super().__init__()
+            self.writing = threading.Event()
+            self.release = threading.Event()
+        
+        def put_many(self, items):
+            items = list(items)
+            self.writing.set()
+            self.release.wait(5)
+            super().put_many(items)
+    
+    backend = SlowBackend()
+    store = WriteBehindSessionStore(backend, flush_interval=60)
+    store.put("a", {"n": 1})
+    
+    flusher = threading.Thread(target=store.flush)
+    flusher.start()
+    assert backend.writing.wait(5)
+    deleter = threading.Thread(target=store.delete, args=("a",))
+    deleter.start()
+    backend.release.set()
+    flusher.join(5)
+    deleter.join(5)
+    
+    assert backend.get("a") is None
+    store.close()
+
+def test_sqlite_store_revision_column(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    store = SQLiteSessionStore(path)
+    store.put("a", {"n": 1, "revision": "r1"})
+    store.put("b", {"n": 2})
+    assert store.shared
+    assert store.get_revision("a") == "r1"
+    assert store.get_revision("b") is None
+    assert store.get_revision("missing") is None
+    store.close()
+
+def test_sqlite_store_adds_revision_to_old_databases(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE sessions (session_id TEXT PRIMARY KEY, data TEXT NOT NULL, updated_at REAL NOT NULL)")
+    conn.execute("INSERT INTO sessions VALUES ('a', '{\"n\": 1}', 0)")
+    conn.commit()
+    conn.close()
+    
+    store = SQLiteSessionStore(path)
+    assert store.get("a") == {"n": 1}
+    store.put("a", {"n": 2, "revision": "r2"})
+    assert store.get_revision("a") == "r2"
+    store.close()
+
+def test_redis_store_keeps_revision_key(clock):
+    client = FakeRedis()
+    store = RedisSessionStore(client, prefix="test:", ttl_seconds=60)
+    store.put("a", {"n": 1, "revision": "r1"})
+    assert client.get("test:a:revision") == b"r1"
+    assert store.get_revision("a") == "r1"
+    
+    store.put("a", {"n": 2})
+    assert store.get_revision("a") is None
+    store.put("a", {"n": 3, "revision": "r3"})
+    store.delete("a")
+    assert client.get("test:a:revision") is None
+    
+    store.put("b", {"revision": "r4"})
+    clock.now += 60
+    assert store.get_revision("b") is None
+
+def test_write_behind_revision_sees_pending_writes():
+    backend = MemorySessionStore()
+    store = WriteBehindSessionStore(backend, flush_interval=60)
+    assert not store.shared
+    store.put("a", {"revision": "r1"})
+    assert store.get_revision("a") == "r1"
+    store.flush()
+    assert store.get_revision("a") == "r1"
+    store.close()
+    
+    shared = WriteBehindSessionStore(SQLiteSessionStore(":memory:"), flush_interval=60)
+    assert shared.shared
+    shared.close()
@@ -0,0 +1,73 @@
+"""
+The vectorized balance simulator against the live combat rules.
+"""
+
+import random
+
+import pytest
+
+pytest.importorskip("numpy")
+
+import catalog as game_catalog
+from systems import simulation
+from systems.combat import CombatSystem
+from systems.simulation import Matchup
+
+
+MATCHUP = Matchup("salvage_run", "Stonelock", "Vanguard", "Basic Sword", "Medium Armor")
+
+
+def _reference(matchup, fights, seed):
+    """Win rate and mean rounds from fights played one at a time with CombatSystem."""
+    catalog = game_catalog.get_catalog()
+    mission = catalog.get_mission(matchup.mission_id)
+    rng = random.Random(seed)
+    victories = total_rounds = 0
+    for _ in range(fights):
+        player = simulation.build_player(
+            catalog, matchup.race, matchup.class_name, matchup.weapon, matchup.armor, matchup.level
+        )
+        enemies = simulation.build_enemies(catalog, mission)
+        combat = CombatSystem(rng)
+        turn_order = combat.start_combat(player, enemies)
+        over, result = False, "timeout"
+        for round_num in range(1, simulation.DEFAULT_MAX_ROUNDS + 1):
+            for combatant in [player] + enemies:
+                if combatant.is_alive():
+                    combat.apply_status_effects(combatant)
+            over, result = combat.is_combat_over(player, enemies)
+            for actor in turn_order:
+                if over:
+                    break
+                if not actor.is_alive():
+                    continue
+                # Enemies attack the player; the player attacks the first living enemy
+                target = player if actor is not player else next(e for e in enemies if e.is_alive())
+                combat.attack(actor, target)
+                over, result = combat.is_combat_over(player, enemies)
+            if over:
+                break
+        victories += result == "victory"
+        total_rounds += round_num
+    return victories / fights, total_rounds / fights
+
+
+def test_simulator_matches_live_combat_rules():
+    reference_win_rate, reference_rounds = _reference(MATCHUP, fights=3000, seed=1)
+    result = simulation.simulate_matchup(MATCHUP, fights=20000, seed=1)
+    
+    assert result.fights == result.victories + result.defeats + result.timeouts == 20000
+    assert 0.2 < reference_win_rate < 0.9  # a matchup where the outcome is in doubt
+    assert result.win_rate == pytest.approx(reference_win_rate, abs=0.04)
+    assert result.mean_rounds == pytest.approx(reference_rounds, abs=0.25)
+
+def test_results_do_not_depend_on_worker_count():
+    matchups = [MATCHUP, Matchup("raider_ambush", "Human", "Operative", "Basic Pistol", "Light Armor", policy="tactical")]
+    kwargs = {"fights": 3000, "seed": 7, "batch_size": 1000}
+    
+    in_process = simulation.run_simulations(matchups, workers=1, **kwargs)
+    parallel = simulation.run_simulations(matchups, workers=2, **kwargs)
+    assert [r.to_dict() for r in in_process] == [r.to_dict() for r in parallel]
+    
+    reseeded = simulation.run_simulations(matchups, workers=1, **{**kwargs, "seed": 8})
+    assert [r.to_dict() for r in reseeded] != [r.to_dict() for r in in_process]
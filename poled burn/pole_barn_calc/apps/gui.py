@@ -36,6 +36,24 @@ def get_config_dir():
     return base_path / "config"
 
 
+# Calculators kept alive across runs so unchanged pipeline stages are memoized
+_calculators = {}
+
+
+def get_calculator(config_dir: Path) -> PoleBarnCalculator:
+    """
+    Get the shared calculator for a config directory.
+    
+    Reusing one calculator lets what-if edits recompute only the stages whose
+    inputs changed (e.g. a tax rate edit only re-prices).
+    """
+    calculator = _calculators.get(config_dir)
+    if calculator is None:
+        calculator = PoleBarnCalculator(config_dir=config_dir)
+        _calculators[config_dir] = calculator
+    return calculator
+
+
 def parse_roof_pitch(pitch_str: str) -> float:
     """
     Parse roof pitch from various formats into a numeric ratio.
@@ -277,8 +295,8 @@ def run_calculation(vars_dict, output_text, status_label):
         
         # Create calculator and run
         config_dir = get_config_dir()
-        calculator = PoleBarnCalculator(config_dir=config_dir)
-        calculator.load_config()
+        calculator = get_calculator(config_dir)
+        calculator.load_config()  # Cheap when config is unchanged; picks up CSV edits
         
         geom_model, takeoff, priced_items, summary, bom_items = calculator.calculate(inputs)
         
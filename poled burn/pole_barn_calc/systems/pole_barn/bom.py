@@ -10,6 +10,15 @@ from .model import (
     GeometryModel,
     GeometryInputs,
 )
+from .pricing import PriceBook, compile_price_book
+from .cutting import (
+    CutPlan,
+    DEFAULT_CUTTING_MODE,
+    DEFAULT_TIME_BUDGET_S,
+    pack_first_fit,
+    plan_lumber_cuts,
+    plan_segment_cuts,
+)
 
 
 def generate_gable_panel_lengths(
@@ -73,6 +82,9 @@ def pack_segments_into_sticks(
     """
     Pack J-channel segments into 10' stock sticks.
     
+    Legacy first-fit counter; see cutting.plan_segment_cuts() for the
+    best-fit and bounded exact engines with cut lists.
+    
     Uses a greedy algorithm:
     - Sort segments descending by length
     - For each segment, try to fit it into an existing stick
@@ -91,33 +103,7 @@ def pack_segments_into_sticks(
     if not segments_in:
         return 0
     
-    # Sort descending (longest first)
-    segments = sorted(segments_in, reverse=True)
-    
-    # Track remaining length in each stick
-    sticks: List[float] = []
-    
-    for segment in segments:
-        if segment > stock_length_in:
-            # This shouldn't happen, but handle gracefully
-            # Open a new stick for this oversized segment
-            sticks.append(stock_length_in - segment)
-            continue
-        
-        # Try to fit into an existing stick
-        fitted = False
-        for i, remaining in enumerate(sticks):
-            if remaining >= segment:
-                # Fits! Use this stick
-                sticks[i] = remaining - segment
-                fitted = True
-                break
-        
-        if not fitted:
-            # Need a new stick
-            sticks.append(stock_length_in - segment)
-    
-    return len(sticks)
+    return pack_first_fit(segments_in, stock_length_in).stick_count
 
 
 def calculate_eave_top_j_segments(
@@ -266,6 +252,9 @@ def expand_to_parts(
     pricing_df: pd.DataFrame,
     geometry_model: Optional[GeometryModel] = None,
     geometry_inputs: Optional[GeometryInputs] = None,
+    price_book: Optional[PriceBook] = None,
+    cutting_mode: str = DEFAULT_CUTTING_MODE,
+    cutting_time_budget_s: float = DEFAULT_TIME_BUDGET_S,
 ) -> List[PartQuantity]:
     """
     Expand assembly quantities into part quantities (BOM).
@@ -273,6 +262,7 @@ def expand_to_parts(
     Now handles:
     - Gable panel length breakdown (multiple lengths per part_id)
     - Lumber stock length packing (multiple lengths per part_id)
+    - Per-stick cut lists and scrap % for J-channel and lumber
     - Panel units fixed (sqft → ea with per-panel pricing)
     - Sheathing, concrete, overhead doors
     
@@ -283,25 +273,36 @@ def expand_to_parts(
         pricing_df: DataFrame with pricing data
         geometry_model: Optional geometry model for dimensions
         geometry_inputs: Optional geometry inputs for roof pitch/style
+        price_book: Precompiled PriceBook for these DataFrames. If None, one is
+            compiled here.
+        cutting_mode: Cutting-stock engine for J-channel and lumber:
+            "first_fit" (legacy), "best_fit" (default) or "optimal"
+        cutting_time_budget_s: Time budget per packing in "optimal" mode
         
     Returns:
         List of PartQuantity items (normalized BOM, may have multiple rows per part_id with different lengths)
     """
+    if price_book is None:
+        price_book = compile_price_book(parts_df, pricing_df, assemblies_df)
+    
     bom_items: List[PartQuantity] = []
     
     # Dictionary keyed by (part_id, length_in) for length-based items
     # For non-length items, length_in = None
     part_quantities: Dict[Tuple[str, Optional[float]], float] = {}
     
+    # Cut plans for packed stock items, keyed the same way as part_quantities
+    cut_plans: Dict[Tuple[str, Optional[float]], CutPlan] = {}
+    
     # Process each assembly quantity
     for assembly_qty in material_takeoff.items:
         # Find all part mappings for this assembly
-        assembly_mappings = assemblies_df[assemblies_df["assembly_name"] == assembly_qty.name]
+        assembly_mappings = price_book.get_assembly_rows(assembly_qty.name)
         
-        if assembly_mappings.empty:
+        if not assembly_mappings:
             continue
         
-        for _, mapping in assembly_mappings.iterrows():
+        for mapping in assembly_mappings:
             part_id = mapping.get("part_id")
             if not part_id or pd.isna(part_id):
                 continue
@@ -313,11 +314,10 @@ def expand_to_parts(
             base_qty = assembly_qty.quantity * quantity_multiplier
             
             # Get part record
-            part_record = parts_df[parts_df["part_id"] == part_id]
-            if part_record.empty:
+            part_row = price_book.get_part_row(part_id)
+            if part_row is None:
                 continue
             
-            part_row = part_record.iloc[0]
             coverage_width = part_row.get("coverage_width_in")
             coverage_height = part_row.get("coverage_height_in")
             unit = part_row.get("unit", "")
@@ -462,13 +462,19 @@ def expand_to_parts(
                 
                 # Pack segments into sticks
                 if j_segments:
-                    stick_count = pack_segments_into_sticks(j_segments, stock_length_in)
+                    plan = plan_segment_cuts(
+                        j_segments,
+                        stock_length_in,
+                        mode=cutting_mode,
+                        time_budget_s=cutting_time_budget_s,
+                    )
                     
                     key = (part_id, stock_length_in)
                     if key in part_quantities:
-                        part_quantities[key] += stick_count
+                        part_quantities[key] += plan.stick_count
                     else:
-                        part_quantities[key] = stick_count
+                        part_quantities[key] = plan.stick_count
+                    _merge_cut_plan(cut_plans, key, plan)
                 continue
             
             # Handle lumber (2x4, 2x6, etc.) - split into stock lengths
@@ -479,15 +485,16 @@ def expand_to_parts(
                                   "door_framing" in assembly_qty.name.lower() or
                                   "window_framing" in assembly_qty.name.lower()):
                 total_lf = base_qty * waste_factor
-                stock_lengths = split_lumber_into_stock_lengths(total_lf)
+                stock_plans = plan_lumber_cuts(total_lf, mode=cutting_mode)
                 
-                for length_ft, count in stock_lengths.items():
+                for length_ft, plan in stock_plans.items():
                     length_in = length_ft * 12.0
                     key = (part_id, length_in)
                     if key in part_quantities:
-                        part_quantities[key] += count
+                        part_quantities[key] += plan.stick_count
                     else:
-                        part_quantities[key] = count
+                        part_quantities[key] = plan.stick_count
+                    _merge_cut_plan(cut_plans, key, plan)
                 continue
             
             # Default: accumulate by part_id only (no length breakdown)
@@ -501,11 +508,10 @@ def expand_to_parts(
     # Build PartQuantity items
     for (part_id, length_in), total_qty in part_quantities.items():
         # Get part record
-        part_record = parts_df[parts_df["part_id"] == part_id]
-        if part_record.empty:
+        part_row = price_book.get_part_row(part_id)
+        if part_row is None:
             continue
         
-        part_row = part_record.iloc[0]
         part_name = part_row.get("part_name", part_id)
         category = part_row.get("category", "Misc")
         export_category = part_row.get("export_category", "Misc")
@@ -521,10 +527,10 @@ def expand_to_parts(
             unit = "ea"
         
         # Get unit price
-        price_record = pricing_df[pricing_df["part_id"] == part_id]
+        price_row = price_book.get_price_row(part_id)
         unit_price = 0.0
-        if not price_record.empty:
-            unit_price = float(price_record.iloc[0].get("unit_price", 0.0))
+        if price_row is not None:
+            unit_price = float(price_row.get("unit_price", 0.0))
             
             # If panel was priced per sqft, convert to per-panel
             if "panel" in part_id.lower() and unit == "ea":
@@ -548,6 +554,11 @@ def expand_to_parts(
             else:
                 notes = f"Length: {length_ft:.1f}ft ({length_in:.0f}\")"
         
+        # Add scrap info for packed stock items
+        plan = cut_plans.get((part_id, length_in))
+        if plan is not None:
+            notes = f"{notes}; Scrap: {plan.scrap_pct:.1f}%" if notes else f"Scrap: {plan.scrap_pct:.1f}%"
+        
         # Set sheet_name based on export_category (logical tab name)
         sheet_name = export_category if export_category else category
         
@@ -563,11 +574,51 @@ def expand_to_parts(
             length_in=length_in,
             sheet_name=sheet_name,
             notes=notes,
+            cut_list=plan.sticks if plan is not None else None,
+            scrap_pct=plan.scrap_pct if plan is not None else None,
         ))
     
     return bom_items
 
 
+def _merge_cut_plan(
+    cut_plans: Dict[Tuple[str, Optional[float]], CutPlan],
+    key: Tuple[str, Optional[float]],
+    plan: CutPlan,
+) -> None:
+    """Append a plan's sticks to the accumulated cut plan for a BOM key."""
+    if key in cut_plans:
+        cut_plans[key].sticks.extend(plan.sticks)
+    else:
+        cut_plans[key] = CutPlan(stock_length_in=plan.stock_length_in, sticks=list(plan.sticks))
+
+
+def summarize_scrap(bom_items: List[PartQuantity]) -> Dict[str, Any]:
+    """
+    Summarize offcut scrap across all packed stock items in a BOM.
+    
+    Args:
+        bom_items: List of PartQuantity items from expand_to_parts()
+        
+    Returns:
+        Dictionary with purchased_in, scrap_in and scrap_pct totals
+    """
+    purchased_in = 0.0
+    scrap_in = 0.0
+    for item in bom_items:
+        if item.cut_list is None or item.length_in is None:
+            continue
+        plan = CutPlan(stock_length_in=item.length_in, sticks=item.cut_list)
+        purchased_in += plan.stick_count * plan.stock_length_in
+        scrap_in += plan.scrap_in
+    
+    return {
+        "purchased_in": purchased_in,
+        "scrap_in": scrap_in,
+        "scrap_pct": scrap_in / purchased_in * 100.0 if purchased_in > 0 else 0.0,
+    }
+
+
 def create_material_takeoff_from_bom(
     bom_items: List[PartQuantity],
 ) -> MaterialTakeoff:
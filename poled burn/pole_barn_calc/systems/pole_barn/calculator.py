@@ -1,8 +1,13 @@
 """Main calculator class that orchestrates all calculations."""
 
+import os
 import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Optional, Tuple, List, Iterable, Iterator
 import pandas as pd
 from .model import (
     PoleBarnInputs,
@@ -16,6 +21,34 @@ from . import geometry
 from . import assemblies
 from . import pricing
 from . import bom
+from . import config_cache
+from .cutting import DEFAULT_CUTTING_MODE, DEFAULT_TIME_BUDGET_S
+
+
+# Result tuple returned by PoleBarnCalculator.calculate()
+CalculationResult = Tuple[
+    GeometryModel, MaterialTakeoff, List[PricedLineItem], PricingSummary, List[PartQuantity]
+]
+
+# Pipeline stage names, in execution order (keys of stage timing dicts)
+PIPELINE_STAGES = ("geometry", "assemblies", "pricing", "bom")
+
+# GeometryInputs fields read by geometry.build_geometry_model() (geometry stage key);
+# door/window fields only feed the assemblies stage
+GEOMETRY_MODEL_FIELDS = (
+    "length",
+    "width",
+    "eave_height",
+    "roof_pitch",
+    "peak_height",
+    "overhang_front",
+    "overhang_rear",
+    "overhang_sides",
+    "pole_spacing_length",
+)
+
+# Memoized results kept per stage (most recently used input combinations)
+DEFAULT_STAGE_CACHE_SIZE = 32
 
 
 def _get_default_config_dir() -> Path:
@@ -40,6 +73,9 @@ class PoleBarnCalculator:
         self,
         inputs: Optional[PoleBarnInputs] = None,
         config_dir: Optional[Path] = None,
+        cutting_mode: str = DEFAULT_CUTTING_MODE,
+        cutting_time_budget_s: float = DEFAULT_TIME_BUDGET_S,
+        stage_cache_size: int = DEFAULT_STAGE_CACHE_SIZE,
     ):
         """
         Initialize calculator with inputs and config directory.
@@ -47,51 +83,80 @@ class PoleBarnCalculator:
         Args:
             inputs: Complete pole barn inputs (optional, can be set later)
             config_dir: Directory containing CSV config files. If None, uses default.
+            cutting_mode: Cutting-stock engine for J-channel and lumber in the BOM
+                ("first_fit", "best_fit" or "optimal")
+            cutting_time_budget_s: Time budget per packing in "optimal" mode
+            stage_cache_size: Memoized results kept per pipeline stage (0 disables)
         """
         self.inputs = inputs
         self.config_dir = config_dir or _get_default_config_dir()
+        self.cutting_mode = cutting_mode
+        self.cutting_time_budget_s = cutting_time_budget_s
         
         # DataFrames for config data (loaded lazily)
         self.parts_df: Optional[pd.DataFrame] = None
         self.pricing_df: Optional[pd.DataFrame] = None
         self.assemblies_df: Optional[pd.DataFrame] = None
+        # Compiled lookup tables built from the DataFrames in load_config()
+        self.price_book: Optional[pricing.PriceBook] = None
         self._config_loaded = False
+        
+        # Memoized stage outputs, keyed on the inputs each stage reads
+        self._stage_caches: Dict[str, _StageCache] = {
+            stage: _StageCache(stage_cache_size) for stage in PIPELINE_STAGES
+        }
     
-    def load_config(self) -> None:
+    def load_config(self, use_disk_cache: bool = True) -> None:
         """
-        Load configuration data from CSV files.
+        Load configuration data from CSV files and compile the price book.
+        
+        Catalogs are shared through the process-wide config registry and a
+        binary snapshot next to the CSVs, so repeat calculators skip parsing
+        (see config_cache.load_config_snapshot).
+        
+        Args:
+            use_disk_cache: Whether to read/write the binary config snapshot
         
         Raises:
             FileNotFoundError: If config files are not found
             ValueError: If config files are malformed
         """
-        # Try parts.example.csv first, fall back to parts.csv
-        parts_path = self.config_dir / "parts.example.csv"
-        if not parts_path.exists():
-            parts_path = self.config_dir / "parts.csv"
-        
-        pricing_path = self.config_dir / "pricing.example.csv"
-        if not pricing_path.exists():
-            pricing_path = self.config_dir / "pricing.csv"
-        
-        assemblies_path = self.config_dir / "assemblies.example.csv"
-        if not assemblies_path.exists():
-            assemblies_path = self.config_dir / "assemblies.csv"
-        
-        self.parts_df = pricing.load_parts(parts_path)
-        self.pricing_df = pricing.load_pricing(pricing_path)
-        self.assemblies_df = pricing.load_assemblies(assemblies_path)
+        snapshot = config_cache.load_config_snapshot(self.config_dir, use_disk_cache=use_disk_cache)
+        if snapshot.price_book is not self.price_book:
+            # Config changed: memoized stage results are stale
+            self.clear_stage_caches()
+        self.parts_df = snapshot.parts_df
+        self.pricing_df = snapshot.pricing_df
+        self.assemblies_df = snapshot.assemblies_df
+        self.price_book = snapshot.price_book
         self._config_loaded = True
     
+    def clear_stage_caches(self) -> None:
+        """Drop all memoized stage results (e.g. after editing config DataFrames in place)."""
+        for cache in self._stage_caches.values():
+            cache.clear()
+    
+    def get_stage_cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Return memoization hit/miss counts per pipeline stage.
+        
+        Returns:
+            Dictionary mapping stage name to {"hits", "misses", "size"}
+        """
+        return {stage: cache.stats() for stage, cache in self._stage_caches.items()}
+    
     def calculate(
         self,
         inputs: Optional[PoleBarnInputs] = None,
-    ) -> Tuple[GeometryModel, MaterialTakeoff, List[PricedLineItem], PricingSummary, List[PartQuantity]]:
+        timings: Optional[Dict[str, float]] = None,
+    ) -> CalculationResult:
         """
         Run complete calculation pipeline: geometry → quantities → pricing → BOM.
         
         Args:
             inputs: Pole barn inputs. If None, uses self.inputs.
+            timings: Optional dict to accumulate per-stage wall time (seconds) into,
+                keyed by PIPELINE_STAGES.
             
         Returns:
             Tuple of (GeometryModel, MaterialTakeoff, list of PricedLineItem, PricingSummary, list of PartQuantity)
@@ -112,44 +177,168 @@ class PoleBarnCalculator:
         if self.parts_df is None or self.pricing_df is None or self.assemblies_df is None:
             raise RuntimeError("Configuration data not loaded. Call load_config() first.")
         
-        # 1. Build geometry
-        geom_model = geometry.build_geometry_model(inputs.geometry)
+        return self._run_pipeline(inputs, timings)
+    
+    def calculate_many(
+        self,
+        inputs_list: Iterable[PoleBarnInputs],
+        max_workers: Optional[int] = None,
+        chunksize: int = 1,
+        timings: Optional[Dict[str, float]] = None,
+    ) -> Iterator[CalculationResult]:
+        """
+        Run the calculation pipeline for many buildings, yielding results in input order.
         
-        # 2. Calculate quantities
-        # Pass geometry_inputs for door/window counts (per changelog entry [14])
-        quantities = assemblies.calculate_material_quantities(
-            geom_model,
-            inputs.materials,
-            inputs.assemblies,
-            geometry_inputs=inputs.geometry,  # For door/window assemblies
-        )
-        takeoff = MaterialTakeoff(items=quantities)
+        Config is loaded once and shared: each worker process receives the loaded
+        DataFrames and price book when it starts, not once per building. Results are
+        identical to calling calculate() on each input in turn.
         
-        # 3. Price the takeoff
-        priced_items, summary = pricing.price_material_takeoff(
-            takeoff,
-            inputs.pricing,
-            self.parts_df,
-            self.pricing_df,
-            self.assemblies_df,
-        )
+        Args:
+            inputs_list: Pole barn inputs to calculate
+            max_workers: Number of worker processes. None uses os.cpu_count();
+                1 runs everything in the current process.
+            chunksize: Number of inputs sent to a worker per task
+            timings: Optional dict to accumulate per-stage wall time (seconds) into,
+                summed across all buildings and workers
+            
+        Yields:
+            Result tuple (same shape as calculate()) for each input, in order
+            
+        Raises:
+            RuntimeError: If config is not loaded
+        """
+        if not self._config_loaded:
+            self.load_config()
         
-        # 4. Generate BOM (expand assemblies to parts)
-        bom_items = bom.expand_to_parts(
-            takeoff,
-            self.assemblies_df,
-            self.parts_df,
-            self.pricing_df,
-            geometry_model=geom_model,
-            geometry_inputs=inputs.geometry,
+        if self.parts_df is None or self.pricing_df is None or self.assemblies_df is None:
+            raise RuntimeError("Configuration data not loaded. Call load_config() first.")
+        
+        inputs_list = list(inputs_list)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(inputs_list)))
+        
+        if max_workers == 1:
+            for inputs in inputs_list:
+                yield self._run_pipeline(inputs, timings)
+            return
+        
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_batch_worker,
+            initargs=(
+                self.config_dir,
+                self.cutting_mode,
+                self.cutting_time_budget_s,
+                self.parts_df,
+                self.pricing_df,
+                self.assemblies_df,
+                self.price_book,
+            ),
+        ) as executor:
+            for result, stage_timings in executor.map(
+                _calculate_in_batch_worker, inputs_list, chunksize=chunksize
+            ):
+                if timings is not None:
+                    _add_timings(timings, stage_timings)
+                yield result
+    
+    def _run_pipeline(
+        self,
+        inputs: PoleBarnInputs,
+        timings: Optional[Dict[str, float]] = None,
+    ) -> CalculationResult:
+        """
+        Run geometry → quantities → pricing → BOM for one set of inputs.
+        
+        Assumes config is already loaded.
+        
+        Args:
+            inputs: Pole barn inputs
+            timings: Optional dict to accumulate per-stage wall time (seconds) into
+            
+        Returns:
+            Result tuple (same shape as calculate()). Result objects may be shared
+            with later calls that hit the stage caches and should not be mutated.
+        """
+        # Each stage is memoized on exactly the inputs it reads, so a pricing-only
+        # edit re-prices without rebuilding geometry, quantities or the BOM.
+        # Config identity is part of the downstream keys in case DataFrames are
+        # swapped without load_config().
+        config_key = (id(self.price_book), id(self.parts_df), id(self.pricing_df), id(self.assemblies_df))
+        geometry_key = tuple(getattr(inputs.geometry, name) for name in GEOMETRY_MODEL_FIELDS)
+        assemblies_key = (
+            _fields_key(inputs.geometry),
+            _fields_key(inputs.materials),
+            _fields_key(inputs.assemblies),
         )
+        pricing_key = (assemblies_key, _fields_key(inputs.pricing), config_key)
+        bom_key = (assemblies_key, config_key, self.cutting_mode, self.cutting_time_budget_s)
         
-        # 5. Override material_takeoff to match BOM (PHASE 2 fix)
-        # This ensures material_takeoff uses packed quantities (sticks, sheets, stock lengths)
-        # instead of raw inches/sqft
-        takeoff = bom.create_material_takeoff_from_bom(bom_items)
+        stage_start = time.perf_counter()
         
-        return geom_model, takeoff, priced_items, summary, bom_items
+        # 1. Build geometry
+        geom_model = self._stage_caches["geometry"].get(geometry_key)
+        if geom_model is None:
+            geom_model = geometry.build_geometry_model(inputs.geometry)
+            self._stage_caches["geometry"].put(geometry_key, geom_model)
+        stage_start = _record_stage(timings, "geometry", stage_start)
+        
+        # 2. Calculate quantities
+        takeoff = self._stage_caches["assemblies"].get(assemblies_key)
+        if takeoff is None:
+            # Pass geometry_inputs for door/window counts (per changelog entry [14])
+            quantities = assemblies.calculate_material_quantities(
+                geom_model,
+                inputs.materials,
+                inputs.assemblies,
+                geometry_inputs=inputs.geometry,  # For door/window assemblies
+            )
+            takeoff = MaterialTakeoff(items=quantities)
+            self._stage_caches["assemblies"].put(assemblies_key, takeoff)
+        stage_start = _record_stage(timings, "assemblies", stage_start)
+        
+        # 3. Price the takeoff
+        priced = self._stage_caches["pricing"].get(pricing_key)
+        if priced is None:
+            priced = pricing.price_material_takeoff(
+                takeoff,
+                inputs.pricing,
+                self.parts_df,
+                self.pricing_df,
+                self.assemblies_df,
+                price_book=self.price_book,
+            )
+            self._stage_caches["pricing"].put(pricing_key, priced)
+        priced_items, summary = priced
+        stage_start = _record_stage(timings, "pricing", stage_start)
+        
+        expanded = self._stage_caches["bom"].get(bom_key)
+        if expanded is None:
+            # 4. Generate BOM (expand assemblies to parts)
+            bom_items = bom.expand_to_parts(
+                takeoff,
+                self.assemblies_df,
+                self.parts_df,
+                self.pricing_df,
+                geometry_model=geom_model,
+                geometry_inputs=inputs.geometry,
+                price_book=self.price_book,
+                cutting_mode=self.cutting_mode,
+                cutting_time_budget_s=self.cutting_time_budget_s,
+            )
+            
+            # 5. Override material_takeoff to match BOM (PHASE 2 fix)
+            # This ensures material_takeoff uses packed quantities (sticks, sheets, stock lengths)
+            # instead of raw inches/sqft
+            expanded = (bom_items, bom.create_material_takeoff_from_bom(bom_items))
+            self._stage_caches["bom"].put(bom_key, expanded)
+        bom_items, takeoff = expanded
+        _record_stage(timings, "bom", stage_start)
+        
+        # Fresh outer lists so callers can't reorder/extend the memoized results
+        takeoff = MaterialTakeoff(items=list(takeoff.items))
+        return geom_model, takeoff, list(priced_items), summary, list(bom_items)
     
     def calculate_geometry(self) -> Dict[str, Any]:
         """
@@ -224,6 +413,7 @@ class PoleBarnCalculator:
             self.parts_df,
             self.pricing_df,
             self.assemblies_df,
+            price_book=self.price_book,
         )
         
         return {
@@ -313,3 +503,99 @@ class PoleBarnCalculator:
                 for cat, items in by_category.items()
             },
         }
+
+
+class _StageCache:
+    """Small LRU memo for one pipeline stage."""
+    
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entries: "OrderedDict[Any, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Any) -> Any:
+        """Return the cached value for key (None on a miss)."""
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+    
+    def put(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        if self.max_size <= 0:
+            return
+        self.entries[key] = value
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self.entries.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries)}
+
+
+def _fields_key(obj: Any) -> Tuple:
+    """Hashable key from a flat inputs dataclass's field values."""
+    return tuple(getattr(obj, f.name) for f in fields(obj))
+
+
+def _record_stage(
+    timings: Optional[Dict[str, float]],
+    stage: str,
+    stage_start: float,
+) -> float:
+    """Add elapsed time since stage_start to timings[stage]; return the new start time."""
+    now = time.perf_counter()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + (now - stage_start)
+    return now
+
+
+def _add_timings(total: Dict[str, float], extra: Dict[str, float]) -> None:
+    """Accumulate one stage timing dict into another."""
+    for stage, seconds in extra.items():
+        total[stage] = total.get(stage, 0.0) + seconds
+
+
+# Per-process calculator used by calculate_many() workers
+_batch_calculator: Optional[PoleBarnCalculator] = None
+
+
+def _init_batch_worker(
+    config_dir: Path,
+    cutting_mode: str,
+    cutting_time_budget_s: float,
+    parts_df: pd.DataFrame,
+    pricing_df: pd.DataFrame,
+    assemblies_df: pd.DataFrame,
+    price_book: Optional[pricing.PriceBook],
+) -> None:
+    """Process pool initializer: install already-loaded config in this worker."""
+    global _batch_calculator
+    calculator = PoleBarnCalculator(
+        config_dir=config_dir,
+        cutting_mode=cutting_mode,
+        cutting_time_budget_s=cutting_time_budget_s,
+    )
+    calculator.parts_df = parts_df
+    calculator.pricing_df = pricing_df
+    calculator.assemblies_df = assemblies_df
+    calculator.price_book = price_book
+    calculator._config_loaded = True
+    _batch_calculator = calculator
+
+
+def _calculate_in_batch_worker(
+    inputs: PoleBarnInputs,
+) -> Tuple[CalculationResult, Dict[str, float]]:
+    """Process pool task: calculate one building and return its stage timings."""
+    stage_timings: Dict[str, float] = {}
+    result = _batch_calculator._run_pipeline(inputs, stage_timings)
+    return result, stage_timings
@@ -0,0 +1,207 @@
+"""Cached loading of the parts, pricing and assemblies config catalogs."""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import pandas as pd
+from . import pricing
+
+
+# Bump when the pickled snapshot layout (or PriceBook) changes
+SNAPSHOT_FORMAT_VERSION = 1
+
+# Subdirectory of the config dir holding binary snapshots
+CACHE_DIR_NAME = ".cache"
+
+# Config file stems, in (parts, pricing, assemblies) order
+CONFIG_FILE_STEMS = ("parts", "pricing", "assemblies")
+
+
+@dataclass
+class ConfigSnapshot:
+    """
+    Parsed config catalogs plus the compiled price book.
+    
+    Snapshots are shared between calculators through the process registry,
+    so the DataFrames and price book must be treated as read-only.
+    """
+    
+    fingerprint: str  # Content hash of the three CSV files
+    parts_df: pd.DataFrame
+    pricing_df: pd.DataFrame
+    assemblies_df: pd.DataFrame
+    price_book: pricing.PriceBook
+
+
+# Process-wide registry: content fingerprint -> loaded snapshot
+_registry: Dict[str, ConfigSnapshot] = {}
+# (path, mtime_ns, size) signature of the three files -> content fingerprint
+_stat_fingerprints: Dict[Tuple, str] = {}
+_registry_lock = threading.Lock()
+
+
+def resolve_config_paths(config_dir: Path) -> Tuple[Path, Path, Path]:
+    """
+    Resolve the parts, pricing and assemblies CSV paths in a config directory.
+    
+    Prefers the *.example.csv files and falls back to *.csv.
+    
+    Args:
+        config_dir: Directory containing CSV config files
+    
+    Returns:
+        Tuple of (parts_path, pricing_path, assemblies_path)
+    """
+    paths = []
+    for stem in CONFIG_FILE_STEMS:
+        path = config_dir / f"{stem}.example.csv"
+        if not path.exists():
+            path = config_dir / f"{stem}.csv"
+        paths.append(path)
+    return tuple(paths)
+
+
+def fingerprint_config(paths: Tuple[Path, ...]) -> str:
+    """
+    Compute a content hash over the config files.
+    
+    Args:
+        paths: Config CSV paths
+    
+    Returns:
+        Hex SHA-256 digest of the file names and contents
+    
+    Raises:
+        FileNotFoundError: If a config file is missing
+    """
+    digest = hashlib.sha256(f"v{SNAPSHOT_FORMAT_VERSION}".encode())
+    for path in paths:
+        try:
+            data = Path(path).read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config CSV not found: {path}")
+        digest.update(Path(path).name.encode())
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def _stat_signature(paths: Tuple[Path, ...]) -> Optional[Tuple]:
+    """Cheap change-detection key from file mtimes and sizes (None if a file is missing)."""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        signature.append((str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _snapshot_path(config_dir: Path, fingerprint: str) -> Path:
+    """Path of the binary snapshot for a fingerprint."""
+    return config_dir / CACHE_DIR_NAME / f"config-{fingerprint[:32]}.pkl"
+
+
+def _read_disk_snapshot(path: Path, fingerprint: str) -> Optional[ConfigSnapshot]:
+    """Load a snapshot from disk, or None if it is missing, stale or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(snapshot, ConfigSnapshot) or snapshot.fingerprint != fingerprint:
+        return None
+    return snapshot
+
+
+def _write_disk_snapshot(path: Path, snapshot: ConfigSnapshot) -> None:
+    """Atomically write a snapshot; failures (e.g. read-only install) are ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Drop snapshots for older config contents
+        for stale in path.parent.glob("config-*.pkl"):
+            if stale != path:
+                stale.unlink()
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, path)
+    except OSError:
+        pass
+
+
+def _parse_snapshot(paths: Tuple[Path, Path, Path], fingerprint: str) -> ConfigSnapshot:
+    """Parse the CSVs and compile the price book."""
+    parts_path, pricing_path, assemblies_path = paths
+    parts_df = pricing.load_parts(parts_path)
+    pricing_df = pricing.load_pricing(pricing_path)
+    assemblies_df = pricing.load_assemblies(assemblies_path)
+    return ConfigSnapshot(
+        fingerprint=fingerprint,
+        parts_df=parts_df,
+        pricing_df=pricing_df,
+        assemblies_df=assemblies_df,
+        price_book=pricing.compile_price_book(parts_df, pricing_df, assemblies_df),
+    )
+
+
+def load_config_snapshot(config_dir: Path, use_disk_cache: bool = True) -> ConfigSnapshot:
+    """
+    Load the config catalogs, reusing in-process and on-disk snapshots.
+    
+    Lookup order:
+    1. Process registry, keyed by file mtimes/sizes (no file reads)
+    2. Process registry, keyed by content hash
+    3. Binary snapshot in <config_dir>/.cache/ matching the content hash
+    4. Parse the CSVs (and write a new binary snapshot)
+    
+    Editing a CSV changes its mtime and content hash, so stale snapshots are
+    never returned.
+    
+    Args:
+        config_dir: Directory containing CSV config files
+        use_disk_cache: Whether to read/write binary snapshots under config_dir
+    
+    Returns:
+        Shared ConfigSnapshot (treat as read-only)
+    
+    Raises:
+        FileNotFoundError: If config files are not found
+        ValueError: If config files are malformed
+    """
+    config_dir = Path(config_dir)
+    paths = resolve_config_paths(config_dir)
+    signature = _stat_signature(paths)
+    
+    with _registry_lock:
+        if signature is not None:
+            fingerprint = _stat_fingerprints.get(signature)
+            if fingerprint in _registry:
+                return _registry[fingerprint]
+        
+        fingerprint = fingerprint_config(paths)
+        snapshot = _registry.get(fingerprint)
+        if snapshot is None and use_disk_cache:
+            snapshot = _read_disk_snapshot(_snapshot_path(config_dir, fingerprint), fingerprint)
+        if snapshot is None:
+            snapshot = _parse_snapshot(paths, fingerprint)
+            if use_disk_cache:
+                _write_disk_snapshot(_snapshot_path(config_dir, fingerprint), snapshot)
+        
+        _registry[fingerprint] = snapshot
+        if signature is not None:
+            _stat_fingerprints[signature] = fingerprint
+        return snapshot
+
+
+def clear_config_registry() -> None:
+    """Forget all in-process snapshots (disk snapshots are kept)."""
+    with _registry_lock:
+        _registry.clear()
+        _stat_fingerprints.clear()
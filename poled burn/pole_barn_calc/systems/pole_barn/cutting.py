@@ -0,0 +1,350 @@
+"""Cutting-stock engines for packing required lengths into stock sticks."""
+
+import bisect
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+
+# Tolerance for float length comparisons (inches)
+_EPS = 1e-6
+
+# Default time budget for the bounded exact optimizer (seconds)
+DEFAULT_TIME_BUDGET_S = 0.5
+
+
+@dataclass
+class CutPlan:
+    """Cut list for one stock length: which segments are cut from each stick."""
+    
+    stock_length_in: float
+    sticks: List[List[float]] = field(default_factory=list)  # Segment lengths cut from each stick
+    
+    @property
+    def stick_count(self) -> int:
+        """Number of stock sticks used."""
+        return len(self.sticks)
+    
+    @property
+    def used_in(self) -> float:
+        """Total length cut from the sticks, in inches."""
+        return sum(sum(cuts) for cuts in self.sticks)
+    
+    @property
+    def scrap_in(self) -> float:
+        """Total offcut length left over, in inches (oversized segments count as zero scrap)."""
+        return sum(max(0.0, self.stock_length_in - sum(cuts)) for cuts in self.sticks)
+    
+    @property
+    def scrap_pct(self) -> float:
+        """Scrap as a percentage of purchased stock length."""
+        purchased = self.stick_count * self.stock_length_in
+        if purchased <= 0:
+            return 0.0
+        return self.scrap_in / purchased * 100.0
+
+
+def _split_oversized(segments_in: List[float], stock_length_in: float) -> List[float]:
+    """
+    Break segments longer than one stick into full sticks plus a remainder.
+    
+    Used for continuous runs (e.g. eave-top J) that are spliced along their length.
+    """
+    result: List[float] = []
+    for segment in segments_in:
+        while segment > stock_length_in + _EPS:
+            result.append(stock_length_in)
+            segment -= stock_length_in
+        if segment > _EPS:
+            result.append(segment)
+    return result
+
+
+def pack_first_fit(segments_in: List[float], stock_length_in: float) -> CutPlan:
+    """
+    Legacy first-fit-decreasing packing (linear scan over open sticks).
+    
+    Matches the original pack_segments_into_sticks() behaviour exactly,
+    including giving each oversized segment its own stick.
+    
+    Args:
+        segments_in: Required segment lengths in inches
+        stock_length_in: Stock stick length in inches
+    
+    Returns:
+        CutPlan with per-stick cuts
+    """
+    plan = CutPlan(stock_length_in=stock_length_in)
+    remaining: List[float] = []
+    
+    for segment in sorted(segments_in, reverse=True):
+        if segment > stock_length_in:
+            # Open a new stick for this oversized segment
+            remaining.append(stock_length_in - segment)
+            plan.sticks.append([segment])
+            continue
+        
+        for i, space in enumerate(remaining):
+            if space >= segment:
+                remaining[i] = space - segment
+                plan.sticks[i].append(segment)
+                break
+        else:
+            remaining.append(stock_length_in - segment)
+            plan.sticks.append([segment])
+    
+    return plan
+
+
+def pack_best_fit(segments_in: List[float], stock_length_in: float) -> CutPlan:
+    """
+    Best-fit-decreasing packing using a sorted list of open stick offcuts.
+    
+    Each segment goes into the open stick with the smallest offcut that still
+    fits, found with bisect in O(log n). Segments longer than a stick are
+    spliced from full sticks plus a remainder.
+    
+    Args:
+        segments_in: Required segment lengths in inches
+        stock_length_in: Stock stick length in inches
+    
+    Returns:
+        CutPlan with per-stick cuts
+    """
+    plan = CutPlan(stock_length_in=stock_length_in)
+    # Sorted (remaining_in, stick_index) for sticks that still have room
+    open_sticks: List[tuple] = []
+    
+    for segment in sorted(_split_oversized(segments_in, stock_length_in), reverse=True):
+        pos = bisect.bisect_left(open_sticks, (segment - _EPS, -1))
+        if pos < len(open_sticks):
+            remaining, index = open_sticks.pop(pos)
+        else:
+            remaining, index = stock_length_in, len(plan.sticks)
+            plan.sticks.append([])
+        plan.sticks[index].append(segment)
+        remaining -= segment
+        if remaining > _EPS:
+            bisect.insort(open_sticks, (remaining, index))
+    
+    return plan
+
+
+def pack_optimal(
+    segments_in: List[float],
+    stock_length_in: float,
+    time_budget_s: float = DEFAULT_TIME_BUDGET_S,
+) -> CutPlan:
+    """
+    Bounded exact packing: branch-and-bound seeded with the best-fit plan.
+    
+    Returns a provably minimal stick count when the search finishes within
+    time_budget_s, otherwise the best plan found so far (never worse than
+    best-fit).
+    
+    Args:
+        segments_in: Required segment lengths in inches
+        stock_length_in: Stock stick length in inches
+        time_budget_s: Wall-clock budget for the search in seconds
+    
+    Returns:
+        CutPlan with per-stick cuts
+    """
+    best = pack_best_fit(segments_in, stock_length_in)
+    items = sorted(_split_oversized(segments_in, stock_length_in), reverse=True)
+    total = sum(items)
+    lower_bound = max(
+        math.ceil(total / stock_length_in - _EPS),
+        sum(1 for item in items if item > stock_length_in / 2.0 + _EPS),
+    )
+    if best.stick_count <= lower_bound:
+        return best
+    
+    deadline = time.perf_counter() + time_budget_s
+    bins: List[List[float]] = []
+    free: List[float] = []
+    best_count, best_sticks, placed = best.stick_count, None, 0.0
+    
+    # Depth-first search with an explicit stack (one frame per placed segment,
+    # so large takeoffs cannot hit the recursion limit). A frame holds the
+    # sticks the segment may go into, the next one to try, the stick it is in
+    # now (-1 for a new one) and that stick's free length before the cut.
+    stack: List[list] = []
+    descend = True
+    while True:
+        if descend:
+            if time.perf_counter() > deadline:
+                break
+            i = len(stack)
+            if i == len(items):
+                if len(bins) < best_count:
+                    best_count, best_sticks = len(bins), [list(cuts) for cuts in bins]
+                    if best_count <= lower_bound:
+                        break
+            else:
+                # Bound: sticks already open plus those needed for what is left over
+                overflow = (total - placed) - sum(free)
+                needed = len(bins) + max(0, math.ceil(overflow / stock_length_in - _EPS))
+                if needed < best_count:
+                    item, choices, tried = items[i], [], set()
+                    for b, space in enumerate(free):
+                        if space + _EPS >= item and round(space, 6) not in tried:
+                            tried.add(round(space, 6))
+                            choices.append(b)
+                    stack.append([choices, 0, None, 0.0])
+        if not stack:
+            break
+        
+        frame = stack[-1]
+        choices, pos, current, space = frame
+        item = items[len(stack) - 1]
+        if current is not None:
+            # Undo the previous placement before trying the next one
+            placed -= item
+            if current < 0:
+                free.pop()
+                bins.pop()
+            else:
+                free[current] = space
+                bins[current].pop()
+            frame[2] = None
+        
+        if pos < len(choices):
+            b = choices[pos]
+            bins[b].append(item)
+            frame[1:] = [pos + 1, b, free[b]]
+            free[b] -= item
+        elif pos == len(choices) and len(bins) + 1 < best_count:
+            bins.append([item])
+            free.append(stock_length_in - item)
+            frame[1:] = [pos + 1, -1, 0.0]
+        else:
+            stack.pop()
+            descend = False
+            continue
+        placed += item
+        descend = True
+    
+    if best_sticks is None:
+        return best
+    return CutPlan(stock_length_in=stock_length_in, sticks=best_sticks)
+
+
+# Registry of segment packing engines, keyed by cutting mode
+CUTTING_ENGINES: Dict[str, Callable[..., CutPlan]] = {
+    "first_fit": pack_first_fit,
+    "best_fit": pack_best_fit,
+    "optimal": pack_optimal,
+}
+
+DEFAULT_CUTTING_MODE = "best_fit"
+
+
+def plan_segment_cuts(
+    segments_in: List[float],
+    stock_length_in: float = 120.0,
+    mode: str = DEFAULT_CUTTING_MODE,
+    time_budget_s: float = DEFAULT_TIME_BUDGET_S,
+) -> CutPlan:
+    """
+    Pack required segments into stock sticks with the selected engine.
+    
+    Args:
+        segments_in: Required segment lengths in inches
+        stock_length_in: Stock stick length in inches (default 120" = 10')
+        mode: "first_fit" (legacy), "best_fit" (fast) or "optimal" (bounded exact)
+        time_budget_s: Time budget for "optimal" mode in seconds
+    
+    Returns:
+        CutPlan with per-stick cuts
+    
+    Raises:
+        ValueError: If mode is not a known cutting mode
+    """
+    if mode not in CUTTING_ENGINES:
+        raise ValueError(f"Unknown cutting mode: {mode}. Expected one of {', '.join(CUTTING_ENGINES)}")
+    if mode == "optimal":
+        return pack_optimal(segments_in, stock_length_in, time_budget_s)
+    return CUTTING_ENGINES[mode](segments_in, stock_length_in)
+
+
+def plan_lumber_cuts(
+    total_lf: float,
+    stock_lengths_ft: Optional[List[float]] = None,
+    mode: str = DEFAULT_CUTTING_MODE,
+) -> Dict[float, CutPlan]:
+    """
+    Choose stock lengths to cover a continuous run of lumber, with cut lists.
+    
+    "first_fit" reproduces the legacy greedy split (longest length only).
+    Other modes take as many longest pieces as possible, then search
+    combinations of up to three pieces for the remainder that minimise
+    offcut, preferring fewer pieces on ties.
+    
+    Args:
+        total_lf: Total linear feet required
+        stock_lengths_ft: Available stock lengths in feet (default: [16, 14, 12, 10, 8])
+        mode: Cutting mode (see plan_segment_cuts)
+    
+    Returns:
+        Dictionary mapping length_ft to CutPlan (stock length in inches)
+    """
+    from .bom import split_lumber_into_stock_lengths
+    
+    if mode not in CUTTING_ENGINES:
+        raise ValueError(f"Unknown cutting mode: {mode}. Expected one of {', '.join(CUTTING_ENGINES)}")
+    if stock_lengths_ft is None:
+        stock_lengths_ft = [16.0, 14.0, 12.0, 10.0, 8.0]
+    lengths = sorted(stock_lengths_ft, reverse=True)
+    
+    if total_lf <= 0:
+        return {}
+    
+    if mode == "first_fit":
+        counts = split_lumber_into_stock_lengths(total_lf, lengths)
+        pieces = [length for length in lengths for _ in range(counts.get(length, 0))]
+    else:
+        longest = lengths[0]
+        base = max(0, math.floor(total_lf / longest - _EPS) - 1)
+        remainder = total_lf - base * longest
+        best_combo: Optional[tuple] = None
+        best_key: Optional[tuple] = None
+        for combo in _combinations_up_to(lengths, 3):
+            covered = sum(combo)
+            if covered + _EPS < remainder:
+                continue
+            key = (round(covered - remainder, 6), len(combo))
+            if best_key is None or key < best_key:
+                best_key, best_combo = key, combo
+        if best_combo is None:
+            # Remainder longer than three longest pieces (single-length catalogs)
+            best_combo = (longest,) * math.ceil(remainder / longest - _EPS)
+        pieces = [longest] * base + sorted(best_combo, reverse=True)
+    
+    # Cut list: full pieces along the run, the last piece trimmed to what is left
+    plans: Dict[float, CutPlan] = {}
+    left_in = total_lf * 12.0
+    for length_ft in pieces:
+        stock_in = length_ft * 12.0
+        cut = min(stock_in, max(0.0, left_in))
+        left_in -= cut
+        plan = plans.setdefault(length_ft, CutPlan(stock_length_in=stock_in))
+        plan.sticks.append([cut] if cut > 0 else [])
+    return plans
+
+
+def _combinations_up_to(lengths: List[float], max_pieces: int) -> List[tuple]:
+    """All multisets of 1..max_pieces stock lengths (lengths sorted descending)."""
+    combos: List[tuple] = []
+    
+    def extend(start: int, current: tuple) -> None:
+        if current:
+            combos.append(current)
+        if len(current) == max_pieces:
+            return
+        for i in range(start, len(lengths)):
+            extend(i, current + (lengths[i],))
+    
+    extend(0, ())
+    return combos
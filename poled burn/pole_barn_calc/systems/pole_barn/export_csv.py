@@ -6,6 +6,23 @@ from typing import List
 from .model import PartQuantity
 
 
+# Column order for flat BOM CSV files
+FLAT_CSV_FIELDNAMES = [
+    "project_name",
+    "building_id",
+    "sheet_name",
+    "category",
+    "part_id",
+    "part_name",
+    "unit",
+    "qty",
+    "length_in",
+    "unit_price",
+    "ext_price",
+    "notes",
+]
+
+
 def export_bom_to_flat_csv(
     bom_items: List[PartQuantity],
     output_path: Path,
@@ -66,20 +83,7 @@ def export_bom_to_flat_csv(
         aggregated[key]["ext_price"] += item.ext_price
     
     # Write CSV
-    fieldnames = [
-        "project_name",
-        "building_id",
-        "sheet_name",
-        "category",
-        "part_id",
-        "part_name",
-        "unit",
-        "qty",
-        "length_in",
-        "unit_price",
-        "ext_price",
-        "notes",
-    ]
+    fieldnames = FLAT_CSV_FIELDNAMES
     
     with open(output_path, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
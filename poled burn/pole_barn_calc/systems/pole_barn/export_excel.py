@@ -19,6 +19,9 @@ CATEGORY_SHEETS = {
     "Misc": "Misc",
 }
 
+# Column headers for each category tab
+BOM_SHEET_HEADERS = ["Part ID", "Part Name", "Description", "Length (in)", "Unit", "Qty", "Unit Price", "Ext Price", "Notes"]
+
 
 def export_bom_to_excel(
     bom: List[PartQuantity],
@@ -56,8 +59,7 @@ def export_bom_to_excel(
             ws = wb[sheet_name]
         
         # Headers
-        headers = ["Part ID", "Part Name", "Description", "Length (in)", "Unit", "Qty", "Unit Price", "Ext Price", "Notes"]
-        ws.append(headers)
+        ws.append(BOM_SHEET_HEADERS)
         
         # Style headers
         for cell in ws[1]:
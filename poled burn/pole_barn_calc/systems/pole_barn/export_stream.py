@@ -0,0 +1,290 @@
+"""Streaming, constant-memory BOM exporters (Excel, CSV, JSON Lines).
+
+Unlike export_excel/export_csv/export_json, these writers consume iterators
+and write each item as it arrives, so memory stays flat no matter how many
+items or projects are exported. Each format has a single-project function and
+a multi-project function that writes one combined file from
+(project_name, items) pairs, e.g.:
+
+    results = calculator.calculate_many(inputs_list)
+    export_projects_stream_to_csv(
+        ((inputs.project_name, result[4]) for inputs, result in zip(inputs_list, results)),
+        Path("batch_bom.csv"),
+    )
+
+Rows are written in arrival order; nothing is aggregated or sorted.
+"""
+
+import csv
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from .model import PartQuantity, PricedLineItem
+from .export_csv import FLAT_CSV_FIELDNAMES
+from .export_excel import BOM_SHEET_HEADERS, CATEGORY_SHEETS
+
+
+# (project_name, items) pair accepted by the multi-project writers
+ProjectItems = Tuple[Optional[str], Iterable[PartQuantity]]
+ProjectRecords = Tuple[Optional[str], Iterable[Union[PartQuantity, PricedLineItem]]]
+
+# Fixed column widths (write-only sheets can't be auto-sized after writing)
+_BOM_COLUMN_WIDTHS = [22, 36, 36, 12, 8, 10, 12, 12, 36]
+_PROJECT_COLUMN_WIDTH = 28
+
+
+def _flat_csv_row(item: PartQuantity, project_name: Optional[str], building_id: Optional[str]) -> Dict[str, object]:
+    """One flat-CSV row for a BOM item (same columns as export_bom_to_flat_csv)."""
+    return {
+        "project_name": project_name or "",
+        "building_id": building_id or "",
+        "sheet_name": item.sheet_name or item.export_category or item.category,
+        "category": item.category,
+        "part_id": item.part_id,
+        "part_name": item.part_name,
+        "unit": item.unit,
+        "qty": item.qty,
+        "length_in": "" if item.length_in is None else str(item.length_in),
+        "unit_price": item.unit_price,
+        "ext_price": item.ext_price,
+        "notes": item.notes or "",
+    }
+
+
+def export_bom_stream_to_csv(
+    bom_items: Iterable[PartQuantity],
+    output_path: Path,
+    project_name: Optional[str] = None,
+    building_id: Optional[str] = None,
+) -> int:
+    """
+    Write BOM items to a flat CSV one row at a time.
+    
+    Args:
+        bom_items: Iterable of PartQuantity items (consumed once)
+        output_path: Path to output CSV file
+        project_name: Optional project name for every row
+        building_id: Optional building/test identifier for every row
+    
+    Returns:
+        Number of rows written
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(output_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FLAT_CSV_FIELDNAMES)
+        writer.writeheader()
+        for item in bom_items:
+            writer.writerow(_flat_csv_row(item, project_name, building_id))
+            count += 1
+    return count
+
+
+def export_projects_stream_to_csv(
+    projects: Iterable[ProjectItems],
+    output_path: Path,
+) -> int:
+    """
+    Write the BOMs of many projects to one combined flat CSV.
+    
+    Args:
+        projects: Iterable of (project_name, BOM items) pairs
+        output_path: Path to output CSV file
+    
+    Returns:
+        Number of rows written
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(output_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FLAT_CSV_FIELDNAMES)
+        writer.writeheader()
+        for project_name, bom_items in projects:
+            for item in bom_items:
+                writer.writerow(_flat_csv_row(item, project_name, None))
+                count += 1
+    return count
+
+
+def _header_row(ws, headers) -> list:
+    """Bold header cells for a write-only sheet."""
+    row = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = Font(bold=True)
+        row.append(cell)
+    return row
+
+
+def _write_excel_stream(
+    projects: Iterable[ProjectItems],
+    output_path: Path,
+    include_project_column: bool,
+) -> int:
+    """Shared write-only workbook writer for the Excel streaming exports."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    wb = Workbook(write_only=True)
+    
+    # Summary goes first in the workbook but is filled in after all items
+    summary_ws = wb.create_sheet(title="Summary")
+    summary_headers = ["Category", "Total Cost"]
+    summary_widths = [24, 16]
+    if include_project_column:
+        summary_headers = ["Project"] + summary_headers
+        summary_widths = [_PROJECT_COLUMN_WIDTH] + summary_widths
+    for index, width in enumerate(summary_widths):
+        summary_ws.column_dimensions[chr(ord("A") + index)].width = width
+    
+    headers = list(BOM_SHEET_HEADERS)
+    widths = list(_BOM_COLUMN_WIDTHS)
+    if include_project_column:
+        headers = ["Project"] + headers
+        widths = [_PROJECT_COLUMN_WIDTH] + widths
+    
+    sheets = {}
+    # (project_name, category) -> total ext_price
+    totals: Dict[Tuple[str, str], float] = {}
+    count = 0
+    
+    for project_name, bom_items in projects:
+        for item in bom_items:
+            category = item.export_category or "Misc"
+            sheet_name = CATEGORY_SHEETS.get(category, "Misc")
+            ws = sheets.get(sheet_name)
+            if ws is None:
+                ws = wb.create_sheet(title=sheet_name)
+                for index, width in enumerate(widths):
+                    ws.column_dimensions[chr(ord("A") + index)].width = width
+                ws.append(_header_row(ws, headers))
+                sheets[sheet_name] = ws
+            
+            row = [
+                item.part_id,
+                item.part_name,
+                item.notes or "",
+                item.length_in if item.length_in is not None else "",
+                item.unit,
+                item.qty,
+                item.unit_price,
+                item.ext_price,
+                item.notes or "",
+            ]
+            if include_project_column:
+                row = [project_name or ""] + row
+            ws.append(row)
+            
+            key = (project_name or "", category)
+            totals[key] = totals.get(key, 0.0) + item.ext_price
+            count += 1
+    
+    summary_ws.append(_header_row(summary_ws, summary_headers))
+    for (project_name, category), total in sorted(totals.items()):
+        summary_ws.append([project_name, category, total] if include_project_column else [category, total])
+    summary_ws.append([])
+    grand_label = WriteOnlyCell(summary_ws, value="GRAND TOTAL")
+    grand_label.font = Font(bold=True)
+    grand_total = WriteOnlyCell(summary_ws, value=sum(totals.values()))
+    grand_total.font = Font(bold=True)
+    summary_ws.append(([""] if include_project_column else []) + [grand_label, grand_total])
+    
+    wb.save(output_path)
+    return count
+
+
+def export_bom_stream_to_excel(
+    bom_items: Iterable[PartQuantity],
+    output_path: Path,
+    project_name: Optional[str] = None,
+) -> int:
+    """
+    Write BOM items to a write-only Excel workbook with category tabs.
+    
+    Same tabs and columns as export_bom_to_excel, but rows keep arrival order
+    and column widths are fixed.
+    
+    Args:
+        bom_items: Iterable of PartQuantity items (consumed once)
+        output_path: Path to save Excel file
+        project_name: Optional project name (used for Summary totals only)
+    
+    Returns:
+        Number of item rows written
+    """
+    return _write_excel_stream([(project_name, bom_items)], output_path, include_project_column=False)
+
+
+def export_projects_stream_to_excel(
+    projects: Iterable[ProjectItems],
+    output_path: Path,
+) -> int:
+    """
+    Write the BOMs of many projects to one combined write-only workbook.
+    
+    Every tab gets a leading Project column; Summary totals are per
+    project and category.
+    
+    Args:
+        projects: Iterable of (project_name, BOM items) pairs
+        output_path: Path to save Excel file
+    
+    Returns:
+        Number of item rows written
+    """
+    return _write_excel_stream(projects, output_path, include_project_column=True)
+
+
+def _jsonl_record(item: Union[PartQuantity, PricedLineItem], project_name: Optional[str]) -> Dict[str, object]:
+    """JSON Lines record for a BOM or priced line item."""
+    record_type = "bom_item" if isinstance(item, PartQuantity) else "priced_item"
+    return {"project_name": project_name, "record_type": record_type, **asdict(item)}
+
+
+def export_records_stream_to_jsonl(
+    records: Iterable[Union[PartQuantity, PricedLineItem]],
+    output_path: Path,
+    project_name: Optional[str] = None,
+) -> int:
+    """
+    Write BOM and/or priced line items as JSON Lines, one object per line.
+    
+    Each line has project_name, record_type ("bom_item" or "priced_item")
+    and the item's fields.
+    
+    Args:
+        records: Iterable of PartQuantity and/or PricedLineItem (consumed once)
+        output_path: Path to output .jsonl file
+        project_name: Optional project name for every record
+    
+    Returns:
+        Number of lines written
+    """
+    return export_projects_stream_to_jsonl([(project_name, records)], output_path)
+
+
+def export_projects_stream_to_jsonl(
+    projects: Iterable[ProjectRecords],
+    output_path: Path,
+) -> int:
+    """
+    Write records for many projects to one combined JSON Lines file.
+    
+    Args:
+        projects: Iterable of (project_name, records) pairs
+        output_path: Path to output .jsonl file
+    
+    Returns:
+        Number of lines written
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with open(output_path, "w", encoding="utf-8") as f:
+        for project_name, records in projects:
+            for item in records:
+                f.write(json.dumps(_jsonl_record(item, project_name), default=str))
+                f.write("\n")
+                count += 1
+    return count
@@ -212,6 +212,8 @@ class PartQuantity:
     length_in: Optional[float] = None  # For panels, lumber, etc. (length in inches)
     sheet_name: Optional[str] = None  # Logical "tab" name for CSV export
     notes: str = ""
+    cut_list: Optional[List[List[float]]] = None  # Per-stick cut lengths in inches (packed stock items)
+    scrap_pct: Optional[float] = None  # Offcut as % of purchased stock length (packed stock items)
 
 
 @dataclass
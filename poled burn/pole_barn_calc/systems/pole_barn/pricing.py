@@ -130,8 +130,22 @@ def find_assembly_mapping(
         return None
     
     # Take first match
-    row = matches.iloc[0]
+    return _assembly_mapping_from_row(matches.iloc[0], assembly_name)
+
+
+def _assembly_mapping_from_row(row: Any, assembly_name: str) -> Dict[str, Any]:
+    """
+    Build an assembly mapping dict from a single assemblies row.
     
+    Accepts either a pandas Series (DataFrame row) or a plain dict record.
+    
+    Args:
+        row: Assemblies row (Series or dict)
+        assembly_name: Name of the assembly (used when the row has no name)
+        
+    Returns:
+        Dictionary with mapping info (part_id, waste_factor, labor_per_unit, etc.)
+    """
     result: Dict[str, Any] = {
         "assembly_id": row.get("assembly_id", ""),
         "assembly_name": row.get("assembly_name", assembly_name),
@@ -202,7 +216,11 @@ def find_part_record(
     if len(matches) == 0:
         return None
     
-    row = matches.iloc[0]
+    return _part_record_from_row(matches.iloc[0], part_id)
+
+
+def _part_record_from_row(row: Any, part_id: str) -> Dict[str, Any]:
+    """Build a part record dict from a single parts row (Series or dict)."""
     return {
         "part_id": row.get("part_id", part_id),
         "part_name": row.get("part_name", ""),
@@ -232,7 +250,11 @@ def find_unit_price(
         return None
     
     # Take first match (if multiple, could add date-based selection later)
-    row = matches.iloc[0]
+    return _unit_price_from_row(matches.iloc[0])
+
+
+def _unit_price_from_row(row: Any) -> Optional[float]:
+    """Extract a float unit price from a single pricing row (Series or dict)."""
     unit_price = row.get("unit_price")
     
     if pd.isna(unit_price):
@@ -244,6 +266,105 @@ def find_unit_price(
         return None
 
 
+class PriceBook:
+    """
+    Compiled, hash-indexed view of the parts, pricing and assemblies catalogs.
+    
+    Built once from the config DataFrames so that per-line-item lookups are
+    dict hits instead of boolean-mask scans over the whole catalog. Lookups
+    follow the same first-match rules as find_part_record(), find_unit_price()
+    and find_assembly_mapping().
+    """
+    
+    def __init__(
+        self,
+        parts_df: pd.DataFrame,
+        pricing_df: pd.DataFrame,
+        assemblies_df: pd.DataFrame,
+    ):
+        """
+        Compile the catalogs into lookup tables.
+        
+        Args:
+            parts_df: DataFrame with parts catalog
+            pricing_df: DataFrame with pricing data
+            assemblies_df: DataFrame with assembly mappings
+        """
+        # part_id -> raw parts row (first match wins)
+        self.part_rows: Dict[str, Dict[str, Any]] = {}
+        for row in parts_df.to_dict("records"):
+            self.part_rows.setdefault(row.get("part_id"), row)
+        
+        # part_id -> raw pricing row (first match wins)
+        self.price_rows: Dict[str, Dict[str, Any]] = {}
+        for row in pricing_df.to_dict("records"):
+            self.price_rows.setdefault(row.get("part_id"), row)
+        
+        # assembly_name -> all raw assembly rows, in file order
+        self.assembly_rows: Dict[str, List[Dict[str, Any]]] = {}
+        for row in assemblies_df.to_dict("records"):
+            self.assembly_rows.setdefault(row.get("assembly_name"), []).append(row)
+        
+        # Derived lookups, precomputed so pricing never rebuilds them per item
+        self.parts: Dict[str, Dict[str, Any]] = {
+            part_id: _part_record_from_row(row, part_id)
+            for part_id, row in self.part_rows.items()
+        }
+        self.prices: Dict[str, Optional[float]] = {
+            part_id: _unit_price_from_row(row)
+            for part_id, row in self.price_rows.items()
+        }
+        self.assemblies: Dict[str, Dict[str, Any]] = {
+            name: _assembly_mapping_from_row(rows[0], name)
+            for name, rows in self.assembly_rows.items()
+        }
+    
+    def find_assembly_mapping(self, assembly_name: str) -> Optional[Dict[str, Any]]:
+        """Return the primary assembly mapping (see find_assembly_mapping)."""
+        mapping = self.assemblies.get(assembly_name)
+        return dict(mapping) if mapping is not None else None
+    
+    def find_part_record(self, part_id: str) -> Optional[Dict[str, Any]]:
+        """Return the part record (see find_part_record)."""
+        record = self.parts.get(part_id)
+        return dict(record) if record is not None else None
+    
+    def find_unit_price(self, part_id: str) -> Optional[float]:
+        """Return the unit price (see find_unit_price)."""
+        return self.prices.get(part_id)
+    
+    def get_assembly_rows(self, assembly_name: str) -> List[Dict[str, Any]]:
+        """Return every raw assemblies row for an assembly (empty if none)."""
+        return self.assembly_rows.get(assembly_name, [])
+    
+    def get_part_row(self, part_id: str) -> Optional[Dict[str, Any]]:
+        """Return the raw parts row for a part (None if not in catalog)."""
+        return self.part_rows.get(part_id)
+    
+    def get_price_row(self, part_id: str) -> Optional[Dict[str, Any]]:
+        """Return the raw pricing row for a part (None if not priced)."""
+        return self.price_rows.get(part_id)
+
+
+def compile_price_book(
+    parts_df: pd.DataFrame,
+    pricing_df: pd.DataFrame,
+    assemblies_df: pd.DataFrame,
+) -> PriceBook:
+    """
+    Compile config DataFrames into a hash-indexed PriceBook.
+    
+    Args:
+        parts_df: DataFrame with parts catalog
+        pricing_df: DataFrame with pricing data
+        assemblies_df: DataFrame with assembly mappings
+        
+    Returns:
+        PriceBook with O(1) part, price and assembly lookups
+    """
+    return PriceBook(parts_df, pricing_df, assemblies_df)
+
+
 def _create_simple_assembly_mapping() -> Dict[str, str]:
     """
     Create a simple mapping from assembly names to part IDs.
@@ -289,12 +410,104 @@ def _create_simple_assembly_mapping() -> Dict[str, str]:
     }
 
 
+def get_markup_rates(pricing_inputs: PricingInputs) -> Dict[str, float]:
+    """
+    Resolve global markup, overhead and tax percentages from pricing inputs.
+    
+    Args:
+        pricing_inputs: Pricing parameters
+        
+    Returns:
+        Dictionary with material_markup_pct, labor_markup_pct,
+        subcontractor_markup_pct, overhead_pct and tax_rate (all as percentages)
+    """
+    # Use material_markup_pct if provided, otherwise derive from legacy material_markup field
+    if hasattr(pricing_inputs, 'material_markup_pct') and pricing_inputs.material_markup_pct > 0:
+        material_markup_pct = pricing_inputs.material_markup_pct
+    else:
+        # Backward compatibility: convert 1.15 to 15%
+        material_markup_pct = (pricing_inputs.material_markup - 1.0) * 100.0
+    
+    return {
+        "material_markup_pct": material_markup_pct,
+        # Other markup percentages (with defaults)
+        "labor_markup_pct": getattr(pricing_inputs, 'labor_markup_pct', 10.0),
+        "subcontractor_markup_pct": getattr(pricing_inputs, 'subcontractor_markup_pct', 10.0),
+        "overhead_pct": getattr(pricing_inputs, 'overhead_pct', 0.0),
+        "tax_rate": pricing_inputs.tax_rate * 100.0,  # Convert 0.08 to 8%
+    }
+
+
+def resolve_line_pricing(
+    assembly_name: str,
+    price_book: PriceBook,
+    simple_mapping: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Resolve part, waste, labor and unit price for one assembly line.
+    
+    Uses the assemblies mapping when present, else the built-in simple mapping.
+    
+    Args:
+        assembly_name: Assembly name (matches AssemblyQuantity.name)
+        price_book: Compiled price book
+        simple_mapping: Fallback assembly_name -> part_id mapping. If None, the
+            default simple mapping is used.
+        
+    Returns:
+        Dictionary with part_id, waste_factor, labor_per_unit, markup_override,
+        unit_price and notes (list of strings)
+    """
+    if simple_mapping is None:
+        simple_mapping = _create_simple_assembly_mapping()
+    
+    # Find assembly mapping
+    assembly_map = price_book.find_assembly_mapping(assembly_name)
+    
+    # Determine part_id
+    part_id = None
+    waste_factor = 1.0
+    labor_per_unit = 0.0
+    markup_override = None
+    
+    if assembly_map:
+        part_id = assembly_map.get("part_id")
+        waste_factor = assembly_map.get("waste_factor", 1.0)
+        labor_per_unit = assembly_map.get("labor_per_unit", 0.0)
+        markup_override = assembly_map.get("markup_percent_override")
+    else:
+        # Fallback to simple mapping
+        part_id = simple_mapping.get(assembly_name)
+    
+    # Find unit price
+    unit_price = 0.0
+    notes_list: List[str] = []
+    
+    if part_id:
+        unit_price = price_book.find_unit_price(part_id) or 0.0
+        
+        if unit_price == 0.0:
+            notes_list.append(f"No price found for part {part_id}")
+    else:
+        notes_list.append(f"No part mapping for {assembly_name}")
+    
+    return {
+        "part_id": part_id,
+        "waste_factor": waste_factor,
+        "labor_per_unit": labor_per_unit,
+        "markup_override": markup_override,
+        "unit_price": unit_price,
+        "notes": notes_list,
+    }
+
+
 def price_material_takeoff(
     takeoff: MaterialTakeoff,
     pricing_inputs: PricingInputs,
     parts_df: pd.DataFrame,
     pricing_df: pd.DataFrame,
     assemblies_df: pd.DataFrame,
+    price_book: Optional[PriceBook] = None,
 ) -> Tuple[List[PricedLineItem], PricingSummary]:
     """
     Price a material takeoff, returning priced line items and summary.
@@ -305,65 +518,39 @@ def price_material_takeoff(
         parts_df: DataFrame with parts catalog
         pricing_df: DataFrame with pricing data
         assemblies_df: DataFrame with assembly mappings
+        price_book: Precompiled PriceBook for these DataFrames. If None, one is
+            compiled here (callers pricing many takeoffs should pass their own).
         
     Returns:
         Tuple of (list of PricedLineItem, PricingSummary)
     """
+    if price_book is None:
+        price_book = compile_price_book(parts_df, pricing_df, assemblies_df)
+    
     priced_items: List[PricedLineItem] = []
     simple_mapping = _create_simple_assembly_mapping()
     
     # Get global pricing parameters
     labor_rate = pricing_inputs.labor_rate
-    # Use material_markup_pct if provided, otherwise derive from legacy material_markup field
-    if hasattr(pricing_inputs, 'material_markup_pct') and pricing_inputs.material_markup_pct > 0:
-        material_markup_pct = pricing_inputs.material_markup_pct
-    else:
-        # Backward compatibility: convert 1.15 to 15%
-        material_markup_pct = (pricing_inputs.material_markup - 1.0) * 100.0
-    
-    # Get other markup percentages (with defaults)
-    labor_markup_pct = getattr(pricing_inputs, 'labor_markup_pct', 10.0)
-    subcontractor_markup_pct = getattr(pricing_inputs, 'subcontractor_markup_pct', 10.0)
-    overhead_pct = getattr(pricing_inputs, 'overhead_pct', 0.0)
-    
-    tax_rate = pricing_inputs.tax_rate * 100.0  # Convert 0.08 to 8%
+    rates = get_markup_rates(pricing_inputs)
+    material_markup_pct = rates["material_markup_pct"]
+    labor_markup_pct = rates["labor_markup_pct"]
+    subcontractor_markup_pct = rates["subcontractor_markup_pct"]
+    overhead_pct = rates["overhead_pct"]
+    tax_rate = rates["tax_rate"]
     
     for assembly_qty in takeoff.items:
-        # Find assembly mapping
-        assembly_map = find_assembly_mapping(assemblies_df, assembly_qty.name)
-        
-        # Determine part_id
-        part_id = None
-        waste_factor = 1.0
-        labor_per_unit = 0.0
-        markup_override = None
-        
-        if assembly_map:
-            part_id = assembly_map.get("part_id")
-            waste_factor = assembly_map.get("waste_factor", 1.0)
-            labor_per_unit = assembly_map.get("labor_per_unit", 0.0)
-            markup_override = assembly_map.get("markup_percent_override")
-        else:
-            # Fallback to simple mapping
-            part_id = simple_mapping.get(assembly_qty.name)
+        line = resolve_line_pricing(assembly_qty.name, price_book, simple_mapping)
+        part_id = line["part_id"]
+        waste_factor = line["waste_factor"]
+        labor_per_unit = line["labor_per_unit"]
+        markup_override = line["markup_override"]
+        unit_price = line["unit_price"]
+        notes_list = line["notes"]
         
         # Effective quantity with waste
         effective_qty = assembly_qty.quantity * waste_factor
         
-        # Find unit price
-        unit_price = 0.0
-        part_record = None
-        notes_list = []
-        
-        if part_id:
-            part_record = find_part_record(parts_df, part_id)
-            unit_price = find_unit_price(pricing_df, part_id) or 0.0
-            
-            if unit_price == 0.0:
-                notes_list.append(f"No price found for part {part_id}")
-        else:
-            notes_list.append(f"No part mapping for {assembly_qty.name}")
-        
         # Calculate base costs
         material_cost = effective_qty * unit_price
         labor_hours = effective_qty * labor_per_unit
@@ -0,0 +1,451 @@
+"""Vectorized parametric sweeps over pole barn geometry and material inputs."""
+
+from pathlib import Path
+from typing import Dict, List, Mapping, Sequence, Tuple
+import numpy as np
+import pandas as pd
+from .model import PoleBarnInputs, GeometryInputs, PricingInputs
+from .pricing import PriceBook, get_markup_rates, resolve_line_pricing
+
+
+# Numeric fields that can be swept (the categorical ones stay fixed from base inputs)
+SWEEPABLE_GEOMETRY_FIELDS = (
+    "length",
+    "width",
+    "eave_height",
+    "roof_pitch",
+    "overhang_front",
+    "overhang_rear",
+    "overhang_sides",
+    "door_count",
+    "door_width",
+    "door_height",
+    "window_count",
+    "window_width",
+    "window_height",
+    "pole_spacing_length",
+    "overhead_door_count",
+)
+SWEEPABLE_MATERIAL_FIELDS = (
+    "truss_spacing",
+    "purlin_spacing",
+    "girt_spacing",
+    "slab_thickness_in",
+)
+
+# Standard opening sizes used by assemblies._calculate_door_window_assemblies()
+_STANDARD_DOOR_WIDTH_FT = 3.0
+_STANDARD_DOOR_HEIGHT_FT = 7.0
+_STANDARD_WINDOW_WIDTH_FT = 3.0
+_STANDARD_WINDOW_HEIGHT_FT = 3.0
+
+
+def build_sweep_grid(
+    base_inputs: PoleBarnInputs,
+    ranges: Mapping[str, Sequence[float]],
+) -> Dict[str, np.ndarray]:
+    """
+    Expand swept field ranges into flat per-configuration arrays.
+    
+    Every sweepable field gets an array with one entry per configuration
+    (the full Cartesian product of the given ranges). Fields not in ranges are
+    broadcast from base_inputs.
+    
+    Args:
+        base_inputs: Inputs supplying every non-swept value
+        ranges: Mapping of field name -> values to sweep (e.g. {"length": range(24, 121, 4)})
+    
+    Returns:
+        Dictionary mapping field name -> 1-D array of length n_configurations
+    
+    Raises:
+        ValueError: If a field is not sweepable or has no values
+    """
+    sweepable = SWEEPABLE_GEOMETRY_FIELDS + SWEEPABLE_MATERIAL_FIELDS
+    for name, values in ranges.items():
+        if name not in sweepable:
+            raise ValueError(f"Field '{name}' cannot be swept. Sweepable fields: {', '.join(sweepable)}")
+        if len(values) == 0:
+            raise ValueError(f"Sweep range for '{name}' is empty")
+    
+    swept_names = list(ranges.keys())
+    axes = [np.asarray(ranges[name], dtype=float) for name in swept_names]
+    if axes:
+        mesh = np.meshgrid(*axes, indexing="ij")
+        n = mesh[0].size
+    else:
+        mesh = []
+        n = 1
+    
+    grid: Dict[str, np.ndarray] = {}
+    for name, values in zip(swept_names, mesh):
+        grid[name] = values.ravel()
+    
+    for name in SWEEPABLE_GEOMETRY_FIELDS:
+        if name not in grid:
+            grid[name] = np.full(n, float(getattr(base_inputs.geometry, name)))
+    for name in SWEEPABLE_MATERIAL_FIELDS:
+        if name not in grid:
+            value = getattr(base_inputs.materials, name)
+            grid[name] = np.full(n, np.nan if value is None else float(value))
+    
+    return grid
+
+
+def sweep_geometry(
+    grid: Mapping[str, np.ndarray],
+    geometry_inputs: GeometryInputs,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized equivalent of geometry.build_geometry_model() over a sweep grid.
+    
+    Args:
+        grid: Per-configuration field arrays from build_sweep_grid()
+        geometry_inputs: Base geometry inputs (for peak_height)
+    
+    Returns:
+        Dictionary of GeometryModel field name -> array
+    """
+    L = grid["length"]
+    W = grid["width"]
+    H = grid["eave_height"]
+    bay_spacing = grid["pole_spacing_length"]
+    oh_side = grid["overhang_sides"]
+    oh_front = grid["overhang_front"]
+    oh_rear = grid["overhang_rear"]
+    
+    # Calculate bays and frames
+    with np.errstate(divide="ignore", invalid="ignore"):
+        num_bays = np.where(bay_spacing > 0, np.ceil(L / bay_spacing), 0).astype(np.int64)
+    num_frame_lines = num_bays + 1
+    
+    footprint_area_sqft = L * W
+    sidewall_area_sqft = 2 * L * H
+    endwall_area_sqft = 2 * W * H
+    total_wall_area_sqft = sidewall_area_sqft + endwall_area_sqft
+    
+    # Roof area with pitch and overhangs
+    L_eff = L + oh_front + oh_rear
+    W_eff = W + 2 * oh_side
+    slope_factor = np.sqrt(1 + grid["roof_pitch"] ** 2)
+    roof_area_sqft = (L_eff * W_eff) * slope_factor
+    
+    building_volume_cuft = footprint_area_sqft * H
+    
+    if geometry_inputs.peak_height is None:
+        peak_height_ft = H + (W / 2.0) * grid["roof_pitch"]
+    else:
+        peak_height_ft = np.full(L.shape, float(geometry_inputs.peak_height))
+    
+    return {
+        "overall_length_ft": L,
+        "overall_width_ft": W,
+        "eave_height_ft": H,
+        "peak_height_ft": peak_height_ft,
+        "sidewall_overhang_ft": oh_side,
+        "endwall_overhang_front_ft": oh_front,
+        "endwall_overhang_rear_ft": oh_rear,
+        "bay_spacing_ft": bay_spacing,
+        "num_bays": num_bays,
+        "num_frame_lines": num_frame_lines,
+        "footprint_area_sqft": footprint_area_sqft,
+        "sidewall_area_sqft": sidewall_area_sqft,
+        "endwall_area_sqft": endwall_area_sqft,
+        "total_wall_area_sqft": total_wall_area_sqft,
+        "roof_area_sqft": roof_area_sqft,
+        "building_volume_cuft": building_volume_cuft,
+    }
+
+
+def sweep_material_quantities(
+    grid: Mapping[str, np.ndarray],
+    geom: Mapping[str, np.ndarray],
+    base_inputs: PoleBarnInputs,
+) -> List[Tuple[str, np.ndarray]]:
+    """
+    Vectorized equivalent of assemblies.calculate_material_quantities().
+    
+    Assemblies that the scalar path would omit for a configuration (e.g. door
+    framing when door_count is 0) get a quantity of 0 there.
+    
+    Args:
+        grid: Per-configuration field arrays from build_sweep_grid()
+        geom: Geometry arrays from sweep_geometry()
+        base_inputs: Base inputs supplying categorical material choices
+    
+    Returns:
+        List of (assembly_name, quantity array) in the scalar path's item order
+    """
+    materials = base_inputs.materials
+    geometry_inputs = base_inputs.geometry
+    L = geom["overall_length_ft"]
+    W = geom["overall_width_ft"]
+    H = geom["eave_height_ft"]
+    zeros = np.zeros(L.shape)
+    quantities: List[Tuple[str, np.ndarray]] = []
+    
+    # Posts: one per frame line on each sidewall
+    quantities.append(("posts", geom["num_frame_lines"] * 2))
+    
+    # Trusses: by truss spacing if it differs from bay spacing, else one per frame line
+    truss_spacing = grid["truss_spacing"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        by_spacing = np.ceil(L / truss_spacing) + 1
+    truss_count = np.where(
+        np.abs(truss_spacing - geom["bay_spacing_ft"]) > 0.5,
+        by_spacing,
+        geom["num_frame_lines"],
+    ).astype(np.int64)
+    quantities.append(("trusses", truss_count))
+    
+    # Girts
+    girt_spacing = grid["girt_spacing"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        num_girt_rows = np.where(girt_spacing > 0, np.ceil(H / girt_spacing), 0)
+    quantities.append(("sidewall_girts", num_girt_rows * L * 2))
+    quantities.append(("endwall_girts", num_girt_rows * W * 2))
+    
+    # Roof purlins
+    purlin_spacing = grid["purlin_spacing"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        num_purlin_rows = np.where(purlin_spacing > 0, np.ceil((W / 2) / purlin_spacing), 0)
+    effective_length = L + geom["endwall_overhang_front_ft"] + geom["endwall_overhang_rear_ft"]
+    quantities.append(("roof_purlins", (num_purlin_rows * effective_length) * 2))
+    
+    # Roof and wall panels
+    if materials.exterior_finish_type == "metal_26ga":
+        roof_name, sidewall_name, endwall_name = (
+            "roof_panels_26ga", "sidewall_panels_26ga", "endwall_panels_26ga"
+        )
+    else:
+        roof_name, sidewall_name, endwall_name = "roof_panels", "sidewall_panels", "endwall_panels"
+    quantities.append((roof_name, geom["roof_area_sqft"]))
+    quantities.append((sidewall_name, geom["sidewall_area_sqft"]))
+    quantities.append((endwall_name, geom["endwall_area_sqft"]))
+    
+    # Trim
+    quantities.append(("eave_trim", 2 * L))
+    quantities.append(("rake_trim", 2 * W))
+    quantities.append(("base_trim", 2 * (L + W)))
+    quantities.append(("corner_trim", 4 * H))
+    
+    # Door and window framing/trim (standard opening sizes)
+    door_count = grid["door_count"]
+    window_count = grid["window_count"]
+    door_framing_lf = (
+        door_count * (_STANDARD_DOOR_WIDTH_FT + 0.5)
+        + door_count * 2 * H
+        + door_count * 2 * _STANDARD_DOOR_HEIGHT_FT
+    )
+    quantities.append(("door_framing", np.where(door_count > 0, door_framing_lf, zeros)))
+    quantities.append((
+        "door_trim",
+        np.where(door_count > 0, door_count * (_STANDARD_DOOR_WIDTH_FT + 2 * _STANDARD_DOOR_HEIGHT_FT), zeros),
+    ))
+    window_framing_lf = (
+        window_count * (_STANDARD_WINDOW_WIDTH_FT + 0.5)
+        + window_count * 2 * H
+        + window_count * 2 * _STANDARD_WINDOW_HEIGHT_FT
+    )
+    quantities.append(("window_framing", np.where(window_count > 0, window_framing_lf, zeros)))
+    quantities.append((
+        "window_trim",
+        np.where(
+            window_count > 0,
+            window_count * (
+                _STANDARD_WINDOW_WIDTH_FT + _STANDARD_WINDOW_WIDTH_FT + 2 * _STANDARD_WINDOW_HEIGHT_FT
+            ),
+            zeros,
+        ),
+    ))
+    
+    # Insulation
+    insulation_names = {
+        "rock_wool": "_rockwool",
+        "rigid_board": "_rigid",
+        "spray_foam": "_sprayfoam",
+    }
+    if materials.wall_insulation_type and materials.wall_insulation_type != "none":
+        suffix = insulation_names.get(materials.wall_insulation_type, "")
+        quantities.append((f"wall_insulation{suffix}", geom["total_wall_area_sqft"]))
+    if materials.roof_insulation_type and materials.roof_insulation_type != "none":
+        suffix = insulation_names.get(materials.roof_insulation_type, "")
+        quantities.append((f"roof_insulation{suffix}", geom["roof_area_sqft"]))
+    
+    # Sheathing
+    if materials.wall_sheathing_type and materials.wall_sheathing_type != "none":
+        quantities.append((f"wall_sheathing_{materials.wall_sheathing_type}", geom["total_wall_area_sqft"]))
+    if materials.roof_sheathing_type and materials.roof_sheathing_type != "none":
+        quantities.append((f"roof_sheathing_{materials.roof_sheathing_type}", geom["roof_area_sqft"]))
+    
+    # Concrete slab
+    if materials.floor_type == "slab":
+        footprint_sqft = geom["footprint_area_sqft"]
+        thickness_in = np.where(np.isnan(grid["slab_thickness_in"]), 4.0, grid["slab_thickness_in"])
+        thickness_ft = np.where(thickness_in == 0, 4.0, thickness_in) / 12.0
+        quantities.append(("slab_concrete", (footprint_sqft * thickness_ft) / 27.0))
+        if materials.slab_reinforcement == "mesh":
+            quantities.append(("slab_mesh", np.ceil(footprint_sqft / 50.0)))
+        elif materials.slab_reinforcement == "rebar":
+            perimeter_ft = 2 * (L + W)
+            interior_lf = (L / 2.0) * (W / 2.0) * 2
+            quantities.append(("slab_rebar", perimeter_ft + interior_lf))
+    
+    # Overhead doors
+    if geometry_inputs.overhead_door_type != "none":
+        overhead_count = grid["overhead_door_count"]
+        quantities.append(("overhead_doors", np.where(overhead_count > 0, overhead_count, zeros)))
+    
+    # J-channel (eave tops + door/window openings), in inches
+    if materials.exterior_finish_type in ["metal_29ga", "metal_26ga"]:
+        eave_in = np.where(grid["overhang_sides"] > 0, 2 * L * 12.0, zeros)
+        door_leg = grid["door_height"] * 12.0 + 2.0
+        door_head = grid["door_width"] * 12.0 + 2.0
+        window_vertical = grid["window_height"] * 12.0 + 2.0
+        window_horizontal = grid["window_width"] * 12.0 + 2.0
+        openings_in = (
+            door_count * (2 * door_leg + door_head)
+            + window_count * (2 * window_vertical + 2 * window_horizontal)
+        )
+        quantities.append(("j_channel", eave_in + openings_in))
+    
+    return quantities
+
+
+def sweep_pricing(
+    quantities: Sequence[Tuple[str, np.ndarray]],
+    pricing_inputs: PricingInputs,
+    price_book: PriceBook,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized equivalent of the summary from pricing.price_material_takeoff().
+    
+    Args:
+        quantities: (assembly_name, quantity array) pairs from sweep_material_quantities()
+        pricing_inputs: Pricing parameters (markup, tax rate, labor rate)
+        price_book: Compiled price book
+    
+    Returns:
+        Dictionary of PricingSummary field name -> array
+    """
+    rates = get_markup_rates(pricing_inputs)
+    labor_rate = pricing_inputs.labor_rate
+    n = len(quantities[0][1]) if quantities else 1
+    
+    material_subtotal = np.zeros(n)
+    labor_subtotal = np.zeros(n)
+    markup_total = np.zeros(n)
+    
+    for name, quantity in quantities:
+        line = resolve_line_pricing(name, price_book)
+        effective_qty = quantity * line["waste_factor"]
+        material_cost = effective_qty * line["unit_price"]
+        labor_cost = (effective_qty * line["labor_per_unit"]) * labor_rate
+        
+        markup_pct = line["markup_override"]
+        if markup_pct is None:
+            markup_pct = rates["material_markup_pct"]
+        # No subcontractor items yet (see price_material_takeoff)
+        markup_amount = (
+            material_cost * (markup_pct / 100.0)
+            + labor_cost * (rates["labor_markup_pct"] / 100.0)
+        )
+        
+        material_subtotal = material_subtotal + material_cost
+        labor_subtotal = labor_subtotal + labor_cost
+        markup_total = markup_total + markup_amount
+    
+    overhead_total = (material_subtotal + labor_subtotal) * (rates["overhead_pct"] / 100.0)
+    tax_total = (material_subtotal + markup_total) * (rates["tax_rate"] / 100.0)
+    grand_total = material_subtotal + labor_subtotal + markup_total + overhead_total + tax_total
+    
+    # Fixed per-project costs and MEP allowances
+    for cost in (pricing_inputs.delivery_cost, pricing_inputs.permit_cost, pricing_inputs.site_prep_cost):
+        if cost:
+            grand_total = grand_total + cost
+    mep_total = 0.0
+    for include, allowance in (
+        (pricing_inputs.include_electrical, pricing_inputs.electrical_allowance),
+        (pricing_inputs.include_plumbing, pricing_inputs.plumbing_allowance),
+        (pricing_inputs.include_mechanical, pricing_inputs.mechanical_allowance),
+    ):
+        if include and allowance > 0:
+            grand_total = grand_total + allowance
+            mep_total += allowance
+    material_subtotal = material_subtotal + mep_total
+    
+    return {
+        "material_subtotal": material_subtotal,
+        "labor_subtotal": labor_subtotal,
+        "markup_total": markup_total,
+        "overhead_total": overhead_total,
+        "tax_total": tax_total,
+        "grand_total": grand_total,
+    }
+
+
+def run_sweep(
+    base_inputs: PoleBarnInputs,
+    ranges: Mapping[str, Sequence[float]],
+    price_book: PriceBook,
+) -> pd.DataFrame:
+    """
+    Compute geometry, key member counts and priced totals over a parameter grid.
+    
+    Matches PoleBarnCalculator.calculate() geometry, assembly quantities and
+    PricingSummary for each configuration, without building per-configuration
+    dataclasses.
+    
+    Args:
+        base_inputs: Inputs supplying every non-swept value
+        ranges: Mapping of field name -> values to sweep, e.g.
+            {"length": range(24, 121), "width": range(24, 81), "eave_height": [10, 12, 14]}
+        price_book: Compiled price book (PoleBarnCalculator.price_book)
+    
+    Returns:
+        Tidy DataFrame with one row per configuration: swept inputs, geometry,
+        post/truss/girt/purlin quantities and pricing totals
+    """
+    grid = build_sweep_grid(base_inputs, ranges)
+    geom = sweep_geometry(grid, base_inputs.geometry)
+    quantities = sweep_material_quantities(grid, geom, base_inputs)
+    totals = sweep_pricing(quantities, base_inputs.pricing, price_book)
+    by_name = dict(quantities)
+    
+    columns: Dict[str, np.ndarray] = {}
+    for name in ranges.keys():
+        columns[name] = grid[name]
+    for name in (
+        "peak_height_ft",
+        "num_bays",
+        "num_frame_lines",
+        "footprint_area_sqft",
+        "total_wall_area_sqft",
+        "roof_area_sqft",
+    ):
+        columns[name] = geom[name]
+    columns["post_count"] = by_name["posts"]
+    columns["truss_count"] = by_name["trusses"]
+    columns["girt_lf"] = by_name["sidewall_girts"] + by_name["endwall_girts"]
+    columns["purlin_lf"] = by_name["roof_purlins"]
+    columns.update(totals)
+    
+    return pd.DataFrame(columns)
+
+
+def export_sweep(df: pd.DataFrame, path: Path) -> None:
+    """
+    Write sweep results to Parquet (.parquet) or CSV (any other suffix).
+    
+    Parquet output requires pyarrow or fastparquet to be installed.
+    
+    Args:
+        df: DataFrame from run_sweep()
+        path: Output file path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix.lower() == ".parquet":
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
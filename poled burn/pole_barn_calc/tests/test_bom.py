@@ -0,0 +1,78 @@
+"""Tests for BOM cutting-stock packing."""
+
+import pytest
+from systems.pole_barn import bom
+from systems.pole_barn import cutting
+
+
+SEGMENTS = [84.0, 84.0, 36.0, 36.0, 36.0, 60.0, 60.0, 100.0, 20.0, 20.0, 44.0]
+
+
+def test_pack_segments_into_sticks_legacy_count():
+    """Legacy counter is unchanged (oversized segments take one stick each)."""
+    assert bom.pack_segments_into_sticks([], 120.0) == 0
+    assert bom.pack_segments_into_sticks([60.0, 60.0, 60.0], 120.0) == 2
+    assert bom.pack_segments_into_sticks([300.0, 50.0], 120.0) == 2
+    assert bom.pack_segments_into_sticks(SEGMENTS, 120.0) == cutting.pack_first_fit(SEGMENTS, 120.0).stick_count
+
+
+@pytest.mark.parametrize("mode", ["first_fit", "best_fit", "optimal"])
+def test_cut_list_covers_segments(mode):
+    """Every stick fits its cuts and the cut list accounts for all segments."""
+    plan = cutting.plan_segment_cuts(SEGMENTS, 120.0, mode=mode)
+    
+    assert sorted(cut for cuts in plan.sticks for cut in cuts) == sorted(SEGMENTS)
+    for cuts in plan.sticks:
+        assert sum(cuts) <= 120.0 + 1e-6
+    assert plan.scrap_in == pytest.approx(plan.stick_count * 120.0 - sum(SEGMENTS))
+    assert 0.0 <= plan.scrap_pct < 100.0
+
+
+def test_modes_never_use_more_sticks():
+    """best_fit never beats optimal, and optimal reaches the length lower bound here."""
+    segments = [70.0, 50.0, 70.0, 50.0, 65.0, 55.0, 65.0, 55.0]
+    first_fit = cutting.plan_segment_cuts(segments, 120.0, mode="first_fit")
+    best_fit = cutting.plan_segment_cuts(segments, 120.0, mode="best_fit")
+    optimal = cutting.plan_segment_cuts(segments, 120.0, mode="optimal")
+    
+    assert best_fit.stick_count <= first_fit.stick_count
+    assert optimal.stick_count <= best_fit.stick_count
+    assert optimal.stick_count == 4
+
+
+def test_oversized_runs_are_spliced():
+    """A continuous run longer than a stick is counted in full sticks."""
+    plan = cutting.plan_segment_cuts([600.0, 30.0], 120.0, mode="best_fit")
+    
+    assert plan.stick_count == 6
+    assert plan.used_in == pytest.approx(630.0)
+
+
+def test_plan_lumber_cuts_reduces_waste():
+    """Waste-minimising lumber plan covers the run with no more offcut than the greedy split."""
+    legacy = cutting.plan_lumber_cuts(100.0, mode="first_fit")
+    improved = cutting.plan_lumber_cuts(100.0, mode="best_fit")
+    
+    assert legacy == {16.0: legacy[16.0]} and legacy[16.0].stick_count == 7
+    purchased = sum(plan.stick_count * plan.stock_length_in for plan in improved.values())
+    used = sum(plan.used_in for plan in improved.values())
+    assert used == pytest.approx(100.0 * 12.0)
+    assert purchased == pytest.approx(100.0 * 12.0)
+    assert cutting.plan_lumber_cuts(0.0) == {}
+
+
+def test_unknown_cutting_mode_raises():
+    """Unknown modes are rejected."""
+    with pytest.raises(ValueError, match="Unknown cutting mode"):
+        cutting.plan_segment_cuts(SEGMENTS, mode="random")
+    with pytest.raises(ValueError, match="Unknown cutting mode"):
+        cutting.plan_lumber_cuts(50.0, mode="random")
+
+
+def test_optimal_handles_large_takeoffs():
+    """The exact search is not recursive, so >1000 segments fall back instead of crashing."""
+    segments = [48.0, 40.0, 36.0, 30.0, 26.0] * 240
+    plan = cutting.plan_segment_cuts(segments, 120.0, mode="optimal", time_budget_s=0.2)
+    
+    assert sorted(cut for cuts in plan.sticks for cut in cuts) == sorted(segments)
+    assert plan.stick_count <= cutting.pack_best_fit(segments, 120.0).stick_count
@@ -0,0 +1,70 @@
+"""Tests for cached config loading."""
+
+import shutil
+import pytest
+from pathlib import Path
+from systems.pole_barn import config_cache
+from systems.pole_barn.calculator import PoleBarnCalculator
+
+
+CONFIG_DIR = Path(__file__).parent.parent / "config"
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Copy of the example config in a scratch directory, with a clean registry."""
+    for path in CONFIG_DIR.glob("*.csv"):
+        shutil.copy(path, tmp_path / path.name)
+    config_cache.clear_config_registry()
+    yield tmp_path
+    config_cache.clear_config_registry()
+
+
+def test_snapshot_matches_csv_parse(config_dir):
+    """Cached snapshot holds the same catalogs as parsing the CSVs directly."""
+    snapshot = config_cache.load_config_snapshot(config_dir)
+    parts_path, pricing_path, assemblies_path = config_cache.resolve_config_paths(config_dir)
+    
+    assert snapshot.parts_df.equals(config_cache.pricing.load_parts(parts_path))
+    assert snapshot.pricing_df.equals(config_cache.pricing.load_pricing(pricing_path))
+    assert snapshot.assemblies_df.equals(config_cache.pricing.load_assemblies(assemblies_path))
+    assert list((config_dir / config_cache.CACHE_DIR_NAME).glob("config-*.pkl"))
+
+
+def test_registry_shared_between_calculators(config_dir):
+    """Repeat calculators reuse the loaded catalog."""
+    first = PoleBarnCalculator(config_dir=config_dir)
+    first.load_config()
+    second = PoleBarnCalculator(config_dir=config_dir)
+    second.load_config()
+    
+    assert second.price_book is first.price_book
+    assert second.parts_df is first.parts_df
+
+
+def test_disk_snapshot_reused_across_processes(config_dir, monkeypatch):
+    """A fresh registry loads the binary snapshot instead of re-parsing CSVs."""
+    config_cache.load_config_snapshot(config_dir)
+    config_cache.clear_config_registry()
+    
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("CSV parsed despite a valid snapshot")
+    
+    monkeypatch.setattr(config_cache, "_parse_snapshot", fail_parse)
+    snapshot = config_cache.load_config_snapshot(config_dir)
+    assert len(snapshot.parts_df) > 0
+
+
+def test_edited_csv_invalidates_snapshot(config_dir):
+    """Changing a CSV produces a new snapshot with the new contents."""
+    before = config_cache.load_config_snapshot(config_dir)
+    parts_path = config_cache.resolve_config_paths(config_dir)[0]
+    text = parts_path.read_text()
+    parts_path.write_text(text.rstrip("\n") + "\nTEST_PART_X,Test Part X,misc,ea,added in test\n")
+    
+    after = config_cache.load_config_snapshot(config_dir)
+    
+    assert after.fingerprint != before.fingerprint
+    assert "TEST_PART_X" in after.price_book.part_rows
+    assert "TEST_PART_X" not in before.price_book.part_rows
+    assert len(list((config_dir / config_cache.CACHE_DIR_NAME).glob("config-*.pkl"))) == 1
@@ -443,3 +443,163 @@ def test_calculator_summary():
     assert summary["costs"]["grand_total"] > 0
     assert summary["project_name"] == "Summary Test"
 
+
+
+def _make_batch_inputs(length: float, width: float, door_count: int) -> PoleBarnInputs:
+    """Build a complete PoleBarnInputs for batch calculation tests."""
+    return PoleBarnInputs(
+        geometry=GeometryInputs(
+            length=length,
+            width=width,
+            eave_height=12.0,
+            roof_pitch=4.0 / 12.0,
+            overhang_front=1.0,
+            overhang_rear=1.0,
+            overhang_sides=1.0,
+            door_count=door_count,
+            door_width=3.0,
+            door_height=6.67,
+            window_count=2,
+            window_width=3.0,
+            window_height=3.0,
+            pole_spacing_length=10.0,
+            pole_spacing_width=12.0,
+            pole_diameter=6.0,
+            pole_depth=4.0,
+        ),
+        materials=MaterialInputs(
+            roof_material_type="metal",
+            wall_material_type="metal",
+            truss_type="standard",
+            truss_spacing=10.0,
+            purlin_spacing=2.0,
+            girt_spacing=2.0,
+            foundation_type="concrete_pad",
+        ),
+        pricing=PricingInputs(
+            material_markup=1.15,
+            tax_rate=0.08,
+            labor_rate=50.0,
+        ),
+        assemblies=AssemblyInputs(
+            assembly_method="standard",
+            fastening_type="screws",
+            weather_sealing=True,
+        ),
+        project_name=f"Batch {length:.0f}x{width:.0f}",
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_calculate_many_matches_calculate(max_workers):
+    """Test that calculate_many yields the same results, in order, as calculate."""
+    inputs_list = [
+        _make_batch_inputs(30.0, 24.0, 1),
+        _make_batch_inputs(60.0, 40.0, 2),
+        _make_batch_inputs(80.0, 50.0, 0),
+    ]
+    
+    calculator = PoleBarnCalculator()
+    expected = [calculator.calculate(inputs) for inputs in inputs_list]
+    
+    timings = {}
+    results = list(calculator.calculate_many(inputs_list, max_workers=max_workers, timings=timings))
+    
+    assert results == expected
+    assert set(timings) == {"geometry", "assemblies", "pricing", "bom"}
+    assert all(seconds >= 0.0 for seconds in timings.values())
+
+
+def test_incremental_recalculation_reuses_unaffected_stages():
+    """Test that editing one input only recomputes the stages that read it."""
+    from dataclasses import replace
+    
+    base = _make_batch_inputs(60.0, 40.0, 1)
+    calculator = PoleBarnCalculator()
+    calculator.calculate(base)
+    
+    # Pricing-only edit: geometry, quantities and BOM come from the caches
+    taxed = replace(base, pricing=replace(base.pricing, tax_rate=0.10))
+    result = calculator.calculate(taxed)
+    stats = calculator.get_stage_cache_stats()
+    assert stats["geometry"]["hits"] == 1
+    assert stats["assemblies"]["hits"] == 1
+    assert stats["bom"]["hits"] == 1
+    assert stats["pricing"]["misses"] == 2
+    assert result == PoleBarnCalculator(stage_cache_size=0).calculate(taxed)
+    
+    # Door edit: geometry reused, quantities/pricing/BOM recomputed
+    doors = replace(taxed, geometry=replace(taxed.geometry, door_count=3))
+    result = calculator.calculate(doors)
+    stats = calculator.get_stage_cache_stats()
+    assert stats["geometry"]["hits"] == 2
+    assert stats["assemblies"]["misses"] == 2
+    assert stats["pricing"]["misses"] == 3
+    assert stats["bom"]["misses"] == 2
+    assert result == PoleBarnCalculator(stage_cache_size=0).calculate(doors)
+    
+    # Reverting hits every stage
+    assert calculator.calculate(base) == PoleBarnCalculator(stage_cache_size=0).calculate(base)
+    assert calculator.get_stage_cache_stats()["bom"]["hits"] == 2
+
+
+def test_sweep_matches_calculate():
+    """Test that the vectorized sweep matches calculate() cell by cell."""
+    from dataclasses import replace
+    from systems.pole_barn import sweep
+    
+    base = _make_batch_inputs(40.0, 30.0, 1)
+    base = replace(
+        base,
+        materials=replace(
+            base.materials,
+            wall_insulation_type="rock_wool",
+            roof_sheathing_type="osb",
+            floor_type="slab",
+            slab_reinforcement="mesh",
+        ),
+        geometry=replace(base.geometry, overhead_door_type="steel_rollup"),
+    )
+    ranges = {
+        "length": [24.0, 37.0, 60.0],
+        "width": [24.0, 50.0],
+        "eave_height": [10.0, 14.0],
+        "door_count": [0, 2],
+        "overhead_door_count": [0, 1],
+    }
+    
+    calculator = PoleBarnCalculator()
+    calculator.load_config()
+    df = sweep.run_sweep(base, ranges, calculator.price_book)
+    
+    assert len(df) == 3 * 2 * 2 * 2 * 2
+    
+    for row in df.itertuples(index=False):
+        inputs = replace(
+            base,
+            geometry=replace(
+                base.geometry,
+                length=row.length,
+                width=row.width,
+                eave_height=row.eave_height,
+                door_count=int(row.door_count),
+                overhead_door_count=int(row.overhead_door_count),
+            ),
+        )
+        geom_model, _, _, summary, _ = calculator.calculate(inputs)
+        
+        assert row.num_frame_lines == geom_model.num_frame_lines
+        assert row.roof_area_sqft == pytest.approx(geom_model.roof_area_sqft)
+        assert row.post_count == geom_model.num_frame_lines * 2
+        assert row.material_subtotal == pytest.approx(summary.material_subtotal)
+        assert row.labor_subtotal == pytest.approx(summary.labor_subtotal)
+        assert row.markup_total == pytest.approx(summary.markup_total)
+        assert row.grand_total == pytest.approx(summary.grand_total)
+
+
+def test_sweep_rejects_unknown_field():
+    """Test that sweeping a non-numeric field raises ValueError."""
+    from systems.pole_barn import sweep
+    
+    with pytest.raises(ValueError):
+        sweep.build_sweep_grid(_make_batch_inputs(40.0, 30.0, 1), {"roof_style": ["gable"]})
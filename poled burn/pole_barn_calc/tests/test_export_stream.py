@@ -0,0 +1,73 @@
+"""Tests for streaming BOM exporters."""
+
+import csv
+import json
+from openpyxl import load_workbook
+from systems.pole_barn.model import PartQuantity, PricedLineItem
+from systems.pole_barn import export_stream
+
+
+def _bom_items(prefix: str = "P", count: int = 3):
+    """Generator of BOM items across two export categories."""
+    for i in range(count):
+        yield PartQuantity(
+            part_id=f"{prefix}{i}",
+            part_name=f"Part {i}",
+            category="framing" if i % 2 == 0 else "roof",
+            export_category="Framing" if i % 2 == 0 else "Metal",
+            unit="ea",
+            qty=float(i + 1),
+            unit_price=10.0,
+            ext_price=10.0 * (i + 1),
+            length_in=144.0 if i == 0 else None,
+        )
+
+
+def test_stream_csv_single_and_multi_project(tmp_path):
+    """CSV streaming writes one row per item with the flat CSV columns."""
+    path = tmp_path / "bom.csv"
+    assert export_stream.export_bom_stream_to_csv(_bom_items(), path, project_name="Barn A") == 3
+    
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["part_id"] for row in rows] == ["P0", "P1", "P2"]
+    assert rows[0]["length_in"] == "144.0" and rows[1]["length_in"] == ""
+    assert {row["project_name"] for row in rows} == {"Barn A"}
+    
+    combined = tmp_path / "batch.csv"
+    projects = ((name, _bom_items(name)) for name in ["A", "B"])
+    assert export_stream.export_projects_stream_to_csv(projects, combined) == 6
+    with open(combined, newline="", encoding="utf-8") as f:
+        assert [row["project_name"] for row in csv.DictReader(f)] == ["A"] * 3 + ["B"] * 3
+
+
+def test_stream_excel_tabs_and_summary(tmp_path):
+    """Write-only workbook has Summary first, category tabs and per-project totals."""
+    path = tmp_path / "batch.xlsx"
+    projects = ((name, _bom_items(name)) for name in ["A", "B"])
+    assert export_stream.export_projects_stream_to_excel(projects, path) == 6
+    
+    wb = load_workbook(path)
+    assert wb.sheetnames == ["Summary", "Framing", "Metal"]
+    framing = list(wb["Framing"].iter_rows(values_only=True))
+    assert framing[0][0] == "Project"
+    assert [row[1] for row in framing[1:]] == ["A0", "A2", "B0", "B2"]
+    summary = list(wb["Summary"].iter_rows(values_only=True))
+    assert summary[-1][1:] == ("GRAND TOTAL", 120.0)
+    
+    single = tmp_path / "single.xlsx"
+    export_stream.export_bom_stream_to_excel(_bom_items(), single)
+    assert load_workbook(single)["Summary"]["B3"].value == 20.0
+
+
+def test_stream_jsonl_records(tmp_path):
+    """JSON Lines output tags each record with project and record type."""
+    path = tmp_path / "records.jsonl"
+    priced = PricedLineItem(name="posts", description="Posts", category="framing", quantity=4.0, unit="ea")
+    projects = [("A", _bom_items()), ("B", iter([priced]))]
+    
+    assert export_stream.export_projects_stream_to_jsonl(projects, path) == 4
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [line["record_type"] for line in lines] == ["bom_item"] * 3 + ["priced_item"]
+    assert lines[0]["project_name"] == "A" and lines[0]["part_id"] == "P0"
+    assert lines[3]["name"] == "posts"
@@ -397,3 +397,64 @@ def test_assemblies_csv_schema():
     labor_values = assemblies_df["labor_per_unit"].tolist()
     assert all(0.0 <= lv <= 1.0 for lv in labor_values)  # Labor should be reasonable hours
 
+
+
+def test_price_book_matches_dataframe_lookups():
+    """Test that compiled PriceBook lookups match the DataFrame scan helpers."""
+    parts_df = pricing.load_parts()
+    pricing_df = pricing.load_pricing()
+    assemblies_df = pricing.load_assemblies()
+    
+    price_book = pricing.compile_price_book(parts_df, pricing_df, assemblies_df)
+    
+    for part_id in parts_df["part_id"].tolist() + ["NONEXISTENT"]:
+        assert price_book.find_part_record(part_id) == pricing.find_part_record(parts_df, part_id)
+        assert price_book.find_unit_price(part_id) == pricing.find_unit_price(pricing_df, part_id)
+    
+    for name in assemblies_df["assembly_name"].tolist() + ["NONEXISTENT"]:
+        assert price_book.find_assembly_mapping(name) == pricing.find_assembly_mapping(
+            assemblies_df, name
+        )
+    
+    assert price_book.get_assembly_rows("NONEXISTENT") == []
+    assert price_book.get_part_row("NONEXISTENT") is None
+
+
+def test_price_material_takeoff_with_price_book():
+    """Test that passing a precompiled PriceBook gives the same pricing."""
+    takeoff = MaterialTakeoff(items=[
+        AssemblyQuantity(
+            name="posts",
+            description="Structural posts",
+            category="framing",
+            quantity=10.0,
+            unit="ea",
+        ),
+        AssemblyQuantity(
+            name="eave_trim",
+            description="Eave trim",
+            category="trim",
+            quantity=60.0,
+            unit="lf",
+        ),
+    ])
+    
+    pricing_inputs = PricingInputs(
+        material_markup=1.15,
+        tax_rate=0.08,
+        labor_rate=50.0,
+    )
+    
+    parts_df = pricing.load_parts()
+    pricing_df = pricing.load_pricing()
+    assemblies_df = pricing.load_assemblies()
+    price_book = pricing.compile_price_book(parts_df, pricing_df, assemblies_df)
+    
+    expected = pricing.price_material_takeoff(
+        takeoff, pricing_inputs, parts_df, pricing_df, assemblies_df
+    )
+    actual = pricing.price_material_takeoff(
+        takeoff, pricing_inputs, parts_df, pricing_df, assemblies_df, price_book=price_book
+    )
+    
+    assert actual == expected
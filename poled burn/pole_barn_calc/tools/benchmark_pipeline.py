@@ -0,0 +1,403 @@
+"""Benchmark the pole barn pipeline stages and exporters on synthetic buildings.
+
+Usage:
+    python tools/benchmark_pipeline.py --output bench.json
+    python tools/benchmark_pipeline.py --compare bench.json --threshold 0.25
+
+Results are JSON so runs from different commits can be compared; --compare
+exits with status 1 when any stage's median time or peak memory regresses
+past the threshold.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from systems.pole_barn import geometry, assemblies, pricing, bom
+from systems.pole_barn.calculator import PoleBarnCalculator
+from systems.pole_barn.model import (
+    PoleBarnInputs,
+    GeometryInputs,
+    MaterialInputs,
+    PricingInputs,
+    AssemblyInputs,
+    MaterialTakeoff,
+)
+from systems.pole_barn.export_excel import export_bom_to_excel
+from systems.pole_barn.export_json import export_project_to_json
+from systems.pole_barn.export_csv import export_bom_to_flat_csv
+
+
+RESULTS_FORMAT_VERSION = 1
+
+# Synthetic building sizes: name -> (length_ft, width_ft, eave_ft, doors, windows, overhead_doors)
+BUILDING_SIZES = {
+    "tiny": (20.0, 16.0, 8.0, 1, 0, 0),
+    "small": (30.0, 24.0, 10.0, 1, 2, 1),
+    "medium": (60.0, 40.0, 12.0, 2, 4, 2),
+    "large": (120.0, 60.0, 16.0, 4, 10, 4),
+    "warehouse": (300.0, 100.0, 20.0, 8, 24, 10),
+}
+
+# Timed stages, in pipeline order
+STAGES = (
+    "build_geometry_model",
+    "calculate_material_quantities",
+    "price_material_takeoff",
+    "expand_to_parts",
+    "export_excel",
+    "export_csv",
+    "export_json",
+)
+
+# Ignore slowdowns smaller than this (ms) when flagging regressions
+DEFAULT_NOISE_FLOOR_MS = 0.5
+# Ignore peak memory growth smaller than this (KiB) when flagging regressions
+DEFAULT_NOISE_FLOOR_KB = 16.0
+
+
+def create_synthetic_building(size: str) -> PoleBarnInputs:
+    """
+    Create benchmark inputs for a named building size.
+    
+    Args:
+        size: Key of BUILDING_SIZES
+    
+    Returns:
+        PoleBarnInputs for an insulated, sheathed metal building of that size
+    """
+    length, width, eave, doors, windows, overhead_doors = BUILDING_SIZES[size]
+    geometry_inputs = GeometryInputs(
+        length=length,
+        width=width,
+        eave_height=eave,
+        roof_pitch=4.0 / 12.0,
+        overhang_front=1.0,
+        overhang_rear=1.0,
+        overhang_sides=1.0,
+        door_count=doors,
+        door_width=3.0,
+        door_height=6.67,
+        window_count=windows,
+        window_width=3.0,
+        window_height=3.0,
+        pole_spacing_length=10.0 if length < 100 else 12.0,
+        pole_spacing_width=8.0,
+        pole_diameter=6.0,
+        pole_depth=4.0,
+        overhead_door_count=overhead_doors,
+        overhead_door_type="steel_rollup" if overhead_doors else "none",
+    )
+    materials = MaterialInputs(
+        roof_material_type="metal",
+        wall_material_type="metal",
+        truss_type="standard",
+        truss_spacing=4.0,
+        purlin_spacing=2.0,
+        girt_spacing=2.0,
+        foundation_type="concrete_pad",
+        exterior_finish_type="metal_29ga",
+        wall_insulation_type="fiberglass_batts",
+        roof_insulation_type="fiberglass_batts",
+        wall_sheathing_type="osb",
+        roof_sheathing_type="osb",
+        floor_type="slab",
+        slab_thickness_in=4.0,
+        slab_reinforcement="mesh",
+    )
+    pricing_inputs = PricingInputs(
+        material_markup=1.15,
+        tax_rate=0.08,
+        labor_rate=50.0,
+    )
+    assembly_inputs = AssemblyInputs(
+        assembly_method="standard",
+        fastening_type="screws",
+        weather_sealing=True,
+        ventilation_type="ridge_vent",
+    )
+    return PoleBarnInputs(
+        geometry=geometry_inputs,
+        materials=materials,
+        pricing=pricing_inputs,
+        assemblies=assembly_inputs,
+        project_name=f"Bench_{size}",
+    )
+
+
+def _time_call(func: Callable[[], Any], repeat: int) -> Tuple[Any, List[float]]:
+    """Call func repeat times; return the last result and per-call times in ms."""
+    times_ms = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times_ms.append((time.perf_counter() - start) * 1000.0)
+    return result, times_ms
+
+
+def _peak_memory_kb(func: Callable[[], Any]) -> float:
+    """Peak traced Python allocation (KiB) during one call."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024.0
+
+
+def benchmark_building(
+    calculator: PoleBarnCalculator,
+    inputs: PoleBarnInputs,
+    repeat: int,
+    output_dir: Path,
+) -> Dict[str, Dict[str, float]]:
+    """
+    Time each pipeline stage and exporter for one building.
+    
+    Stages are called directly (not through the calculator's stage caches) so
+    every repeat does the full work.
+    
+    Args:
+        calculator: Calculator with config loaded
+        inputs: Building inputs
+        repeat: Timed calls per stage
+        output_dir: Scratch directory for exporter output
+    
+    Returns:
+        Dictionary mapping stage name to {median_ms, min_ms, peak_kb}
+    """
+    stage_calls: Dict[str, Callable[[], Any]] = {}
+    
+    stage_calls["build_geometry_model"] = lambda: geometry.build_geometry_model(inputs.geometry)
+    geom_model = stage_calls["build_geometry_model"]()
+    
+    stage_calls["calculate_material_quantities"] = lambda: MaterialTakeoff(
+        items=assemblies.calculate_material_quantities(
+            geom_model,
+            inputs.materials,
+            inputs.assemblies,
+            geometry_inputs=inputs.geometry,
+        )
+    )
+    takeoff = stage_calls["calculate_material_quantities"]()
+    
+    stage_calls["price_material_takeoff"] = lambda: pricing.price_material_takeoff(
+        takeoff,
+        inputs.pricing,
+        calculator.parts_df,
+        calculator.pricing_df,
+        calculator.assemblies_df,
+        price_book=calculator.price_book,
+    )
+    priced_items, summary = stage_calls["price_material_takeoff"]()
+    
+    stage_calls["expand_to_parts"] = lambda: bom.expand_to_parts(
+        takeoff,
+        calculator.assemblies_df,
+        calculator.parts_df,
+        calculator.pricing_df,
+        geometry_model=geom_model,
+        geometry_inputs=inputs.geometry,
+        price_book=calculator.price_book,
+        cutting_mode=calculator.cutting_mode,
+        cutting_time_budget_s=calculator.cutting_time_budget_s,
+    )
+    bom_items = stage_calls["expand_to_parts"]()
+    bom_takeoff = bom.create_material_takeoff_from_bom(bom_items)
+    
+    stage_calls["export_excel"] = lambda: export_bom_to_excel(
+        bom_items, output_dir / "bench_bom.xlsx", inputs.project_name
+    )
+    stage_calls["export_csv"] = lambda: export_bom_to_flat_csv(
+        bom_items, output_dir / "bench_bom_flat.csv", project_name=inputs.project_name
+    )
+    stage_calls["export_json"] = lambda: export_project_to_json(
+        inputs, geom_model, bom_takeoff, bom_items, priced_items, summary, output_dir / "bench_project.json"
+    )
+    
+    results = {}
+    for stage in STAGES:
+        _, times_ms = _time_call(stage_calls[stage], repeat)
+        results[stage] = {
+            "median_ms": statistics.median(times_ms),
+            "min_ms": min(times_ms),
+            "peak_kb": _peak_memory_kb(stage_calls[stage]),
+        }
+    results["_counts"] = {
+        "takeoff_items": len(takeoff.items),
+        "bom_items": len(bom_items),
+    }
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    """Current git commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(sizes: List[str], repeat: int, cutting_mode: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Benchmark every requested building size.
+    
+    Args:
+        sizes: Keys of BUILDING_SIZES to run
+        repeat: Timed calls per stage
+        cutting_mode: BOM cutting mode (None uses the calculator default)
+    
+    Returns:
+        Results dictionary (see module docstring for the JSON layout)
+    """
+    project_root = Path(__file__).parent.parent
+    kwargs = {"cutting_mode": cutting_mode} if cutting_mode else {}
+    calculator = PoleBarnCalculator(config_dir=project_root / "config", **kwargs)
+    
+    start = time.perf_counter()
+    calculator.load_config()
+    load_config_ms = (time.perf_counter() - start) * 1000.0
+    
+    buildings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            buildings[size] = benchmark_building(calculator, create_synthetic_building(size), repeat, Path(tmp))
+    
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "cutting_mode": calculator.cutting_mode,
+            "load_config_ms": load_config_ms,
+        },
+        "buildings": buildings,
+    }
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float,
+    noise_floor_ms: float = DEFAULT_NOISE_FLOOR_MS,
+    noise_floor_kb: float = DEFAULT_NOISE_FLOOR_KB,
+) -> List[Dict[str, Any]]:
+    """
+    Find stages whose median time or peak memory regressed past the threshold.
+    
+    Args:
+        baseline: Earlier results dictionary
+        current: New results dictionary
+        threshold: Allowed relative increase (0.25 = 25% slower or larger)
+        noise_floor_ms: Minimum absolute slowdown to report
+        noise_floor_kb: Minimum absolute peak memory growth to report
+    
+    Returns:
+        List of {building, stage, metric, unit, baseline, current, change_pct}
+        for regressions (metric is "median_ms" or "peak_kb")
+    """
+    metrics = (("median_ms", "ms", noise_floor_ms), ("peak_kb", "KiB", noise_floor_kb))
+    regressions = []
+    for size, stages in current.get("buildings", {}).items():
+        base_stages = baseline.get("buildings", {}).get(size, {})
+        for stage in STAGES:
+            if stage not in stages or stage not in base_stages:
+                continue
+            for metric, unit, noise_floor in metrics:
+                if metric not in stages[stage] or metric not in base_stages[stage]:
+                    continue
+                base_value = base_stages[stage][metric]
+                cur_value = stages[stage][metric]
+                if cur_value - base_value < noise_floor or base_value <= 0:
+                    continue
+                change = (cur_value - base_value) / base_value
+                if change > threshold:
+                    regressions.append({
+                        "building": size,
+                        "stage": stage,
+                        "metric": metric,
+                        "unit": unit,
+                        "baseline": base_value,
+                        "current": cur_value,
+                        "change_pct": change * 100.0,
+                    })
+    return regressions
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    """Print a stage x building table of median times and peak memory."""
+    sizes = list(results["buildings"])
+    print(f"{'stage':<32}" + "".join(f"{size:>22}" for size in sizes))
+    for stage in STAGES:
+        row = f"{stage:<32}"
+        for size in sizes:
+            cell = results["buildings"][size][stage]
+            row += f"{cell['median_ms']:>10.2f} ms {cell['peak_kb']:>7.0f} KiB"
+        print(row)
+    print(f"\nload_config: {results['meta']['load_config_ms']:.2f} ms")
+
+
+def main():
+    """Run the benchmark suite from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark the pole barn calculation pipeline.")
+    parser.add_argument("--sizes", nargs="+", choices=list(BUILDING_SIZES), default=list(BUILDING_SIZES))
+    parser.add_argument("--repeat", type=int, default=5, help="Timed calls per stage (default 5)")
+    parser.add_argument("--cutting-mode", default=None, help="BOM cutting mode (default: calculator default)")
+    parser.add_argument("--output", type=Path, default=None, help="Write results JSON to this path")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline results JSON to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Allowed relative slowdown or memory growth (default 0.25)"
+    )
+    args = parser.parse_args()
+    
+    results = run_benchmarks(args.sizes, args.repeat, args.cutting_mode)
+    print_results(results)
+    
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+    
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, results, args.threshold)
+        base_commit = baseline.get("meta", {}).get("commit")
+        print(f"\nCompared against {args.compare} (commit {base_commit}), threshold {args.threshold:.0%}")
+        if regressions:
+            for reg in regressions:
+                kind = "time" if reg["metric"] == "median_ms" else "memory"
+                print(
+                    f"  [REGRESSION] {reg['building']:<10} {reg['stage']:<32} {kind:<7}"
+                    f"{reg['baseline']:.2f} -> {reg['current']:.2f} {reg['unit']} (+{reg['change_pct']:.0f}%)"
+                )
+            sys.exit(1)
+        print("  [OK] No regressions")
+
+
+if __name__ == "__main__":
+    main()
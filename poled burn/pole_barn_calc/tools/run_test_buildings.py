@@ -339,6 +339,7 @@ def main():
     ]
     
     results = []
+    stage_timings = {}
     
     # Process each test building
     for test_name, create_func in test_buildings:
@@ -349,7 +350,7 @@ def main():
             inputs = create_func()
             
             # Run calculation
-            geom_model, takeoff, priced_items, summary, bom_items = calculator.calculate(inputs)
+            geom_model, takeoff, priced_items, summary, bom_items = calculator.calculate(inputs, timings=stage_timings)
             
             # Generate filenames
             excel_filename = f"{test_name}_bom.xlsx"
@@ -412,6 +413,10 @@ def main():
     
     print(f"All files saved in: {test_dir}")
     print()
+    print("Stage timings (all buildings):")
+    for stage, seconds in stage_timings.items():
+        print(f"  {stage:<12} {seconds * 1000.0:8.1f} ms")
+    print()
     print("=" * 70)
 
 
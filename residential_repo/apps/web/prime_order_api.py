@@ -8,23 +8,39 @@ from __future__ import annotations
 from pathlib import Path
 import json
 import csv
+import hmac
+import os
+import threading
 import zipfile
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from io import StringIO, BytesIO
-from functools import lru_cache
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse
 from pydantic import BaseModel, ValidationError
-from typing import Optional, List, Literal, Dict, Any
+from typing import Optional, List, Literal, Dict, Any, Mapping, Tuple
 import traceback
 import logging
 
-app = FastAPI(title="ACC Prime Order API")
-
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load catalog, finishes and pricing before the first order
+    try:
+        get_order_context()
+    except Exception as e:
+        logger.error(f"Error loading order config at startup: {e}")
+        logger.error(traceback.format_exc())
+    yield
+
+
+app = FastAPI(title="ACC Prime Order API", lifespan=lifespan)
+
 # Mount static files directory for logos and assets
 STATIC_DIR = Path(__file__).resolve().parent / "static"
 if STATIC_DIR.exists():
@@ -36,24 +52,20 @@ FINISHES_PATH = Path(__file__).resolve().parents[2] / "config" / "finish_colors.
 PRICING_PATH = Path(__file__).resolve().parents[2] / "config" / "express_pricing.csv"
 PRESETS_PATH = Path(__file__).resolve().parents[2] / "config" / "express_presets.json"
 
+# POST /express-order/admin/reload requires this value in X-Admin-Token (disabled when unset)
+ADMIN_TOKEN_ENV = "ACC_EXPRESS_ADMIN_TOKEN"
+
 def load_catalog():
     """Load the cabinets catalog JSON."""
     with open(CATALOG_PATH, "r", encoding="utf-8") as f:
         return json.load(f)
 
-# Cache catalog
-_catalog = None
-
 def get_catalog():
-    """Get cached catalog or load it."""
-    global _catalog
-    if _catalog is None:
-        _catalog = load_catalog()
-    return _catalog
+    """Get the catalog from the shared order context."""
+    return get_order_context().catalog
 
 
 # Finish library loading
-@lru_cache()
 def load_finish_library() -> Dict[str, List[Dict[str, Any]]]:
     """
     Load finish colors library from CSV and organize by medium.
@@ -142,12 +154,7 @@ def load_finish_library() -> Dict[str, List[Dict[str, Any]]]:
 
 def get_finish_by_id(finish_id: str) -> Optional[Dict[str, Any]]:
     """Look up a finish record by finish_id across all mediums."""
-    library = load_finish_library()
-    for medium_list in library.values():
-        for finish in medium_list:
-            if finish.get("finish_id") == finish_id:
-                return finish
-    return None
+    return get_order_context().finishes_by_id.get(finish_id)
 
 
 def load_pricing_config() -> Dict[str, Dict[str, Any]]:
@@ -205,6 +212,112 @@ def load_pricing_config() -> Dict[str, Dict[str, Any]]:
     return pricing_config
 
 
+@dataclass(frozen=True)
+class OrderPricingContext:
+    """
+    Config the order endpoints read on every request, loaded once and shared
+    read-only. Never mutate it; reload_order_context() builds a new one.
+    
+    Attributes:
+        catalog: family_code -> family data (cabinets_catalog.json)
+        finish_library: medium -> active finish records (finish_colors.csv)
+        finishes_by_id: finish_id -> finish record (first medium listed wins)
+        pricing: key_type ('family', 'finish', 'option') -> key -> pricing data
+        pricing_enabled: False when express_pricing.csv has no active rows
+        signature: (path, mtime_ns, size) of each file it was built from
+    """
+    catalog: Dict[str, Any]
+    finish_library: Dict[str, List[Dict[str, Any]]]
+    finishes_by_id: Mapping[str, Dict[str, Any]]
+    pricing: Dict[str, Dict[str, Any]]
+    pricing_enabled: bool
+    signature: Tuple
+
+
+def _order_config_signature() -> Tuple:
+    """mtime/size of the catalog, finish and pricing files, for change detection."""
+    signature = []
+    for path in (CATALOG_PATH, FINISHES_PATH, PRICING_PATH):
+        try:
+            stat = path.stat()
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append((str(path), None, None))
+    return tuple(signature)
+
+
+def build_order_context() -> OrderPricingContext:
+    """Read the catalog, finish library and pricing config into a new context."""
+    # Taken before reading, so an edit made mid-build triggers another rebuild
+    signature = _order_config_signature()
+    
+    finish_library = load_finish_library()
+    finishes_by_id = {}
+    for medium_list in finish_library.values():
+        for finish in medium_list:
+            finishes_by_id.setdefault(finish.get("finish_id"), finish)
+    
+    pricing = load_pricing_config()
+    return OrderPricingContext(
+        catalog=load_catalog(),
+        finish_library=finish_library,
+        finishes_by_id=finishes_by_id,
+        pricing=pricing,
+        pricing_enabled=bool(pricing['family'] or pricing['finish'] or pricing['option']),
+        signature=signature
+    )
+
+
+_order_context: Optional[OrderPricingContext] = None
+# Signature of config files that failed to load; not retried until they change again
+_failed_signature: Optional[Tuple] = None
+_order_context_lock = threading.Lock()
+
+
+def get_order_context() -> OrderPricingContext:
+    """
+    Return the shared order context, loading it on first use and rebuilding
+    it when the catalog, finish or pricing file changes on disk.
+    
+    If a rebuild fails (e.g. a half-saved catalog), the error is logged and
+    the previous context stays in use until the files change again.
+    """
+    global _order_context, _failed_signature
+    context = _order_context
+    if context is not None and _order_config_signature() in (context.signature, _failed_signature):
+        return context
+    
+    with _order_context_lock:
+        signature = _order_config_signature()
+        if _order_context is not None and signature in (_order_context.signature, _failed_signature):
+            return _order_context
+        try:
+            context = build_order_context()
+        except Exception as e:
+            if _order_context is None:
+                raise
+            _failed_signature = signature
+            logger.error(f"Error reloading order config, keeping the previous config: {e}")
+            logger.error(traceback.format_exc())
+            return _order_context
+        _order_context = context
+        _failed_signature = None
+        logger.info(f"Order config loaded: {len(context.catalog)} cabinet families, "
+                   f"{len(context.finishes_by_id)} finishes, "
+                   f"pricing {'enabled' if context.pricing_enabled else 'disabled'}")
+        return context
+
+
+def reload_order_context() -> OrderPricingContext:
+    """Rebuild the order context from config/ and swap it in."""
+    global _order_context, _failed_signature
+    context = build_order_context()
+    with _order_context_lock:
+        _order_context = context
+        _failed_signature = None
+    return context
+
+
 def calculate_cabinet_price(
     cabinet: CabinetLineItem,
     room: RoomInfo,
@@ -382,7 +495,7 @@ def get_express_catalog_endpoint():
 @app.get("/prime-order/finish-library")
 def get_finish_library_endpoint():
     """Return the finish colors library organized by medium for the frontend (legacy route)."""
-    library = load_finish_library()
+    library = get_order_context().finish_library
     # Ensure we return the exact structure expected
     response = {
         "Paint": library.get("Paint", []),
@@ -396,7 +509,7 @@ def get_finish_library_endpoint():
 def get_express_finish_library_endpoint():
     """Return the finish colors library organized by medium for the frontend."""
     try:
-        library = load_finish_library()
+        library = get_order_context().finish_library
         # Ensure we return the exact structure expected
         response = {
             "Paint": library.get("Paint", []),
@@ -481,6 +594,98 @@ def resolve_finish_id(finishes: FinishesInfo, finish_type: str, finish_number: i
         return None
 
 
+# Finish columns for cabinets whose room isn't in the order
+NO_ROOM_FINISH = {
+    "finish_slot": None,
+    "finish_label": "",
+    "finish_id": None,
+    "color_brand": "",
+    "color_name": "",
+    "color_code": "",
+    "medium": "",
+    "shop_product_line": "",
+    "shop_sku": "",
+    "vendor": ""
+}
+
+
+def resolve_room_finish(finishes: FinishesInfo, room: RoomInfo, context: OrderPricingContext) -> Dict[str, Any]:
+    """
+    Resolve a room's finish slot, label, finish_id and library metadata
+    (color, medium, shop product line/SKU, vendor) for its order CSV rows.
+    """
+    finish_type = room.finish_type
+    finish_number = room.finish_number
+    room_finish = dict(NO_ROOM_FINISH)
+    room_finish["finish_label"] = resolve_finish_label(finishes, finish_type, finish_number)
+    room_finish["finish_id"] = resolve_finish_id(finishes, finish_type, finish_number)
+    
+    # Get finish slot to check for "Other" metadata
+    if finish_type == "Paint":
+        slot_list = finishes.paint or []
+    elif finish_type == "Stain":
+        slot_list = finishes.stain or []
+    elif finish_type == "Melamine":
+        slot_list = finishes.melamine or []
+    else:
+        slot_list = []
+    
+    finish_slot = None
+    for slot in slot_list:
+        if slot.index == finish_number:
+            finish_slot = slot
+            break
+    room_finish["finish_slot"] = finish_slot
+    
+    # Look up library metadata if finish_id exists
+    if room_finish["finish_id"]:
+        finish_record = context.finishes_by_id.get(room_finish["finish_id"])
+        if finish_record:
+            for field in ("color_brand", "color_name", "color_code", "medium",
+                          "shop_product_line", "shop_sku", "vendor"):
+                room_finish[field] = finish_record.get(field, "")
+    elif finish_slot and finish_slot.other_brand:
+        # Handle "Other" manual finishes - use metadata from slot
+        room_finish["color_brand"] = finish_slot.other_brand or ""
+        room_finish["color_name"] = finish_slot.other_name or ""
+        room_finish["color_code"] = finish_slot.other_code or ""
+        room_finish["medium"] = finish_type  # Use finish_type as medium for "Other"
+    
+    return room_finish
+
+
+@app.post("/express-order/admin/reload")
+def reload_order_config_endpoint(x_admin_token: Optional[str] = Header(None)):
+    """
+    Reload the catalog, finish library and pricing from config/ and swap them
+    in for new requests. Config edits are also picked up on the next request
+    without this; use it to reload right away or to check a config change.
+    
+    Disabled unless ACC_EXPRESS_ADMIN_TOKEN is set; the X-Admin-Token header
+    must match it. If loading fails the previous config stays in use.
+    """
+    admin_token = os.getenv(ADMIN_TOKEN_ENV)
+    if not admin_token:
+        raise HTTPException(status_code=403, detail=f"Admin reload is disabled (set {ADMIN_TOKEN_ENV})")
+    if not hmac.compare_digest((x_admin_token or "").encode("utf-8"), admin_token.encode("utf-8")):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+    
+    try:
+        context = reload_order_context()
+    except Exception as e:
+        logger.error(f"Error reloading order config: {e}")
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Error reloading config: {str(e)}")
+    
+    logger.info("Order config reloaded via admin endpoint")
+    return {
+        "status": "ok",
+        "cabinet_families": len(context.catalog),
+        "finishes": len(context.finishes_by_id),
+        "pricing_enabled": context.pricing_enabled
+    }
+
+
 @app.post("/prime-order/submit")
 def prime_order_submit(request: PrimeOrderRequest):
     """Legacy route - kept for backward compatibility."""
@@ -517,19 +722,16 @@ def express_order_submit(request: PrimeOrderRequest):
         if not request.cabinets:
             raise HTTPException(status_code=400, detail="At least one cabinet is required")
         
-        catalog = get_catalog()
+        # Catalog, finishes and pricing (optional - if missing, prices will be 0.0) are loaded once, not per order
+        context = get_order_context()
+        catalog = context.catalog
         job = request.job
         finishes = request.finishes
         rooms = request.rooms
         cabinets = request.cabinets
         
-        # Load pricing config (optional - if missing, prices will be 0.0)
-        pricing_config = load_pricing_config()
-        pricing_enabled = any(
-            pricing_config.get('family', {}) or
-            pricing_config.get('finish', {}) or
-            pricing_config.get('option', {})
-        )
+        pricing_config = context.pricing
+        pricing_enabled = context.pricing_enabled
         
         # Track pricing totals
         room_totals = {room.name: 0.0 for room in rooms}
@@ -539,17 +741,25 @@ def express_order_submit(request: PrimeOrderRequest):
         for idx, room in enumerate(rooms):
             if not hasattr(room, 'box_material') or not room.box_material:
                 room.box_material = "Melamine"  # Set default if missing
-            logger.info(f"Room {idx}: {room.name}, box_material: {room.box_material}")
+            logger.debug(f"Room {idx}: {room.name}, box_material: {room.box_material}")
         
         # Validate cabinet data
+        log_cabinets = logger.isEnabledFor(logging.DEBUG)
         for idx, cabinet in enumerate(cabinets):
             if not hasattr(cabinet, 'applied_panels'):
                 cabinet.applied_panels = 0  # Set default if missing
-            logger.info(f"Cabinet {idx}: {cabinet.family_code}, applied_panels: {getattr(cabinet, 'applied_panels', 0)}")
+            if log_cabinets:
+                logger.debug(f"Cabinet {idx}: {cabinet.family_code}, applied_panels: {getattr(cabinet, 'applied_panels', 0)}")
         
         # Build room lookup dict (name -> room object)
         room_lookup = {room.name: room for room in rooms}
         
+        # Resolve each room's finish once instead of per cabinet
+        room_finishes = {
+            name: resolve_room_finish(finishes, room, context)
+            for name, room in room_lookup.items()
+        }
+        
         # Create order CSV in memory
         order_output = StringIO()
         order_writer = csv.writer(order_output)
@@ -639,69 +849,23 @@ def express_order_submit(request: PrimeOrderRequest):
             
             # Derive finish from room
             room_obj = room_lookup.get(line.room)
-            finish_id = None
-            color_brand = ""
-            color_name = ""
-            color_code = ""
-            medium = ""
-            shop_product_line = ""
-            shop_sku = ""
-            vendor = ""
             door_style = ""
             grain_direction = ""
             
             if room_obj:
                 finish_type = room_obj.finish_type
                 finish_number = room_obj.finish_number
-                finish_label = resolve_finish_label(finishes, finish_type, finish_number)
-                finish_id = resolve_finish_id(finishes, finish_type, finish_number)
+                room_finish = room_finishes[line.room]
                 door_style = room_obj.door_style or ""
                 grain_direction = room_obj.grain_direction or ""
                 box_material = room_obj.box_material or "Melamine"
-                
-                # Get finish slot to check for "Other" metadata
-                finish_slot = None
-                if finish_type == "Paint":
-                    slot_list = finishes.paint or []
-                elif finish_type == "Stain":
-                    slot_list = finishes.stain or []
-                elif finish_type == "Melamine":
-                    slot_list = finishes.melamine or []
-                else:
-                    slot_list = []
-                
-                for slot in slot_list:
-                    if slot.index == finish_number:
-                        finish_slot = slot
-                        break
-                
-                # Look up library metadata if finish_id exists
-                if finish_id:
-                    finish_record = get_finish_by_id(finish_id)
-                    if finish_record:
-                        color_brand = finish_record.get("color_brand", "")
-                        color_name = finish_record.get("color_name", "")
-                        color_code = finish_record.get("color_code", "")
-                        medium = finish_record.get("medium", "")
-                        shop_product_line = finish_record.get("shop_product_line", "")
-                        shop_sku = finish_record.get("shop_sku", "")
-                        vendor = finish_record.get("vendor", "")
-                elif finish_slot and finish_slot.other_brand:
-                    # Handle "Other" manual finishes - use metadata from slot
-                    color_brand = finish_slot.other_brand or ""
-                    color_name = finish_slot.other_name or ""
-                    color_code = finish_slot.other_code or ""
-                    medium = finish_type  # Use finish_type as medium for "Other"
-                    shop_product_line = ""
-                    shop_sku = ""
-                    vendor = ""
             else:
                 # Room not found - use defaults
                 finish_type = ""
                 finish_number = 0
-                finish_label = ""
+                room_finish = NO_ROOM_FINISH
                 box_material = "Melamine"  # Default when room not found
-                finish_slot = None
+            finish_slot = room_finish["finish_slot"]
             
             # Calculate pricing
             unit_price = 0.0
@@ -732,15 +896,15 @@ def express_order_submit(request: PrimeOrderRequest):
                 line.quantity,
                 finish_type,
                 finish_number,
-                finish_label,
-                finish_id or "",
-                color_brand,
-                color_name,
-                color_code,
-                medium,
-                shop_product_line,
-                shop_sku,
-                vendor,
+                room_finish["finish_label"],
+                room_finish["finish_id"] or "",
+                room_finish["color_brand"],
+                room_finish["color_name"],
+                room_finish["color_code"],
+                room_finish["medium"],
+                room_finish["shop_product_line"],
+                room_finish["shop_sku"],
+                room_finish["vendor"],
                 door_style,
                 grain_direction,
                 box_material,
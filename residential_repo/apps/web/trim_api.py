@@ -1,10 +1,21 @@
+import os
+from contextlib import asynccontextmanager
 from pathlib import Path
-from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
+from typing import Literal
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, StreamingResponse
+from systems.trim.batch import iter_csv, iter_ndjson, parse_jobs, price_jobs
 from systems.trim.models import TrimJobInput, TrimJobResult
 from systems.trim.pricing_engine import price_job
+from systems.trim.rate_tables import get_rate_tables
 
-app = FastAPI(title="Residential Trim API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Compile rate tables (from the config bundle when current) before the first quote
+    get_rate_tables()
+    yield
+
+app = FastAPI(title="Residential Trim API", lifespan=lifespan)
 
 @app.get("/api/trim/ping")
 def ping():
@@ -14,6 +25,43 @@ def ping():
 def quote(job_input: TrimJobInput):
     return price_job(job_input)
 
+@app.post("/api/trim/quote/batch")
+async def quote_batch(
+    request: Request,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    workers: int = Query(1, ge=1)
+):
+    """
+    Price many jobs in one call.
+    
+    Body: a JSON array of jobs, NDJSON (Content-Type application/x-ndjson),
+    CSV (text/csv, one row per room), or a multipart upload with the file
+    in a "file" field. Results stream back in input order as NDJSON or CSV;
+    a job that can't be priced gets an error instead of failing the batch.
+    workers > 1 prices across that many processes (capped at the CPU count).
+    """
+    content_type = request.headers.get("content-type", "")
+    filename = None
+    if content_type.startswith("multipart/form-data"):
+        form = await request.form()
+        upload = form.get("file")
+        if upload is None or isinstance(upload, str):
+            raise HTTPException(status_code=400, detail='Upload the jobs file in a "file" field')
+        data = await upload.read()
+        content_type, filename = upload.content_type, upload.filename
+    else:
+        data = await request.body()
+    
+    try:
+        jobs = parse_jobs(data, content_type, filename)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    results = price_jobs(jobs, max_workers=min(workers, os.cpu_count() or 1))
+    if format == "csv":
+        return StreamingResponse(iter_csv(results), media_type="text/csv")
+    return StreamingResponse(iter_ndjson(results), media_type="application/x-ndjson")
+
 @app.get("/", response_class=HTMLResponse)
 def index():
     # Resolve template path relative to this file's location for robustness
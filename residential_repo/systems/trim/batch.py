@@ -0,0 +1,222 @@
+"""
+Trim system module: Batch quoting.
+Prices many jobs in one pass (e.g. a subdivision imported from an intake
+spreadsheet) against the shared rate tables, optionally across a process
+pool, and writes the results as NDJSON or CSV.
+
+Accepted inputs:
+- JSON: an array of TrimJobInput objects
+- NDJSON: one TrimJobInput object per line
+- CSV: one row per room; rows with the same job_number/job_name form a job
+"""
+
+import csv
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+from pydantic import ValidationError
+
+from .models import TrimBatchItem, TrimJobInput
+from .pricing_engine import price_job
+from .rate_tables import get_rate_tables
+
+# CSV upload room columns (job_name, job_number, spec_level and job_notes repeat on each room row)
+CSV_ROOM_COLUMNS = ('room', 'base_lf', 'case_openings', 'window_openings', 'crown_lf', 'shoe_lf', 'notes')
+
+# CSV result columns (one row per job)
+CSV_RESULT_COLUMNS = ('index', 'job_number', 'job_name', 'rooms', 'items', 'subtotal', 'tax', 'total', 'error')
+
+
+def _decode(data):
+    if isinstance(data, bytes):
+        # utf-8-sig drops the BOM Excel puts on "CSV UTF-8" exports
+        return data.decode('utf-8-sig')
+    return data
+
+
+def parse_jobs_json(data):
+    """Parse a JSON array of jobs into a list of dicts"""
+    jobs = json.loads(_decode(data))
+    if not isinstance(jobs, list):
+        raise ValueError("Expected a JSON array of jobs")
+    return jobs
+
+
+def parse_jobs_ndjson(data):
+    """Parse NDJSON (one job object per line, blank lines skipped) into a list of dicts"""
+    jobs = []
+    for line_number, line in enumerate(_decode(data).splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            jobs.append(json.loads(line))
+        except ValueError as e:
+            raise ValueError(f"Line {line_number}: invalid JSON ({str(e)})")
+    return jobs
+
+
+def parse_jobs_csv(data):
+    """
+    Parse a room-per-row CSV into a list of job dicts.
+    
+    Rows are grouped into jobs by (job_number, job_name), in the order jobs
+    first appear. Blank cells are treated as missing values.
+    """
+    reader = csv.DictReader(io.StringIO(_decode(data)))
+    if reader.fieldnames is None or 'job_name' not in reader.fieldnames:
+        raise ValueError("CSV needs a header row with at least a job_name column")
+    
+    jobs = {}
+    for row in reader:
+        row = {key.strip(): (value.strip() if value else None) or None for key, value in row.items() if key}
+        if not any(row.values()):
+            continue
+        key = (row.get('job_number'), row.get('job_name'))
+        job = jobs.get(key)
+        if job is None:
+            job = jobs[key] = {
+                'job_name': row.get('job_name'),
+                'job_number': row.get('job_number'),
+                'spec_level': row.get('spec_level'),
+                'notes': row.get('job_notes'),
+                'rooms': []
+            }
+        room = {column: row.get(column) for column in CSV_ROOM_COLUMNS if column != 'room'}
+        room['name'] = row.get('room') or f"Room {len(job['rooms']) + 1}"
+        job['rooms'].append(room)
+    return list(jobs.values())
+
+
+def detect_format(content_type=None, filename=None):
+    """Pick 'json', 'ndjson' or 'csv' from a content type and/or upload file name"""
+    content_type = (content_type or '').lower()
+    extension = os.path.splitext(filename or '')[1].lower()
+    if 'csv' in content_type or extension == '.csv':
+        return 'csv'
+    if 'ndjson' in content_type or 'jsonl' in content_type or extension in ('.ndjson', '.jsonl'):
+        return 'ndjson'
+    return 'json'
+
+
+def parse_jobs(data, content_type=None, filename=None):
+    """
+    Parse a batch upload in any accepted format.
+    
+    Returns:
+        list of job dicts (validated per job when priced)
+    
+    Raises:
+        ValueError: If the upload itself can't be parsed
+    """
+    parsers = {
+        'json': parse_jobs_json,
+        'ndjson': parse_jobs_ndjson,
+        'csv': parse_jobs_csv
+    }
+    try:
+        return parsers[detect_format(content_type, filename)](data)
+    except UnicodeDecodeError:
+        raise ValueError("Upload must be UTF-8 text")
+
+
+def _error_message(error):
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc']) or 'job'}: {detail['msg']}"
+            for detail in error.errors()
+        )
+    return str(error) or error.__class__.__name__
+
+
+def price_batch_item(index, job, options=None):
+    """Validate and price one job; errors are returned on the item, not raised"""
+    job_name = job.job_name if isinstance(job, TrimJobInput) else (job.get('job_name') if isinstance(job, dict) else None)
+    try:
+        if not isinstance(job, TrimJobInput):
+            job = TrimJobInput.model_validate(job)
+        result = price_job(job, **(options or {}))
+    except Exception as e:
+        return TrimBatchItem(index=index, job_name=job_name, error=_error_message(e))
+    return TrimBatchItem(index=index, job_name=job_name, result=result)
+
+
+def _price_in_batch_worker(task):
+    index, job, options = task
+    return price_batch_item(index, job, options)
+
+
+def price_jobs(jobs: Iterable, max_workers: Optional[int] = 1, chunksize: int = 16,
+               **options) -> Iterator[TrimBatchItem]:
+    """
+    Price many jobs, yielding one TrimBatchItem per job in input order.
+    
+    A job that fails validation or pricing yields an item with `error`
+    set; the rest of the batch still runs.
+    
+    Args:
+        jobs: TrimJobInput models or dicts
+        max_workers: Worker processes. 1 prices in the current process;
+            None uses os.cpu_count()
+        chunksize: Jobs sent to a worker per task
+        **options: Passed to price_job (species, bf_markup_pct, sales_tax_rate, ...)
+    
+    Yields:
+        TrimBatchItem for each job
+    """
+    jobs = list(jobs)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(jobs)))
+    
+    # Built once here; worker processes build (or inherit) their own copy at start
+    get_rate_tables()
+    
+    if max_workers == 1:
+        for index, job in enumerate(jobs):
+            yield price_batch_item(index, job, options)
+        return
+    
+    tasks = [(index, job, options) for index, job in enumerate(jobs)]
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=get_rate_tables) as executor:
+        yield from executor.map(_price_in_batch_worker, tasks, chunksize=chunksize)
+
+
+def iter_ndjson(items: Iterable[TrimBatchItem]) -> Iterator[str]:
+    """Serialize batch items as NDJSON lines"""
+    for item in items:
+        yield item.model_dump_json(exclude={'result'} if item.error else {'error'}) + "\n"
+
+
+def iter_csv(items: Iterable[TrimBatchItem]) -> Iterator[str]:
+    """Serialize batch items as CSV text, one row per job (header first)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    def flush():
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+    
+    writer.writerow(CSV_RESULT_COLUMNS)
+    yield flush()
+    for item in items:
+        result = item.result
+        if result is None:
+            writer.writerow([item.index, '', item.job_name or '', '', '', '', '', '', item.error])
+        else:
+            writer.writerow([
+                item.index,
+                result.job.job_number or '',
+                result.job.job_name,
+                len(result.job.rooms),
+                len(result.items),
+                result.totals.subtotal,
+                result.totals.tax,
+                result.totals.total,
+                ''
+            ])
+        yield flush()
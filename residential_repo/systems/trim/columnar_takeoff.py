@@ -0,0 +1,357 @@
+"""
+Trim system module: Columnar takeoff engine.
+Runs the trim takeoff (trim_rules.calculate_trim) and BF/waste conversion
+(trim_bf_calculator.calculate_bf_with_waste) over a whole table of rooms
+at once with NumPy, instead of one inputs dict at a time.
+
+Every formula keeps the scalar code's order of operations, so each row's
+LF, BF and waste are identical to the scalar path, not just close.
+
+Input columns (one row per room; same names as the calculate_trim inputs):
+    int_walls_linear_ft, ext_walls_linear_ft, ext_doors, int_doors, windows, sliders
+Optional columns (default):
+    trimmed_openings (0), door_height ('7/0'), wood_wrapped (True),
+    has_schedule (False), trim_style ('craftsman'), finish_level ('Standard')
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Mapping
+
+import numpy as np
+
+from .trim_bf_calculator import get_nominal_stock_thickness, get_trim_dimensions, get_waste_factor
+from .trim_rules import (
+    DEFAULT_DOOR_WIDTH_INCHES,
+    DEFAULT_WINDOW_WIDTH_INCHES,
+    DEFAULT_WOOD_WRAPPED,
+    DOOR_HEIGHTS,
+    RUNNING_WASTE,
+    STANDING_WASTE,
+    WINDOW_HEIGHT_OFFSET_INCHES,
+    inches_to_feet
+)
+
+# Numeric input columns (summed per job)
+COUNT_COLUMNS = (
+    'int_walls_linear_ft', 'ext_walls_linear_ft', 'ext_doors', 'int_doors',
+    'trimmed_openings', 'windows', 'sliders'
+)
+
+# Per-job settings: every room of a job must share them
+SETTING_COLUMNS = ('door_height', 'wood_wrapped', 'has_schedule', 'trim_style', 'finish_level')
+
+COLUMN_DEFAULTS = {
+    'trimmed_openings': 0,
+    'door_height': '7/0',
+    'wood_wrapped': DEFAULT_WOOD_WRAPPED,
+    'has_schedule': False,
+    'trim_style': 'craftsman',
+    'finish_level': 'Standard'
+}
+
+# calculate_baseboard style multipliers (Control Document Section 2.2)
+BASE_STYLE_MULTIPLIERS = {
+    'craftsman': 1.15,
+    'mitered': 1.05,
+    'built_up': 2.00,
+    'sill_apron_only': 1.00
+}
+
+# Key order of calculate_trim results
+RESULT_TYPES = ('base', 'casing', 'headers', 'sills', 'apron', 'jambs', 'dentils')
+
+
+@dataclass
+class ColumnarTakeoff:
+    """
+    Takeoff results for many rows; each dict maps trim type -> array (one value per row).
+    
+    lf matches calculate_trim(); the other fields match the keys of
+    calculate_bf_with_waste() (dimensions split into width/thickness).
+    """
+    lf: Dict[str, np.ndarray]
+    bf_raw: Dict[str, np.ndarray]
+    bf_with_waste: Dict[str, np.ndarray]
+    waste_factors: Dict[str, np.ndarray]
+    width: Dict[str, np.ndarray]
+    thickness: Dict[str, np.ndarray]
+    nominal_thickness: Dict[str, np.ndarray]
+    thickness_category: Dict[str, np.ndarray]
+    
+    def __len__(self):
+        return len(self.lf['base'])
+    
+    def lf_row(self, i) -> dict:
+        """Row i in calculate_trim() form"""
+        return {trim_type: float(self.lf[trim_type][i]) for trim_type in RESULT_TYPES}
+    
+    def bf_row(self, i) -> dict:
+        """Row i in calculate_bf_with_waste() form"""
+        return {
+            'bf_raw': {t: float(self.bf_raw[t][i]) for t in RESULT_TYPES},
+            'bf_with_waste': {t: float(self.bf_with_waste[t][i]) for t in RESULT_TYPES},
+            'waste_factors': {t: float(self.waste_factors[t][i]) for t in RESULT_TYPES},
+            'dimensions': {t: (float(self.width[t][i]), float(self.thickness[t][i])) for t in RESULT_TYPES},
+            'nominal_thickness': {t: float(self.nominal_thickness[t][i]) for t in RESULT_TYPES},
+            'thickness_category': {t: str(self.thickness_category[t][i]) for t in RESULT_TYPES}
+        }
+    
+    def to_frame(self, index=None):
+        """One DataFrame row per input row: lf_<type>, bf_<type>, bf_waste_<type>, waste_<type>"""
+        import pandas as pd
+        
+        data = {}
+        for prefix, values in (('lf', self.lf), ('bf', self.bf_raw),
+                               ('bf_waste', self.bf_with_waste), ('waste', self.waste_factors)):
+            for trim_type in RESULT_TYPES:
+                data[f'{prefix}_{trim_type}'] = values[trim_type]
+        return pd.DataFrame(data, index=index)
+
+
+def _column(columns, name, n):
+    if name in columns:
+        values = np.asarray(columns[name])
+        if values.shape != (n,):
+            raise ValueError(f"Column {name} has {values.size} values, expected {n}")
+        return values
+    if name in COLUMN_DEFAULTS:
+        return np.full(n, COLUMN_DEFAULTS[name], dtype=object)
+    raise ValueError(f"Missing takeoff column: {name}")
+
+
+def _row_count(columns):
+    for name in COUNT_COLUMNS:
+        if name in columns:
+            return len(columns[name])
+    raise ValueError("Missing takeoff column: int_walls_linear_ft")
+
+
+def _map(values, mapping, default):
+    """Map an object array through a dict (one lookup per distinct value)"""
+    keys, inverse = np.unique(values.astype(str), return_inverse=True)
+    return np.array([mapping.get(key, default) for key in keys], dtype=float)[inverse]
+
+
+def calculate_trim_columns(columns: Mapping) -> Dict[str, np.ndarray]:
+    """
+    Vectorized calculate_trim(): LF per trim type for every row.
+    
+    Args:
+        columns: column name -> array-like (see module docstring)
+    
+    Returns:
+        dict of trim type -> float array
+    """
+    n = _row_count(columns)
+    int_walls = _column(columns, 'int_walls_linear_ft', n).astype(float)
+    ext_walls = _column(columns, 'ext_walls_linear_ft', n).astype(float)
+    ext_doors = _column(columns, 'ext_doors', n).astype(float)
+    int_doors = _column(columns, 'int_doors', n).astype(float)
+    trimmed = _column(columns, 'trimmed_openings', n).astype(float)
+    windows = _column(columns, 'windows', n).astype(float)
+    sliders = _column(columns, 'sliders', n).astype(float)
+    wood_wrapped = _column(columns, 'wood_wrapped', n).astype(bool)
+    has_schedule = _column(columns, 'has_schedule', n).astype(bool)
+    style = _column(columns, 'trim_style', n).astype(str)
+    door_height_ft = _map(_column(columns, 'door_height', n), DOOR_HEIGHTS, 7.0)
+    
+    mitered = style == 'mitered'
+    sill_apron_only = style == 'sill_apron_only'
+    running = 1 + RUNNING_WASTE
+    standing = 1 + STANDING_WASTE
+    zero = np.zeros(n)
+    
+    total_windows = windows + sliders
+    has_windows = total_windows != 0
+    window_width_ft = inches_to_feet(DEFAULT_WINDOW_WIDTH_INCHES)
+    window_height_ft = np.where(
+        has_schedule, door_height_ft, door_height_ft - inches_to_feet(WINDOW_HEIGHT_OFFSET_INCHES)
+    )
+    door_width_ft = inches_to_feet(DEFAULT_DOOR_WIDTH_INCHES)
+    
+    # Baseboard (Section 2)
+    multiplier = _map(style, BASE_STYLE_MULTIPLIERS, 1.00)
+    base = (((2 * int_walls) + ext_walls) * multiplier) * running
+    
+    # Window raw LF (Section 3)
+    window_casing_raw = np.where(has_windows, window_height_ft * 2 * total_windows, zero)
+    window_header_raw = np.where(has_windows, (window_width_ft + 1) * total_windows, zero)
+    window_sill_raw = np.where(has_windows, window_width_ft * windows, zero)
+    
+    sills = np.where((windows == 0) | mitered, zero, (window_width_ft * windows) * running)
+    apron = np.where(mitered, zero, (window_width_ft * windows) * running)
+    dentils = np.where((style == 'built_up') & has_windows, (2 * ((window_width_ft + 1) * total_windows)) * running, zero)
+    
+    # Doors (Section 4)
+    door_casing = ((door_height_ft * 1 * ext_doors) + (door_height_ft * 2 * int_doors)) * standing
+    door_header = (((door_width_ft * 1 + 1) * ext_doors) + ((door_width_ft * 2 + 1) * int_doors)) * running
+    
+    # Style overrides (Section 5): mitered moves sill, apron and header LF into casing
+    mitered_casing_raw = window_casing_raw + ((window_sill_raw + window_sill_raw) + window_header_raw)
+    casing = np.select(
+        [mitered, sill_apron_only],
+        [mitered_casing_raw * standing + door_casing, door_casing],
+        window_casing_raw * standing + door_casing
+    )
+    headers = np.where(mitered | sill_apron_only, door_header, window_header_raw * running + door_header)
+    
+    # Jambs: windows (3 sides, 4 for mitered) plus barn/pocket doors
+    jamb_perimeter = np.where(mitered, (2 * window_height_ft) + (2 * window_width_ft), (2 * window_height_ft) + window_width_ft)
+    window_jamb = np.where(has_windows & wood_wrapped & ~sill_apron_only, (jamb_perimeter * total_windows) * standing, zero)
+    door_jamb = np.where((trimmed != 0) & wood_wrapped, (door_height_ft * 2 * trimmed) * standing, zero)
+    jambs = window_jamb + door_jamb
+    
+    return {
+        'base': base,
+        'casing': casing,
+        'headers': headers,
+        'sills': sills,
+        'apron': apron,
+        'jambs': jambs,
+        'dentils': dentils
+    }
+
+
+def _stock_for(trim_style, trim_type, finish_level):
+    """(width, thickness, nominal, category, waste) for one style/type/finish, or None"""
+    width, thickness = get_trim_dimensions(trim_style, trim_type, finish_level)
+    if width is None or thickness is None:
+        return None
+    nominal, category = get_nominal_stock_thickness(thickness)
+    return width, thickness, nominal, category, get_waste_factor(width, category)
+
+
+def takeoff_columns(columns: Mapping) -> ColumnarTakeoff:
+    """
+    Vectorized calculate_trim() + calculate_bf_with_waste() for every row.
+    
+    Args:
+        columns: column name -> array-like, or a DataFrame (see module docstring)
+    
+    Returns:
+        ColumnarTakeoff with one value per row for each trim type
+    """
+    lf = calculate_trim_columns(columns)
+    n = len(lf['base'])
+    styles = _column(columns, 'trim_style', n).astype(str)
+    finishes = _column(columns, 'finish_level', n).astype(str)
+    
+    # Dimensions depend only on (style, finish): look each pair up once
+    pairs, inverse = np.unique(np.stack([styles, finishes]), axis=1, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    
+    result = ColumnarTakeoff(lf, {}, {}, {}, {}, {}, {}, {})
+    for trim_type in RESULT_TYPES:
+        stock = [_stock_for(style, trim_type, finish) for style, finish in pairs.T]
+        found = np.array([s is not None for s in stock])[inverse]
+        width, thickness, nominal, waste = (
+            np.array([s[k] if s is not None else 0.0 for s in stock], dtype=float)[inverse]
+            for k in (0, 1, 2, 4)
+        )
+        category = np.array([s[3] if s is not None else '' for s in stock], dtype=object)[inverse]
+        
+        linear_ft = lf[trim_type]
+        # Rows with no LF or no dimensions are all zeros (as in calculate_bf_with_waste)
+        active = (linear_ft != 0) & found
+        bf = np.where(active & (width != 0) & (nominal != 0), ((nominal * width) * linear_ft) / 12.0, 0.0)
+        
+        result.bf_raw[trim_type] = bf
+        result.bf_with_waste[trim_type] = np.where(active, bf * (1 + waste), 0.0)
+        result.waste_factors[trim_type] = np.where(active, waste, 0.0)
+        result.width[trim_type] = np.where(active, width, 0.0)
+        result.thickness[trim_type] = np.where(active, thickness, 0.0)
+        result.nominal_thickness[trim_type] = np.where(active, nominal, 0.0)
+        result.thickness_category[trim_type] = np.where(active, category, '')
+    return result
+
+
+def _sum_by_job(values, order, starts, lengths):
+    """Per-job sums, added room by room in input order (same rounding as sum())"""
+    totals = np.zeros(len(starts))
+    for k in range(lengths.max(initial=0)):
+        has_room = lengths > k
+        totals[has_room] += values[order[starts[has_room] + k]]
+    return totals
+
+
+def takeoff_by_job(rooms, job_column='job'):
+    """
+    Per-room and per-job takeoff for a table of rooms.
+    
+    A job's result is the takeoff of its rooms' summed inputs, i.e. what
+    calculate_trim()/calculate_bf_with_waste() give for the job totals.
+    
+    Args:
+        rooms: DataFrame or column dict, one row per room, with a job id column
+        job_column: Name of the job id column
+    
+    Returns:
+        tuple: (room ColumnarTakeoff, job ColumnarTakeoff, job ids in first-seen order)
+    
+    Raises:
+        ValueError: If a column is missing, or rooms of one job have different
+            settings (door_height, wood_wrapped, has_schedule, trim_style, finish_level)
+    """
+    n = _row_count(rooms)
+    job_ids = _column(rooms, job_column, n)
+    room_takeoff = takeoff_columns(rooms)
+    
+    keys, first_index, inverse = np.unique(job_ids, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    # Number jobs in first-seen order
+    rank = np.empty(len(keys), dtype=int)
+    rank[np.argsort(first_index, kind='stable')] = np.arange(len(keys))
+    job_of_row = rank[inverse]
+    order = np.argsort(job_of_row, kind='stable')
+    lengths = np.bincount(job_of_row, minlength=len(keys))
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(int)
+    first_rows = order[starts]
+    
+    job_columns = {}
+    for name in COUNT_COLUMNS:
+        job_columns[name] = _sum_by_job(_column(rooms, name, n).astype(float), order, starts, lengths)
+    for name in SETTING_COLUMNS:
+        values = _column(rooms, name, n)
+        job_values = values[first_rows]
+        mismatch = values != job_values[job_of_row]
+        if mismatch.any():
+            job = job_ids[np.flatnonzero(mismatch)[0]]
+            raise ValueError(f"Rooms of job {job!r} have different {name} values")
+        job_columns[name] = job_values
+    
+    return room_takeoff, takeoff_columns(job_columns), job_ids[first_rows]
+
+
+def takeoff_jobs(job_inputs) -> List[dict]:
+    """
+    run_takeoff() for many TrimJobInputs, vectorized across jobs.
+    
+    Returns:
+        list of dicts shaped like run_takeoff() results, in input order
+    """
+    from .takeoff_engine import build_internal_job_from_input
+    
+    internals = [build_internal_job_from_input(job_input) for job_input in job_inputs]
+    if not internals:
+        return []
+    columns = {
+        name: np.array([internal['inputs'].get(name, COLUMN_DEFAULTS.get(name)) for internal in internals], dtype=object)
+        for name in COUNT_COLUMNS + ('door_height', 'wood_wrapped', 'has_schedule')
+    }
+    columns['trim_style'] = np.array([internal['trim_style'] for internal in internals], dtype=object)
+    columns['finish_level'] = np.array([internal['finish_level'] for internal in internals], dtype=object)
+    takeoff = takeoff_columns(columns)
+    
+    results = []
+    for i, internal in enumerate(internals):
+        inputs = dict(internal['inputs'])
+        inputs.setdefault('wood_wrapped', DEFAULT_WOOD_WRAPPED)
+        inputs.setdefault('has_schedule', False)
+        results.append({
+            'lf': takeoff.lf_row(i),
+            'bf': takeoff.bf_row(i),
+            'trim_style': internal['trim_style'],
+            'finish_level': internal['finish_level'],
+            'inputs': inputs
+        })
+    return results
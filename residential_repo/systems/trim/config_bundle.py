@@ -0,0 +1,227 @@
+"""
+Trim system module: Precompiled config bundle.
+Compiles the trim config workbooks (config/*.xlsx, *.csv) into one
+versioned, checksummed JSON file so the trim API starts without pandas
+or openpyxl parsing.
+
+Rebuild after editing any of the workbooks:
+
+    python -m systems.trim.config_bundle build
+
+The build validates the workbooks first (config_validator) and refuses to
+write a bundle for an invalid config. At runtime the bundle is used only
+while the SHA-256 of every workbook still matches; otherwise callers fall
+back to reading the workbooks.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'config')
+
+BUNDLE_FILENAME = 'trim_config.bundle.json'
+
+# Bump when the bundle layout changes (older bundles are then ignored)
+BUNDLE_FORMAT_VERSION = 1
+
+# Config files compiled into the bundle; optional ones are included when present
+REQUIRED_SOURCES = ('trim_dimensions.xlsx', 'awi_waste_chart.xlsx', 'lumber_species.csv', 'bf_cost.xlsx')
+OPTIONAL_SOURCES = ('Finish_Rates.xlsx', 'setup_costs.xlsx', 'finish_pricing.xlsx', 'knife_costs.xlsx')
+SOURCES = REQUIRED_SOURCES + OPTIONAL_SOURCES
+
+
+def bundle_path(config_dir=CONFIG_DIR):
+    """Path of the config bundle in config_dir"""
+    return os.path.join(config_dir, BUNDLE_FILENAME)
+
+
+def _plain(value):
+    """Cell value -> JSON value (NaN/NaT -> None, numpy scalars -> Python)"""
+    if hasattr(value, 'item'):
+        value = value.item()
+    if value is None or value != value:
+        return None
+    return value
+
+
+def read_config_file(config_dir, filename):
+    """
+    Read one config workbook/CSV into a list of row dicts.
+    
+    Returns:
+        list of dict, or None if the file doesn't exist
+    """
+    import pandas as pd
+    
+    path = os.path.join(config_dir, filename)
+    if not os.path.exists(path):
+        return None
+    df = pd.read_csv(path) if filename.endswith('.csv') else pd.read_excel(path)
+    return [
+        {str(column): _plain(value) for column, value in row.items()}
+        for row in df.to_dict('records')
+    ]
+
+
+def file_sha256(path):
+    """Hex SHA-256 of a file's contents"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _checksum(bundle):
+    """SHA-256 over everything in the bundle except the checksum itself"""
+    content = {key: value for key, value in bundle.items() if key != 'checksum'}
+    encoded = json.dumps(content, sort_keys=True, separators=(',', ':'), allow_nan=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def build_bundle(config_dir=CONFIG_DIR, output_path=None):
+    """
+    Validate the config workbooks and compile them into the bundle.
+    
+    Args:
+        config_dir: Directory with the config workbooks
+        output_path: Where to write the bundle (default: config_dir/trim_config.bundle.json)
+    
+    Returns:
+        dict: The bundle that was written
+    
+    Raises:
+        ValueError: If the workbooks fail validation
+    """
+    from .config_validator import validate_config_files
+    
+    is_valid, errors, warnings = validate_config_files(show_dialogs=False, config_dir=config_dir, use_bundle=False)
+    if not is_valid:
+        raise ValueError("Config validation failed:\n" + "\n".join(errors))
+    
+    sources = {}
+    tables = {}
+    for filename in SOURCES:
+        path = os.path.join(config_dir, filename)
+        if not os.path.exists(path):
+            continue
+        sources[filename] = file_sha256(path)
+        tables[filename] = read_config_file(config_dir, filename)
+    
+    bundle = {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'built_at': datetime.now().isoformat(timespec='seconds'),
+        'sources': sources,
+        'warnings': warnings,
+        'tables': tables
+    }
+    bundle['checksum'] = _checksum(bundle)
+    
+    output_path = output_path or bundle_path(config_dir)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(output_path)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(bundle, f, indent=1, sort_keys=True, allow_nan=False)
+            f.write('\n')
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return bundle
+
+
+def read_bundle(config_dir=CONFIG_DIR):
+    """
+    Read and verify the bundle file.
+    
+    Returns:
+        tuple: (bundle or None, reason) - reason says why the bundle can't be used
+    """
+    path = bundle_path(config_dir)
+    if not os.path.exists(path):
+        return None, f"{BUNDLE_FILENAME} not found"
+    try:
+        with open(path, encoding='utf-8') as f:
+            bundle = json.load(f)
+    except (OSError, ValueError) as e:
+        return None, f"Error reading {BUNDLE_FILENAME}: {str(e)}"
+    
+    if not isinstance(bundle, dict) or bundle.get('format_version') != BUNDLE_FORMAT_VERSION:
+        return None, f"{BUNDLE_FILENAME} has an unsupported format version"
+    if bundle.get('checksum') != _checksum(bundle):
+        return None, f"{BUNDLE_FILENAME} checksum mismatch"
+    return bundle, "OK"
+
+
+def bundle_status(config_dir=CONFIG_DIR):
+    """
+    Check the bundle against the workbooks in config_dir.
+    
+    A workbook that was edited, or added since the build, makes the bundle
+    stale. A workbook missing from config_dir does not (deploys may ship
+    only the bundle).
+    
+    Returns:
+        tuple: (bundle or None, reason) - bundle is None unless it is current
+    """
+    bundle, reason = read_bundle(config_dir)
+    if bundle is None:
+        return None, reason
+    
+    built_from = bundle['sources']
+    for filename in SOURCES:
+        path = os.path.join(config_dir, filename)
+        if not os.path.exists(path):
+            continue
+        if filename not in built_from:
+            return None, f"{filename} was added after the bundle was built"
+        if file_sha256(path) != built_from[filename]:
+            return None, f"{filename} changed after the bundle was built"
+    return bundle, "OK"
+
+
+def load_bundle(config_dir=CONFIG_DIR):
+    """
+    Config tables from the bundle, if it is current.
+    
+    Returns:
+        dict of config filename -> list of row dicts, or None (read the workbooks instead)
+    """
+    bundle, _ = bundle_status(config_dir)
+    if bundle is None:
+        return None
+    return bundle['tables']
+
+
+def main(argv=None):
+    """CLI: python -m systems.trim.config_bundle build|check"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Build or check the precompiled trim config bundle")
+    parser.add_argument('command', choices=['build', 'check'])
+    parser.add_argument('--config-dir', default=CONFIG_DIR)
+    args = parser.parse_args(argv)
+    
+    if args.command == 'build':
+        try:
+            bundle = build_bundle(args.config_dir)
+        except ValueError as e:
+            print(str(e))
+            return 1
+        for warning in bundle['warnings']:
+            print(f"Warning: {warning}")
+        print(f"Wrote {bundle_path(args.config_dir)} ({len(bundle['tables'])} files)")
+        return 0
+    
+    bundle, reason = bundle_status(args.config_dir)
+    if bundle is None:
+        print(f"Bundle is out of date ({reason}) - run: python -m systems.trim.config_bundle build")
+        return 1
+    print(f"Bundle is current (built {bundle['built_at']})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
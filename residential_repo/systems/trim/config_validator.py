@@ -5,7 +5,6 @@ Validates all required Excel and CSV configuration files for the trim calculator
 
 import os
 import pandas as pd
-from tkinter import messagebox
 
 
 def validate_trim_dimensions(config_dir):
@@ -164,22 +163,37 @@ def validate_finish_pricing(config_dir):
         return False, f"Error reading finish_pricing.xlsx: {str(e)}"
 
 
-def validate_config_files(show_dialogs=True):
+def validate_config_files(show_dialogs=True, config_dir=None, use_bundle=True):
     """
     Validate all configuration files.
     
+    A current config bundle (see config_bundle) was validated when it was
+    built, so its result is returned without re-reading the workbooks.
+    
     Args:
         show_dialogs: If True, show Tkinter error dialogs for critical errors
+        config_dir: Config directory (default: repo root/config)
+        use_bundle: If False, always validate the workbooks themselves
     
     Returns:
         tuple: (is_valid: bool, errors: list, warnings: list)
     """
-    # Get config directory (repo root/config)
-    script_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    config_dir = os.path.join(script_dir, 'config')
+    if config_dir is None:
+        # Get config directory (repo root/config)
+        script_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        config_dir = os.path.join(script_dir, 'config')
     errors = []
     warnings = []
     
+    if use_bundle:
+        from .config_bundle import bundle_status
+        
+        bundle, _ = bundle_status(config_dir)
+        if bundle is not None:
+            warnings.extend(bundle['warnings'])
+            _show_dialogs(errors, warnings, show_dialogs)
+            return True, errors, warnings
+    
     # Required files
     validations = [
         ('trim_dimensions.xlsx', validate_trim_dimensions),
@@ -211,16 +225,25 @@ def validate_config_files(show_dialogs=True):
         elif result is None:  # File doesn't exist (optional)
             warnings.append(f"{file_name}: {message}")
     
+    _show_dialogs(errors, warnings, show_dialogs)
+    
+    return len(errors) == 0, errors, warnings
+
+
+def _show_dialogs(errors, warnings, show_dialogs):
+    """Show Tkinter dialogs for critical errors, else for warnings"""
+    if not show_dialogs or not (errors or warnings):
+        return
+    from tkinter import messagebox
+    
     # Show dialogs for critical errors
-    if errors and show_dialogs:
+    if errors:
         error_msg = "Critical configuration errors found:\n\n" + "\n".join(errors)
         error_msg += "\n\nPlease fix these errors before using the calculator."
         messagebox.showerror("Configuration Error", error_msg)
     
     # Show warnings if any
-    if warnings and show_dialogs and not errors:
+    if warnings and not errors:
         warning_msg = "Configuration warnings:\n\n" + "\n".join(warnings)
         messagebox.showwarning("Configuration Warning", warning_msg)
-    
-    return len(errors) == 0, errors, warnings
 
@@ -4,42 +4,9 @@ Creates Excel invoice matching the Moulding Calculator Template format.
 """
 
 import os
-import pandas as pd
 from datetime import datetime
-from openpyxl import load_workbook, Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
 
-
-def load_bf_cost():
-    """Load BF cost per species and thickness from Excel"""
-    # TODO: Update path to use config/ directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    excel_path = os.path.join(script_dir, '..', '..', 'config', 'bf_cost.xlsx')
-    
-    if not os.path.exists(excel_path):
-        return None
-    
-    try:
-        df = pd.read_excel(excel_path)
-        return df
-    except Exception:
-        return None
-
-
-def get_bf_cost(species, thickness_category, bf_cost_df):
-    """Get BF cost for a species and thickness category"""
-    if bf_cost_df is None:
-        return 0.0
-    
-    try:
-        row = bf_cost_df[bf_cost_df['Species'] == species]
-        if row.empty:
-            return 0.0
-        cost = row[thickness_category].iloc[0]
-        return float(cost) if pd.notna(cost) else 0.0
-    except Exception:
-        return 0.0
+from .rate_tables import get_rate_tables
 
 
 def get_finish_multiplier(is_finishing, finish_type):
@@ -103,7 +70,7 @@ def format_description(species, trim_type, width, thickness, finish_level, is_fi
 
 def calculate_pricing(lf_results, bf_data, species, lf_cost_per_ft, bf_markup_pct, is_finishing, finish_type):
     """Calculate pricing for trim items"""
-    bf_cost_df = load_bf_cost()
+    rate_tables = get_rate_tables()
     pricing = {}
     
     for trim_type, linear_ft in lf_results.items():
@@ -114,8 +81,8 @@ def calculate_pricing(lf_results, bf_data, species, lf_cost_per_ft, bf_markup_pc
         thickness_category = bf_data['thickness_category'].get(trim_type, '')
         width, finished_thickness = bf_data['dimensions'].get(trim_type, (0.0, 0.0))
         
-        # Get BF cost from Excel
-        bf_cost_per_bf = get_bf_cost(species, thickness_category, bf_cost_df)
+        # Get BF cost (compiled from bf_cost.xlsx)
+        bf_cost_per_bf = rate_tables.bf_cost(species, thickness_category)
         
         # Calculate costs
         bf_cost = bf_required * bf_cost_per_bf
@@ -211,6 +178,9 @@ def generate_invoice_excel(all_results, species, lf_cost_per_ft, bf_markup_pct,
         sales_tax_rate: Sales tax rate (default 0.06 = 6%)
         output_path: Path to save Excel file (if None, uses data_samples/trim/output folder)
     """
+    from openpyxl import Workbook
+    from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+    
     # Setup output folders
     output_dir, archive_dir = setup_output_folders()
     
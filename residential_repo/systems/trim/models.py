@@ -72,3 +72,11 @@ class TrimJobResult(BaseModel):
         lines.append(f"Total: ${self.totals.total:,.2f}")
         
         return lines
+
+
+class TrimBatchItem(BaseModel):
+    """One job's outcome in a batch quote: its result, or why it couldn't be priced."""
+    index: int  # position of the job in the batch
+    job_name: Optional[str] = None
+    result: Optional[TrimJobResult] = None
+    error: Optional[str] = None
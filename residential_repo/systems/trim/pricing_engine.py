@@ -7,8 +7,7 @@ from .takeoff_engine import run_takeoff
 from .exporters import (
     calculate_pricing,
     format_description,
-    get_setup_cost,
-    load_bf_cost
+    get_setup_cost
 )
 
 
@@ -18,7 +17,7 @@ def price_job(job_input: TrimJobInput, species: str = "Poplar", lf_cost_per_ft:
     """
     High-level API:
     - Runs the takeoff for the job_input.
-    - Looks up rates (BF cost, finish rates, etc.) using the existing code.
+    - Looks up rates (dimensions, waste, BF cost) in the shared compiled rate tables.
     - Builds a TrimJobResult with line items and totals.
     
     Args:
@@ -0,0 +1,205 @@
+"""
+Trim system module: Compiled rate tables.
+Compiles the trim config workbooks once into plain, read-only lookups so
+pricing a job never touches pandas or the filesystem.
+
+- trim_dimensions.xlsx -> (STYLE, PART, finish) -> (width, thickness)
+- awi_waste_chart.xlsx -> sorted rip sizes (bisect) -> waste per thickness category
+- bf_cost.xlsx         -> (species, thickness category) -> cost per BF
+
+The tables are built on first use (from config/trim_config.bundle.json
+when it is current, see config_bundle) and shared by every thread;
+nothing mutates them afterwards.
+"""
+
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+from .config_bundle import CONFIG_DIR, load_bundle, read_config_file
+
+# Workbooks the rate tables are compiled from
+RATE_TABLE_SOURCES = ('trim_dimensions.xlsx', 'awi_waste_chart.xlsx', 'bf_cost.xlsx')
+
+# Finish level -> column prefix in trim_dimensions.xlsx (Luxury is 'UPGRADE')
+FINISH_COLUMNS = {
+    'Economy': 'ECONOMY',
+    'Standard': 'STANDARD'
+}
+DEFAULT_FINISH_COLUMN = 'UPGRADE'
+
+THICKNESS_CATEGORIES = ('4/4', '5/4', '6/4', '8/4')
+
+
+def finish_column(finish_level):
+    """Map a finish level to its trim_dimensions.xlsx column prefix"""
+    return FINISH_COLUMNS.get(finish_level, DEFAULT_FINISH_COLUMN)
+
+
+@dataclass(frozen=True)
+class TrimRateTables:
+    """
+    Immutable lookups compiled from the trim config workbooks.
+    
+    Attributes:
+        dimensions: (STYLE, PART, finish column) -> (width, thickness), first row wins
+        part_dimensions: (PART, finish column) -> (width, thickness), first row for
+            the part in any style (fallback when a style doesn't list the part)
+        rip_sizes: Sorted AWI rip sizes
+        waste_rows: Waste factors per thickness category, parallel to rip_sizes
+        bf_costs: (species, thickness category) -> cost per BF
+    """
+    dimensions: Mapping[Tuple[str, str, str], Tuple[float, float]]
+    part_dimensions: Mapping[Tuple[str, str], Tuple[float, float]]
+    rip_sizes: Tuple[float, ...]
+    waste_rows: Tuple[Mapping[str, float], ...]
+    bf_costs: Mapping[Tuple[str, str], float]
+    
+    def has_part(self, style, part):
+        """True if trim_dimensions.xlsx lists the part for the style"""
+        return (style, part, DEFAULT_FINISH_COLUMN) in self.dimensions
+    
+    def trim_dimensions(self, style, part, finish_level):
+        """
+        (width, thickness) for an Excel STYLE / PART at a finish level,
+        falling back to the part in any style; (None, None) if not listed.
+        """
+        column = finish_column(finish_level)
+        found = self.dimensions.get((style, part, column))
+        if found is None:
+            found = self.part_dimensions.get((part, column))
+        if found is None:
+            return None, None
+        return found
+    
+    def waste_factor(self, rip_size, thickness_category='4/4'):
+        """
+        Waste factor for the nearest rip size in the AWI chart (rip size
+        rounded to 1/8" first; ties go to the smaller size).
+        """
+        if not self.rip_sizes:
+            return 0.0
+        rip_size_rounded = round(rip_size * 8) / 8
+        sizes = self.rip_sizes
+        i = bisect_left(sizes, rip_size_rounded)
+        if i == len(sizes):
+            i -= 1
+        elif i > 0 and sizes[i] != rip_size_rounded:
+            if rip_size_rounded - sizes[i - 1] <= sizes[i] - rip_size_rounded:
+                i -= 1
+        return self.waste_rows[i][thickness_category]
+    
+    def bf_cost(self, species, thickness_category):
+        """Cost per BF for a species and thickness category (0.0 if not listed)"""
+        return self.bf_costs.get((species, thickness_category), 0.0)
+
+
+def _number(value):
+    """Workbook cell -> float (blank cells are None in the bundle, NaN in pandas)"""
+    return float('nan') if value is None else float(value)
+
+
+def _compile_dimensions(rows):
+    dimensions = {}
+    part_dimensions = {}
+    for row in rows or ():
+        for column in (*FINISH_COLUMNS.values(), DEFAULT_FINISH_COLUMN):
+            value = (_number(row[f'{column} WIDTH']), _number(row[f'{column} THICKNESS']))
+            dimensions.setdefault((row['STYLE'], row['PART'], column), value)
+            part_dimensions.setdefault((row['PART'], column), value)
+    return dimensions, part_dimensions
+
+
+def _compile_waste_chart(rows):
+    # Exact rip sizes keep the first row listed, like the old DataFrame match
+    by_size = {}
+    for row in rows or ():
+        by_size.setdefault(float(row['RIP SIZE']), row)
+    rip_sizes = tuple(sorted(by_size))
+    waste_rows = tuple(
+        MappingProxyType({
+            category: _number(value)
+            for category, value in by_size[size].items() if category != 'RIP SIZE'
+        })
+        for size in rip_sizes
+    )
+    return rip_sizes, waste_rows
+
+
+def _compile_bf_costs(rows):
+    bf_costs = {}
+    for row in rows or ():
+        for category in THICKNESS_CATEGORIES:
+            if category not in row:
+                continue
+            cost = row[category]
+            bf_costs.setdefault((row['Species'], category), 0.0 if cost is None or cost != cost else float(cost))
+    return bf_costs
+
+
+def compile_rate_tables(sources):
+    """
+    Compile TrimRateTables from workbook rows.
+    
+    Args:
+        sources: dict of config filename -> list of row dicts (missing files may be absent)
+    """
+    dimensions, part_dimensions = _compile_dimensions(sources.get('trim_dimensions.xlsx'))
+    rip_sizes, waste_rows = _compile_waste_chart(sources.get('awi_waste_chart.xlsx'))
+    try:
+        bf_costs = _compile_bf_costs(sources.get('bf_cost.xlsx'))
+    except Exception:
+        # Same as before: an unreadable cost sheet prices lumber at 0.0
+        bf_costs = {}
+    
+    return TrimRateTables(
+        dimensions=MappingProxyType(dimensions),
+        part_dimensions=MappingProxyType(part_dimensions),
+        rip_sizes=rip_sizes,
+        waste_rows=waste_rows,
+        bf_costs=MappingProxyType(bf_costs)
+    )
+
+
+def build_rate_tables(config_dir=CONFIG_DIR):
+    """
+    Compile TrimRateTables for config_dir: from the config bundle when it is
+    current, otherwise by reading the workbooks.
+    """
+    sources = load_bundle(config_dir)
+    if sources is None:
+        sources = {}
+        for filename in RATE_TABLE_SOURCES:
+            try:
+                sources[filename] = read_config_file(config_dir, filename)
+            except Exception:
+                if filename != 'bf_cost.xlsx':
+                    raise
+    return compile_rate_tables(sources)
+
+
+_rate_tables: Optional[TrimRateTables] = None
+_rate_tables_lock = threading.Lock()
+
+
+def get_rate_tables():
+    """The shared TrimRateTables, built from config/ on first use"""
+    global _rate_tables
+    tables = _rate_tables
+    if tables is None:
+        with _rate_tables_lock:
+            if _rate_tables is None:
+                _rate_tables = build_rate_tables()
+            tables = _rate_tables
+    return tables
+
+
+def reload_rate_tables(config_dir=CONFIG_DIR):
+    """Rebuild the rate tables (after editing the workbooks) and swap them in"""
+    global _rate_tables
+    tables = build_rate_tables(config_dir)
+    with _rate_tables_lock:
+        _rate_tables = tables
+    return tables
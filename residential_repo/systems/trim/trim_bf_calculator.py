@@ -1,35 +1,32 @@
 """
 Board Feet (BF) calculation module.
-Reads trim dimensions and AWI waste chart from Excel files.
+Looks up trim dimensions and AWI waste factors in the compiled rate tables.
 Converts lineal feet to board feet and applies waste factors.
 """
 
 import os
-import pandas as pd
 
-# Cache for loaded Excel data
-_trim_dimensions_df = None
-_awi_waste_df = None
-
-
-def load_trim_dimensions():
-    """Load trim dimensions from Excel file"""
-    global _trim_dimensions_df
-    if _trim_dimensions_df is None:
-        script_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        excel_path = os.path.join(script_dir, 'config', 'trim_dimensions.xlsx')
-        _trim_dimensions_df = pd.read_excel(excel_path)
-    return _trim_dimensions_df
-
-
-def load_awi_waste_chart():
-    """Load AWI waste chart from Excel file"""
-    global _awi_waste_df
-    if _awi_waste_df is None:
-        script_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        excel_path = os.path.join(script_dir, 'config', 'awi_waste_chart.xlsx')
-        _awi_waste_df = pd.read_excel(excel_path)
-    return _awi_waste_df
+from .rate_tables import get_rate_tables
+
+# Map our trim styles to Excel styles
+STYLE_MAP = {
+    'craftsman': 'CRAFTSMAN',
+    'built_up': 'CRAFTSMAN PLUS',
+    'craftsman_plus': 'CRAFTSMAN PLUS',
+    'mitered': 'MITERED',
+    'sill_apron_only': 'CRAFTSMAN'  # Uses same dimensions as Craftsman
+}
+
+# Map our trim types to Excel parts
+PART_MAP = {
+    'base': 'BASE',
+    'casing': 'CASE',
+    'headers': 'HEADER',
+    'sills': 'SILL',
+    'apron': 'APRON',
+    'jambs': 'INT JAMB',  # Will handle window jamb separately
+    'dentils': 'DENTIL'
+}
 
 
 def get_trim_dimensions(trim_style, trim_type, finish_level):
@@ -44,69 +41,22 @@ def get_trim_dimensions(trim_style, trim_type, finish_level):
     Returns:
         tuple: (width_inches, thickness_inches) or (None, None) if not found
     """
-    df = load_trim_dimensions()
-    
-    # Map our trim styles to Excel styles
-    style_map = {
-        'craftsman': 'CRAFTSMAN',
-        'built_up': 'CRAFTSMAN PLUS',
-        'craftsman_plus': 'CRAFTSMAN PLUS',
-        'mitered': 'MITERED',
-        'sill_apron_only': 'CRAFTSMAN'  # Uses same dimensions as Craftsman
-    }
-    excel_style = style_map.get(trim_style, 'CRAFTSMAN')
-    
-    # Map our trim types to Excel parts
-    part_map = {
-        'base': 'BASE',
-        'casing': 'CASE',
-        'headers': 'HEADER',
-        'sills': 'SILL',
-        'apron': 'APRON',
-        'jambs': 'INT JAMB',  # Will handle window jamb separately
-        'dentils': 'DENTIL'
-    }
-    excel_part = part_map.get(trim_type, 'BASE')
+    tables = get_rate_tables()
+    excel_style = STYLE_MAP.get(trim_style, 'CRAFTSMAN')
+    excel_part = PART_MAP.get(trim_type, 'BASE')
     
     # Special handling for jambs (window vs door)
     # Note: Our LF calculation combines window and door jambs, so we use WINDOW JAMB
     # when available (it's typically larger, more conservative estimate)
     if trim_type == 'jambs':
         # Try WINDOW JAMB first (for Craftsman/Craftsman Plus), fall back to INT JAMB
-        if excel_style in ['CRAFTSMAN', 'CRAFTSMAN PLUS']:
-            # Check if WINDOW JAMB exists for this style
-            window_jamb_check = df[(df['STYLE'] == excel_style) & (df['PART'] == 'WINDOW JAMB')]
-            if not window_jamb_check.empty:
-                excel_part = 'WINDOW JAMB'
-            else:
-                excel_part = 'INT JAMB'
+        if excel_style in ['CRAFTSMAN', 'CRAFTSMAN PLUS'] and tables.has_part(excel_style, 'WINDOW JAMB'):
+            excel_part = 'WINDOW JAMB'
         else:
             excel_part = 'INT JAMB'
     
-    # Filter by style and part
-    filtered = df[(df['STYLE'] == excel_style) & (df['PART'] == excel_part)]
-    
-    if filtered.empty:
-        # Fallback: try without style filter
-        filtered = df[df['PART'] == excel_part]
-    
-    if filtered.empty:
-        return None, None
-    
-    row = filtered.iloc[0]
-    
-    # Map finish level to column names (Excel uses 'UPGRADE' for Luxury)
-    if finish_level == 'Economy':
-        width = row['ECONOMY WIDTH']
-        thickness = row['ECONOMY THICKNESS']
-    elif finish_level == 'Standard':
-        width = row['STANDARD WIDTH']
-        thickness = row['STANDARD THICKNESS']
-    else:  # Luxury (mapped to UPGRADE in Excel)
-        width = row['UPGRADE WIDTH']
-        thickness = row['UPGRADE THICKNESS']
-    
-    return float(width), float(thickness)
+    # Style + part, else the part in any style (Excel uses 'UPGRADE' for Luxury)
+    return tables.trim_dimensions(excel_style, excel_part, finish_level)
 
 
 def get_waste_factor(rip_size, thickness_category='4/4'):
@@ -120,27 +70,8 @@ def get_waste_factor(rip_size, thickness_category='4/4'):
     Returns:
         float: Waste factor (e.g., 0.111 = 11.1% waste)
     """
-    df = load_awi_waste_chart()
-    
-    # Find closest rip size (round to nearest 0.125)
-    rip_size_rounded = round(rip_size * 8) / 8  # Round to nearest 1/8"
-    
-    # Find matching row
-    matches = df[df['RIP SIZE'] == rip_size_rounded]
-    
-    if matches.empty:
-        # Find closest match
-        df['diff'] = abs(df['RIP SIZE'] - rip_size_rounded)
-        closest_idx = df['diff'].idxmin()
-        matches = df.loc[[closest_idx]]
-    
-    if matches.empty:
-        return 0.0  # Default no waste if not found
-    
-    row = matches.iloc[0]
-    waste_factor = row[thickness_category]
-    
-    return float(waste_factor)
+    # Nearest rip size (rounded to 1/8") via bisect on the compiled chart
+    return get_rate_tables().waste_factor(rip_size, thickness_category)
 
 
 def calculate_bf_from_lf(linear_ft, width_inches, nominal_thickness_inches):
@@ -229,6 +160,7 @@ def load_lumber_species():
         return ['Poplar', 'Maple', 'Oak', 'Cherry', 'Walnut']
     
     try:
+        import pandas as pd
         df = pd.read_csv(csv_path)
         if 'Species' in df.columns:
             return df['Species'].tolist()
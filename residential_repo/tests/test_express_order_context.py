@@ -0,0 +1,68 @@
+"""
+Shared order pricing context for the ACC Express Order API: reload on
+config changes, keeping the last good config, and the admin reload endpoint.
+"""
+
+import os
+import shutil
+
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.web import prime_order_api as api
+
+
+@pytest.fixture
+def config_paths(tmp_path, monkeypatch):
+    """Point the API at a scratch copy of the order config, with no context loaded."""
+    for name in ("CATALOG_PATH", "FINISHES_PATH", "PRICING_PATH"):
+        path = getattr(api, name)
+        copy = tmp_path / path.name
+        shutil.copy(path, copy)
+        monkeypatch.setattr(api, name, copy)
+    monkeypatch.setattr(api, "_order_context", None)
+    monkeypatch.setattr(api, "_failed_signature", None)
+    return tmp_path
+
+
+def _touch(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_context_is_shared_until_config_changes(config_paths):
+    context = api.get_order_context()
+    assert api.get_order_context() is context
+    
+    pricing = api.PRICING_PATH
+    pricing.write_text(pricing.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    _touch(pricing, os.stat(pricing).st_mtime_ns + 1)
+    rebuilt = api.get_order_context()
+    assert rebuilt is not context
+    assert rebuilt.pricing == context.pricing
+
+def test_broken_config_keeps_previous_context(config_paths):
+    context = api.get_order_context()
+    
+    api.CATALOG_PATH.write_text("{ half saved", encoding="utf-8")
+    _touch(api.CATALOG_PATH, os.stat(api.CATALOG_PATH).st_mtime_ns + 1)
+    assert api.get_order_context() is context
+    assert api.get_catalog() is context.catalog
+    
+    api.CATALOG_PATH.write_text('{"B_2D": {"display_name": "Base 2-Door"}}', encoding="utf-8")
+    _touch(api.CATALOG_PATH, os.stat(api.CATALOG_PATH).st_mtime_ns + 1)
+    assert list(api.get_order_context().catalog) == ["B_2D"]
+
+def test_admin_reload_requires_token(config_paths, monkeypatch):
+    client = TestClient(api.app)
+    monkeypatch.delenv(api.ADMIN_TOKEN_ENV, raising=False)
+    assert client.post("/express-order/admin/reload").status_code == 403
+    
+    monkeypatch.setenv(api.ADMIN_TOKEN_ENV, "s3cret")
+    assert client.post("/express-order/admin/reload").status_code == 403
+    assert client.post("/express-order/admin/reload", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    
+    context = api.get_order_context()
+    response = client.post("/express-order/admin/reload", headers={"X-Admin-Token": "s3cret"})
+    assert response.status_code == 200
+    assert response.json()["cabinet_families"] == len(context.catalog)
+    assert api.get_order_context() is not context
@@ -0,0 +1,40 @@
+"""
+Batch trim quoting: parsing uploads and pricing many jobs.
+"""
+
+from systems.trim.batch import iter_csv, parse_jobs, price_jobs
+from systems.trim.models import TrimJobInput
+from systems.trim.pricing_engine import price_job
+
+
+JOBS_CSV = (
+    "job_number,job_name,spec_level,room,base_lf,window_openings\n"
+    "101,Lot 1,premium,Kitchen,60,2\n"
+    "101,Lot 1,premium,Den,40,\n"
+    "102,Lot 2,,,80,1\n"
+)
+
+
+def test_csv_rows_group_into_jobs():
+    jobs = parse_jobs(JOBS_CSV.encode("utf-8-sig"), "text/csv")
+    assert [job["job_name"] for job in jobs] == ["Lot 1", "Lot 2"]
+    assert [room["name"] for room in jobs[0]["rooms"]] == ["Kitchen", "Den"]
+    assert jobs[0]["rooms"][1]["window_openings"] is None
+    assert jobs[1]["rooms"][0]["name"] == "Room 1"
+
+def test_batch_matches_single_quotes_and_keeps_going_on_errors():
+    jobs = parse_jobs(JOBS_CSV, "text/csv")
+    jobs.insert(1, {"job_name": "Broken", "rooms": [{"base_lf": "lots"}]})
+    
+    items = list(price_jobs(jobs))
+    assert [item.index for item in items] == [0, 1, 2]
+    assert items[1].result is None and "rooms.0.name" in items[1].error
+    assert items[0].result == price_job(TrimJobInput.model_validate(jobs[0]))
+    
+    rows = "".join(iter_csv(items)).splitlines()
+    assert rows[0].startswith("index,job_number,job_name")
+    assert len(rows) == 4
+
+def test_ndjson_upload():
+    jobs = parse_jobs('{"job_name": "A", "rooms": []}\n\n{"job_name": "B", "rooms": []}\n', "application/x-ndjson")
+    assert [job["job_name"] for job in jobs] == ["A", "B"]
@@ -0,0 +1,67 @@
+"""
+Columnar trim takeoff matches the scalar calculate_trim / calculate_bf_with_waste path.
+"""
+
+import pytest
+
+from systems.trim.columnar_takeoff import takeoff_by_job, takeoff_jobs
+from systems.trim.models import TrimJobInput, TrimRoomInput
+from systems.trim.takeoff_engine import run_takeoff
+from systems.trim.trim_bf_calculator import calculate_bf_with_waste
+from systems.trim.trim_rules import calculate_trim
+
+
+ROOMS = {
+    'job': ['A', 'B', 'A', 'C', 'B'],
+    'int_walls_linear_ft': [40.0, 0.0, 22.5, 60.0, 35.0],
+    'ext_walls_linear_ft': [20.0, 18.0, 0.0, 30.0, 12.5],
+    'ext_doors': [1, 0, 0, 2, 1],
+    'int_doors': [2, 1, 3, 0, 1],
+    'trimmed_openings': [0, 1, 1, 0, 0],
+    'windows': [3, 0, 2, 4, 1],
+    'sliders': [0, 1, 0, 1, 0],
+    'door_height': ['7/0', '8/0', '7/0', '6/8', '8/0'],
+    'wood_wrapped': [True, True, True, False, True],
+    'has_schedule': [False, True, False, False, True],
+    'trim_style': ['craftsman', 'mitered', 'craftsman', 'built_up', 'mitered'],
+    'finish_level': ['Standard', 'Luxury', 'Standard', 'Economy', 'Luxury']
+}
+
+INPUT_COLUMNS = ('int_walls_linear_ft', 'ext_walls_linear_ft', 'ext_doors', 'int_doors',
+                 'trimmed_openings', 'windows', 'sliders', 'door_height', 'wood_wrapped', 'has_schedule')
+
+
+def _scalar(inputs, trim_style, finish_level):
+    lf = calculate_trim(dict(inputs), trim_style, finish_level)
+    return lf, calculate_bf_with_waste(lf, trim_style, finish_level)
+
+def test_rooms_and_jobs_match_scalar_path():
+    rooms, jobs, job_ids = takeoff_by_job(ROOMS)
+    
+    for i in range(len(ROOMS['job'])):
+        inputs = {name: ROOMS[name][i] for name in INPUT_COLUMNS}
+        lf, bf = _scalar(inputs, ROOMS['trim_style'][i], ROOMS['finish_level'][i])
+        assert rooms.lf_row(i) == lf
+        assert rooms.bf_row(i) == bf
+    
+    assert list(job_ids) == ['A', 'B', 'C']
+    for j, job in enumerate(job_ids):
+        rows = [i for i, room_job in enumerate(ROOMS['job']) if room_job == job]
+        inputs = {name: sum(ROOMS[name][i] for i in rows) for name in INPUT_COLUMNS[:7]}
+        inputs.update({name: ROOMS[name][rows[0]] for name in INPUT_COLUMNS[7:]})
+        lf, bf = _scalar(inputs, ROOMS['trim_style'][rows[0]], ROOMS['finish_level'][rows[0]])
+        assert jobs.lf_row(j) == lf
+        assert jobs.bf_row(j) == bf
+
+def test_rooms_of_a_job_must_share_settings():
+    rooms = dict(ROOMS, trim_style=['craftsman', 'mitered', 'mitered', 'built_up', 'mitered'])
+    with pytest.raises(ValueError, match="trim_style"):
+        takeoff_by_job(rooms)
+
+def test_takeoff_jobs_matches_run_takeoff():
+    jobs = [
+        TrimJobInput(job_name="Lot 1", rooms=[TrimRoomInput(name="A", base_lf=120.0, window_openings=4)]),
+        TrimJobInput(job_name="Lot 2", rooms=[TrimRoomInput(name="A", case_openings=5)], spec_level="premium"),
+        TrimJobInput(job_name="Lot 3", rooms=[], spec_level="economy")
+    ]
+    assert takeoff_jobs(jobs) == [run_takeoff(job) for job in jobs]
@@ -0,0 +1,52 @@
+"""
+Precompiled trim config bundle: build, staleness and fallback.
+"""
+
+import os
+import shutil
+
+from systems.trim import config_bundle
+from systems.trim.rate_tables import build_rate_tables
+
+
+def _copy_config(tmp_path):
+    for filename in config_bundle.SOURCES:
+        path = os.path.join(config_bundle.CONFIG_DIR, filename)
+        if os.path.exists(path):
+            shutil.copy(path, tmp_path)
+    return str(tmp_path)
+
+def test_bundle_matches_workbooks(tmp_path):
+    config_dir = _copy_config(tmp_path)
+    from_workbooks = build_rate_tables(config_dir)
+    
+    config_bundle.build_bundle(config_dir)
+    assert config_bundle.load_bundle(config_dir) is not None
+    assert build_rate_tables(config_dir) == from_workbooks
+
+def test_edited_workbook_makes_bundle_stale(tmp_path):
+    config_dir = _copy_config(tmp_path)
+    config_bundle.build_bundle(config_dir)
+    
+    with open(os.path.join(config_dir, 'lumber_species.csv'), 'a') as f:
+        f.write("Sapele\n")
+    bundle, reason = config_bundle.bundle_status(config_dir)
+    assert bundle is None
+    assert 'lumber_species.csv' in reason
+
+def test_tampered_bundle_is_rejected(tmp_path):
+    config_dir = _copy_config(tmp_path)
+    config_bundle.build_bundle(config_dir)
+    
+    path = config_bundle.bundle_path(config_dir)
+    with open(path) as f:
+        text = f.read()
+    with open(path, 'w') as f:
+        f.write(text.replace('"CRAFTSMAN"', '"CRAFTSMEN"', 1))
+    bundle, reason = config_bundle.read_bundle(config_dir)
+    assert bundle is None
+    assert 'checksum' in reason
+
+def test_committed_bundle_is_current():
+    bundle, reason = config_bundle.bundle_status()
+    assert bundle is not None, reason
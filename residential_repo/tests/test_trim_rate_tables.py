@@ -0,0 +1,27 @@
+"""
+Compiled trim rate tables match the config workbooks.
+"""
+
+import pytest
+
+from systems.trim.rate_tables import get_rate_tables
+from systems.trim.trim_bf_calculator import get_trim_dimensions, get_waste_factor
+
+
+def test_dimension_lookups():
+    assert get_trim_dimensions('craftsman', 'base', 'Standard') == (5.25, 0.5)
+    assert get_trim_dimensions('craftsman', 'jambs', 'Luxury') == (6.0, 0.75)  # WINDOW JAMB
+    assert get_trim_dimensions('mitered', 'jambs', 'Economy') == (4.75, 0.75)  # INT JAMB
+    assert get_trim_dimensions('mitered', 'headers', 'Standard') == (5.25, 0.875)  # part fallback
+
+def test_waste_factor_nearest_rip_size():
+    assert get_waste_factor(0.75, '4/4') == 0.111
+    assert get_waste_factor(4.125, '4/4') == get_waste_factor(4.0, '4/4')  # tie -> smaller size
+    assert get_waste_factor(20.0, '8/4') == get_waste_factor(9.0, '8/4')
+
+def test_rate_tables_are_shared_and_read_only():
+    tables = get_rate_tables()
+    assert get_rate_tables() is tables
+    assert tables.bf_cost('No Such Species', '4/4') == 0.0
+    with pytest.raises(TypeError):
+        tables.bf_costs[('Poplar', '4/4')] = 1.0